@@ -0,0 +1,105 @@
+"""
+요청 단위 권한 컨텍스트 (request.access)
+
+AccessContextMiddleware가 로그인 사용자의 역할과 관리 센터 ID를 요청당 한 번만 읽어 request.access에 붙입니다.
+- 처음 사용할 때 Profile을 select_related('managed_center')로 한 번에 읽고 request.user.profile 캐시도 채움
+- (역할, 관리 센터 ID)는 ACCESS_CONTEXT_CACHE_SECONDS초 동안 캐시에도 저장 (0이면 사용 안 함).
+  Profile 저장/삭제 시 지우고 (accounts/models.py), 센터 삭제로 managed_center가 비워지는 경우는 TTL 안에 반영됨
+- 뷰, 템플릿, 관리자 화면의 권한 검사는 access_for(request)로 같은 객체를 사용
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+from .models import Profile
+
+CACHE_KEY = 'access_context:{user_id}'
+DEFAULT_CACHE_SECONDS = 60
+
+
+class AccessContext:
+    """권한 검사에 필요한 값 (Profile의 is_admin/is_center_manager/can_manage_center와 같은 이름)"""
+
+    def __init__(self, user_id=None, is_superuser=False, role=None, managed_center_id=None):
+        self.user_id = user_id
+        self.is_superuser = is_superuser
+        self.role = role  # 프로필이 없으면 None
+        self.managed_center_id = managed_center_id
+
+    def __repr__(self):
+        return f'<AccessContext user={self.user_id} role={self.role} center={self.managed_center_id}>'
+
+    @property
+    def has_profile(self):
+        return self.role is not None
+
+    def is_admin(self):
+        """총관리자인지 확인"""
+        return self.role == 'admin'
+
+    def is_center_manager(self):
+        """센터운영자인지 확인"""
+        return self.role == 'center_manager'
+
+    def is_manager(self):
+        """센터 관리 화면에 들어갈 수 있는지 (총관리자 또는 센터운영자)"""
+        return self.is_admin() or self.is_center_manager()
+
+    def has_full_access(self):
+        """관리자 화면에서 모든 센터를 다룰 수 있는지 (슈퍼유저 또는 총관리자)"""
+        return self.is_superuser or self.is_admin()
+
+    def can_manage_center(self, center):
+        """특정 센터(객체 또는 ID)를 관리할 수 있는지 확인"""
+        if self.is_admin():
+            return True
+        center_id = getattr(center, 'pk', center)
+        return self.is_center_manager() and center_id is not None and self.managed_center_id == center_id
+
+
+def _cache_seconds():
+    return getattr(settings, 'ACCESS_CONTEXT_CACHE_SECONDS', DEFAULT_CACHE_SECONDS)
+
+
+def load_access_context(user):
+    """user의 AccessContext (캐시에 없으면 Profile을 한 번 읽음)"""
+    if not user.is_authenticated:
+        return AccessContext()
+
+    key = CACHE_KEY.format(user_id=user.pk)
+    cache_seconds = _cache_seconds()
+    values = cache.get(key) if cache_seconds else None
+    if values is None:
+        profile = Profile.objects.select_related('managed_center').filter(user_id=user.pk).first()
+        if profile is not None:
+            user.profile = profile  # 이후 request.user.profile 접근도 쿼리 없음
+            values = (profile.role, profile.managed_center_id)
+        else:
+            values = (None, None)
+        if cache_seconds:
+            cache.set(key, values, cache_seconds)
+    return AccessContext(user.pk, user.is_superuser, *values)
+
+
+def invalidate_access_context(user_id):
+    cache.delete(CACHE_KEY.format(user_id=user_id))
+
+
+def access_for(request):
+    """요청의 AccessContext (미들웨어를 거치지 않은 요청이면 여기서 만들어 붙임)"""
+    access = getattr(request, 'access', None)
+    if access is None:
+        access = request.access = load_access_context(request.user)
+    return access
+
+
+class AccessContextMiddleware:
+    """request.access를 지연 로드 객체로 붙임 (AuthenticationMiddleware 뒤에 둠)"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.access = SimpleLazyObject(lambda: load_access_context(request.user))
+        return self.get_response(request)
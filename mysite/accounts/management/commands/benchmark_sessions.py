@@ -0,0 +1,89 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from centers.models import Center
+
+DEFAULT_ENGINES = [
+    'django.contrib.sessions.backends.db',
+    'django.contrib.sessions.backends.cached_db',
+    'accounts.session_store',
+]
+
+
+class SessionQueryCounter:
+    """django_session 테이블 쿼리를 읽기/쓰기로 나눠 셈 (connection.execute_wrapper)"""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        if 'django_session' in sql:
+            if sql.lstrip().upper().startswith('SELECT'):
+                self.reads += 1
+            else:
+                self.writes += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = '세션 저장소별로 로그인 사용자의 요청당 django_session 읽기/쓰기 수를 비교합니다 (DB 변경은 모두 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=100,
+            help='저장소마다 보낼 요청 수 (기본값: 100)'
+        )
+        parser.add_argument(
+            '--engine',
+            dest='engines',
+            nargs='+',
+            default=DEFAULT_ENGINES,
+            help='비교할 SESSION_ENGINE 목록 (기본값: db, cached_db, accounts.session_store)'
+        )
+
+    def handle(self, *args, **options):
+        # 지도 화면에서 반복해서 부르는 AJAX 요청
+        paths = [reverse('centers:check_auth')]
+        center = Center.objects.order_by('pk').first()
+        if center:
+            paths.append(reverse('centers:get_reviews', args=[center.pk]))
+
+        self.stdout.write(self.style.SUCCESS(f"=== 세션 쓰기 벤치마크: 저장소마다 {options['requests']}회 요청 ==="))
+        self.stdout.write(f"요청 경로: {', '.join(paths)}\n")
+        self.stdout.write(f"{'SESSION_ENGINE':<45} {'쓰기':>6} {'읽기':>6} {'요청당 쓰기':>10} {'시간':>8}")
+        for engine in options['engines']:
+            with transaction.atomic():
+                counter, elapsed = self._run(engine, paths, options['requests'])
+                transaction.set_rollback(True)
+            self.stdout.write(
+                f"{engine:<45} {counter.writes:>6} {counter.reads:>6} "
+                f"{counter.writes / options['requests']:>10.2f} {elapsed:>7.2f}s"
+            )
+
+    def _run(self, engine, paths, total):
+        with override_settings(SESSION_ENGINE=engine, ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False):
+            user = get_user_model().objects.create_user(username='session-benchmark', password=None)
+            client = Client()
+            client.force_login(user)
+
+            counter = SessionQueryCounter()
+            started = time.monotonic()
+            with connection.execute_wrapper(counter):
+                for i in range(total):
+                    response = client.get(paths[i % len(paths)])
+                    if response.status_code != 200:
+                        self.stdout.write(self.style.WARNING(f'⚠️ {paths[i % len(paths)]}: {response.status_code}'))
+            elapsed = time.monotonic() - started
+
+            # 캐시에 남은 세션 정리 (DB는 롤백)
+            client.logout()
+        return counter, elapsed
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 class Profile(models.Model):
@@ -43,12 +43,10 @@ class Profile(models.Model):
         return self.role == 'admin'
     
     def can_manage_center(self, center):
-        """특정 센터를 관리할 수 있는지 확인"""
-        if self.is_admin():
-            return True
-        if self.is_center_manager() and self.managed_center == center:
-            return True
-        return False
+        """특정 센터를 관리할 수 있는지 확인 (managed_center를 읽지 않고 ID로 비교)"""
+        from .access import AccessContext
+        access = AccessContext(self.user_id, role=self.role, managed_center_id=self.managed_center_id)
+        return access.can_manage_center(center)
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
@@ -61,4 +59,11 @@ def create_user_profile(sender, instance, created, **kwargs):
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, **kwargs):
     if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+        instance.profile.save()
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_access_context(sender, instance, **kwargs):
+    """역할/관리 센터가 바뀌면 캐시된 권한 컨텍스트 삭제 (accounts/access.py)"""
+    from .access import invalidate_access_context
+    invalidate_access_context(instance.user_id)
@@ -0,0 +1,81 @@
+"""
+쓰기를 줄인 세션 저장소 (SESSION_ENGINE = 'accounts.session_store')
+
+cached_db처럼 캐시를 먼저 읽고 DB에 저장하지만, SESSION_SAVE_EVERY_REQUEST로 매 요청 save()가 불려도
+- 세션 데이터가 실제로 바뀌었거나 (값을 같은 값으로 다시 넣은 경우는 바뀐 것으로 보지 않음)
+- 마지막 저장 후 SESSION_REFRESH_INTERVAL초가 지나 만료일을 늘려야 할 때만
+django_session에 씁니다. 만료일은 최대 SESSION_REFRESH_INTERVAL만큼 늦게 밀리므로
+마지막 요청 후 (SESSION_COOKIE_AGE - SESSION_REFRESH_INTERVAL) ~ SESSION_COOKIE_AGE 사이에 만료됩니다.
+
+캐시에는 (세션 데이터, 만료일)을 함께 저장해 캐시만 읽고도 갱신 시점을 판단합니다.
+벤치마크: python manage.py benchmark_sessions
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.utils import timezone
+
+KEY_PREFIX = 'accounts.session_store'
+DEFAULT_REFRESH_INTERVAL = 3600  # 초
+
+
+class SessionStore(CachedDBStore):
+    cache_key_prefix = KEY_PREFIX
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._expire_date = None  # DB에 저장된 만료일
+        self._saved_state = None  # 마지막으로 읽거나 저장한 데이터의 직렬화 값
+
+    @property
+    def refresh_interval(self):
+        return getattr(settings, 'SESSION_REFRESH_INTERVAL', DEFAULT_REFRESH_INTERVAL)
+
+    def _serialize(self, data):
+        return self.serializer().dumps(data)
+
+    def _remember(self, data, expire_date):
+        self._expire_date = expire_date
+        self._saved_state = self._serialize(data)
+
+    def load(self):
+        try:
+            cached = self._cache.get(self.cache_key)
+        except Exception:
+            # 캐시 키가 잘못된 경우 등은 DB에서 다시 읽음 (cached_db와 동일)
+            cached = None
+
+        if cached is not None:
+            data, expire_date = cached
+            self._remember(data, expire_date)
+            return data
+
+        s = self._get_session_from_db()
+        if not s:
+            return {}
+        data = self.decode(s.session_data)
+        self._remember(data, s.expire_date)
+        self._cache.set(self.cache_key, (data, s.expire_date), self.get_expiry_age(expiry=s.expire_date))
+        return data
+
+    def needs_write(self):
+        """DB에 써야 하는지 (새 세션, 데이터 변경, 만료일 갱신 시점)"""
+        if self.session_key is None or self._expire_date is None:
+            return True
+        if self.modified and self._serialize(self._session) != self._saved_state:
+            return True
+        # 남은 유효 기간이 (전체 기간 - 갱신 간격)보다 짧아지면 만료일을 다시 밀어 줌
+        remaining = self._expire_date - timezone.now()
+        return remaining < timedelta(seconds=self.get_expiry_age() - self.refresh_interval)
+
+    def save(self, must_create=False):
+        data = self._get_session(no_load=must_create)
+        if not must_create and not self.needs_write():
+            return
+        DBStore.save(self, must_create=must_create)
+        expire_date = self.get_expiry_date()
+        self._remember(data, expire_date)
+        self._cache.set(self.cache_key, (data, expire_date), self.get_expiry_age())
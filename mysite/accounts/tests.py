@@ -1,3 +1,126 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from centers.models import Center
+
+from .access import AccessContextMiddleware, access_for, load_access_context
+from .session_store import SessionStore
+
+
+class SessionStoreWriteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        session = SessionStore()
+        session['cart'] = [1, 2]
+        session.save()
+        self.session_key = session.session_key
+
+    def save_queries(self, change):
+        """새 요청처럼 세션을 읽고 change(session) 후 save()할 때의 쿼리 수"""
+        session = SessionStore(self.session_key)
+        session.load()
+        change(session)
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+        return len(queries)
+
+    def test_unchanged_session_skips_write(self):
+        self.assertEqual(self.save_queries(lambda session: None), 0)
+
+    def test_same_value_reassigned_skips_write(self):
+        def reassign(session):
+            session['cart'] = [1, 2]
+            self.assertTrue(session.modified)
+
+        self.assertEqual(self.save_queries(reassign), 0)
+
+    def test_changed_value_is_written(self):
+        def change(session):
+            session['cart'] = [1, 2, 3]
+
+        self.assertGreater(self.save_queries(change), 0)
+        self.assertEqual(SessionStore(self.session_key).load(), {'cart': [1, 2, 3]})
+        self.assertEqual(Session.objects.get(pk=self.session_key).get_decoded(), {'cart': [1, 2, 3]})
+
+    def test_cache_miss_reads_db_without_writing(self):
+        cache.clear()
+        self.assertEqual(self.save_queries(lambda session: None), 0)
+
+    def test_expiry_is_extended_after_refresh_interval(self):
+        # 마지막 저장이 갱신 간격보다 오래전인 것처럼 만료일을 당김
+        session = SessionStore(self.session_key)
+        stale_expiry = timezone.now() + timedelta(
+            seconds=settings.SESSION_COOKIE_AGE - settings.SESSION_REFRESH_INTERVAL - 60
+        )
+        cache.set(session.cache_key, ({'cart': [1, 2]}, stale_expiry), 60)
+
+        self.assertGreater(self.save_queries(lambda session: None), 0)
+        self.assertGreater(Session.objects.get(pk=self.session_key).expire_date, stale_expiry)
+
+
+class AccessContextTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.center = Center.objects.create(name='센터', address='서울', latitude=37.5, longitude=127.0)
+        self.other_center = Center.objects.create(name='다른 센터', address='부산', latitude=35.1, longitude=129.0)
+        self.user = User.objects.create_user('manager')
+        self.user.profile.role = 'center_manager'
+        self.user.profile.managed_center = self.center
+        self.user.profile.save()
+        self.user = User.objects.get(pk=self.user.pk)  # profile 캐시 없이 새로 읽음
+
+    def request_for(self, user):
+        request = RequestFactory().get('/')
+        request.user = user
+        AccessContextMiddleware(lambda request: None)(request)
+        return request
+
+    def test_profile_is_loaded_once_per_request(self):
+        request = self.request_for(self.user)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(request.access.is_manager())
+            self.assertTrue(access_for(request).can_manage_center(self.center))
+            self.assertFalse(request.access.is_admin())
+            self.assertEqual(request.user.profile.managed_center, self.center)
+
+    def test_next_request_uses_cache(self):
+        load_access_context(self.user)
+
+        request = self.request_for(User.objects.get(pk=self.user.pk))
+        with self.assertNumQueries(0):
+            self.assertTrue(request.access.can_manage_center(self.center.pk))
+
+    def test_profile_save_invalidates_cache(self):
+        self.assertTrue(load_access_context(self.user).is_center_manager())
+
+        profile = self.user.profile
+        profile.role = 'admin'
+        profile.save()
+
+        access = load_access_context(User.objects.get(pk=self.user.pk))
+        self.assertTrue(access.is_admin())
+        self.assertTrue(access.has_full_access())
+
+    def test_can_manage_center(self):
+        manager = load_access_context(self.user)
+        self.assertTrue(manager.can_manage_center(self.center))
+        self.assertTrue(manager.can_manage_center(self.center.pk))
+        self.assertFalse(manager.can_manage_center(self.other_center))
+        self.assertFalse(manager.can_manage_center(None))
+
+        member = load_access_context(User.objects.create_user('member'))
+        self.assertFalse(member.is_manager())
+        self.assertFalse(member.can_manage_center(self.center))
+
+        anonymous = self.request_for(AnonymousUser()).access
+        self.assertFalse(anonymous.has_profile)
+        self.assertFalse(anonymous.can_manage_center(self.center))
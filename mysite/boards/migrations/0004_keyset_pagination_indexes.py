@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_eventpost'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board_type', 'created_at', 'id'], name='post_board_created_id_idx'),
+        ),
+    ]
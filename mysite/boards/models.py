@@ -21,6 +21,10 @@ class Post(models.Model):
         ordering = ['-created_at']
         verbose_name = '게시글'
         verbose_name_plural = '게시글'
+        indexes = [
+            # 게시판별 목록 (-created_at, -id) 페이지네이션 용 복합 인덱스
+            models.Index(fields=['board_type', 'created_at', 'id'], name='post_board_created_id_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -1,3 +1,32 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from centers.tiered_cache import tiered_cache
+
+from .models import Post
+
+
+class BoardListTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        tiered_cache.l1.clear()
+        self.user = User.objects.create_user('writer', password='pw')
+        self.client.force_login(self.user)
+        for i in range(10):
+            Post.objects.create(title=f'글 {i}', content='내용', author=self.user, board_type='free')
+
+    def page_count(self):
+        response = self.client.get(reverse('boards:free_board'))
+        self.assertEqual(response.status_code, 200)
+        return response.context['posts'].paginator.num_pages
+
+    def test_cached_count_follows_new_and_deleted_posts(self):
+        self.assertEqual(self.page_count(), 1)
+
+        post = Post.objects.create(title='새 글', content='내용', author=self.user, board_type='free')
+        self.assertEqual(self.page_count(), 2)
+
+        post.delete()
+        self.assertEqual(self.page_count(), 1)
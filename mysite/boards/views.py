@@ -1,21 +1,24 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
 from django.contrib import messages
 from django.http import JsonResponse
 from django.contrib.admin.views.decorators import staff_member_required
 from django.db import transaction
 from .models import Post, Comment, EventPost
 from .forms import PostForm, CommentForm, EventPostForm
+from centers.pagination import CachedCountPaginator, count_cache_key
+from centers.page_cache import cache_anonymous_page
 
+@cache_anonymous_page('boards.Post', 'boards.EventPost', 'boards.Comment')
 def board_list(request, board_type):
     if board_type == 'event':
         # 이벤트 게시판은 EventPost와 조인하여 가져오기
-        posts = Post.objects.filter(board_type=board_type).select_related('event_detail').order_by('-created_at')
+        posts = Post.objects.filter(board_type=board_type).select_related('event_detail').order_by('-created_at', '-id')
     else:
-        posts = Post.objects.filter(board_type=board_type)
+        posts = Post.objects.filter(board_type=board_type).order_by('-created_at', '-id')
     
-    paginator = Paginator(posts, 10)  # 한 페이지에 10개씩
+    # 한 페이지에 10개씩, 전체 개수는 게시판별로 캐시된 값 사용
+    paginator = CachedCountPaginator(posts, 10, count_cache_key=count_cache_key('board_posts', board_type, dependencies=['boards.Post']))
     page = request.GET.get('page', 1)
     posts = paginator.get_page(page)
     
@@ -1,9 +1,8 @@
 from django.contrib import admin
 from django.db import models
 from django import forms
-from .models import Center, Review, Therapist, CenterImage, ExternalReview, BackupHistory, RestoreHistory
+from .models import Center, Review, Therapist, CenterImage, ExternalReview, BackupHistory, BackupCatalogEntry, RestoreHistory, CloudinaryOutbox
 from django.conf import settings
-import requests
 import csv
 import os
 from django.shortcuts import render, redirect
@@ -20,145 +19,87 @@ from PIL import Image
 import io
 import tempfile
 from datetime import datetime
-from django.core.cache import cache
-import uuid
 
 # Cloudinary imports 추가
 from .utils import upload_image_to_cloudinary, delete_image_from_cloudinary
+from .csv_import import CenterImporter, ExternalReviewImporter, TherapistImporter, duplicate_keys
+from .image_import import ZipImageSource
+from .geocoding import geocode
+from accounts.access import access_for
 
 # CSV Import Mixin - 공통 로직 분리
 class CSVImportMixin:
     """CSV 업로드 공통 기능을 제공하는 Mixin"""
     
-    def init_progress_tracking(self, request, total_rows):
-        """진행 상황 추적 초기화 - 캐시 기반"""
-        try:
-            # 고유한 작업 ID 생성
-            if not hasattr(request, '_import_task_id'):
-                request._import_task_id = str(uuid.uuid4())
-            
-            task_id = request._import_task_id
-            print(f"=== 진행 상황 초기화 시작 ===")
-            print(f"Task ID: {task_id}")
-            print(f"Total rows: {total_rows}")
-            
-            progress_data = {
-                'total': total_rows,
-                'processed': 0,
-                'success': 0,
-                'errors': []
-            }
-            
-            # 캐시에 저장 (10분간 유지)
-            cache.set(f'import_progress_{task_id}', progress_data, 600)
-            
-            # 세션에도 task_id 저장 - 더 명시적으로 처리
-            request.session['current_import_task_id'] = task_id
-            request.session.modified = True
-            request.session.save()  # 명시적으로 세션 저장
-            
-            print(f"캐시에 저장된 데이터: {progress_data}")
-            print(f"캐시 키: import_progress_{task_id}")
-            print(f"세션에 저장된 task_id: {request.session.get('current_import_task_id')}")
-            
-        except Exception as e:
-            print(f"진행 상황 초기화 오류: {str(e)}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
+    # CSV 가져오기는 요청 안에서 파일 검증만 하고 실제 처리는 백그라운드 작업(centers/tasks.py)으로 실행
+    csv_import_job_kind = 'centers.csv_import'
+    csv_importer = None  # csv_import.BulkImporter 하위 클래스 (각 ModelAdmin에서 지정)
     
-    def update_progress(self, request, success=True, error_msg=None, row_num=None):
-        """진행 상황 업데이트 - 캐시 기반"""
-        try:
-            task_id = getattr(request, '_import_task_id', None)
-            if not task_id:
-                task_id = request.session.get('current_import_task_id')
-            
-            if not task_id:
-                print("Task ID를 찾을 수 없어 진행률 업데이트를 건너뜁니다.")
-                return
-            
-            cache_key = f'import_progress_{task_id}'
-            progress_data = cache.get(cache_key)
-            
-            if not progress_data:
-                print(f"캐시에서 진행률 데이터를 찾을 수 없습니다: {cache_key}")
-                return
-            
-            print(f"=== 진행 상황 업데이트 ===")
-            print(f"Task ID: {task_id}")
-            print(f"업데이트 전: {progress_data}")
-            
-            if success:
-                progress_data['success'] += 1
-                print(f"성공 처리: {progress_data['success']}")
-            else:
-                error_info = {
-                    'row': row_num or 'unknown',
-                    'error': str(error_msg) if error_msg else 'Unknown error'
-                }
-                progress_data['errors'].append(error_info)
-                print(f"오류 처리: {error_info}")
-            
-            progress_data['processed'] += 1
-            
-            # 캐시에 업데이트된 데이터 저장
-            cache.set(cache_key, progress_data, 600)
-            
-            print(f"업데이트 후: {progress_data}")
-            print(f"진행 상황: {progress_data['processed']}/{progress_data['total']}")
-            
-        except Exception as e:
-            print(f"진행 상황 업데이트 중 오류: {str(e)}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
+    def start_import_job(self, request, csv_file, image_zip=None, options=None):
+        """업로드 파일을 저장하고 CSV 가져오기 작업 등록 (run_worker가 run_import_job으로 처리)"""
+        from jobs.runner import enqueue, save_job_file
+        
+        if image_zip and not zipfile.is_zipfile(image_zip):
+            raise ValueError('올바른 ZIP 파일이 아닙니다.')
+        
+        csv_path = save_job_file(csv_file)
+        zip_path = save_job_file(image_zip) if image_zip else None
+        job = enqueue(
+            self.csv_import_job_kind,
+            {
+                'model': self.model._meta.label_lower,
+                'csv_path': csv_path,
+                'zip_path': zip_path,
+                'options': options or {},
+            },
+            user=request.user,
+            files=[p for p in (csv_path, zip_path) if p],
+        )
+        print(f"📥 CSV 가져오기 작업 등록: {job}")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'CSV 파일이 업로드되었습니다. 백그라운드에서 처리 중입니다.',
+            'redirect': '../',
+            'task_id': job.pk,
+        })
     
-    def clear_progress(self, request):
-        """진행 상황 데이터 정리 - 캐시 기반"""
-        try:
-            task_id = getattr(request, '_import_task_id', None)
-            if not task_id:
-                task_id = request.session.get('current_import_task_id')
-            
-            if task_id:
-                cache_key = f'import_progress_{task_id}'
-                cache.delete(cache_key)
-                print(f"캐시 정리 완료: {cache_key}")
-            
-            if 'current_import_task_id' in request.session:
-                del request.session['current_import_task_id']
-                
-        except Exception as e:
-            print(f"진행 상황 정리 중 오류: {str(e)}")
+    def import_csv_progress(self, request):
+        """CSV 가져오기 작업 진행 상황 조회 (task_id는 작업 ID)"""
+        from jobs.models import Job
+        
+        if request.method != 'GET':
+            return JsonResponse({'error': 'Invalid request method'})
+        
+        task_id = request.GET.get('task_id', '')
+        job = Job.objects.filter(pk=task_id, kind=self.csv_import_job_kind).first() if task_id.isdigit() else None
+        if job is None or not (request.user.is_superuser or job.created_by_id == request.user.pk):
+            return JsonResponse({'success': False, 'error': '작업을 찾을 수 없습니다.'}, status=404)
+        return JsonResponse(job.to_dict())
     
-    def get_progress_data(self, request):
-        """현재 진행률 데이터 조회 - 캐시 기반"""
+    def run_import_job(self, ctx):
+        """워커에서 실행: 저장된 CSV를 읽어 csv_importer로 일괄 저장 (배치별 bulk_create, centers/csv_import.py)"""
+        payload = ctx.payload
+        with open(payload['csv_path'], 'rb') as csv_file:
+            data_rows, fieldnames = self.read_csv_data(csv_file)
+        images = self.open_image_source(payload.get('zip_path'))
+        options = self.prepare_import_options(payload.get('options', {}))
+        
+        importer = self.csv_importer(options=options, images=images)
         try:
-            # URL 파라미터에서 task_id 확인 (우선순위 1)
-            task_id = request.GET.get('task_id')
-            if not task_id:
-                # 세션에서 task_id 확인 (우선순위 2)
-                task_id = request.session.get('current_import_task_id')
-            
-            print(f"진행률 조회 시도 - Task ID: {task_id}")
-            print(f"URL 파라미터: {request.GET.get('task_id')}")
-            print(f"세션 task_id: {request.session.get('current_import_task_id')}")
-            print(f"모든 세션 키: {list(request.session.keys())}")
-            
-            if not task_id:
-                print("Task ID를 찾을 수 없습니다.")
-                return {'total': 0, 'processed': 0}
-            
-            cache_key = f'import_progress_{task_id}'
-            progress_data = cache.get(cache_key, {'total': 0, 'processed': 0})
-            
-            print(f"캐시 키: {cache_key}")
-            print(f"조회된 데이터: {progress_data}")
-            
-            return progress_data
-            
-        except Exception as e:
-            print(f"진행률 조회 중 오류: {str(e)}")
-            return {'total': 0, 'processed': 0}
+            result = importer.run(data_rows, ctx)
+        finally:
+            if images is not None:
+                images.close()
+        
+        message = (f"CSV 파일 처리가 완료되었습니다. "
+                   f"(총 {result['total']}개 중 성공: {result['success']}개, 실패: {result['errors']}개)")
+        ctx.set_message(message)
+        return {**result, 'message': message}
+    
+    def prepare_import_options(self, options):
+        """작업 인자(JSON)를 csv_importer에 넘길 값으로 변환 (예: center_id -> Center)"""
+        return options
     
     def validate_csv_file(self, csv_file):
         """CSV 파일 유효성 검사"""
@@ -187,84 +128,9 @@ class CSVImportMixin:
                 if field not in row or not row[field].strip():
                     raise ValueError(f'필수 필드 {field}가 누락되었습니다.')
     
-    def extract_images_from_zip(self, zip_file):
-        """ZIP 파일에서 이미지를 딕셔너리로 추출"""
-        image_dict = {}
-        if zip_file:
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                for filename in zip_ref.namelist():
-                    if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                        image_data = zip_ref.read(filename)
-                        # 이미지 유효성 검사
-                        try:
-                            Image.open(io.BytesIO(image_data))
-                            image_dict[os.path.basename(filename)] = image_data
-                        except:
-                            continue
-        return image_dict
-    
-    def save_image(self, image_data, file_path):
-        """이미지 파일 저장 - Cloudinary와 로컬 저장소 통합"""
-        try:
-            # Cloudinary 업로드 시도
-            upload_result = upload_image_to_cloudinary(
-                image_data, 
-                folder='centers' if 'centers/' in file_path else 'therapists'
-            )
-            
-            if upload_result['success']:
-                print(f"✅ Cloudinary 업로드 성공: {upload_result.get('url', 'URL 없음')}")
-                # 로컬에도 저장 (백업용)
-                os.makedirs(os.path.dirname(os.path.join(settings.MEDIA_ROOT, file_path)), exist_ok=True)
-                default_storage.save(file_path, ContentFile(image_data))
-                return file_path, upload_result.get('url')
-            else:
-                print(f"⚠️ Cloudinary 업로드 실패, 로컬 저장소만 사용: {upload_result.get('error', '알 수 없는 오류')}")
-                # Cloudinary 실패 시 로컬 저장소만 사용
-                os.makedirs(os.path.dirname(os.path.join(settings.MEDIA_ROOT, file_path)), exist_ok=True)
-                default_storage.save(file_path, ContentFile(image_data))
-                return file_path, None
-                
-        except Exception as e:
-            print(f"❌ 이미지 저장 중 오류: {str(e)}")
-            # 오류 발생 시 로컬 저장소만 사용
-            os.makedirs(os.path.dirname(os.path.join(settings.MEDIA_ROOT, file_path)), exist_ok=True)
-            default_storage.save(file_path, ContentFile(image_data))
-            return file_path, None
-    
-    def process_batch(self, data_rows, batch_size=10):
-        """배치 단위로 데이터 처리"""
-        for i in range(0, len(data_rows), batch_size):
-            yield i, data_rows[i:i + batch_size]
-    
-    def get_success_response(self, request):
-        """성공 응답 생성"""
-        task_id = getattr(request, '_import_task_id', None)
-        if not task_id:
-            task_id = request.session.get('current_import_task_id')
-            
-        cache_key = f'import_progress_{task_id}' if task_id else None
-        progress = cache.get(cache_key, {}) if cache_key else {}
-        
-        success_count = progress.get('success', 0)
-        error_count = len(progress.get('errors', []))
-        total_count = progress.get('total', 0)
-        
-        response_data = {
-            'success': True,
-            'message': f'CSV 파일이 성공적으로 업로드되었습니다. (총 {total_count}개 중 성공: {success_count}개, 실패: {error_count}개)',
-            'redirect': '../',
-            'task_id': task_id,  # task_id 포함
-            'stats': {
-                'total': total_count,
-                'success': success_count,
-                'errors': error_count,
-                'error_details': progress.get('errors', [])
-            }
-        }
-        
-        print(f"응답 데이터: {response_data}")
-        return JsonResponse(response_data)
+    def open_image_source(self, zip_path):
+        """ZIP 파일의 이미지 목록 (이미지는 업로드할 때 하나씩 읽음, centers/image_import.py)"""
+        return ZipImageSource(zip_path) if zip_path else None
 
 # Inline for managing images within the Center admin
 class CenterImageInline(admin.TabularInline):
@@ -276,6 +142,38 @@ class TherapistInline(admin.TabularInline):
     model = Therapist
     extra = 1  # Number of extra blank therapist forms to show
 
+# 센터에 속한 모델(상담사, 센터 이미지) 관리자 공통 권한
+class ManagedCenterPermissionMixin:
+    """총관리자는 전체, 센터운영자는 자신이 관리하는 센터(obj.center)의 항목만 다룸 (권한은 request.access, accounts/access.py)"""
+    
+    def get_queryset(self, request):
+        """사용자 권한에 따라 목록을 필터링"""
+        qs = super().get_queryset(request)
+        access = access_for(request)
+        
+        # 슈퍼유저와 총관리자는 모두 접근 가능
+        if access.has_full_access():
+            return qs
+        
+        # 센터운영자는 자신이 관리하는 센터의 항목만 접근 가능 (프로필이 없거나 일반 사용자는 접근 불가)
+        if access.is_center_manager() and access.managed_center_id:
+            return qs.filter(center_id=access.managed_center_id)
+        return qs.none()
+    
+    def has_add_permission(self, request):
+        """추가 권한 확인 (총관리자 또는 센터운영자)"""
+        access = access_for(request)
+        return access.is_superuser or access.is_manager()
+    
+    def has_change_permission(self, request, obj=None):
+        """수정 권한 확인 (obj.center를 읽지 않고 center_id로 비교)"""
+        access = access_for(request)
+        return access.has_full_access() or (obj is not None and access.can_manage_center(obj.center_id))
+    
+    def has_delete_permission(self, request, obj=None):
+        """삭제 권한 확인"""
+        return self.has_change_permission(request, obj)
+
 class CenterAdminForm(forms.ModelForm):
     class Meta:
         model = Center
@@ -323,12 +221,13 @@ class ExternalReviewCsvImportForm(forms.Form):
 @admin.register(Center)
 class CenterAdmin(CSVImportMixin, admin.ModelAdmin):
     form = CenterAdminForm
-    list_display = ('name', 'type', 'address', 'phone', 'url', 'created_at')
+    list_display = ('name', 'type', 'address', 'phone', 'url', 'review_count', 'average_rating', 'created_at')
     search_fields = ('name', 'address')
     list_filter = ('type', 'created_at',)
     inlines = [TherapistInline, CenterImageInline]  # Display therapists and images inline
     readonly_fields = ('latitude', 'longitude')
     change_list_template = 'centers/admin/center_changelist.html'
+    csv_importer = CenterImporter
     fieldsets = (
         ('기본 정보', {
             'fields': ('name', 'type', 'address', 'phone', 'url')
@@ -347,69 +246,35 @@ class CenterAdmin(CSVImportMixin, admin.ModelAdmin):
     )
 
     def get_queryset(self, request):
-        """사용자 권한에 따라 센터 목록을 필터링"""
+        """사용자 권한에 따라 센터 목록을 필터링 (권한은 request.access, accounts/access.py)"""
         qs = super().get_queryset(request)
+        access = access_for(request)
         
-        # 슈퍼유저는 모든 센터 접근 가능
-        if request.user.is_superuser:
+        # 슈퍼유저와 총관리자는 모든 센터 접근 가능
+        if access.has_full_access():
             return qs
         
-        # 프로필이 없는 경우 빈 쿼리셋 반환
-        if not hasattr(request.user, 'profile'):
-            return qs.none()
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 센터 접근 가능
-        if profile.is_admin():
-            return qs
-        
-        # 센터운영자는 자신이 관리하는 센터만 접근 가능
-        if profile.is_center_manager() and profile.managed_center:
-            return qs.filter(id=profile.managed_center.id)
-        
-        # 일반 사용자는 접근 불가
+        # 센터운영자는 자신이 관리하는 센터만 접근 가능 (프로필이 없거나 일반 사용자는 접근 불가)
+        if access.is_center_manager() and access.managed_center_id:
+            return qs.filter(id=access.managed_center_id)
         return qs.none()
     
     def has_add_permission(self, request):
         """센터 추가 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if hasattr(request.user, 'profile'):
-            return request.user.profile.is_admin()
-        
-        return False
+        return access_for(request).has_full_access()
     
     def has_change_permission(self, request, obj=None):
         """센터 수정 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if not hasattr(request.user, 'profile'):
-            return False
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 센터 수정 가능
-        if profile.is_admin():
+        access = access_for(request)
+        if access.has_full_access():
             return True
         
         # 센터운영자는 자신이 관리하는 센터만 수정 가능
-        if profile.is_center_manager() and obj:
-            return profile.managed_center == obj
-        
-        return False
+        return obj is not None and access.can_manage_center(obj)
     
     def has_delete_permission(self, request, obj=None):
         """센터 삭제 권한 확인 (총관리자만 가능)"""
-        if request.user.is_superuser:
-            return True
-        
-        if hasattr(request.user, 'profile'):
-            return request.user.profile.is_admin()
-        
-        return False
+        return access_for(request).has_full_access()
 
     def get_urls(self):
         urls = super().get_urls()
@@ -419,16 +284,6 @@ class CenterAdmin(CSVImportMixin, admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def import_csv_progress(self, request):
-        print(f"=== 진행률 체크 요청 (캐시 기반) ===")
-        print(f"Method: {request.method}")
-        print(f"Session keys: {list(request.session.keys())}")
-        
-        if request.method == 'GET':
-            progress_data = self.get_progress_data(request)
-            return JsonResponse(progress_data)
-        return JsonResponse({'error': 'Invalid request method'})
-
     def import_csv(self, request):
         print(f"=== CSV Import 호출됨 ===")
         print(f"Request method: {request.method}")
@@ -462,7 +317,7 @@ class CenterAdmin(CSVImportMixin, admin.ModelAdmin):
             
             # 중복 주소 검사
             addresses = [row['address'].strip() for row in data_rows]
-            duplicate_addresses = set([x for x in addresses if addresses.count(x) > 1])
+            duplicate_addresses = duplicate_keys(addresses)
             if duplicate_addresses:
                 raise ValueError(f'중복된 주소가 있습니다: {", ".join(duplicate_addresses)}')
             
@@ -472,201 +327,25 @@ class CenterAdmin(CSVImportMixin, admin.ModelAdmin):
             if duplicate_existing:
                 raise ValueError(f'이미 등록된 상담소 주소가 있습니다: {", ".join(duplicate_existing)}')
             
-            # 이미지 추출
-            image_dict = self.extract_images_from_zip(image_zip)
-            print(f"추출된 이미지 수: {len(image_dict)}")
-            
-            # 진행 상황 추적 초기화
-            self.init_progress_tracking(request, len(data_rows))
-            print(f"진행 상황 추적 초기화 완료")
-            
-            # 배치 처리
-            for i, batch in self.process_batch(data_rows):
-                print(f"배치 처리 시작: {i} ~ {i + len(batch) - 1}")
-                for row in batch:
-                    try:
-                        with transaction.atomic():  # 개별 row마다 독립적인 트랜잭션
-                            center = self.create_center_from_row(row, image_dict)
-                            print(f"센터 생성 성공: {center.name}")
-                            self.update_progress(request, success=True)
-                    except Exception as e:
-                        print(f"센터 생성 실패: {str(e)}")
-                        self.update_progress(request, success=False, 
-                                           error_msg=str(e), 
-                                           row_num=i + batch.index(row) + 1)
-                print(f"배치 완료: {i} ~ {i + len(batch) - 1}")
-            
-            # 성공 응답
-            response = self.get_success_response(request)
-            print(f"성공 응답 생성: {response.content}")
-            self.clear_progress(request)
-            return response
+            # 실제 생성(지오코딩, 이미지 업로드)은 백그라운드 작업에서 처리
+            return self.start_import_job(request, csv_file, image_zip)
             
         except Exception as e:
             print(f"전체 오류: {str(e)}")
             import traceback
             print(f"Traceback: {traceback.format_exc()}")
-            self.clear_progress(request)
             return JsonResponse({
                 'success': False,
                 'error': f'CSV 파일 처리 중 오류가 발생했습니다: {str(e)}'
             }, status=500)
     
-    def create_center_from_row(self, row, image_dict):
-        """CSV 행에서 센터 생성"""
-        try:
-            # 기본 검증
-            if not row.get('name', '').strip():
-                raise ValueError(f"센터명이 비어있습니다")
-            if not row.get('address', '').strip():
-                raise ValueError(f"주소가 비어있습니다")
-            
-            # 좌표 변환
-            latitude, longitude = None, None
-            if row['address'].strip():
-                try:
-                    # 네이버 지도 API를 사용하여 주소를 좌표로 변환
-                    headers = {
-                        'x-ncp-apigw-api-key-id': settings.NAVER_CLIENT_ID,
-                        'x-ncp-apigw-api-key': settings.NAVER_CLIENT_SECRET,
-                        'Accept': 'application/json'
-                    }
-                    
-                    print(f"🔍 Geocoding 시도: {row['address'].strip()}")
-                    print(f"🔑 Client ID: {settings.NAVER_CLIENT_ID[:10]}...")
-                    
-                    response = requests.get(
-                        'https://maps.apigw.ntruss.com/map-geocode/v2/geocode',
-                        params={'query': row['address'].strip()},
-                        headers=headers,
-                        timeout=10
-                    )
-                    
-                    print(f"📡 API 응답 상태 코드: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        print(f"📋 API 응답 데이터: {result}")
-                        
-                        if result.get('addresses'):
-                            first_result = result['addresses'][0]
-                            latitude = first_result['y']
-                            longitude = first_result['x']
-                            print(f"✅ 좌표 변환 성공: ({latitude}, {longitude})")
-                        else:
-                            print(f"❌ 주소 좌표 변환 실패: {row['address']} - 검색 결과 없음")
-                            print(f"🔍 전체 응답: {result}")
-                    else:
-                        print(f"❌ 주소 좌표 변환 API 오류: {response.status_code}")
-                        print(f"📄 응답 내용: {response.text}")
-                        
-                        # 특정 오류 코드에 대한 상세 안내
-                        if response.status_code == 401:
-                            print("🔐 인증 실패: API 키를 확인하세요")
-                        elif response.status_code == 429:
-                            print("📊 API 호출 한도 초과: 일일 허용량을 확인하세요")
-                        elif response.status_code == 403:
-                            print("🚫 접근 권한 없음: NCP 콘솔에서 Geocoding API 서비스 활성화를 확인하세요")
-                            
-                except requests.exceptions.Timeout:
-                    print(f"⏰ 주소 변환 타임아웃: {row['address']}")
-                except requests.exceptions.ConnectionError:
-                    print(f"🌐 네트워크 연결 오류: {row['address']}")
-                except Exception as e:
-                    print(f"❌ 주소 변환 중 예상치 못한 오류: {str(e)}")
-                    print(f"🔍 오류 타입: {type(e).__name__}")
-            
-            # 타입 처리
-            type_value = row.get('type', '').strip()
-            if type_value == '정신건강의학과':
-                center_type = 'clinic'
-            else:
-                center_type = 'counseling'  # 기본값 또는 "심리상담센터"인 경우
-            
-            # 중복 검사
-            if Center.objects.filter(name=row['name'].strip(), address=row['address'].strip()).exists():
-                raise ValueError(f"같은 이름과 주소의 센터가 이미 존재합니다: {row['name'].strip()}")
-            
-            # 센터 생성
-            center = Center.objects.create(
-                name=row['name'].strip(),
-                address=row['address'].strip(),
-                phone=row.get('phone', '').strip(),
-                url=row.get('url', '').strip(),
-                description=row.get('description', '').strip(),
-                operating_hours=row.get('operating_hours', '').strip(),
-                type=center_type,
-                latitude=latitude,
-                longitude=longitude
-            )
-            
-            # 이미지 처리 - 쉼표로 구분된 여러 이미지 지원
-            image_filename = row.get('image_filename', '').strip()
-            if image_filename and image_dict:
-                # 쉼표로 구분된 이미지 파일명들을 분리
-                image_filenames = [name.strip() for name in image_filename.split(',') if name.strip()]
-                
-                for idx, filename in enumerate(image_filenames):
-                    if filename in image_dict:
-                        try:
-                            # 각 이미지별로 고유한 경로 생성
-                            image_path = f'centers/{center.name}_{filename}'
-                            saved_path, cloudinary_url = self.save_image(image_dict[filename], image_path)
-                            
-                            # Center 이미지 생성 - Cloudinary URL 포함
-                            center_image = CenterImage.objects.create(
-                                center=center, 
-                                image=saved_path,
-                                image_url=cloudinary_url
-                            )
-                            
-                            # 첫 번째 이미지는 Center 모델의 image_url에도 저장
-                            if idx == 0 and cloudinary_url:
-                                center.image_url = cloudinary_url
-                                center.save()
-                            
-                            print(f"🖼️ 이미지 처리 성공 ({idx+1}/{len(image_filenames)}): {image_path}")
-                            if cloudinary_url:
-                                print(f"🌐 Cloudinary URL: {cloudinary_url}")
-                        except Exception as e:
-                            print(f"⚠️ 이미지 처리 실패 - {filename}: {str(e)}")
-                    else:
-                        print(f"⚠️ ZIP 파일에서 이미지를 찾을 수 없음: {filename}")
-                
-                if image_filenames:
-                    print(f"🎨 총 {len(image_filenames)}개 이미지 중 업로드 시도 완료")
-            
-            print(f"🎉 센터 생성 성공: {center.name}")
-            return center
-        
-        except Exception as e:
-            # 오류 발생 시 더 구체적인 정보 제공
-            error_msg = f"센터 '{row.get('name', 'Unknown')}' 생성 실패: {str(e)}"
-            print(f"💥 {error_msg}")
-            raise ValueError(error_msg)
-
     def save_model(self, request, obj, form, change):
-        # 좌표가 없으면 Naver API로 변환
+        # 좌표가 없으면 주소로 변환 (캐시 우선, centers/geocoding.py)
         if not obj.latitude or not obj.longitude:
             try:
-                # 네이버 지도 API를 사용하여 주소를 좌표로 변환
-                headers = {
-                    'x-ncp-apigw-api-key-id': settings.NAVER_CLIENT_ID,
-                    'x-ncp-apigw-api-key': settings.NAVER_CLIENT_SECRET,
-                    'Accept': 'application/json'
-                }
-                response = requests.get(
-                    'https://maps.apigw.ntruss.com/map-geocode/v2/geocode',
-                    params={'query': obj.address},
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get('addresses'):
-                        first_result = result['addresses'][0]
-                        obj.latitude = first_result['y']
-                        obj.longitude = first_result['x']
+                coords = geocode(obj.address)
+                if coords:
+                    obj.latitude, obj.longitude = coords
             except Exception as e:
                 self.message_user(request, f'주소 변환 중 오류가 발생했습니다: {str(e)}', level='ERROR')
         
@@ -735,87 +414,12 @@ class ReviewAdmin(admin.ModelAdmin):
     list_filter = ('center', 'user', 'rating', 'date')
 
 @admin.register(Therapist)
-class TherapistAdmin(CSVImportMixin, admin.ModelAdmin):
+class TherapistAdmin(ManagedCenterPermissionMixin, CSVImportMixin, admin.ModelAdmin):
     list_display = ('name', 'center', 'specialty', 'created_at')
     search_fields = ('name', 'specialty')
     list_filter = ('center', 'created_at')
     change_list_template = 'centers/admin/therapist_changelist.html'
-
-    def get_queryset(self, request):
-        """사용자 권한에 따라 상담사 목록을 필터링"""
-        qs = super().get_queryset(request)
-        
-        # 슈퍼유저는 모든 상담사 접근 가능
-        if request.user.is_superuser:
-            return qs
-        
-        # 프로필이 없는 경우 빈 쿼리셋 반환
-        if not hasattr(request.user, 'profile'):
-            return qs.none()
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 상담사 접근 가능
-        if profile.is_admin():
-            return qs
-        
-        # 센터운영자는 자신이 관리하는 센터의 상담사만 접근 가능
-        if profile.is_center_manager() and profile.managed_center:
-            return qs.filter(center=profile.managed_center)
-        
-        # 일반 사용자는 접근 불가
-        return qs.none()
-    
-    def has_add_permission(self, request):
-        """상담사 추가 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if hasattr(request.user, 'profile'):
-            profile = request.user.profile
-            return profile.is_admin() or profile.is_center_manager()
-        
-        return False
-    
-    def has_change_permission(self, request, obj=None):
-        """상담사 수정 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if not hasattr(request.user, 'profile'):
-            return False
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 상담사 수정 가능
-        if profile.is_admin():
-            return True
-        
-        # 센터운영자는 자신이 관리하는 센터의 상담사만 수정 가능
-        if profile.is_center_manager() and obj:
-            return profile.managed_center == obj.center
-        
-        return False
-    
-    def has_delete_permission(self, request, obj=None):
-        """상담사 삭제 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if not hasattr(request.user, 'profile'):
-            return False
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 상담사 삭제 가능
-        if profile.is_admin():
-            return True
-        
-        # 센터운영자는 자신이 관리하는 센터의 상담사만 삭제 가능
-        if profile.is_center_manager() and obj:
-            return profile.managed_center == obj.center
-        
-        return False
+    csv_importer = TherapistImporter
 
     def get_urls(self):
         urls = super().get_urls()
@@ -825,41 +429,9 @@ class TherapistAdmin(CSVImportMixin, admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def import_csv_progress(self, request):
-        if request.method == 'GET':
-            progress = request.session.get('import_progress', {'total': 0, 'processed': 0})
-            return JsonResponse(progress)
-        return JsonResponse({'error': 'Invalid request method'})
-
-    def create_therapist_from_row(self, row, center, image_dict):
-        """CSV 행에서 상담사 객체 생성"""
-        therapist = Therapist(
-            center=center,
-            name=row['name'].strip(),
-            specialty=row.get('specialty', '').strip(),
-            description=row.get('description', '').strip(),
-            experience=int(row.get('experience', 0) or 0)
-        )
-        therapist.save()
-        
-        # 이미지 처리
-        if row.get('image_filename') and image_dict:
-            image_filename = row['image_filename']
-            image_data = image_dict.get(image_filename)
-            if image_data:
-                file_path = f'therapists/{center.name}/{therapist.name}/{image_filename}'
-                saved_path, cloudinary_url = self.save_image(image_data, file_path)
-                therapist.photo = saved_path
-                therapist.photo_url = cloudinary_url
-                therapist.save()
-                print(f"이미지 처리 성공: {file_path}")
-                if cloudinary_url:
-                    print(f"🌐 Cloudinary URL: {cloudinary_url}")
-            else:
-                print(f"이미지 처리 실패: {image_filename}")
-        
-        return therapist
-
+    def prepare_import_options(self, options):
+        return {'center': Center.objects.get(id=options['center_id'])}
+    
     def import_csv(self, request):
         if request.method != "POST":
             form = TherapistCsvImportForm()
@@ -881,38 +453,18 @@ class TherapistAdmin(CSVImportMixin, admin.ModelAdmin):
             data_rows, fieldnames = self.read_csv_data(csv_file)
             self.validate_required_fields(data_rows, ['name'])
             
-            # 이미지 추출
-            image_dict = self.extract_images_from_zip(image_zip)
-            
-            # 진행 상황 추적 초기화
-            self.init_progress_tracking(request, len(data_rows))
-            
-            # 배치 처리
-            for i, batch in self.process_batch(data_rows):
-                for row in batch:
-                    try:
-                        with transaction.atomic():  # 개별 row마다 독립적인 트랜잭션
-                            self.create_therapist_from_row(row, center, image_dict)
-                            self.update_progress(request, success=True)
-                    except Exception as e:
-                        self.update_progress(request, success=False, 
-                                           error_msg=str(e), 
-                                           row_num=i + batch.index(row) + 1)
-            
-            # 성공 응답
-            response = self.get_success_response(request)
-            self.clear_progress(request)
-            return response
+            return self.start_import_job(request, csv_file, image_zip, {'center_id': center.id})
             
         except Exception as e:
             return JsonResponse({'error': f'CSV 파일 처리 중 오류가 발생했습니다: {str(e)}'}, status=500)
 
 @admin.register(ExternalReview)
-class ExternalReviewAdmin(admin.ModelAdmin):
+class ExternalReviewAdmin(CSVImportMixin, admin.ModelAdmin):
     list_display = ('title', 'center', 'source', 'created_at')
     search_fields = ('title', 'source')
     list_filter = ('center', 'source', 'created_at')
     change_list_template = 'centers/admin/external_review_changelist.html'
+    csv_importer = ExternalReviewImporter
 
     def get_urls(self):
         urls = super().get_urls()
@@ -922,231 +474,39 @@ class ExternalReviewAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def import_csv_progress(self, request):
-        if request.method == 'GET':
-            progress = request.session.get('import_progress', {'total': 0, 'processed': 0})
-            return JsonResponse(progress)
-        return JsonResponse({'error': 'Invalid request method'})
-
+    def prepare_import_options(self, options):
+        return {'center': Center.objects.get(id=options['center_id'])}
+    
     def import_csv(self, request):
-        if request.method == "POST":
+        if request.method != "POST":
+            form = ExternalReviewCsvImportForm()
+            return render(request, "centers/admin/external_review_csv_form.html", {"form": form})
+        
+        try:
             csv_file = request.FILES.get("csv_file")
             center_id = request.POST.get("center")
             
-            print("=== CSV 업로드 시작 ===")
-            print(f"CSV 파일: {csv_file}")
-            print(f"상담소 ID: {center_id}")
+            self.validate_csv_file(csv_file)
+            if not center_id:
+                raise ValueError('상담소를 선택해주세요.')
             
-            if not csv_file:
-                print("오류: CSV 파일이 없습니다.")
-                return JsonResponse({'error': 'CSV 파일을 선택해주세요.'}, status=400)
-                
-            if not csv_file.name.endswith('.csv'):
-                print("오류: CSV 파일 형식이 아닙니다.")
-                return JsonResponse({'error': 'CSV 파일만 업로드 가능합니다.'}, status=400)
+            center = Center.objects.get(id=center_id)
             
-            if not center_id:
-                print("오류: 상담소가 선택되지 않았습니다.")
-                return JsonResponse({'error': '상담소를 선택해주세요.'}, status=400)
+            # CSV 데이터 읽기 및 검증
+            data_rows, fieldnames = self.read_csv_data(csv_file)
+            self.validate_required_fields(data_rows, ['title', 'url'])
             
-            try:
-                center = Center.objects.get(id=center_id)
-                print(f"선택된 상담소: {center.name}")
-                
-                # CSV 파일을 바이트로 읽기
-                csv_content = csv_file.read().decode('utf-8-sig')
-                
-                # CSV 리더 설정 - 따옴표로 묶인 데이터 처리
-                csv_reader = csv.DictReader(
-                    csv_content.splitlines(),
-                    quoting=csv.QUOTE_ALL,  # 모든 필드를 따옴표로 처리
-                    skipinitialspace=True  # 따옴표 안의 공백 유지
-                )
-                
-                # 데이터 행 읽기
-                data_rows = list(csv_reader)
-                
-                if not data_rows:
-                    print("오류: CSV 파일에 유효한 데이터가 없습니다.")
-                    return JsonResponse({'error': 'CSV 파일에 유효한 데이터가 없습니다.'}, status=400)
-                
-                print("CSV 필드명:", csv_reader.fieldnames)
-                print("첫 번째 행 데이터:", data_rows[0])
-                
-                # 필수 필드 확인
-                required_fields = ['title', 'url']
-                for row in data_rows:
-                    for field in required_fields:
-                        if field not in row or not row[field].strip():
-                            print(f"오류: 필수 필드 {field}가 누락되었습니다.")
-                            print(f"행 데이터: {row}")
-                            return JsonResponse({'error': f'필수 필드 {field}가 누락되었습니다.'}, status=400)
-                
-                # Initialize progress tracking
-                request.session['import_progress'] = {
-                    'total': len(data_rows),
-                    'processed': 0,
-                    'success': 0,
-                    'errors': []
-                }
-                print(f"처리할 총 행 수: {len(data_rows)}")
-                
-                # Process rows in batches
-                batch_size = 10
-                for i in range(0, len(data_rows), batch_size):
-                    batch = data_rows[i:i + batch_size]
-                    print(f"=== 배치 처리 시작 (행 {i+1} ~ {i+len(batch)}) ===")
-                    for row in batch:
-                        try:
-                            with transaction.atomic():  # 개별 row마다 독립적인 트랜잭션
-                                print(f"외부 리뷰 생성 시도: {row['title']}")
-                                # Create external review
-                                external_review = ExternalReview(
-                                    center=center,
-                                    title=row['title'].strip(),
-                                    url=row['url'].strip(),
-                                    summary=row.get('summary', '').strip(),
-                                    source=row.get('source', '').strip(),
-                                    likes=int(row.get('likes', 0) or 0),
-                                    dislikes=int(row.get('dislikes', 0) or 0)
-                                )
-
-                                # created_at 처리
-                                created_at = row.get('created_at', '').strip()
-                                if created_at:
-                                    try:
-                                        # Django의 기본 datetime 모듈 사용
-                                        external_review.created_at = datetime.strptime(created_at, '%Y-%m-%d %H:%M:%S')
-                                    except ValueError as e:
-                                        print(f"날짜 형식 오류: {created_at}")
-                                        raise ValueError("날짜 형식이 올바르지 않습니다. YYYY-MM-DD HH:MM:SS 형식을 사용해주세요. (예: 2024-03-15 14:30:00)")
-
-                                external_review.save()
-                                print(f"외부 리뷰 생성 성공: {external_review.title}")
-                                
-                                request.session['import_progress']['success'] += 1
-                        except Exception as e:
-                            print(f"오류 발생: {str(e)}")
-                            print(f"오류가 발생한 행: {row}")
-                            request.session['import_progress']['errors'].append({
-                                'row': i + batch.index(row) + 1,
-                                'error': str(e)
-                            })
-                        
-                        request.session['import_progress']['processed'] += 1
-                        request.session.modified = True
-                        print(f"진행 상황: {request.session['import_progress']['processed']}/{request.session['import_progress']['total']}")
-                
-                # Final success message
-                success_count = request.session['import_progress']['success']
-                error_count = len(request.session['import_progress']['errors'])
-                print(f"처리 완료: 성공 {success_count}, 실패 {error_count}")
-                
-                response_data = {
-                    'success': True,
-                    'message': f'CSV 파일이 성공적으로 업로드되었습니다. (성공: {success_count}, 실패: {error_count})',
-                    'redirect': '../'
-                }
-                
-                # Clear progress data
-                del request.session['import_progress']
-                
-                return JsonResponse(response_data)
-                
-            except Exception as e:
-                print(f"전체 처리 중 오류 발생: {str(e)}")
-                print(f"오류 상세 정보: {type(e).__name__}")
-                import traceback
-                print(traceback.format_exc())
-                return JsonResponse({'error': f'CSV 파일 처리 중 오류가 발생했습니다: {str(e)}'}, status=500)
-        
-        form = ExternalReviewCsvImportForm()
-        payload = {"form": form}
-        return render(
-            request, "centers/admin/external_review_csv_form.html", payload
-        )
+            return self.start_import_job(request, csv_file, options={'center_id': center.id})
+            
+        except Exception as e:
+            print(f"외부 리뷰 CSV 처리 중 오류: {str(e)}")
+            return JsonResponse({'error': f'CSV 파일 처리 중 오류가 발생했습니다: {str(e)}'}, status=500)
 
 @admin.register(CenterImage)
-class CenterImageAdmin(admin.ModelAdmin):
+class CenterImageAdmin(ManagedCenterPermissionMixin, admin.ModelAdmin):
     list_display = ('center', 'image', 'created_at')
     list_filter = ('center', 'created_at')
 
-    def get_queryset(self, request):
-        """사용자 권한에 따라 센터 이미지 목록을 필터링"""
-        qs = super().get_queryset(request)
-        
-        # 슈퍼유저는 모든 센터 이미지 접근 가능
-        if request.user.is_superuser:
-            return qs
-        
-        # 프로필이 없는 경우 빈 쿼리셋 반환
-        if not hasattr(request.user, 'profile'):
-            return qs.none()
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 센터 이미지 접근 가능
-        if profile.is_admin():
-            return qs
-        
-        # 센터운영자는 자신이 관리하는 센터의 이미지만 접근 가능
-        if profile.is_center_manager() and profile.managed_center:
-            return qs.filter(center=profile.managed_center)
-        
-        # 일반 사용자는 접근 불가
-        return qs.none()
-    
-    def has_add_permission(self, request):
-        """센터 이미지 추가 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if hasattr(request.user, 'profile'):
-            profile = request.user.profile
-            return profile.is_admin() or profile.is_center_manager()
-        
-        return False
-    
-    def has_change_permission(self, request, obj=None):
-        """센터 이미지 수정 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if not hasattr(request.user, 'profile'):
-            return False
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 센터 이미지 수정 가능
-        if profile.is_admin():
-            return True
-        
-        # 센터운영자는 자신이 관리하는 센터의 이미지만 수정 가능
-        if profile.is_center_manager() and obj:
-            return profile.managed_center == obj.center
-        
-        return False
-    
-    def has_delete_permission(self, request, obj=None):
-        """센터 이미지 삭제 권한 확인"""
-        if request.user.is_superuser:
-            return True
-        
-        if not hasattr(request.user, 'profile'):
-            return False
-        
-        profile = request.user.profile
-        
-        # 총관리자는 모든 센터 이미지 삭제 가능
-        if profile.is_admin():
-            return True
-        
-        # 센터운영자는 자신이 관리하는 센터의 이미지만 삭제 가능
-        if profile.is_center_manager() and obj:
-            return profile.managed_center == obj.center
-        
-        return False
-
 @admin.register(BackupHistory)
 class BackupHistoryAdmin(admin.ModelAdmin):
     list_display = ('filename', 'backup_type', 'status', 'file_size_kb', 'created_by', 'created_at')
@@ -1166,6 +526,26 @@ class BackupHistoryAdmin(admin.ModelAdmin):
     def has_change_permission(self, request, obj=None):
         return False  # 읽기 전용
 
+@admin.register(BackupCatalogEntry)
+class BackupCatalogEntryAdmin(admin.ModelAdmin):
+    list_display = ('filename', 'storage', 'kind', 'backup_mode', 'file_size_kb', 'created_at', 'synced_at')
+    list_filter = ('storage', 'kind', 'backup_mode')
+    search_fields = ('filename',)
+    readonly_fields = (
+        'filename', 'storage', 'kind', 'location', 'size', 'sha256', 'backup_format', 'backup_mode',
+        'models_count', 'extra', 'history', 'created_at', 'synced_at',
+    )
+    
+    def file_size_kb(self, obj):
+        return f"{obj.size / 1024:.1f} KB"
+    file_size_kb.short_description = "파일 크기"
+    
+    def has_add_permission(self, request):
+        return False  # 백업할 때와 sync_backup_catalog 명령으로만 기록
+    
+    def has_change_permission(self, request, obj=None):
+        return False  # 읽기 전용
+
 @admin.register(RestoreHistory)
 class RestoreHistoryAdmin(admin.ModelAdmin):
     list_display = ('filename', 'restore_type', 'status', 'file_size_kb', 'restored_by', 'created_at')
@@ -1184,3 +564,19 @@ class RestoreHistoryAdmin(admin.ModelAdmin):
     
     def has_change_permission(self, request, obj=None):
         return False  # 읽기 전용
+
+@admin.register(CloudinaryOutbox)
+class CloudinaryOutboxAdmin(admin.ModelAdmin):
+    list_display = ('action', 'status', 'target_model', 'target_id', 'public_id', 'attempts', 'next_attempt_at', 'created_at')
+    list_filter = ('action', 'status')
+    search_fields = ('public_id', 'file_name', 'last_error')
+    readonly_fields = (
+        'action', 'status', 'key', 'target_model', 'target_id', 'file_name', 'folder', 'public_id', 'url',
+        'attempts', 'next_attempt_at', 'locked_by', 'locked_until', 'last_error', 'created_at', 'processed_at',
+    )
+    
+    def has_add_permission(self, request):
+        return False  # 센터 관리 화면에서 자동 기록
+    
+    def has_change_permission(self, request, obj=None):
+        return False  # 읽기 전용 (실패 항목 재시도: drain_cloudinary_outbox --retry-failed)
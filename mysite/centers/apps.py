@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CentersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'centers'
+
+    def ready(self):
+        # 모델 변경 시 캐시 무효화 등을 처리하는 시그널 등록
+        from . import signals
@@ -0,0 +1,118 @@
+"""
+백업 목록 (BackupCatalogEntry)
+
+- record_uploads(): backup_data가 업로드 직후 위치, 크기, 체크섬, 모델별 레코드 수, 형식을 기록
+- sync_storage(): 원격 저장소의 파일 목록과 비교해 새 파일은 추가, 사라진 파일은 삭제, 바뀐 크기/위치는 갱신
+- entry_to_dict(): list_backups --json과 대시보드 JSON 응답 형식
+list_backups 명령과 백업 대시보드는 원격 API를 부르지 않고 이 표만 읽습니다.
+"""
+
+from django.db import transaction
+from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
+
+from .models import BackupCatalogEntry, BackupHistory
+
+SYNCABLE_STORAGES = ('local', 'github', 's3', 'http')
+
+
+def _format_from_filename(filename, kind):
+    if kind == 'media':
+        return 'tar.gz'
+    name = filename[:-3] if filename.endswith('.gz') else filename
+    return name.rsplit('.', 1)[-1] if '.' in name else ''
+
+
+def _mode_from_filename(filename):
+    return 'incremental' if '_incremental.' in filename else 'full'
+
+
+def record_uploads(storage_name, uploads, locations, history=None, metadata=None):
+    """업로드된 파일을 목록에 기록 (같은 저장소의 같은 파일명이면 갱신)"""
+    metadata = metadata or {}
+    now = timezone.now()
+    for upload in uploads:
+        if upload.name not in locations:
+            continue
+        is_data = upload.kind == 'data'
+        BackupCatalogEntry.objects.update_or_create(
+            storage=storage_name,
+            filename=upload.name,
+            defaults={
+                'kind': upload.kind,
+                'location': locations[upload.name],
+                'size': upload.size,
+                'sha256': upload.sha256,
+                'backup_format': metadata.get('backup_format', '') if is_data else 'tar.gz',
+                'backup_mode': metadata.get('backup_mode', ''),
+                'models_count': metadata.get('record_counts', {}) if is_data else {},
+                'history': history,
+                'created_at': now,
+                'synced_at': now,
+            },
+        )
+
+
+@transaction.atomic
+def sync_storage(storage):
+    """
+    storage(BackupStorage)의 파일 목록으로 해당 저장소 항목을 맞추고 {'added', 'updated', 'removed', 'total'}을 반환합니다.
+    새로 찾은 파일의 모델별 레코드 수는 같은 파일명의 성공한 BackupHistory에서 가져옵니다.
+    """
+    remote = {item['filename']: item for item in storage.list_files()}
+    existing = {entry.filename: entry for entry in BackupCatalogEntry.objects.filter(storage=storage.name)}
+    histories = {
+        history.filename: history
+        for history in BackupHistory.objects.filter(filename__in=list(set(remote) - set(existing)), status='success')
+    }
+    now = timezone.now()
+    added, updated, new_entries = 0, 0, []
+    for filename, item in remote.items():
+        entry = existing.pop(filename, None)
+        if entry is None:
+            history = histories.get(filename)
+            new_entries.append(BackupCatalogEntry(
+                storage=storage.name,
+                filename=filename,
+                kind=item['kind'],
+                location=item['location'],
+                size=item['size'],
+                backup_format=_format_from_filename(filename, item['kind']),
+                backup_mode=history.backup_mode if history else _mode_from_filename(filename),
+                models_count=history.models_count if history and item['kind'] == 'data' else {},
+                extra=item['extra'],
+                history=history,
+                created_at=item['modified'] or now,
+                synced_at=now,
+            ))
+            added += 1
+            continue
+        if entry.size != item['size'] or entry.location != item['location']:
+            # 원격 파일이 바뀌었으므로 기록해 둔 체크섬은 더 이상 맞지 않음
+            entry.size, entry.location, entry.sha256 = item['size'], item['location'], ''
+            updated += 1
+        entry.extra = item['extra'] or entry.extra
+        entry.synced_at = now
+        entry.save(update_fields=['size', 'location', 'sha256', 'extra', 'synced_at'])
+    BackupCatalogEntry.objects.bulk_create(new_entries)
+    removed, _ = BackupCatalogEntry.objects.filter(pk__in=[entry.pk for entry in existing.values()]).delete()
+    return {'added': added, 'updated': updated, 'removed': removed, 'total': len(remote)}
+
+
+def entry_to_dict(entry):
+    return {
+        'filename': entry.filename,
+        'storage': entry.storage,
+        'kind': entry.kind,
+        'location': entry.location,
+        'size': entry.size,
+        'size_display': filesizeformat(entry.size),
+        'sha256': entry.sha256,
+        'backup_format': entry.backup_format,
+        'backup_mode': entry.backup_mode,
+        'models_count': entry.models_count,
+        'total_records': sum(entry.models_count.values()),
+        'extra': entry.extra,
+        'created_at': entry.created_at.isoformat(),
+        'synced_at': entry.synced_at.isoformat() if entry.synced_at else None,
+    }
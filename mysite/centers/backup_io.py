@@ -0,0 +1,264 @@
+"""
+백업 파일 스트리밍 입출력
+모델별 QuerySet을 iterator(chunk_size)로 읽으면서 레코드를 바로 gzip 스트림(임시 파일)에 기록해
+레코드 수와 상관없이 메모리 사용량이 일정합니다. 저장소(GitHub/S3/Google Drive)는 이 파일을 읽으며 업로드합니다.
+복원할 때는 iter_backup_file()로 파일 전체를 json.load하지 않고 레코드 단위로 읽습니다.
+
+파일 구조는 기존 백업과 같아서 예전 백업/복원 코드와 호환됩니다.
+    {"Center": {"data": [{"model": ..., "pk": ..., "fields": {...}}, ...], "count": N}, ..., "_metadata": {...}}
+증분 백업은 모델 구역보다 앞에 삭제 목록 "_deletions": {"Review": [pk, ...], ...}을 둡니다.
+"""
+
+import gzip
+import io
+import json
+import os
+import tempfile
+
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+
+DEFAULT_CHUNK_SIZE = 1000
+COPY_BUFFER_SIZE = 1024 * 1024  # 1MB
+READ_BUFFER_SIZE = 64 * 1024
+
+
+class BackupFormatError(ValueError):
+    pass
+
+
+def iter_serialized(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    QuerySet을 chunk_size개씩 읽어 serializers.serialize('json')의 각 항목과 같은 dict로 변환합니다.
+    pk 순서로 읽어 인덱스를 타고, 한 번에 chunk_size개 객체만 메모리에 둡니다.
+    """
+    serializer = serializers.get_serializer('python')()
+    chunk = []
+    for obj in queryset.order_by('pk').iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            yield from serializer.serialize(chunk)
+            chunk = []
+    if chunk:
+        yield from serializer.serialize(chunk)
+
+
+class StreamingBackupWriter:
+    """
+    백업 파일을 모델 단위로 이어 쓰는 writer
+
+        with StreamingBackupWriter(path) as writer:
+            writer.write_model('Center', Center.objects.all())
+            writer.write_metadata({...})
+    """
+
+    def __init__(self, path, compress=True, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.compress = compress
+        self.chunk_size = chunk_size
+        self.counts = {}
+        self._file = None
+        self._first_key = True
+
+    def __enter__(self):
+        if self.compress:
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8', compresslevel=6)
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('{')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._file.write('\n}\n')
+        finally:
+            self._file.close()
+        return False
+
+    def _write_key(self, key):
+        self._file.write('\n' if self._first_key else ',\n')
+        self._file.write(json.dumps(key, ensure_ascii=False))
+        self._file.write(': ')
+        self._first_key = False
+
+    def write_model(self, name, queryset, data_format='json'):
+        """모델 레코드를 기록하고 레코드 수를 반환합니다"""
+        self._write_key(name)
+        if data_format == 'json':
+            count = 0
+            self._file.write('{"data": [')
+            for record in iter_serialized(queryset, self.chunk_size):
+                self._file.write('\n' if count == 0 else ',\n')
+                self._file.write(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False))
+                count += 1
+            self._file.write(f'\n], "count": {count}}}')
+        else:
+            # XML은 한 문자열로 저장되는 형식이므로 모델 단위로 만든 뒤 기록 (스트리밍은 JSON 형식만 지원)
+            stream = io.StringIO()
+            count = queryset.count()
+            serializers.serialize(data_format, queryset.order_by('pk').iterator(chunk_size=self.chunk_size), stream=stream)
+            self._file.write(json.dumps({'data': stream.getvalue(), 'count': count}, ensure_ascii=False))
+        self.counts[name] = count
+        return count
+
+    def write_section(self, key, value):
+        """모델 이외의 구역 기록 (키는 '_'로 시작, 예: 증분 백업의 '_deletions')"""
+        self._write_key(key)
+        self._file.write(json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False))
+
+    def write_metadata(self, metadata):
+        self.write_section('_metadata', metadata)
+
+
+def create_temp_path(suffix):
+    """백업 파일용 임시 경로 (호출한 쪽에서 삭제)"""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    return path
+
+
+def iter_file_chunks(path, chunk_size=COPY_BUFFER_SIZE):
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def write_base64_json_body(source_path, fields, data_key='data'):
+    """
+    {"...": ..., "data": "<파일 내용 base64>"} 형태의 JSON 요청 본문을 임시 파일에 만듭니다.
+    파일 전체를 메모리에 올리지 않고 3의 배수 크기 조각 단위로 인코딩합니다.
+    """
+    import base64
+
+    body_path = create_temp_path('.json')
+    # 3바이트 단위로 끊어야 조각별 base64 결과를 이어 붙여도 패딩이 중간에 생기지 않음
+    chunk_size = COPY_BUFFER_SIZE - COPY_BUFFER_SIZE % 3
+    with open(body_path, 'w', encoding='utf-8') as body:
+        body.write(json.dumps(fields, ensure_ascii=False)[:-1])
+        body.write(', ' if fields else '')
+        body.write(json.dumps(data_key) + ': "')
+        for chunk in iter_file_chunks(source_path, chunk_size):
+            body.write(base64.b64encode(chunk).decode('ascii'))
+        body.write('"}')
+    return body_path
+
+
+def open_backup_file(path_or_file):
+    """경로 또는 바이너리 파일 객체를 텍스트 스트림으로 열기 (gzip 여부는 매직 넘버로 판단)"""
+    raw = open(path_or_file, 'rb') if isinstance(path_or_file, (str, os.PathLike)) else path_or_file
+    is_gzip = raw.read(2) == b'\x1f\x8b'
+    raw.seek(0)
+    stream = gzip.GzipFile(fileobj=raw, mode='rb') if is_gzip else raw
+    return io.TextIOWrapper(stream, encoding='utf-8')
+
+
+class _JSONStreamReader:
+    """텍스트 스트림에서 JSON 값을 하나씩 읽는 간단한 점진적 파서 (버퍼에는 값 하나 정도만 유지)"""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.stream.read(READ_BUFFER_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자 (끝이면 '')"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise BackupFormatError(f"백업 파일 형식 오류: '{char}'이(가) 필요합니다.")
+        self.pos += 1
+
+    def skip_if(self, char):
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise BackupFormatError('백업 파일 형식 오류: JSON 값을 읽을 수 없습니다.')
+            # 숫자 등은 버퍼 끝에서 잘렸을 수 있으므로 더 읽은 뒤 다시 해석
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_backup_file(path_or_file):
+    """
+    백업 파일을 레코드 단위로 읽습니다. 다음 이벤트를 차례로 만듭니다.
+        ('model', 모델명, None)        모델 구역 시작
+        ('record', 모델명, dict)       JSON 레코드 하나 ({'model', 'pk', 'fields'})
+        ('xml', 모델명, str)           XML 형식 백업의 모델 데이터 전체
+        ('metadata', '_metadata', dict)   ('_deletions' 등 '_'로 시작하는 구역도 같은 형태)
+    예전(indent=2, count가 data보다 앞) 백업과 스트리밍 백업 모두 읽을 수 있습니다.
+    """
+    with open_backup_file(path_or_file) as stream:
+        reader = _JSONStreamReader(stream)
+        reader.expect('{')
+        if reader.skip_if('}'):
+            return
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            if key.startswith('_') or reader.peek() != '{':
+                yield ('metadata', key, reader.value())
+            else:
+                yield ('model', key, None)
+                yield from _iter_model_section(reader, key)
+            if not reader.skip_if(','):
+                break
+        reader.expect('}')
+
+
+def _iter_model_section(reader, model_name):
+    reader.expect('{')
+    if reader.skip_if('}'):
+        return
+    while True:
+        field = reader.value()
+        reader.expect(':')
+        if field == 'data' and reader.peek() == '[':
+            reader.expect('[')
+            if not reader.skip_if(']'):
+                while True:
+                    yield ('record', model_name, reader.value())
+                    if not reader.skip_if(','):
+                        break
+                reader.expect(']')
+        elif field == 'data':
+            yield ('xml', model_name, reader.value())
+        else:
+            reader.value()  # count 등은 복원 시 다시 계산
+        if not reader.skip_if(','):
+            break
+    reader.expect('}')
@@ -0,0 +1,569 @@
+"""
+백업 파일 저장소 (backup_data 명령이 사용)
+
+- BackupStorage.save(uploads): 데이터 파일과 미디어 아카이브를 스레드 풀로 동시에 업로드
+- 업로드마다 지수 백오프 재시도 (1초, 2초, 4초 ...), 업로드 후 sha256 또는 크기로 검증
+- 큰 파일은 조각 단위로 전송 (S3는 multipart, HTTP 대상은 Content-Range 조각이며 끊긴 위치부터 이어서 전송)
+- FanOutStorage: 기본 저장소와 보조 저장소(--mirror)에 동시에 기록
+- HTTPStorage: 간단한 조각 업로드 프로토콜의 HTTP 대상 (로컬 테스트용 fake_backup_server 명령과 짝)
+- list_files(): 저장소에 있는 백업 파일 목록 (sync_backup_catalog 명령이 백업 목록 표와 맞출 때 사용)
+"""
+
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+import requests
+
+from .backup_io import create_temp_path, write_base64_json_body
+from .incremental import file_sha256
+
+# boto3는 선택적 import (S3 사용시에만 필요)
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+UPLOAD_WORKERS = 4
+UPLOAD_RETRIES = 4  # 최대 시도 횟수
+RETRY_BASE_DELAY = 1.0  # 초
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # HTTP 조각 / S3 multipart 조각 크기
+MULTIPART_THRESHOLD = 16 * 1024 * 1024  # 이보다 큰 파일은 S3 multipart
+
+
+class StorageError(Exception):
+    """저장소 설정 오류 또는 업로드/검증 실패"""
+
+
+def backup_file_kind(filename):
+    """백업 파일명이면 'data' 또는 'media', 아니면 None"""
+    if filename.startswith('backup_') and (filename.endswith('.gz') or filename.endswith('.json') or filename.endswith('.xml')):
+        return 'data'
+    if filename.startswith('media_') and filename.endswith('.tar.gz'):
+        return 'media'
+    return None
+
+
+class Upload:
+    """업로드할 로컬 파일 (kind: data 또는 media)"""
+
+    def __init__(self, path, name, content_type='application/gzip', kind='data'):
+        self.path = path
+        self.name = name
+        self.content_type = content_type
+        self.kind = kind
+        self.size = os.path.getsize(path)
+        self._sha256 = None
+
+    def compute_digest(self):
+        """파일의 sha256을 계산해 둠 (이미 계산했으면 재사용). 임시 파일을 지우기 전에 호출해야 함"""
+        if self._sha256 is None:
+            self._sha256 = file_sha256(self.path)
+        return self._sha256
+
+    @property
+    def sha256(self):
+        return self.compute_digest()
+
+
+def call_with_retries(func, label, attempts=None, log=print):
+    """func()를 지수 백오프로 재시도하고 마지막 시도의 예외는 그대로 올림"""
+    attempts = attempts or getattr(settings, 'BACKUP_UPLOAD_RETRIES', UPLOAD_RETRIES)
+    for attempt in range(1, attempts + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= attempts:
+                raise
+            delay = RETRY_BASE_DELAY * (2 ** (attempt - 1))
+            log(f'⚠️ {label} 실패 ({attempt}/{attempts}), {delay:.0f}초 후 재시도: {e}')
+            time.sleep(delay)
+
+
+def run_concurrently(func, items, workers=None):
+    """items마다 func(item)을 스레드 풀에서 실행하고 [(item, 결과, 예외)]를 입력 순서대로 반환"""
+    items = list(items)
+    workers = min(workers or getattr(settings, 'BACKUP_UPLOAD_WORKERS', UPLOAD_WORKERS), len(items)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    results = []
+    for item, future in zip(items, futures):
+        error = future.exception()
+        results.append((item, None if error else future.result(), error))
+    return results
+
+
+class BackupStorage:
+    """
+    저장소 공통 동작. 하위 클래스는 upload()(위치 반환)와 필요하면 prepare()/verify()를 구현합니다.
+
+        locations = storage.save([Upload(data_path, 'backup_....json.gz')], timestamp)
+    """
+
+    name = ''
+    label = ''
+    supports_media = True
+
+    def __init__(self, log=print):
+        self.log = log
+
+    def prepare(self, uploads, timestamp):
+        """업로드 전 한 번 실행 (GitHub 릴리스 생성 등)"""
+
+    def upload(self, upload):
+        raise NotImplementedError
+
+    def verify(self, upload, location):
+        """업로드된 내용이 로컬 파일과 같은지 확인 (다르면 StorageError)"""
+
+    def list_files(self):
+        """[{'filename', 'kind', 'size', 'modified'(aware datetime), 'location', 'extra'}] (목록 조회를 지원하지 않으면 NotImplementedError)"""
+        raise NotImplementedError(f'{self.label}은 파일 목록 조회를 지원하지 않습니다.')
+
+    def save(self, uploads, timestamp):
+        """모든 파일을 동시에 업로드하고 {파일명: 위치}를 반환 (하나라도 실패하면 StorageError)"""
+        skipped = [upload.name for upload in uploads if upload.kind == 'media' and not self.supports_media]
+        if skipped:
+            self.log(f"⚠️ {self.label}은 미디어 아카이브를 저장하지 않습니다: {', '.join(skipped)}")
+        uploads = [upload for upload in uploads if upload.name not in skipped]
+        call_with_retries(lambda: self.prepare(uploads, timestamp), f'{self.label} 준비', log=self.log)
+
+        locations, errors = {}, []
+        for upload, location, error in run_concurrently(self._upload_verified, uploads):
+            if error:
+                errors.append(f'{upload.name}: {error}')
+            else:
+                locations[upload.name] = location
+        if errors:
+            raise StorageError(f"{self.label} 업로드 실패 - {'; '.join(errors)}")
+        return locations
+
+    def _upload_verified(self, upload):
+        def attempt():
+            location = self.upload(upload)
+            self.verify(upload, location)
+            return location
+
+        started = time.monotonic()
+        location = call_with_retries(attempt, f'{self.label} 업로드 ({upload.name})', log=self.log)
+        self.log(f'{self.label}에 저장 완료: {location} ({upload.size / 1024 / 1024:.1f}MB, {time.monotonic() - started:.1f}초)')
+        return location
+
+
+class LocalStorage(BackupStorage):
+    name = 'local'
+    label = '로컬'
+
+    def __init__(self, backup_dir=None, log=print):
+        super().__init__(log)
+        self.backup_dir = backup_dir or os.path.join(settings.BASE_DIR, 'backups')
+
+    def upload(self, upload):
+        os.makedirs(self.backup_dir, exist_ok=True)
+        dest = os.path.join(self.backup_dir, upload.name)
+        # 원본은 다른 저장소도 읽을 수 있으므로 이동하지 않고 복사 (임시 이름으로 쓴 뒤 교체)
+        temp_dest = f'{dest}.part'
+        shutil.copyfile(upload.path, temp_dest)
+        os.replace(temp_dest, dest)
+        return dest
+
+    def verify(self, upload, location):
+        if file_sha256(location) != upload.sha256:
+            raise StorageError(f'체크섬 불일치: {location}')
+
+    def list_files(self):
+        if not os.path.isdir(self.backup_dir):
+            return []
+        files = []
+        for entry in os.scandir(self.backup_dir):
+            kind = backup_file_kind(entry.name)
+            if kind and entry.is_file():
+                stat = entry.stat()
+                files.append({
+                    'filename': entry.name,
+                    'kind': kind,
+                    'size': stat.st_size,
+                    'modified': datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc),
+                    'location': entry.path,
+                    'extra': {},
+                })
+        return files
+
+
+class GitHubStorage(BackupStorage):
+    """
+    GitHub Releases: 백업마다 릴리스를 만들고 파일을 asset으로 업로드.
+    asset 업로드 API는 조각 전송을 지원하지 않으므로 재시도 시 중간에 끊긴 asset을 지우고 처음부터 다시 올림
+    """
+
+    name = 'github'
+    label = 'GitHub'
+    api_url = 'https://api.github.com'
+
+    def __init__(self, repo, token, log=print):
+        super().__init__(log)
+        self.repo = repo
+        self.headers = {
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        self.release = None
+
+    def prepare(self, uploads, timestamp):
+        if self.release is not None:
+            return
+        tag_name = f'backup-{timestamp}'
+        response = requests.get(f'{self.api_url}/repos/{self.repo}/releases/tags/{tag_name}', headers=self.headers, timeout=30)
+        if response.status_code == 200:
+            # 이전 시도에서 이미 만든 릴리스 (재시도)
+            self.release = response.json()
+            return
+        data_files = [upload.name for upload in uploads if upload.kind == 'data']
+        media_files = [upload.name for upload in uploads if upload.kind == 'media']
+        response = requests.post(
+            f'{self.api_url}/repos/{self.repo}/releases',
+            headers=self.headers,
+            json={
+                'tag_name': tag_name,
+                'name': f'Complete Backup {timestamp}',
+                'body': f'''자동 백업 생성일: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+📊 **백업 내용:**
+- 데이터베이스: {', '.join(data_files)}
+- 미디어 파일: {', '.join(media_files) or "미디어 블롭 저장소(media-blobs 릴리스) 또는 미디어 파일 없음"}
+
+⚠️ **복원 시 주의사항:**
+- 미디어 아카이브가 있으면 두 파일을 모두 다운로드하여 복원해야 완전한 복원이 가능합니다''',
+                'draft': False,
+                'prerelease': True
+            },
+            timeout=30,
+        )
+        if response.status_code != 201:
+            raise StorageError(f'Release 생성 실패: {response.status_code} - {response.text}')
+        self.release = response.json()
+
+    def list_files(self):
+        files, page = [], 1
+        while True:
+            response = requests.get(
+                f'{self.api_url}/repos/{self.repo}/releases',
+                headers=self.headers, params={'per_page': 100, 'page': page}, timeout=30,
+            )
+            if response.status_code != 200:
+                raise StorageError(f'GitHub API 호출 실패: {response.status_code}')
+            releases = response.json()
+            for release in releases:
+                if not release['tag_name'].startswith('backup-'):
+                    continue
+                for asset in release.get('assets', []):
+                    kind = backup_file_kind(asset['name'])
+                    if kind:
+                        files.append({
+                            'filename': asset['name'],
+                            'kind': kind,
+                            'size': asset['size'],
+                            'modified': parse_datetime(asset['updated_at']),
+                            'location': asset['browser_download_url'],
+                            'extra': {
+                                'release_tag': release['tag_name'],
+                                'release_name': release['name'],
+                                'download_count': asset.get('download_count', 0),
+                            },
+                        })
+            if len(releases) < 100:
+                return files
+            page += 1
+
+    def _existing_asset(self, name):
+        response = requests.get(
+            f"{self.api_url}/repos/{self.repo}/releases/{self.release['id']}/assets",
+            headers=self.headers, params={'per_page': 100}, timeout=30,
+        )
+        response.raise_for_status()
+        return next((asset for asset in response.json() if asset['name'] == name), None)
+
+    def upload(self, upload):
+        asset = self._existing_asset(upload.name)
+        if asset is not None:
+            if asset.get('state') == 'uploaded' and asset.get('size') == upload.size:
+                return asset['browser_download_url']
+            requests.delete(asset['url'], headers=self.headers, timeout=30).raise_for_status()
+
+        upload_url = self.release['upload_url'].replace('{?name,label}', '')
+        # 파일 객체를 넘기면 requests가 조각 단위로 읽어 전송
+        with open(upload.path, 'rb') as f:
+            response = requests.post(
+                f'{upload_url}?name={upload.name}',
+                headers={**self.headers, 'Content-Type': upload.content_type},
+                data=f,
+                timeout=600,
+            )
+        if response.status_code != 201:
+            raise StorageError(f'파일 업로드 실패: {response.status_code}')
+        asset = response.json()
+        if asset.get('size') != upload.size:
+            raise StorageError(f"크기 불일치: {asset.get('size')} != {upload.size}")
+        # GitHub가 계산한 sha256이 있으면 비교
+        if asset.get('digest') and asset['digest'] != f'sha256:{upload.sha256}':
+            raise StorageError(f"체크섬 불일치: {asset['digest']}")
+        return asset['browser_download_url']
+
+
+class S3Storage(BackupStorage):
+    """S3: 큰 파일은 boto3 multipart(조각 동시 전송), 업로드 후 HEAD로 크기와 sha256 메타데이터 확인"""
+
+    name = 's3'
+    label = 'S3'
+
+    def __init__(self, client, bucket, log=print):
+        super().__init__(log)
+        self.client = client
+        self.bucket = bucket
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=UPLOAD_CHUNK_SIZE,
+            max_concurrency=UPLOAD_WORKERS,
+        )
+
+    def upload(self, upload):
+        key = f'backups/{upload.name}'
+        self.client.upload_file(
+            upload.path,
+            self.bucket,
+            key,
+            ExtraArgs={
+                'ContentType': upload.content_type,
+                'Metadata': {
+                    'backup-type': f'django-{upload.kind}',
+                    'timestamp': datetime.now().isoformat(),
+                    'sha256': upload.sha256,
+                }
+            },
+            Config=self.transfer_config,
+        )
+        return f's3://{self.bucket}/{key}'
+
+    def list_files(self):
+        files = []
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix='backups/'):
+            for obj in page.get('Contents', []):
+                filename = os.path.basename(obj['Key'])
+                kind = backup_file_kind(filename)
+                if kind:
+                    files.append({
+                        'filename': filename,
+                        'kind': kind,
+                        'size': obj['Size'],
+                        'modified': obj['LastModified'],
+                        'location': f"s3://{self.bucket}/{obj['Key']}",
+                        'extra': {'s3_key': obj['Key']},
+                    })
+        return files
+
+    def verify(self, upload, location):
+        head = self.client.head_object(Bucket=self.bucket, Key=f'backups/{upload.name}')
+        if head['ContentLength'] != upload.size or head.get('Metadata', {}).get('sha256') != upload.sha256:
+            raise StorageError(f'업로드 검증 실패: {location}')
+
+
+class GoogleDriveStorage(BackupStorage):
+    """Google Drive Webhook: 데이터 파일만 base64 JSON으로 전송 (수신 쪽 검증용 sha256 포함)"""
+
+    name = 'google_drive'
+    label = 'Google Drive'
+    supports_media = False
+
+    def __init__(self, webhook_url, log=print):
+        super().__init__(log)
+        self.webhook_url = webhook_url
+
+    def upload(self, upload):
+        # Webhook 요청 본문을 파일로 만든 뒤 스트리밍 전송 (base64 인코딩도 조각 단위로 처리)
+        body_path = write_base64_json_body(upload.path, {
+            'filename': upload.name,
+            'compressed': upload.name.endswith('.gz'),
+            'timestamp': datetime.now().isoformat(),
+            'size': upload.size,
+            'sha256': upload.sha256,
+        })
+        try:
+            with open(body_path, 'rb') as body:
+                response = requests.post(
+                    self.webhook_url, data=body, headers={'Content-Type': 'application/json'}, timeout=120
+                )
+            response.raise_for_status()
+        finally:
+            os.remove(body_path)
+        return upload.name
+
+
+class HTTPStorage(BackupStorage):
+    """
+    조각 업로드 HTTP 대상 (BACKUP_HTTP_URL)
+    - HEAD {url}/{name}: Upload-Offset(받은 바이트 수), 완료된 파일이면 X-Checksum-Sha256
+    - PUT {url}/{name} + Content-Range: bytes start-end/total: 조각 추가 (start가 받은 크기와 다르면 409)
+    - GET {url}/: 파일 목록 JSON
+    재시도하면 서버가 받은 위치부터 이어서 보냅니다.
+    """
+
+    name = 'http'
+    label = 'HTTP'
+
+    def __init__(self, base_url, token=None, chunk_size=UPLOAD_CHUNK_SIZE, log=print):
+        super().__init__(log)
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Authorization': f'Bearer {token}'} if token else {}
+        self.chunk_size = chunk_size
+
+    def _url(self, name):
+        return f'{self.base_url}/{name}'
+
+    def _head(self, name):
+        response = requests.head(self._url(name), headers=self.headers, timeout=30)
+        if response.status_code == 404:
+            return 0, None
+        response.raise_for_status()
+        return int(response.headers.get('Upload-Offset', 0)), response.headers.get('X-Checksum-Sha256')
+
+    def upload(self, upload):
+        offset, checksum = self._head(upload.name)
+        if offset > upload.size or (checksum and checksum != upload.sha256):
+            # 다른 내용의 같은 이름 파일: 처음부터 다시 올림
+            requests.delete(self._url(upload.name), headers=self.headers, timeout=30).raise_for_status()
+            offset = 0
+        elif offset:
+            self.log(f'{upload.name}: {offset}바이트 이후부터 이어서 업로드')
+        with open(upload.path, 'rb') as f:
+            while offset < upload.size:
+                f.seek(offset)
+                chunk = f.read(self.chunk_size)
+                # 조각마다 재시도 (실패한 조각만 다시 보내고, 파일 전체 시도 횟수는 쓰지 않음)
+                offset = call_with_retries(
+                    lambda: self._put_chunk(upload, offset, chunk), f'{upload.name} 조각 ({offset}바이트~)', log=self.log
+                )
+        return self._url(upload.name)
+
+    def _put_chunk(self, upload, offset, chunk):
+        """조각 하나를 보내고 서버가 받은 크기를 반환 (서버 위치가 다르면 그 위치부터 다시 보내도록 반환)"""
+        response = requests.put(
+            self._url(upload.name),
+            data=chunk,
+            headers={
+                **self.headers,
+                'Content-Type': upload.content_type,
+                'Content-Range': f'bytes {offset}-{offset + len(chunk) - 1}/{upload.size}',
+            },
+            timeout=120,
+        )
+        if response.status_code == 409:
+            return int(response.headers.get('Upload-Offset', 0))
+        response.raise_for_status()
+        return offset + len(chunk)
+
+    def list_files(self):
+        """GET {url}/ 응답: [{'name', 'size', 'modified'(ISO 8601)}]"""
+        response = requests.get(f'{self.base_url}/', headers=self.headers, timeout=30)
+        response.raise_for_status()
+        files = []
+        for item in response.json():
+            kind = backup_file_kind(item['name'])
+            if kind:
+                files.append({
+                    'filename': item['name'],
+                    'kind': kind,
+                    'size': item['size'],
+                    'modified': parse_datetime(item['modified']),
+                    'location': self._url(item['name']),
+                    'extra': {},
+                })
+        return files
+
+    def verify(self, upload, location):
+        offset, checksum = self._head(upload.name)
+        if offset != upload.size or checksum != upload.sha256:
+            raise StorageError(f'업로드 검증 실패: {location} ({offset}/{upload.size}바이트)')
+
+
+class FanOutStorage(BackupStorage):
+    """기본 저장소와 보조 저장소들에 동시에 기록 (보조 저장소 실패는 경고만 하고 백업은 성공으로 처리)"""
+
+    def __init__(self, primary, mirrors, log=print):
+        super().__init__(log)
+        self.primary = primary
+        self.mirrors = list(mirrors)
+        self.name = primary.name
+        self.label = primary.label
+        self.failed_mirrors = []
+        self.mirror_locations = {}  # 저장소 이름 -> {파일명: 위치} (성공한 보조 저장소만)
+
+    def save(self, uploads, timestamp):
+        targets = [self.primary] + self.mirrors
+        results = run_concurrently(lambda storage: storage.save(uploads, timestamp), targets, workers=len(targets))
+        for storage, locations, error in results[1:]:
+            if error:
+                self.failed_mirrors.append(storage.name)
+                self.log(f'⚠️ 보조 저장소 {storage.label} 저장 실패: {error}')
+            else:
+                self.mirror_locations[storage.name] = locations
+        storage, locations, error = results[0]
+        if error:
+            raise error
+        return locations
+
+
+def get_backup_storage(name, log=print, repo=None, token=None):
+    """저장소 이름으로 BackupStorage 생성 (설정이 없으면 StorageError)"""
+    if name == 'local':
+        return LocalStorage(log=log)
+    if name == 'github':
+        repo = repo or getattr(settings, 'GITHUB_BACKUP_REPO', None) or os.getenv('GITHUB_BACKUP_REPO')
+        token = token or getattr(settings, 'GITHUB_TOKEN', None) or os.getenv('GITHUB_TOKEN')
+        if not repo or not token:
+            raise StorageError('GitHub 백업을 위해서는 GITHUB_TOKEN과 GITHUB_BACKUP_REPO가 필요합니다.')
+        return GitHubStorage(repo, token, log=log)
+    if name == 's3':
+        if not HAS_BOTO3:
+            raise StorageError('S3 백업을 위해서는 boto3 패키지가 필요합니다. pip install boto3')
+        aws_access_key = getattr(settings, 'AWS_ACCESS_KEY_ID', None)
+        aws_secret_key = getattr(settings, 'AWS_SECRET_ACCESS_KEY', None)
+        bucket_name = getattr(settings, 'AWS_BACKUP_BUCKET_NAME', None)
+        if not all([aws_access_key, aws_secret_key, bucket_name]):
+            raise StorageError('AWS 설정이 완료되지 않았습니다. settings에서 AWS 설정을 확인하세요.')
+        client = boto3.client(
+            's3',
+            aws_access_key_id=aws_access_key,
+            aws_secret_access_key=aws_secret_key,
+            region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2')
+        )
+        return S3Storage(client, bucket_name, log=log)
+    if name == 'google_drive':
+        webhook_url = getattr(settings, 'GOOGLE_DRIVE_WEBHOOK_URL', None)
+        if not webhook_url:
+            raise StorageError('Google Drive Webhook URL이 설정되지 않았습니다.')
+        return GoogleDriveStorage(webhook_url, log=log)
+    if name == 'http':
+        base_url = getattr(settings, 'BACKUP_HTTP_URL', None)
+        if not base_url:
+            raise StorageError('HTTP 백업을 위해서는 BACKUP_HTTP_URL이 필요합니다.')
+        return HTTPStorage(base_url, token=getattr(settings, 'BACKUP_HTTP_TOKEN', None), log=log)
+    raise StorageError(f'알 수 없는 저장소입니다: {name}')
+
+
+def download_http_file(name, log=print):
+    """HTTP 대상에서 백업 파일을 임시 파일로 내려받습니다 (restore_data --storage http)"""
+    storage = get_backup_storage('http', log=log)
+    download_path = create_temp_path(suffix=f'_{os.path.basename(name)}')
+    with requests.get(storage._url(name), headers=storage.headers, stream=True, timeout=120) as response:
+        response.raise_for_status()
+        with open(download_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                f.write(chunk)
+    return download_path
@@ -0,0 +1,202 @@
+"""
+Cloudinary 업로드/삭제 아웃박스 (CloudinaryOutbox 테이블)
+
+CenterManagementView는 트랜잭션 안에서 Cloudinary를 호출하지 않고 할 일만 기록(record_upload/record_delete)한 뒤 바로 응답합니다.
+같은 트랜잭션에서 처리 작업(centers.cloudinary_outbox, run_worker가 실행)도 등록하므로 롤백되면 어느 쪽도 남지 않습니다.
+
+- 삭제: public_id를 모아 delete_resources로 BATCH_SIZE(100)개씩 한 번에 삭제 (not_found도 완료로 처리)
+- 업로드: 저장소의 로컬 파일을 public_id '<폴더>/<항목 key>'로 동시에 올림 (덮어쓰기라 재시도해도 중복 없음).
+  대상 객체의 파일이 그대로면 URL 필드를 채우고, 그사이 객체가 지워졌거나 파일이 바뀌었으면 올린 이미지를 삭제 대기열에 넣음
+- 재시도: 실패하면 지수 백오프(next_attempt_at)로 MAX_ATTEMPTS까지 다시 시도하고, 이후 failed로 남김 (관리자 화면)
+- 항목은 임대(locked_by/locked_until)해서 가져가므로 워커가 여럿이어도 같은 항목을 동시에 처리하지 않음
+- 수동 처리: python manage.py drain_cloudinary_outbox
+"""
+
+import uuid
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.runner import enqueue
+
+from .backup_storage import run_concurrently
+from .models import CloudinaryOutbox
+from .utils import delete_images_from_cloudinary, public_id_from_url, upload_image_to_cloudinary
+
+DRAIN_JOB_KIND = 'centers.cloudinary_outbox'
+BATCH_SIZE = 100  # delete_resources 한 번에 삭제할 수 있는 최대 개수
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 30  # 초 (30초, 60초, 120초 ...)
+LEASE = timedelta(minutes=5)
+DELETE_DONE_RESULTS = ('deleted', 'not_found', 'skipped')
+
+# 업로드 대상 모델: (파일 필드, URL 필드)
+UPLOAD_FIELDS = {
+    'centers.therapist': ('photo', 'photo_url'),
+    'centers.centerimage': ('image', 'image_url'),
+}
+
+
+def record_upload(instance, folder):
+    """instance의 로컬 파일을 Cloudinary에 올리고 URL 필드를 채우도록 기록 (instance는 저장된 상태여야 함)"""
+    label = instance._meta.label_lower
+    file_field, _ = UPLOAD_FIELDS[label]
+    return CloudinaryOutbox.objects.create(
+        action=CloudinaryOutbox.ACTION_UPLOAD,
+        target_model=label,
+        target_id=instance.pk,
+        file_name=getattr(instance, file_field).name,
+        folder=folder,
+    )
+
+
+def record_delete(url=None, public_id=None):
+    """Cloudinary 이미지(URL 또는 public_id) 삭제를 기록 (Cloudinary URL이 아니면 아무것도 하지 않음)"""
+    public_id = public_id or public_id_from_url(url)
+    if not public_id:
+        return None
+    return CloudinaryOutbox.objects.create(action=CloudinaryOutbox.ACTION_DELETE, public_id=public_id)
+
+
+def schedule_drain(run_after=None):
+    """처리 작업을 등록 (이미 대기 중이면 실행 시각만 앞당김). 호출한 트랜잭션과 함께 커밋됨"""
+    run_after = run_after or timezone.now()
+    queued = Job.objects.filter(kind=DRAIN_JOB_KIND, status=Job.STATUS_QUEUED)
+    if queued.exists():
+        queued.filter(run_after__gt=run_after).update(run_after=run_after)
+        return
+    enqueue(DRAIN_JOB_KIND, run_after=run_after)
+
+
+class OutboxDrainer:
+    """대기 중인 아웃박스 항목을 삭제는 묶어서, 업로드는 동시에 처리"""
+
+    def __init__(self, batch_size=None, workers=None, log=print):
+        self.batch_size = min(batch_size or BATCH_SIZE, BATCH_SIZE)
+        self.workers = workers or getattr(settings, 'IMAGE_UPLOAD_WORKERS', 8)
+        self.log = log
+        self.stats = {'deleted': 0, 'uploaded': 0, 'skipped': 0, 'retried': 0, 'failed': 0}
+
+    def drain(self, ctx=None):
+        """처리할 항목이 없을 때까지 반복하고 통계를 반환. 재시도 대기 항목이 남으면 그 시각에 다시 실행되도록 등록"""
+        while True:
+            deletes = self.claim(CloudinaryOutbox.ACTION_DELETE)
+            if deletes:
+                self.process_deletes(deletes)
+            uploads = self.claim(CloudinaryOutbox.ACTION_UPLOAD)
+            if uploads:
+                self.process_uploads(uploads)
+            if not deletes and not uploads:
+                break
+            if ctx is not None:
+                ctx.advance(count=len(deletes) + len(uploads))
+
+        next_attempt = CloudinaryOutbox.objects.filter(
+            status=CloudinaryOutbox.STATUS_PENDING
+        ).aggregate(next_at=Min('next_attempt_at'))['next_at']
+        if next_attempt is not None:
+            schedule_drain(run_after=next_attempt)
+        return dict(self.stats)
+
+    def claim(self, action):
+        """처리할 항목을 최대 batch_size개 임대해서 가져옴 (조건부 UPDATE라 다른 워커와 겹치지 않음)"""
+        now = timezone.now()
+        available = CloudinaryOutbox.objects.filter(
+            status=CloudinaryOutbox.STATUS_PENDING, action=action, next_attempt_at__lte=now
+        ).filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+        ids = list(available.order_by('id').values_list('pk', flat=True)[:self.batch_size])
+        if not ids:
+            return []
+        token = uuid.uuid4().hex
+        available.filter(pk__in=ids).update(locked_by=token, locked_until=now + LEASE)
+        return list(CloudinaryOutbox.objects.filter(locked_by=token).order_by('id'))
+
+    def process_deletes(self, items):
+        result = delete_images_from_cloudinary([item.public_id for item in items])
+        if not result['success']:
+            for item in items:
+                self.retry_later(item, result.get('error', '알 수 없는 오류'))
+            return
+        done = []
+        for item in items:
+            outcome = result['deleted'].get(item.public_id)
+            if outcome in DELETE_DONE_RESULTS:
+                done.append(item.pk)
+            else:
+                self.retry_later(item, f'삭제 결과: {outcome}')
+        self.mark_done(done)
+        self.stats['deleted'] += len(done)
+        self.log(f'🗑️ Cloudinary 이미지 {len(done)}/{len(items)}개 삭제')
+
+    def process_uploads(self, items):
+        # 대상 객체가 지워졌거나 파일이 바뀐 항목은 올리지 않음 (새 파일의 업로드가 따로 기록됨)
+        current = [item for item in items if self.target_queryset(item).exists()]
+        superseded = [item.pk for item in items if item not in current]
+        self.mark_done(superseded)
+        self.stats['skipped'] += len(superseded)
+
+        for item, result, error in run_concurrently(self.upload, current, workers=self.workers):
+            if error:
+                self.retry_later(item, error)
+            else:
+                self.apply_upload(item, *result)
+
+    def upload(self, item):
+        """스레드에서 실행: 저장소 파일을 읽어 업로드하고 (URL, public_id) 반환 (DB는 사용하지 않음)"""
+        with default_storage.open(item.file_name, 'rb') as image_file:
+            result = upload_image_to_cloudinary(image_file, folder=item.folder, public_id=str(item.key))
+        if not result['success']:
+            raise RuntimeError(result.get('error', '알 수 없는 오류'))
+        return result.get('url'), result.get('public_id')
+
+    def apply_upload(self, item, url, public_id):
+        """업로드 결과를 대상 객체에 반영하고 항목을 완료 처리 (한 트랜잭션)"""
+        _, url_field = UPLOAD_FIELDS[item.target_model]
+        with transaction.atomic():
+            target = self.target_queryset(item).select_for_update().first() if url else None
+            if target is not None:
+                setattr(target, url_field, url)
+                # 시그널로 페이지 캐시/자동완성도 갱신. updated_at도 함께 저장해야 증분 백업에 포함됨
+                target.save(update_fields=[url_field, 'updated_at'])
+            elif url:
+                # 업로드하는 사이 객체가 지워졌거나 파일이 바뀜: 올린 이미지는 정리
+                record_delete(public_id=public_id)
+            CloudinaryOutbox.objects.filter(pk=item.pk).update(
+                status=CloudinaryOutbox.STATUS_DONE, url=url or '', public_id=public_id or '',
+                processed_at=timezone.now(), locked_by='', locked_until=None,
+            )
+        self.stats['uploaded'] += 1
+        self.log(f'✅ Cloudinary 업로드 완료: {item.target_model}#{item.target_id} -> {url or "로컬 저장소만 사용"}')
+
+    def target_queryset(self, item):
+        file_field, _ = UPLOAD_FIELDS[item.target_model]
+        model = apps.get_model(item.target_model)
+        return model.objects.filter(pk=item.target_id, **{file_field: item.file_name})
+
+    def mark_done(self, ids):
+        if ids:
+            CloudinaryOutbox.objects.filter(pk__in=ids).update(
+                status=CloudinaryOutbox.STATUS_DONE, processed_at=timezone.now(), locked_by='', locked_until=None,
+            )
+
+    def retry_later(self, item, error):
+        attempts = item.attempts + 1
+        if attempts >= MAX_ATTEMPTS:
+            status, next_attempt_at = CloudinaryOutbox.STATUS_FAILED, item.next_attempt_at
+            self.stats['failed'] += 1
+            self.log(f'❌ Cloudinary 작업 실패 ({attempts}회 시도): {item} - {error}')
+        else:
+            delay = RETRY_BASE_DELAY * (2 ** (attempts - 1))
+            status, next_attempt_at = CloudinaryOutbox.STATUS_PENDING, timezone.now() + timedelta(seconds=delay)
+            self.stats['retried'] += 1
+            self.log(f'⚠️ Cloudinary 작업 실패 ({attempts}/{MAX_ATTEMPTS}), {delay}초 후 재시도: {item} - {error}')
+        CloudinaryOutbox.objects.filter(pk=item.pk).update(
+            status=status, attempts=attempts, next_attempt_at=next_attempt_at, last_error=str(error),
+            locked_by='', locked_until=None,
+        )
@@ -0,0 +1,113 @@
+"""
+지도 마커 서버 사이드 클러스터링
+줌 레벨별로 Web Mercator 픽셀 격자에 센터를 모아 격자마다 중심점과 개수를 계산합니다.
+결과는 전체 줌 레벨을 한 항목으로 2단계 캐시(tiered_cache)에 저장되며, Center가 저장/삭제되면 버전을 올려 무효화합니다.
+"""
+
+import math
+
+from django.core.cache import cache
+
+MIN_ZOOM = 0
+MAX_CLUSTER_ZOOM = 16  # 이 줌 레벨보다 크면 클러스터링 없이 개별 센터 반환
+
+# 클러스터 격자 한 칸의 크기 (화면 픽셀 기준)
+CLUSTER_CELL_PX = 60
+TILE_SIZE = 256
+
+CACHE_VERSION_KEY = 'center_clusters:version'
+CACHE_TIMEOUT = 60 * 60  # 1시간 (다른 워커의 무효화를 놓쳐도 이 시간 안에 갱신)
+
+
+def _project(lat, lng, zoom):
+    """위도/경도를 해당 줌 레벨의 Web Mercator 픽셀 좌표로 변환"""
+    world_size = TILE_SIZE * (2 ** zoom)
+    siny = math.sin(math.radians(max(-85.05112878, min(85.05112878, lat))))
+    x = (lng + 180.0) / 360.0 * world_size
+    y = (0.5 - math.log((1 + siny) / (1 - siny)) / (4 * math.pi)) * world_size
+    return x, y
+
+
+def _get_version():
+    version = cache.get(CACHE_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(CACHE_VERSION_KEY, version, None)
+    return version
+
+
+def _cache_key(version):
+    return f'center_clusters:v{version}'
+
+
+def invalidate_clusters():
+    """Center 변경 시 모든 줌 레벨의 클러스터 캐시를 무효화"""
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CACHE_VERSION_KEY, 2, None)
+
+
+def build_clusters():
+    """
+    모든 줌 레벨의 클러스터를 한 번의 테이블 조회로 계산합니다.
+
+    반환값: {zoom: [{'lat', 'lng', 'count', 'center_id', 'type'}, ...]}
+    center_id와 type은 센터가 하나뿐인 클러스터에만 채워집니다.
+    """
+    from .models import Center
+
+    rows = list(
+        Center.objects.filter(latitude__isnull=False, longitude__isnull=False)
+        .values_list('id', 'latitude', 'longitude', 'type')
+        .order_by('id')
+    )
+
+    levels = {}
+    for zoom in range(MIN_ZOOM, MAX_CLUSTER_ZOOM + 1):
+        cells = {}
+        for center_id, lat, lng, center_type in rows:
+            x, y = _project(lat, lng, zoom)
+            key = (int(x // CLUSTER_CELL_PX), int(y // CLUSTER_CELL_PX))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [1, lat, lng, center_id, center_type]
+            else:
+                cell[0] += 1
+                cell[1] += lat
+                cell[2] += lng
+
+        levels[zoom] = [
+            {
+                'lat': lat_sum / count,
+                'lng': lng_sum / count,
+                'count': count,
+                'center_id': center_id if count == 1 else None,
+                'type': center_type if count == 1 else None,
+            }
+            for count, lat_sum, lng_sum, center_id, center_type in cells.values()
+        ]
+
+    return levels
+
+
+def get_clusters(zoom):
+    """줌 레벨의 전체 클러스터 목록 (캐시 미스 시 모든 줌 레벨을 한 번에 계산해 저장)"""
+    from .tiered_cache import tiered_cache
+
+    zoom = max(MIN_ZOOM, min(zoom, MAX_CLUSTER_ZOOM))
+    levels = tiered_cache.get_or_set('clusters', _cache_key(_get_version()), build_clusters, CACHE_TIMEOUT)
+    return levels[zoom]
+
+
+def clusters_in_bbox(zoom, sw_lat, sw_lng, ne_lat, ne_lng):
+    """bbox 안에 중심점이 있는 클러스터만 반환"""
+    def in_lng_range(lng):
+        if sw_lng <= ne_lng:
+            return sw_lng <= lng <= ne_lng
+        return lng >= sw_lng or lng <= ne_lng
+
+    return [
+        cluster for cluster in get_clusters(zoom)
+        if sw_lat <= cluster['lat'] <= ne_lat and in_lng_range(cluster['lng'])
+    ]
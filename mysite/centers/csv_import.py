@@ -0,0 +1,356 @@
+"""
+CSV 일괄 가져오기 엔진 (상담소/상담사/외부 리뷰 관리자의 run_import_job이 사용)
+
+- 검증: 필수 필드, 파일 안 중복 키(Counter), 이미 등록된 키(한 번의 쿼리로 미리 조회)를 DB 저장 전에 확인
+- 저장: batch_size개씩 bulk_create, 배치마다 savepoint. 배치가 실패하면 그 배치만 행마다 savepoint로 다시 저장해 문제 행만 실패 처리
+- 진행 상황: 배치마다 ctx.advance(count=...) (JobContext가 PROGRESS_SAVE_INTERVAL마다만 기록)
+- 좌표: 좌표 열이 없는 상담소 행의 주소는 저장 전에 geocoding.geocode_many로 한 번에 변환 (캐시 우선, 동시 요청)
+- 이미지: 배치를 저장하기 전에 savepoint 밖에서 그 배치의 이미지를 image_import.upload_images로 동시에 업로드
+  (트랜잭션을 연 채로 네트워크를 기다리지 않음). 업로드 결과(URL)는 INSERT에 함께 들어가고,
+  저장에 실패한 행의 이미지는 업로드된 채로 남음
+- bulk_create는 save()와 post_save 시그널을 거치지 않으므로 geohash는 객체를 만들 때 계산하고,
+  검색 색인과 캐시 무효화는 가져오기가 끝난 뒤 한 번에 처리
+"""
+
+from collections import Counter
+from datetime import datetime
+import os
+
+from django.conf import settings
+from django.db import transaction
+
+from .geocoding import geocode_many
+from .image_import import upload_images
+from .models import Center, CenterImage, ExternalReview, Therapist
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def duplicate_keys(keys):
+    """keys 중 두 번 이상 나온 값의 집합 (None 제외)"""
+    return {key for key, count in Counter(key for key in keys if key is not None).items() if count > 1}
+
+
+def parse_coordinates(row):
+    """CSV에 latitude/longitude 열이 있으면 (위도, 경도), 없거나 비어 있으면 (None, None)"""
+    latitude, longitude = (row.get('latitude') or '').strip(), (row.get('longitude') or '').strip()
+    if not latitude or not longitude:
+        return None, None
+    try:
+        return float(latitude), float(longitude)
+    except ValueError:
+        raise ValueError(f'좌표 형식이 올바르지 않습니다: {latitude}, {longitude}')
+
+
+class BulkImporter:
+    """
+    CSV 행 목록을 모델 객체로 일괄 저장합니다. 모델별 하위 클래스가 구현하는 부분:
+    - key(row): 중복 판정 키 (None이면 중복 검사 안 함)
+    - existing_keys(): 이미 DB에 있는 키 집합 (한 번의 쿼리, 행마다 exists()를 부르지 않음)
+    - build(row): 저장 전 모델 객체 (잘못된 행은 ValueError)
+    - prepare_batch(objects, rows): 저장 전 준비 (이미지 업로드 등, savepoint 밖에서 실행).
+      객체마다 after_batch에 넘길 값의 목록 반환
+    - after_batch(objects, rows, prepared): 저장된 객체 후처리 (DB 작업만, 같은 savepoint 안에서 실행)
+    images는 image_import.ZipImageSource, uploader는 업로더 객체 (None이면 Cloudinary)
+    - finish(objects): 가져오기가 끝난 뒤 한 번 (검색 색인, 캐시 무효화)
+    """
+
+    model = None
+    required_fields = ()
+
+    def __init__(self, options=None, images=None, uploader=None, batch_size=None, log=print):
+        self.options = options or {}
+        self.images = images
+        self.uploader = uploader
+        self.batch_size = batch_size or getattr(settings, 'CSV_IMPORT_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+        self.log = log
+        self._uploaded = {}  # 저장 경로 -> (저장된 경로, URL). 배치를 행 단위로 다시 저장할 때 다시 올리지 않도록
+
+    def key(self, row):
+        return None
+
+    def existing_keys(self):
+        return set()
+
+    def build(self, row):
+        raise NotImplementedError
+
+    def prepare_batch(self, objects, rows):
+        return [None] * len(objects)
+
+    def after_batch(self, objects, rows, prepared):
+        pass
+
+    def finish(self, objects):
+        pass
+
+    def run(self, rows, ctx=None):
+        """rows를 가져오고 {'total', 'success', 'errors'}를 반환합니다 (ctx가 있으면 진행 상황 기록)"""
+        if ctx is not None:
+            ctx.set_total(len(rows), message='CSV 파일 처리 중')
+        self.success, self.errors = 0, 0
+        self.ctx = ctx
+
+        keys = [self.key(row) for row in rows]
+        existing = self.existing_keys() if any(key is not None for key in keys) else set()
+        seen = {}
+        pending, created = [], []
+        for index, (row, key) in enumerate(zip(rows, keys), 1):
+            try:
+                for field in self.required_fields:
+                    if not (row.get(field) or '').strip():
+                        raise ValueError(f'필수 필드 {field}가 비어있습니다')
+                if key is not None:
+                    if key in existing:
+                        raise ValueError(f'이미 등록되어 있습니다: {self.describe_key(key)}')
+                    if key in seen:
+                        raise ValueError(f'{seen[key]}행과 중복됩니다: {self.describe_key(key)}')
+                    seen[key] = index
+                pending.append((index, row, self.build(row)))
+            except Exception as e:
+                self._fail(index, e)
+                continue
+            if len(pending) >= self.batch_size:
+                created.extend(self._save_batch(pending))
+                pending = []
+        if pending:
+            created.extend(self._save_batch(pending))
+
+        if created:
+            self.finish(created)
+        return {'total': len(rows), 'success': self.success, 'errors': self.errors}
+
+    def upload_images(self, items):
+        """items [(ZIP 파일명, 저장 경로)]를 동시에 업로드하고 같은 순서로 (저장된 경로, URL) 반환 (실패는 None)"""
+        pending = [item for item in dict.fromkeys(items) if item[1] not in self._uploaded]
+        if pending:
+            results = upload_images(self.images, pending, uploader=self.uploader, log=self.log)
+            for (_, file_path), (saved_path, url, error) in zip(pending, results):
+                if not error:
+                    self._uploaded[file_path] = (saved_path, url)
+        return [self._uploaded.get(file_path) for _, file_path in items]
+
+    def image_filenames(self, value):
+        """image_filename 열 값 중 ZIP에 있는 파일명 목록 (쉼표로 여러 개)"""
+        filenames = []
+        for name in (value or '').split(','):
+            name = name.strip()
+            if not name:
+                continue
+            if name not in self.images:
+                self.log(f'⚠️ ZIP 파일에서 이미지를 찾을 수 없음: {name}')
+                continue
+            filenames.append(name)
+        return filenames
+
+    def describe_key(self, key):
+        return ', '.join(str(part) for part in key) if isinstance(key, tuple) else str(key)
+
+    def _save_batch(self, batch):
+        """배치를 한 번에 저장하고, 실패하면 행마다 다시 저장해 실패한 행만 골라냄. 저장된 객체 목록 반환"""
+        objects = [obj for _, _, obj in batch]
+        rows = [row for _, row, _ in batch]
+        prepared = self.prepare_batch(objects, rows)
+        try:
+            with transaction.atomic():
+                self.model.objects.bulk_create(objects)
+                self.after_batch(objects, rows, prepared)
+        except Exception as e:
+            self.log(f'⚠️ {batch[0][0]}~{batch[-1][0]}행 일괄 저장 실패, 행 단위로 다시 시도: {e}')
+            saved = []
+            for (index, row, obj), extra in zip(batch, prepared):
+                # 롤백된 배치에서 받은 pk를 버리고 새로 INSERT
+                obj.pk = None
+                obj._state.adding = True
+                try:
+                    with transaction.atomic():
+                        self.model.objects.bulk_create([obj])
+                        self.after_batch([obj], [row], [extra])
+                except Exception as row_error:
+                    obj.pk = None
+                    self._fail(index, row_error)
+                else:
+                    saved.append(obj)
+                    self._succeed(1)
+            return saved
+        self._succeed(len(objects))
+        return objects
+
+    def _succeed(self, count):
+        self.success += count
+        if self.ctx is not None:
+            self.ctx.advance(success=True, count=count)
+
+    def _fail(self, index, error):
+        self.errors += 1
+        self.log(f'❌ {index}행 처리 실패: {error}')
+        if self.ctx is not None:
+            self.ctx.advance(success=False, error=error, row=index)
+
+
+class CenterImporter(BulkImporter):
+    """상담소 CSV (name, address 필수 / type, phone, url, description, operating_hours, latitude, longitude, image_filename)"""
+
+    model = Center
+    required_fields = ('name', 'address')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.coordinates = {}  # 주소 -> (위도, 경도) 또는 None
+
+    def run(self, rows, ctx=None):
+        # 좌표 열이 없는 행의 주소를 미리 한 번에 변환 (캐시 우선, 나머지는 동시에, centers/geocoding.py)
+        addresses = []
+        for row in rows:
+            try:
+                has_coordinates = parse_coordinates(row)[0] is not None
+            except ValueError:
+                has_coordinates = True  # build()에서 좌표 형식 오류로 처리
+            if not has_coordinates and (row.get('address') or '').strip():
+                addresses.append(row['address'].strip())
+        if addresses:
+            if ctx is not None:
+                ctx.set_message(f'주소 {len(addresses)}개 좌표 변환 중')
+            self.coordinates = geocode_many(addresses, log=self.log)
+        return super().run(rows, ctx)
+
+    def key(self, row):
+        address = (row.get('address') or '').strip()
+        return address or None
+
+    def existing_keys(self):
+        return set(Center.objects.values_list('address', flat=True))
+
+    def build(self, row):
+        address = row['address'].strip()
+        latitude, longitude = parse_coordinates(row)
+        if latitude is None:
+            latitude, longitude = self.geocode(address)
+
+        center = Center(
+            name=row['name'].strip(),
+            address=address,
+            phone=(row.get('phone') or '').strip(),
+            url=(row.get('url') or '').strip(),
+            description=(row.get('description') or '').strip(),
+            operating_hours=(row.get('operating_hours') or '').strip(),
+            # "정신건강의학과"면 clinic, 그 외("심리상담센터" 등)는 counseling
+            type='clinic' if (row.get('type') or '').strip() == '정신건강의학과' else 'counseling',
+            latitude=latitude,
+            longitude=longitude,
+        )
+        center.geohash = center.compute_geohash()
+        return center
+
+    def geocode(self, address):
+        """run()에서 미리 변환한 좌표 (실패하거나 검색 결과가 없으면 (None, None), geocode_centers 명령으로 나중에 채움)"""
+        coords = self.coordinates.get(address)
+        if not coords:
+            self.log(f'❌ 주소 좌표 변환 실패: {address}')
+            return None, None
+        return coords
+
+    def prepare_batch(self, centers, rows):
+        uploaded = [[] for _ in centers]
+        if not self.images:
+            return uploaded
+        # 쉼표로 구분된 여러 이미지 지원, 첫 번째 이미지는 Center.image_url에도 저장
+        targets = [
+            (position, idx, filename)
+            for position, row in enumerate(rows)
+            for idx, filename in enumerate(self.image_filenames(row.get('image_filename')))
+        ]
+        results = self.upload_images([
+            (filename, f'centers/{centers[position].name}_{filename}') for position, _, filename in targets
+        ])
+        for (position, idx, _), result in zip(targets, results):
+            if result is None:
+                continue
+            uploaded[position].append(result)
+            if idx == 0 and result[1]:
+                centers[position].image_url = result[1]
+        return uploaded
+
+    def after_batch(self, centers, rows, uploaded):
+        CenterImage.objects.bulk_create([
+            CenterImage(center=center, image=saved_path, image_url=cloudinary_url)
+            for center, images in zip(centers, uploaded)
+            for saved_path, cloudinary_url in images
+        ])
+
+    def finish(self, centers):
+        from .restore import invalidate_caches
+        from .search import CenterSearch
+
+        CenterSearch().index([center.pk for center in centers])
+        invalidate_caches(['Center', 'CenterImage'])
+
+
+class TherapistImporter(BulkImporter):
+    """상담사 CSV (name 필수 / specialty, description, experience, image_filename). options['center']에 등록"""
+
+    model = Therapist
+    required_fields = ('name',)
+
+    def build(self, row):
+        return Therapist(
+            center=self.options['center'],
+            name=row['name'].strip(),
+            specialty=(row.get('specialty') or '').strip(),
+            description=(row.get('description') or '').strip(),
+            experience=int(row.get('experience') or 0),
+        )
+
+    def prepare_batch(self, therapists, rows):
+        if self.images:
+            targets = []
+            for therapist, row in zip(therapists, rows):
+                filenames = self.image_filenames(row.get('image_filename'))
+                if filenames:
+                    targets.append((therapist, filenames[0]))
+            results = self.upload_images([
+                (filename, f'therapists/{therapist.center.name}/{therapist.name}/{filename}')
+                for therapist, filename in targets
+            ])
+            for (therapist, _), result in zip(targets, results):
+                if result is not None:
+                    therapist.photo, therapist.photo_url = result
+        return super().prepare_batch(therapists, rows)
+
+    def finish(self, therapists):
+        from .restore import invalidate_caches
+        from .search import CenterSearch
+
+        CenterSearch().index([self.options['center'].pk])
+        invalidate_caches(['Therapist'])
+
+
+class ExternalReviewImporter(BulkImporter):
+    """외부 리뷰 CSV (title, url 필수 / summary, source, likes, dislikes, created_at). options['center']에 등록"""
+
+    model = ExternalReview
+    required_fields = ('title', 'url')
+
+    def build(self, row):
+        external_review = ExternalReview(
+            center=self.options['center'],
+            title=row['title'].strip(),
+            url=row['url'].strip(),
+            summary=(row.get('summary') or '').strip(),
+            source=(row.get('source') or '').strip(),
+            likes=int(row.get('likes') or 0),
+            dislikes=int(row.get('dislikes') or 0),
+        )
+        created_at = (row.get('created_at') or '').strip()
+        if created_at:
+            try:
+                external_review.created_at = datetime.strptime(created_at, '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                raise ValueError("날짜 형식이 올바르지 않습니다. YYYY-MM-DD HH:MM:SS 형식을 사용해주세요. (예: 2024-03-15 14:30:00)")
+        return external_review
+
+    def finish(self, external_reviews):
+        from .restore import invalidate_caches
+
+        invalidate_caches(['ExternalReview'])
+
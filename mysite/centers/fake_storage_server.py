@@ -0,0 +1,140 @@
+"""
+로컬 테스트용 HTTP 백업 대상 (HTTPStorage 프로토콜 구현, 운영에서는 사용하지 않음)
+
+    python manage.py fake_backup_server --port 8765 --flaky 3
+    BACKUP_HTTP_URL=http://127.0.0.1:8765/backups python manage.py backup_data --storage http
+
+    with FakeStorageServer(root) as server:  # 스크립트에서 스레드로 실행
+        settings.BACKUP_HTTP_URL = server.url
+
+flaky=N이면 N번째 PUT마다 503을 돌려주어 재시도와 이어 올리기를 확인할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+CONTENT_RANGE = re.compile(r'bytes (\d+)-(\d+)/(\d+)')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'FakeBackupStorage/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _path(self):
+        name = os.path.basename(unquote(self.path.split('?', 1)[0]))
+        return os.path.join(self.server.root, name) if name else None
+
+    def _reply(self, status, headers=None, body=b''):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _state_headers(self, path):
+        size = os.path.getsize(path)
+        headers = {'Upload-Offset': str(size)}
+        total = self.server.totals.get(path)
+        if total is None or total == size:
+            with open(path, 'rb') as f:
+                headers['X-Checksum-Sha256'] = hashlib.file_digest(f, 'sha256').hexdigest()
+        return headers
+
+    def do_HEAD(self):
+        path = self._path()
+        if not path or not os.path.exists(path):
+            return self._reply(404)
+        with self.server.lock:
+            self._reply(200, self._state_headers(path))
+
+    def do_GET(self):
+        path = self._path()
+        if not path:
+            # 업로드가 끝난 파일 목록
+            with self.server.lock:
+                files = [
+                    {
+                        'name': entry.name,
+                        'size': entry.stat().st_size,
+                        'modified': datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc).isoformat(),
+                    }
+                    for entry in os.scandir(self.server.root)
+                    if entry.is_file() and self.server.totals.get(entry.path, entry.stat().st_size) == entry.stat().st_size
+                ]
+            return self._reply(200, {'Content-Type': 'application/json'}, json.dumps(files).encode())
+        if not os.path.exists(path):
+            return self._reply(404)
+        with open(path, 'rb') as f:
+            self._reply(200, {'Content-Type': 'application/octet-stream'}, f.read())
+
+    def do_DELETE(self):
+        path = self._path()
+        with self.server.lock:
+            if path and os.path.exists(path):
+                os.remove(path)
+            self.server.totals.pop(path, None)
+        self._reply(204)
+
+    def do_PUT(self):
+        path = self._path()
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        with self.server.lock:
+            self.server.put_count += 1
+            if self.server.flaky and self.server.put_count % self.server.flaky == 0:
+                return self._reply(503, body=b'temporarily unavailable')
+            match = CONTENT_RANGE.match(self.headers.get('Content-Range', ''))
+            if not path or not match:
+                return self._reply(400, body=b'Content-Range required')
+            start, end, total = (int(value) for value in match.groups())
+            offset = os.path.getsize(path) if os.path.exists(path) else 0
+            if start != offset or end - start + 1 != len(body):
+                return self._reply(409, {'Upload-Offset': str(offset)})
+            with open(path, 'ab') as f:
+                f.write(body)
+            self.server.totals[path] = total
+            self._reply(200, self._state_headers(path))
+
+
+class FakeStorageServer:
+    """root 폴더에 파일을 저장하는 HTTP 서버 (with 블록 동안 백그라운드 스레드로 실행)"""
+
+    def __init__(self, root, host='127.0.0.1', port=0, flaky=0, verbose=False):
+        os.makedirs(root, exist_ok=True)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.root = root
+        self.httpd.flaky = flaky
+        self.httpd.verbose = verbose
+        self.httpd.put_count = 0
+        self.httpd.totals = {}  # 경로 -> 전체 크기 (업로드 중인 파일 구분)
+        self.httpd.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}/backups'
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
@@ -0,0 +1,130 @@
+"""
+위치 계산 유틸리티
+SQLite와 PostgreSQL 모두에서 동작하도록 PostGIS 없이 geohash 격자와 haversine 거리만 사용합니다.
+"""
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Center.geohash에 저장되는 정밀도 (약 4.8m x 4.8m 격자)
+GEOHASH_PRECISION = 9
+
+# bbox 조회 시 OR 조건으로 만들 geohash 격자의 최대 개수
+MAX_COVER_CELLS = 32
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 좌표 사이의 대원 거리(km)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def encode_geohash(lat, lng, precision=GEOHASH_PRECISION):
+    """위도/경도를 geohash 문자열로 변환"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    ch = 0
+    even = True  # 짝수 번째 비트는 경도
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                ch = (ch << 1) | 1
+                lng_range[0] = mid
+            else:
+                ch = ch << 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_range[0] = mid
+            else:
+                ch = ch << 1
+                lat_range[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[ch])
+            bit = 0
+            ch = 0
+
+    return ''.join(chars)
+
+
+def _cell_size(precision):
+    """geohash 정밀도별 격자 크기 (위도 높이, 경도 너비)"""
+    bits = precision * 5
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def _cell_index_range(low, high, origin, size, count):
+    start = int(math.floor((low - origin) / size))
+    end = int(math.floor((high - origin) / size))
+    return max(0, start), min(count - 1, end)
+
+
+def geohash_cover(sw_lat, sw_lng, ne_lat, ne_lng, max_cells=MAX_COVER_CELLS):
+    """
+    bbox를 덮는 geohash 접두사 목록을 반환합니다.
+
+    격자 개수가 max_cells 이하가 되는 가장 높은 정밀도를 선택하며,
+    어떤 정밀도로도 덮을 수 없을 만큼 넓으면 빈 목록(=필터 없음)을 반환합니다.
+    경도가 날짜 변경선을 넘지 않는 bbox(sw_lng <= ne_lng)만 지원합니다.
+    """
+    best = []
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        lat_size, lng_size = _cell_size(precision)
+        lat_count = int(round(180.0 / lat_size))
+        lng_count = int(round(360.0 / lng_size))
+        i0, i1 = _cell_index_range(sw_lat, ne_lat, -90.0, lat_size, lat_count)
+        j0, j1 = _cell_index_range(sw_lng, ne_lng, -180.0, lng_size, lng_count)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > max_cells:
+            break
+        best = [
+            encode_geohash(-90.0 + (i + 0.5) * lat_size, -180.0 + (j + 0.5) * lng_size, precision)
+            for i in range(i0, i1 + 1)
+            for j in range(j0, j1 + 1)
+        ]
+    return best
+
+
+def bounding_box(lat, lng, radius_km):
+    """
+    중심점에서 radius_km 이내의 모든 점을 포함하는 bbox를 반환합니다.
+
+    반환값: [(sw_lat, sw_lng, ne_lat, ne_lng), ...]
+    날짜 변경선을 넘는 경우 두 개의 bbox로 나누어 반환합니다.
+    """
+    angular = radius_km / EARTH_RADIUS_KM
+    lat_rad = math.radians(lat)
+    min_lat = lat_rad - angular
+    max_lat = lat_rad + angular
+
+    if min_lat <= -math.pi / 2 or max_lat >= math.pi / 2:
+        # 극점을 포함하면 모든 경도가 후보
+        return [(max(-90.0, math.degrees(min_lat)), -180.0, min(90.0, math.degrees(max_lat)), 180.0)]
+
+    d_lng = math.degrees(math.asin(math.sin(angular) / math.cos(lat_rad)))
+    min_lat = math.degrees(min_lat)
+    max_lat = math.degrees(max_lat)
+    min_lng = lng - d_lng
+    max_lng = lng + d_lng
+
+    if min_lng < -180.0:
+        return [(min_lat, min_lng + 360.0, max_lat, 180.0), (min_lat, -180.0, max_lat, max_lng)]
+    if max_lng > 180.0:
+        return [(min_lat, min_lng, max_lat, 180.0), (min_lat, -180.0, max_lat, max_lng - 360.0)]
+    return [(min_lat, min_lng, max_lat, max_lng)]
@@ -0,0 +1,233 @@
+"""
+주소 → 좌표 변환 (지오코딩)
+
+- geocode(address): 정규화한 주소로 GeocodeCache를 먼저 보고, 없거나 만료됐으면 공급자를 호출해 저장.
+  검색 결과 없음도 GEOCODE_MISS_TTL 동안 캐시하고, 네트워크/서버 오류는 캐시하지 않고 GeocodingError
+- geocode_many(addresses): 캐시를 한 번의 쿼리로 조회하고, 없는 주소만 스레드 풀(GEOCODE_WORKERS)에서
+  초당 GEOCODE_RATE_LIMIT회 이하로 호출한 뒤 결과를 한 번에 저장 (CSV 가져오기, geocode_centers 명령)
+- 공급자: settings.GEOCODER (기본 NaverGeocoder). 공급자는 geocode(address) -> (위도, 경도) 또는 None을 구현.
+  NaverGeocoder는 연결 풀과 재시도(429/5xx, 지수 백오프)를 설정한 requests.Session 하나를 모든 요청이 공유.
+  네트워크 없이 쓸 때는 FakeGeocoder (GEOCODER = 'centers.geocoding.FakeGeocoder')
+"""
+
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .backup_storage import run_concurrently
+from .models import GeocodeCache
+
+NAVER_GEOCODE_URL = 'https://maps.apigw.ntruss.com/map-geocode/v2/geocode'
+DEFAULT_GEOCODER = 'centers.geocoding.NaverGeocoder'
+CACHE_TTL = timedelta(days=90)
+MISS_TTL = timedelta(days=1)
+TIMEOUT = 5  # 초
+WORKERS = 4
+RATE_LIMIT = 10  # 초당 요청 수
+
+
+class GeocodingError(Exception):
+    """공급자 호출 실패 (네트워크, 인증, 서버 오류). 검색 결과 없음은 오류가 아니라 None"""
+
+
+def normalize_address(address):
+    """캐시 키: 유니코드 정규화, 공백 정리, 소문자"""
+    address = unicodedata.normalize('NFKC', address or '')
+    return re.sub(r'\s+', ' ', address).strip().lower()
+
+
+class RateLimiter:
+    """여러 스레드가 공유하는 호출 간격 제한 (초당 rate회)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_at - now
+            self.next_at = max(now, self.next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """지오코딩 요청이 공유하는 Session (연결 재사용, 429/5xx 재시도)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=('GET',), raise_on_status=False,
+            )
+            pool_size = max(getattr(settings, 'GEOCODE_WORKERS', WORKERS), 10)
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=pool_size))
+            _session = session
+        return _session
+
+
+class NaverGeocoder:
+    """네이버 지도 Geocoding API"""
+
+    name = 'naver'
+
+    def __init__(self, client_id=None, client_secret=None, session=None, timeout=None):
+        self.client_id = client_id or settings.NAVER_CLIENT_ID
+        self.client_secret = client_secret or settings.NAVER_CLIENT_SECRET
+        self.session = session or get_session()
+        self.timeout = timeout or getattr(settings, 'GEOCODE_TIMEOUT', TIMEOUT)
+
+    def geocode(self, address):
+        if not self.client_id or not self.client_secret:
+            raise GeocodingError('NAVER_CLIENT_ID/NAVER_CLIENT_SECRET이 설정되지 않았습니다')
+        try:
+            response = self.session.get(
+                NAVER_GEOCODE_URL,
+                params={'query': address},
+                headers={
+                    'x-ncp-apigw-api-key-id': self.client_id,
+                    'x-ncp-apigw-api-key': self.client_secret,
+                    'Accept': 'application/json'
+                },
+                timeout=self.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            raise GeocodingError(f'주소 변환 요청 오류: {e}')
+        if response.status_code != 200:
+            raise GeocodingError(f'주소 변환 API 오류: {response.status_code}')
+        addresses = response.json().get('addresses')
+        if not addresses:
+            return None
+        return float(addresses[0]['y']), float(addresses[0]['x'])
+
+
+class FakeGeocoder:
+    """
+    네트워크 없이 동작하는 공급자 (테스트/로컬 개발용).
+    known {주소: (위도, 경도)}에 없으면 주소 해시로 서울 부근의 고정 좌표를 만들고, '없는주소'가 들어가면 None
+    """
+
+    name = 'fake'
+
+    def __init__(self, known=None, delay=0.0):
+        self.known = {normalize_address(address): coords for address, coords in (known or {}).items()}
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def geocode(self, address):
+        with self.lock:
+            self.calls.append(address)
+        time.sleep(self.delay)
+        key = normalize_address(address)
+        if key in self.known:
+            return self.known[key]
+        if '없는주소' in key:
+            return None
+        digest = hashlib.sha1(key.encode()).digest()
+        return 37.4 + digest[0] / 255 * 0.3, 126.8 + digest[1] / 255 * 0.4
+
+
+def get_geocoder():
+    return import_string(getattr(settings, 'GEOCODER', DEFAULT_GEOCODER))()
+
+
+def _fresh_entries(keys):
+    """캐시에서 만료되지 않은 항목 {정규화 주소: (위도, 경도) 또는 None}"""
+    now = timezone.now()
+    cache_ttl = timedelta(seconds=getattr(settings, 'GEOCODE_CACHE_TTL', CACHE_TTL.total_seconds()))
+    miss_ttl = timedelta(seconds=getattr(settings, 'GEOCODE_MISS_TTL', MISS_TTL.total_seconds()))
+    fresh = (
+        Q(latitude__isnull=False, fetched_at__gte=now - cache_ttl)
+        | Q(latitude__isnull=True, fetched_at__gte=now - miss_ttl)
+    )
+    entries = {}
+    for entry in GeocodeCache.objects.filter(fresh, address__in=list(keys)):
+        entries[entry.address] = None if entry.latitude is None else (entry.latitude, entry.longitude)
+    return entries
+
+
+def _store(results, provider):
+    """{정규화 주소: (위도, 경도) 또는 None}을 캐시에 저장 (있으면 갱신)"""
+    now = timezone.now()
+    entries = [
+        GeocodeCache(
+            address=key, latitude=coords[0] if coords else None, longitude=coords[1] if coords else None,
+            provider=provider.name, fetched_at=now,
+        )
+        for key, coords in results.items()
+    ]
+    GeocodeCache.objects.bulk_create(
+        entries, update_conflicts=True, unique_fields=['address'],
+        update_fields=['latitude', 'longitude', 'provider', 'fetched_at'],
+    )
+
+
+def geocode(address, geocoder=None, refresh=False):
+    """주소의 (위도, 경도), 검색 결과가 없으면 None. 공급자 호출이 실패하면 GeocodingError"""
+    key = normalize_address(address)
+    if not key:
+        return None
+    if not refresh:
+        cached = _fresh_entries([key])
+        if key in cached:
+            return cached[key]
+    geocoder = geocoder or get_geocoder()
+    coords = geocoder.geocode(address)
+    _store({key: coords}, geocoder)
+    return coords
+
+
+def geocode_many(addresses, geocoder=None, workers=None, rate_limit=None, refresh=False, log=print):
+    """
+    {주소: (위도, 경도) 또는 None}. 같은 주소(정규화 기준)는 한 번만 호출하고,
+    호출이 실패한 주소는 결과에서 빠짐 (다음 실행 때 다시 시도)
+    """
+    keys = {}
+    for address in addresses:
+        key = normalize_address(address)
+        if key:
+            keys.setdefault(key, address)
+    resolved = {} if refresh else _fresh_entries(keys)
+    missing = [(key, address) for key, address in keys.items() if key not in resolved]
+
+    if missing:
+        geocoder = geocoder or get_geocoder()
+        limiter = RateLimiter(rate_limit if rate_limit is not None else getattr(settings, 'GEOCODE_RATE_LIMIT', RATE_LIMIT))
+
+        def lookup(item):
+            limiter.wait()
+            return geocoder.geocode(item[1])
+
+        fetched = {}
+        workers = workers or getattr(settings, 'GEOCODE_WORKERS', WORKERS)
+        for (key, address), coords, error in run_concurrently(lookup, missing, workers=workers):
+            if error:
+                log(f'⚠️ 주소 변환 실패: {address} ({error})')
+            else:
+                fetched[key] = coords
+        if fetched:
+            _store(fetched, geocoder)
+        resolved.update(fetched)
+
+    return {address: resolved[normalize_address(address)] for address in addresses if normalize_address(address) in resolved}
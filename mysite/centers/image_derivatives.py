@@ -0,0 +1,146 @@
+"""
+로컬 이미지 파생본 (Cloudinary URL 없이 저장소에만 있는 CenterImage.image / Therapist.photo의 축소 WebP)
+
+- 키: derivatives/{원본 이름 해시}/w{너비}.webp — 원본 이름과 너비로 정해지므로 저장소를 조회하지 않고 URL을 만들 수 있음
+- 생성: 업로드 시(post_save 커밋 후, signals.py) 또는 첫 요청 시 image_derivative 뷰가 만들어
+  파생본 전용 로컬 저장소(IMAGE_DERIVATIVES_ROOT)에 저장
+- 미디어 저장소가 원격(운영 환경의 MediaCloudinaryStorage)이면 파생본을 만들지 않고 Cloudinary 변환 URL을 사용
+  (원본을 내려받거나 파생본을 다시 올리는 네트워크 호출이 생기지 않도록)
+- variant_url(): Cloudinary URL이면 변환 파라미터(w_, q_auto, f_auto)를, 로컬 파일이면 파생본 URL을 반환
+- 템플릿은 cloudinary_tags의 image_variant / image_srcset 필터와 responsive_image 태그로 사용
+"""
+
+import hashlib
+import io
+import posixpath
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+from .utils import get_optimized_image_url
+
+DERIVATIVE_PREFIX = 'derivatives'
+DERIVATIVE_WIDTHS = (160, 320, 480, 960)
+WEBP_QUALITY = 80
+# 파생본을 만들 수 있는 원본 위치 (업로드 경로)
+SOURCE_PREFIXES = ('centers/', 'therapists/')
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+# 화면별 너비 (지도 사이드바 카드, 상세 캐러셀)
+CARD_WIDTH = 480
+LARGE_WIDTH = 960
+
+
+def media_is_local():
+    """미디어 저장소(default_storage)가 로컬 파일 시스템인지 (아니면 파생본을 만들지 않음)"""
+    return isinstance(default_storage, FileSystemStorage)
+
+
+def derivative_storage():
+    """파생본 전용 로컬 저장소 (미디어 저장소와 분리되어 백업/Cloudinary에 올라가지 않음)"""
+    return FileSystemStorage(location=settings.IMAGE_DERIVATIVES_ROOT)
+
+
+def derivative_name(name, width):
+    digest = hashlib.sha1(name.encode()).hexdigest()[:20]
+    return f'{DERIVATIVE_PREFIX}/{digest[:2]}/{digest}/w{width}.webp'
+
+
+def nearest_width(width):
+    """width 이상인 가장 작은 파생본 너비 (없으면 가장 큰 너비)"""
+    for candidate in DERIVATIVE_WIDTHS:
+        if candidate >= int(width):
+            return candidate
+    return DERIVATIVE_WIDTHS[-1]
+
+
+def is_derivable(name):
+    """로컬 미디어 저장소에 업로드된 이미지 경로인지 (파생본 뷰에서 임의 경로를 읽지 않도록)"""
+    return (
+        bool(name)
+        and media_is_local()
+        and name.startswith(SOURCE_PREFIXES)
+        and name.lower().endswith(SOURCE_EXTENSIONS)
+        and '..' not in name.split('/')
+    )
+
+
+def generate_derivative(name, width):
+    """원본 name의 width 너비 WebP 파생본을 만들고(이미 있으면 그대로) 키를 반환합니다"""
+    key = derivative_name(name, width)
+    storage = derivative_storage()
+    if storage.exists(key):
+        return key
+
+    with default_storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        image = ImageOps.exif_transpose(image)
+        if image.width > width:
+            # 비율 유지, 확대하지 않음
+            image.thumbnail((width, image.height), Image.LANCZOS)
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        output = io.BytesIO()
+        image.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+
+    if storage.exists(key):  # 동시에 만든 요청이 먼저 저장한 경우
+        return key
+    storage.save(key, ContentFile(output.getvalue()))
+    return key
+
+
+def generate_derivatives(name, widths=DERIVATIVE_WIDTHS):
+    return [generate_derivative(name, width) for width in widths]
+
+
+def derivative_url(name, width):
+    return reverse('centers:image_derivative', kwargs={'width': nearest_width(width), 'name': name})
+
+
+def image_source(obj):
+    """CenterImage/Therapist/FieldFile에서 (Cloudinary URL, 저장소 파일 이름)"""
+    if obj is None:
+        return None, ''
+    if hasattr(obj, 'image_url') and hasattr(obj, 'image'):
+        return obj.image_url, obj.image.name if obj.image else ''
+    if hasattr(obj, 'photo_url') and hasattr(obj, 'photo'):
+        return obj.photo_url, obj.photo.name if obj.photo else ''
+    return None, getattr(obj, 'name', '') or ''
+
+
+def remote_source_url(url, name):
+    """Cloudinary URL, 없으면 원격 미디어 저장소에 있는 원본의 URL (로컬 저장소면 url 그대로)"""
+    if url or not name or media_is_local():
+        return url
+    return default_storage.url(name)
+
+
+def variant_url(url, name, width):
+    """Cloudinary URL이 있으면 너비 변환 URL, 없고 로컬 파일이면 파생본 URL"""
+    url = remote_source_url(url, name)
+    if url:
+        return get_optimized_image_url(url, width=width)
+    if is_derivable(name):
+        return derivative_url(name, width)
+    return default_storage.url(name) if name else None
+
+
+def srcset(url, name, widths=DERIVATIVE_WIDTHS):
+    """<img srcset> 값 (Cloudinary도 로컬 파일도 아니면 빈 문자열)"""
+    url = remote_source_url(url, name)
+    if (url and 'cloudinary.com' not in url) or (not url and not is_derivable(name)):
+        return ''
+    return ', '.join(f'{variant_url(url, name, width)} {width}w' for width in widths)
+
+
+def media_name_from_url(url):
+    """MEDIA_URL 아래 로컬 파일 URL이면 저장소 이름 (아니면 빈 문자열)"""
+    media_url = settings.MEDIA_URL
+    if url and media_url and str(url).startswith(media_url):
+        return posixpath.normpath(unquote(str(url)[len(media_url):]))
+    return ''
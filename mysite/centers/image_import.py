@@ -0,0 +1,140 @@
+"""
+CSV 가져오기용 이미지 업로드 파이프라인 (csv_import의 상담소/상담사 이미지)
+
+- ZipImageSource: ZIP 목차만 읽어 두고, 이미지는 업로드할 때 멤버 하나씩 읽음 (ZIP 전체를 메모리에 올리지 않음)
+- validate_image(): PIL로 헤더만 읽어 형식 확인 (픽셀 데이터는 디코딩하지 않음)
+- upload_images(): 스레드 풀(IMAGE_UPLOAD_WORKERS)로 동시에 업로드하고 실패하면 지수 백오프로 재시도,
+  결과는 요청 순서대로 돌려주어 호출하는 쪽에서 행/객체에 다시 연결
+- 업로더는 upload(data, folder) -> URL 인터페이스. 기본은 CloudinaryUploader, 오프라인 테스트는 FakeImageUploader
+"""
+
+import io
+import os
+import threading
+import time
+import zipfile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, UnidentifiedImageError
+
+from .backup_storage import call_with_retries, run_concurrently
+from .utils import upload_image_to_cloudinary
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif')
+IMAGE_FORMATS = {'PNG', 'JPEG', 'GIF'}
+IMAGE_UPLOAD_WORKERS = 8
+IMAGE_UPLOAD_RETRIES = 3
+
+
+class ImageUploadError(Exception):
+    pass
+
+
+class ZipImageSource:
+    """ZIP 파일의 이미지 목록 {파일명(경로 제외): ZipInfo}. 같은 파일명이 여러 폴더에 있으면 처음 것을 사용"""
+
+    def __init__(self, zip_path):
+        self.zip_file = zipfile.ZipFile(zip_path, 'r')
+        self.members = {}
+        for info in self.zip_file.infolist():
+            name = os.path.basename(info.filename)
+            if not info.is_dir() and name.lower().endswith(IMAGE_EXTENSIONS):
+                self.members.setdefault(name, info)
+        # ZipFile은 여러 스레드가 동시에 멤버를 읽을 수 있지만 읽기 위치를 공유하므로 한 번에 하나씩
+        self.lock = threading.Lock()
+
+    def __contains__(self, filename):
+        return filename in self.members
+
+    def __len__(self):
+        return len(self.members)
+
+    def read(self, filename):
+        with self.lock:
+            return self.zip_file.read(self.members[filename])
+
+    def close(self):
+        self.zip_file.close()
+
+
+def validate_image(image_data):
+    """헤더만 읽어 지원하는 이미지 형식인지 확인 (아니면 ValueError)"""
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            image_format = image.format
+    except (UnidentifiedImageError, OSError):
+        raise ValueError('이미지 파일이 아닙니다')
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f'지원하지 않는 이미지 형식입니다: {image_format}')
+    return image_format
+
+
+class CloudinaryUploader:
+    """Cloudinary 업로드 (설정이 없으면 URL 없이 성공 처리되어 로컬 저장소만 사용)"""
+
+    def upload(self, image_data, folder):
+        result = upload_image_to_cloudinary(image_data, folder=folder)
+        if not result['success']:
+            raise ImageUploadError(result.get('error', '알 수 없는 오류'))
+        return result.get('url')
+
+
+class FakeImageUploader:
+    """네트워크 없이 업로드를 흉내내는 업로더 (테스트용). delay초 대기하고, fail_first번째까지의 호출은 실패"""
+
+    def __init__(self, delay=0.0, fail_first=0, base_url='https://images.example.com'):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.base_url = base_url
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def upload(self, image_data, folder):
+        with self.lock:
+            self.calls.append((folder, len(image_data)))
+            call_number = len(self.calls)
+        time.sleep(self.delay)
+        if call_number <= self.fail_first:
+            raise ImageUploadError('일시적인 업로드 오류')
+        return f'{self.base_url}/{folder}/{call_number}'
+
+
+def save_local_image(image_data, file_path):
+    """로컬 저장소에도 저장 (백업용). 실제 저장된 경로 반환"""
+    os.makedirs(os.path.dirname(os.path.join(settings.MEDIA_ROOT, file_path)), exist_ok=True)
+    return default_storage.save(file_path, ContentFile(image_data))
+
+
+def upload_images(source, items, uploader=None, workers=None, attempts=None, log=print):
+    """
+    items [(ZIP 파일명, 저장 경로)]의 이미지를 동시에 올리고 [(저장된 경로, URL, 오류)]를 같은 순서로 반환합니다.
+    검증에 실패한 이미지는 업로드하지 않고, 업로드가 끝내 실패하면 로컬에만 저장하고 URL은 None입니다.
+    """
+    uploader = uploader or CloudinaryUploader()
+    workers = workers or getattr(settings, 'IMAGE_UPLOAD_WORKERS', IMAGE_UPLOAD_WORKERS)
+    attempts = attempts or getattr(settings, 'IMAGE_UPLOAD_RETRIES', IMAGE_UPLOAD_RETRIES)
+
+    def process(item):
+        filename, file_path = item
+        image_data = source.read(filename)
+        validate_image(image_data)
+        folder = 'centers' if file_path.startswith('centers/') else 'therapists'
+        try:
+            url = call_with_retries(
+                lambda: uploader.upload(image_data, folder), f'이미지 업로드 ({filename})', attempts=attempts, log=log
+            )
+        except Exception as e:
+            log(f'⚠️ 이미지 업로드 실패, 로컬 저장소만 사용: {filename} ({e})')
+            url = None
+        return save_local_image(image_data, file_path), url
+
+    results = []
+    for (filename, _), result, error in run_concurrently(process, items, workers=workers):
+        if error:
+            log(f'⚠️ 이미지 처리 실패 - {filename}: {error}')
+            results.append((None, None, error))
+        else:
+            results.append((*result, None))
+    return results
@@ -0,0 +1,139 @@
+"""
+증분 백업 도우미 (backup_data --mode incremental)
+
+- watermark: 직전 성공 백업(BackupHistory.watermark, 백업 시작 시각) 이후 updated_at(없으면 created_at)이
+  바뀐 행만 백업. 실행 중이던 트랜잭션을 놓치지 않도록 WATERMARK_OVERLAP만큼 겹쳐 읽고, 복원은 upsert라 중복은 무해
+- 삭제: post_delete 시그널이 DeletedRecord(tombstone)를 남기고, 증분 백업 파일의 '_deletions' 구역으로 전달.
+  복원 엔진이 지우는 행은 기록하지 않고(suppress_tombstones), 복원 후에는 reset_backup_chain()으로 다음 백업을 전체 백업으로 시작
+- 미디어: 직전 백업의 manifest와 비교해 mtime/크기가 바뀐 파일만 해시를 다시 계산하고, 해시까지 바뀐 파일만 포함
+"""
+
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import BackupHistory, DeletedRecord
+
+WATERMARK_OVERLAP = timedelta(minutes=5)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def last_backup(storage):
+    """저장소별 마지막 성공 백업 (증분 백업의 기준)"""
+    return (
+        BackupHistory.objects
+        .filter(backup_type=storage, status='success', watermark__isnull=False)
+        .order_by('-watermark')
+        .first()
+    )
+
+
+def watermark_field(model):
+    """변경 시각 필드 (updated_at이 없는 모델은 created_at)"""
+    field_names = {field.name for field in model._meta.concrete_fields}
+    return 'updated_at' if 'updated_at' in field_names else 'created_at'
+
+
+def changed_queryset(model, since):
+    return model.objects.filter(**{f'{watermark_field(model)}__gte': since})
+
+
+def deletions_since(since, model_names):
+    """{모델명: [pk, ...]} (since 이후 삭제된 행)"""
+    deletions = {}
+    records = (
+        DeletedRecord.objects
+        .filter(deleted_at__gte=since, model_name__in=model_names)
+        .order_by('id')
+        .values_list('model_name', 'object_pk')
+    )
+    for model_name, object_pk in records.iterator():
+        deletions.setdefault(model_name, []).append(object_pk)
+    return deletions
+
+
+_tombstone_state = threading.local()
+
+
+@contextmanager
+def suppress_tombstones():
+    """이 블록 안의 삭제는 DeletedRecord를 남기지 않음 (현재 스레드, 복원 엔진이 사용)"""
+    depth = getattr(_tombstone_state, 'depth', 0)
+    _tombstone_state.depth = depth + 1
+    try:
+        yield
+    finally:
+        _tombstone_state.depth = depth
+
+
+def tombstones_suppressed():
+    return getattr(_tombstone_state, 'depth', 0) > 0
+
+
+def reset_backup_chain(using=None):
+    """
+    복원 후 호출: 복원된 행은 백업 당시의 updated_at을 가지므로 이전 백업 위에 증분을 이어 붙이면 빠지는 행이 생김.
+    모든 백업의 watermark를 지워 다음 백업이 전체 백업(새 기준)이 되게 하고, 그 전의 삭제 기록도 비웁니다.
+    """
+    BackupHistory.objects.using(using).filter(watermark__isnull=False).update(watermark=None)
+    deleted, _ = DeletedRecord.objects.using(using).all().delete()
+    return deleted
+
+
+def prune_tombstones(retention_days=None):
+    """보관 기간이 지난 삭제 기록 정리 (그보다 오래된 백업 체인은 남아 있지 않음)"""
+    retention_days = retention_days or getattr(settings, 'BACKUP_RETENTION_DAYS', 30)
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = DeletedRecord.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
+
+
+def iter_media_files(media_root):
+    """백업 대상 미디어 파일의 상대 경로 (centers/, therapists/ 폴더와 최상위 파일)"""
+    if not os.path.isdir(media_root):
+        return
+    for item in sorted(os.listdir(media_root)):
+        item_path = os.path.join(media_root, item)
+        if os.path.isfile(item_path):
+            yield item
+        elif item in ('centers', 'therapists') and os.path.isdir(item_path):
+            for dirpath, dirnames, filenames in os.walk(item_path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    yield os.path.relpath(os.path.join(dirpath, filename), media_root).replace(os.sep, '/')
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_media(media_root, previous_manifest=None):
+    """
+    현재 미디어 파일 manifest와 직전 manifest 대비 변경/삭제된 경로 목록을 반환합니다.
+    mtime과 크기가 같으면 이전 해시를 그대로 쓰고, 다르면 해시를 다시 계산해 내용이 바뀐 경우만 변경으로 봅니다.
+    """
+    previous_manifest = previous_manifest or {}
+    manifest, changed = {}, []
+    for relpath in iter_media_files(media_root):
+        path = os.path.join(media_root, relpath)
+        stat = os.stat(path)
+        entry = {'mtime': int(stat.st_mtime), 'size': stat.st_size}
+        previous = previous_manifest.get(relpath)
+        if previous and previous.get('mtime') == entry['mtime'] and previous.get('size') == entry['size']:
+            entry['sha256'] = previous.get('sha256')
+        else:
+            entry['sha256'] = file_sha256(path)
+            if not previous or previous.get('sha256') != entry['sha256']:
+                changed.append(relpath)
+        manifest[relpath] = entry
+    removed = sorted(set(previous_manifest) - set(manifest))
+    return manifest, changed, removed
@@ -1,22 +1,23 @@
 import os
-import json
-import gzip
 import tarfile
 import tempfile
 from datetime import datetime
-from django.core.management.base import BaseCommand
-from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
 from django.apps import apps
 from django.conf import settings
-import requests
+from django.utils import timezone
 
-# boto3는 선택적 import (S3 사용시에만 필요)
-try:
-    import boto3
-    from botocore.exceptions import ClientError
-    HAS_BOTO3 = True
-except ImportError:
-    HAS_BOTO3 = False
+from centers.backup_catalog import record_uploads
+from centers.backup_io import DEFAULT_CHUNK_SIZE, StreamingBackupWriter, create_temp_path
+from centers.backup_storage import FanOutStorage, StorageError, Upload, get_backup_storage
+from centers.incremental import (
+    WATERMARK_OVERLAP, changed_queryset, deletions_since, last_backup, prune_tombstones, scan_media,
+)
+from centers.media_store import get_blob_store, media_section, upload_media_blobs
+from centers.models import BackupHistory
+
+
+STORAGE_CHOICES = ['github', 's3', 'google_drive', 'local', 'http']
 
 
 class Command(BaseCommand):
@@ -31,10 +32,23 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             '--storage',
-            choices=['github', 's3', 'google_drive', 'local'],
+            choices=STORAGE_CHOICES,
             default='github',
             help='백업 저장 위치를 선택합니다 (기본값: github)'
         )
+        parser.add_argument(
+            '--mirror',
+            nargs='+',
+            choices=STORAGE_CHOICES,
+            default=[],
+            help='같은 파일을 동시에 기록할 보조 저장소 (실패해도 백업은 성공으로 처리)'
+        )
+        parser.add_argument(
+            '--mode',
+            choices=['full', 'incremental'],
+            default='full',
+            help='full: 전체 백업, incremental: 같은 저장소의 마지막 백업 이후 변경분만 백업 (기본값: full)'
+        )
         parser.add_argument(
             '--format',
             choices=['json', 'xml'],
@@ -53,6 +67,18 @@ class Command(BaseCommand):
             default=True,
             help='미디어 파일도 함께 백업합니다 (기본값: True)'
         )
+        parser.add_argument(
+            '--media-format',
+            choices=['blobs', 'tar'],
+            default='blobs',
+            help='blobs: 해시 단위로 새 파일만 저장소에 업로드 (local/s3/github), tar: tar.gz 아카이브 (기본값: blobs)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f'한 번에 DB에서 읽을 레코드 수 (기본값: {DEFAULT_CHUNK_SIZE}, 메모리 사용량 상한을 결정)'
+        )
         parser.add_argument(
             '--repo',
             help='GitHub 레포지토리 (예: username/repo-name, 환경변수 GITHUB_BACKUP_REPO 사용 가능)'
@@ -63,110 +89,214 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        self.history = None
         self.stdout.write(self.style.SUCCESS('=== 데이터 백업 시작 ==='))
         
-        # GitHub 사용시 설정 확인
-        if options['storage'] == 'github':
-            repo = options.get('repo') or getattr(settings, 'GITHUB_BACKUP_REPO', None) or os.getenv('GITHUB_BACKUP_REPO')
-            token = options.get('token') or getattr(settings, 'GITHUB_TOKEN', None) or os.getenv('GITHUB_TOKEN')
-            
-            if not repo or not token:
-                self.stdout.write(
-                    self.style.ERROR('GitHub 백업을 위해서는 GITHUB_TOKEN과 GITHUB_BACKUP_REPO가 필요합니다.')
-                )
-                self.stdout.write('환경변수 설정: GITHUB_TOKEN=your_token, GITHUB_BACKUP_REPO=username/repo-name')
-                return
-        
-        # S3 사용시 boto3 확인
-        if options['storage'] == 's3' and not HAS_BOTO3:
-            self.stdout.write(
-                self.style.ERROR('S3 백업을 위해서는 boto3 패키지가 필요합니다. pip install boto3')
+        # 저장소 설정 확인 (--mirror가 있으면 보조 저장소에도 동시에 기록)
+        try:
+            storage = get_backup_storage(
+                options['storage'], log=self.stdout.write, repo=options.get('repo'), token=options.get('token')
             )
+            mirrors = [
+                get_backup_storage(name, log=self.stdout.write)
+                for name in options['mirror'] if name != options['storage']
+            ]
+        except StorageError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            if 'GITHUB_TOKEN' in str(e):
+                self.stdout.write('환경변수 설정: GITHUB_TOKEN=your_token, GITHUB_BACKUP_REPO=username/repo-name')
             return
+        if mirrors:
+            storage = FanOutStorage(storage, mirrors, log=self.stdout.write)
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_data = {}
+        # 증분 백업 기준 (같은 저장소의 마지막 성공 백업). 없으면 전체 백업으로 시작
+        started_at = timezone.now()
+        previous = last_backup(options['storage'])
+        mode = options['mode']
+        if mode == 'incremental' and previous is None:
+            self.stdout.write(self.style.WARNING('기준이 될 이전 백업이 없어 전체 백업을 실행합니다.'))
+            mode = 'full'
+        base = previous if mode == 'incremental' else None
+        since = base.watermark - WATERMARK_OVERLAP if base else None
+        if base:
+            self.stdout.write(f'증분 백업: {base.filename} 이후 변경분 ({since:%Y-%m-%d %H:%M:%S} 부터)')
         
-        # 각 모델별로 데이터 백업
-        for model_name in options['models']:
-            try:
-                app_label = 'centers'  # centers 앱의 모델들
-                model = apps.get_model(app_label, model_name)
-                
-                self.stdout.write(f'{model_name} 모델 백업 중...')
-                
-                # 모델의 모든 데이터를 serialize
-                queryset = model.objects.all()
-                serialized_data = serializers.serialize(options['format'], queryset)
-                
-                backup_data[model_name] = {
-                    'count': queryset.count(),
-                    'data': json.loads(serialized_data) if options['format'] == 'json' else serialized_data
-                }
-                
-                self.stdout.write(
-                    self.style.SUCCESS(f'✓ {model_name}: {queryset.count()}개 레코드 백업 완료')
-                )
-                
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'✗ {model_name} 백업 실패: {str(e)}')
-                )
-                continue
-
-        if not backup_data:
-            self.stdout.write(self.style.ERROR('백업할 데이터가 없습니다.'))
-            return
-
-        # 백업 메타데이터 추가
-        backup_data['_metadata'] = {
-            'backup_time': timestamp,
-            'django_version': getattr(settings, 'DJANGO_VERSION', 'unknown'),
-            'total_models': len(backup_data) - 1,  # _metadata 제외
-            'backup_format': options['format'],
-            'storage_type': options['storage'],
-            'includes_media': options['include_media']
-        }
-
-        # JSON 문자열로 변환
-        backup_json = json.dumps(backup_data, ensure_ascii=False, indent=2)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # 파일명 생성
-        data_filename = f'backup_{timestamp}.{options["format"]}'
-        media_filename = f'media_{timestamp}.tar.gz'
+        suffix = '_incremental' if mode == 'incremental' else ''
+        data_filename = f'backup_{timestamp}{suffix}.{options["format"]}'
+        media_filename = f'media_{timestamp}{suffix}.tar.gz'
         
         if options['compress']:
             data_filename += '.gz'
 
-        # 미디어 파일 백업
-        media_archive_path = None
-        if options['include_media']:
-            media_archive_path = self._create_media_archive(timestamp)
-            if media_archive_path:
-                self.stdout.write(self.style.SUCCESS('✓ 미디어 파일 아카이브 생성 완료'))
+        try:
+            # 미디어 변경분 확인 (직전 manifest와 비교, 해시가 같은 파일은 다시 계산하지 않음)
+            media_manifest = previous.media_manifest if previous else {}
+            media_files, deleted_media, media_store = None, [], None
+            if options['include_media'] and options['media_format'] == 'blobs':
+                media_store = get_blob_store(options['storage'])
+                if media_store is None:
+                    self.stdout.write(self.style.WARNING('이 저장소는 미디어 블롭 저장을 지원하지 않아 tar.gz 아카이브로 백업합니다.'))
+            if options['include_media']:
+                media_manifest, changed, deleted_media = scan_media(settings.MEDIA_ROOT, media_manifest)
+                if media_store:
+                    # 전체/증분 모두 전체 manifest를 기록하고, 저장소에 없는 블롭만 업로드
+                    uploaded = upload_media_blobs(media_store, settings.MEDIA_ROOT, media_manifest, log=self.stdout.write)
+                    self.stdout.write(self.style.SUCCESS(
+                        f'✓ 미디어 파일 {len(media_manifest)}개 (새 블롭 {uploaded}개 업로드)'
+                    ))
+                elif mode == 'incremental':
+                    media_files = changed
+                    self.stdout.write(f'변경된 미디어 파일: {len(changed)}개, 삭제된 파일: {len(deleted_media)}개')
 
-        # 저장 위치에 따른 처리
-        if options['storage'] == 'local':
-            self._save_local(backup_json, data_filename, options['compress'])
-            if media_archive_path:
-                self._save_media_local(media_archive_path, media_filename)
-        elif options['storage'] == 'github':
-            self._save_github(backup_json, data_filename, options['compress'], repo, token, timestamp, media_archive_path, media_filename)
-        elif options['storage'] == 's3':
-            self._save_s3(backup_json, data_filename, options['compress'])
-        elif options['storage'] == 'google_drive':
-            self._save_google_drive(backup_json, data_filename, options['compress'])
+            # 각 모델별 레코드를 임시 파일에 바로 기록 (전체 백업을 메모리에 올리지 않음)
+            data_path = create_temp_path(suffix=f'_{data_filename}')
+            try:
+                backed_up = self._write_data_file(data_path, timestamp, options, {
+                    'backup_mode': mode,
+                    'filename': data_filename,
+                    'base_backup': base.filename if base else None,
+                    'since': since,
+                    'watermark': started_at,
+                    'deleted_media': deleted_media if mode == 'incremental' and not media_store else [],
+                }, media=media_section(media_store, media_manifest) if media_store else None)
+            except Exception:
+                os.remove(data_path)
+                raise
 
-        # 임시 미디어 아카이브 파일 정리
-        if media_archive_path and os.path.exists(media_archive_path):
-            os.remove(media_archive_path)
+            if backed_up is None:
+                os.remove(data_path)
+                self.stdout.write(self.style.ERROR('백업할 데이터가 없습니다.'))
+                return
+            file_size = os.path.getsize(data_path)
+
+            # 미디어 파일 백업 (증분이면 바뀐 파일만)
+            media_archive_path = None
+            if options['include_media'] and not media_store and (media_files is None or media_files):
+                media_archive_path = self._create_media_archive(timestamp, media_files)
+                if media_archive_path:
+                    self.stdout.write(self.style.SUCCESS('✓ 미디어 파일 아카이브 생성 완료'))
+                else:
+                    # 아카이브에 담지 못했으므로 다음 백업에서 다시 변경분으로 잡히도록 manifest를 유지
+                    media_manifest = previous.media_manifest if previous else {}
+
+            # 데이터 파일과 미디어 아카이브를 동시에 업로드 (재시도, 업로드 후 체크섬 검증)
+            try:
+                uploads = [Upload(
+                    data_path, data_filename,
+                    content_type='application/gzip' if options['compress'] else 'application/json',
+                )]
+                if media_archive_path:
+                    uploads.append(Upload(media_archive_path, media_filename, kind='media'))
+                locations = storage.save(uploads, timestamp)
+                # 백업 목록에 기록할 체크섬 (임시 파일을 지우기 전에 계산, 검증에서 이미 계산했으면 재사용)
+                for upload in uploads:
+                    upload.compute_digest()
+            except StorageError as e:
+                self.stdout.write(self.style.ERROR(str(e)))
+                raise CommandError(f'백업 파일을 {options["storage"]}에 저장하지 못했습니다.')
+            finally:
+                # 임시 파일 정리
+                for path in (data_path, media_archive_path):
+                    if path and os.path.exists(path):
+                        os.remove(path)
+        except Exception as e:
+            self.history = BackupHistory.objects.create(
+                filename=f"failed_backup_{timestamp}",
+                file_size=0,
+                backup_type=options['storage'],
+                status='failed',
+                models_count={},
+                backup_mode=mode,
+                error_message=str(e)
+            )
+            raise
+
+        # 다음 증분 백업의 기준 (watermark = 이번 백업 시작 시각)
+        self.history = BackupHistory.objects.create(
+            filename=data_filename,
+            file_size=file_size,
+            backup_type=options['storage'],
+            status='success',
+            models_count=backed_up,
+            backup_mode=mode,
+            watermark=started_at,
+            base_backup=base,
+            media_manifest=media_manifest,
+        )
+        # 백업 목록 (list_backups, 대시보드가 원격 API 없이 읽음)
+        catalog_metadata = {
+            'backup_format': options['format'],
+            'backup_mode': mode,
+            'record_counts': backed_up,
+        }
+        record_uploads(options['storage'], uploads, locations, history=self.history, metadata=catalog_metadata)
+        for mirror_name, mirror_locations in getattr(storage, 'mirror_locations', {}).items():
+            record_uploads(mirror_name, uploads, mirror_locations, history=self.history, metadata=catalog_metadata)
+
+        pruned = prune_tombstones()
+        if pruned:
+            self.stdout.write(f'오래된 삭제 기록 {pruned}개 정리')
 
         self.stdout.write(
             self.style.SUCCESS(f'=== 백업 완료: {data_filename} ===')
         )
 
-    def _create_media_archive(self, timestamp):
-        """미디어 파일들을 tar.gz로 압축합니다"""
+    def _write_data_file(self, data_path, timestamp, options, chain, media=None):
+        """
+        모델별 데이터를 스트리밍으로 백업 파일에 기록하고 {모델명: 레코드 수}를 반환합니다.
+        증분 백업(chain['since']가 있음)이면 삭제 목록을 먼저 쓰고 그 이후 바뀐 행만 기록합니다.
+        media가 있으면 미디어 블롭 manifest를 '_media' 구역으로 기록합니다.
+        """
+        since = chain['since']
+        with StreamingBackupWriter(data_path, compress=options['compress'], chunk_size=options['chunk_size']) as writer:
+            if since:
+                deletions = deletions_since(since, options['models'])
+                writer.write_section('_deletions', deletions)
+                for model_name, pks in deletions.items():
+                    self.stdout.write(f'{model_name}: 삭제 {len(pks)}개 기록')
+
+            for model_name in options['models']:
+                try:
+                    app_label = 'centers'  # centers 앱의 모델들
+                    model = apps.get_model(app_label, model_name)
+                except LookupError as e:
+                    self.stdout.write(
+                        self.style.ERROR(f'✗ {model_name} 백업 실패: {str(e)}')
+                    )
+                    continue
+                
+                self.stdout.write(f'{model_name} 모델 백업 중...')
+                queryset = changed_queryset(model, since) if since else model.objects.all()
+                count = writer.write_model(model_name, queryset, options['format'])
+                self.stdout.write(
+                    self.style.SUCCESS(f'✓ {model_name}: {count}개 레코드 백업 완료')
+                )
+
+            if not writer.counts:
+                return None
+
+            if media:
+                writer.write_section('_media', media)
+
+            # 백업 메타데이터 추가
+            writer.write_metadata({
+                'backup_time': timestamp,
+                'django_version': getattr(settings, 'DJANGO_VERSION', 'unknown'),
+                'total_models': len(writer.counts),
+                'backup_format': options['format'],
+                'storage_type': options['storage'],
+                'includes_media': options['include_media'],
+                'media_format': 'blobs' if media else 'tar',
+                'record_counts': writer.counts,
+                **chain,
+            })
+            return writer.counts
+
+    def _create_media_archive(self, timestamp, files=None):
+        """미디어 파일들을 tar.gz로 압축합니다 (files를 주면 그 파일들만, MEDIA_ROOT 기준 상대 경로)"""
         try:
             media_root = settings.MEDIA_ROOT
             if not os.path.exists(media_root):
@@ -178,6 +308,12 @@ class Command(BaseCommand):
             temp_file.close()
             
             with tarfile.open(temp_file.name, 'w:gz') as tar:
+                if files is not None:
+                    for relpath in files:
+                        tar.add(os.path.join(media_root, relpath), arcname=relpath)
+                    self.stdout.write(f'✓ 변경된 미디어 파일 {len(files)}개 추가')
+                    return temp_file.name
+
                 # centers/ 폴더 (상담소 이미지)
                 centers_path = os.path.join(media_root, 'centers')
                 if os.path.exists(centers_path):
@@ -203,224 +339,3 @@ class Command(BaseCommand):
                 self.style.ERROR(f'미디어 파일 아카이브 생성 실패: {str(e)}')
             )
             return None
-
-    def _save_local(self, data, filename, compress):
-        """로컬에 백업 파일 저장"""
-        backup_dir = os.path.join(settings.BASE_DIR, 'backups')
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        filepath = os.path.join(backup_dir, filename)
-        
-        if compress:
-            with gzip.open(filepath, 'wb') as f:
-                f.write(data.encode('utf-8'))
-        else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(data)
-                
-        self.stdout.write(f'로컬에 저장 완료: {filepath}')
-
-    def _save_media_local(self, media_archive_path, media_filename):
-        """로컬에 미디어 아카이브 저장"""
-        backup_dir = os.path.join(settings.BASE_DIR, 'backups')
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        dest_path = os.path.join(backup_dir, media_filename)
-        
-        import shutil
-        shutil.copy2(media_archive_path, dest_path)
-        self.stdout.write(f'미디어 파일 로컬 저장 완료: {dest_path}')
-
-    def _save_github(self, data, data_filename, compress, repo, token, timestamp, media_archive_path, media_filename):
-        """GitHub Releases에 백업 파일 저장"""
-        try:
-            # 데이터 압축 처리
-            if compress:
-                import io
-                buffer = io.BytesIO()
-                with gzip.GzipFile(fileobj=buffer, mode='wb') as f:
-                    f.write(data.encode('utf-8'))
-                upload_data = buffer.getvalue()
-            else:
-                upload_data = data.encode('utf-8')
-            
-            headers = {
-                'Authorization': f'token {token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
-            # 1. Release 생성
-            tag_name = f'backup-{timestamp}'
-            release_data = {
-                'tag_name': tag_name,
-                'name': f'Complete Backup {timestamp}',
-                'body': f'''자동 백업 생성일: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-📊 **백업 내용:**
-- 데이터베이스: {data_filename}
-- 미디어 파일: {media_filename if media_archive_path else "미디어 파일 없음"}
-
-⚠️ **복원 시 주의사항:**
-- 두 파일을 모두 다운로드하여 복원해야 완전한 복원이 가능합니다
-- 데이터 파일만으로는 이미지가 복원되지 않습니다''',
-                'draft': False,
-                'prerelease': True
-            }
-            
-            create_url = f'https://api.github.com/repos/{repo}/releases'
-            response = requests.post(create_url, headers=headers, json=release_data)
-            
-            if response.status_code != 201:
-                raise Exception(f'Release 생성 실패: {response.status_code} - {response.text}')
-            
-            upload_url = response.json()['upload_url'].replace('{?name,label}', '')
-            
-            # 2. 데이터 파일 업로드
-            upload_headers = {
-                'Authorization': f'token {token}',
-                'Content-Type': 'application/gzip' if compress else 'application/json'
-            }
-            
-            upload_response = requests.post(
-                f'{upload_url}?name={data_filename}',
-                headers=upload_headers,
-                data=upload_data
-            )
-            
-            if upload_response.status_code == 201:
-                download_url = upload_response.json()['browser_download_url']
-                self.stdout.write(f'데이터 파일 GitHub에 저장 완료: {download_url}')
-            else:
-                raise Exception(f'데이터 파일 업로드 실패: {upload_response.status_code}')
-            
-            # 3. 미디어 파일 업로드
-            if media_archive_path and os.path.exists(media_archive_path):
-                with open(media_archive_path, 'rb') as f:
-                    media_data = f.read()
-                
-                media_headers = {
-                    'Authorization': f'token {token}',
-                    'Content-Type': 'application/gzip'
-                }
-                
-                media_response = requests.post(
-                    f'{upload_url}?name={media_filename}',
-                    headers=media_headers,
-                    data=media_data
-                )
-                
-                if media_response.status_code == 201:
-                    media_download_url = media_response.json()['browser_download_url']
-                    self.stdout.write(f'미디어 파일 GitHub에 저장 완료: {media_download_url}')
-                else:
-                    self.stdout.write(f'미디어 파일 업로드 실패: {media_response.status_code}')
-                
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'GitHub 백업 실패: {str(e)}')
-            )
-
-    def _save_s3(self, data, filename, compress):
-        """AWS S3에 백업 파일 저장"""
-        if not HAS_BOTO3:
-            self.stdout.write(
-                self.style.ERROR('boto3 패키지가 필요합니다.')
-            )
-            return
-            
-        try:
-            # AWS 설정 확인
-            aws_access_key = getattr(settings, 'AWS_ACCESS_KEY_ID', None)
-            aws_secret_key = getattr(settings, 'AWS_SECRET_ACCESS_KEY', None)
-            bucket_name = getattr(settings, 'AWS_BACKUP_BUCKET_NAME', None)
-            
-            if not all([aws_access_key, aws_secret_key, bucket_name]):
-                self.stdout.write(
-                    self.style.ERROR('AWS 설정이 완료되지 않았습니다. settings에서 AWS 설정을 확인하세요.')
-                )
-                return
-            
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
-                region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2')
-            )
-            
-            # 데이터 준비
-            if compress:
-                import io
-                buffer = io.BytesIO()
-                with gzip.GzipFile(fileobj=buffer, mode='wb') as f:
-                    f.write(data.encode('utf-8'))
-                upload_data = buffer.getvalue()
-            else:
-                upload_data = data.encode('utf-8')
-            
-            # S3에 업로드
-            s3_key = f'backups/{filename}'
-            s3_client.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=upload_data,
-                ContentType='application/gzip' if compress else 'application/json',
-                Metadata={
-                    'backup-type': 'django-data',
-                    'timestamp': datetime.now().isoformat()
-                }
-            )
-            
-            self.stdout.write(f'S3에 저장 완료: s3://{bucket_name}/{s3_key}')
-            
-        except ClientError as e:
-            self.stdout.write(
-                self.style.ERROR(f'S3 업로드 실패: {str(e)}')
-            )
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'S3 백업 중 오류 발생: {str(e)}')
-            )
-
-    def _save_google_drive(self, data, filename, compress):
-        """Google Drive에 백업 파일 저장 (Webhook 방식)"""
-        try:
-            webhook_url = getattr(settings, 'GOOGLE_DRIVE_WEBHOOK_URL', None)
-            
-            if not webhook_url:
-                self.stdout.write(
-                    self.style.ERROR('Google Drive Webhook URL이 설정되지 않았습니다.')
-                )
-                return
-            
-            # 데이터 준비
-            if compress:
-                import base64
-                import io
-                buffer = io.BytesIO()
-                with gzip.GzipFile(fileobj=buffer, mode='wb') as f:
-                    f.write(data.encode('utf-8'))
-                upload_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            else:
-                upload_data = data
-            
-            # Webhook으로 전송
-            payload = {
-                'filename': filename,
-                'data': upload_data,
-                'compressed': compress,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            response = requests.post(webhook_url, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            self.stdout.write(f'Google Drive에 저장 완료: {filename}')
-            
-        except requests.RequestException as e:
-            self.stdout.write(
-                self.style.ERROR(f'Google Drive 업로드 실패: {str(e)}')
-            )
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'Google Drive 백업 중 오류 발생: {str(e)}')
-            ) 
\ No newline at end of file
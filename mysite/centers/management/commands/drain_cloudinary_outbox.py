@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from centers.cloudinary_outbox import OutboxDrainer
+from centers.models import CloudinaryOutbox
+
+
+class Command(BaseCommand):
+    help = '아웃박스에 기록된 Cloudinary 업로드/삭제를 바로 처리합니다 (평소에는 run_worker가 처리)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='한 번에 가져올 항목 수 (기본값/최대: 100)'
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='실패로 남은 항목을 다시 대기 상태로 돌린 뒤 처리'
+        )
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            count = CloudinaryOutbox.objects.filter(status=CloudinaryOutbox.STATUS_FAILED).update(
+                status=CloudinaryOutbox.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now()
+            )
+            self.stdout.write(f'🔁 실패 항목 {count}개를 다시 대기열에 넣었습니다')
+
+        self.stdout.write(self.style.SUCCESS('=== Cloudinary 아웃박스 처리 시작 ==='))
+        started = time.monotonic()
+        stats = OutboxDrainer(batch_size=options['batch_size'], log=self.stdout.write).drain()
+        elapsed = time.monotonic() - started
+        summary = ', '.join(f'{key} {value}' for key, value in stats.items())
+        self.stdout.write(self.style.SUCCESS(f'=== Cloudinary 아웃박스 처리 완료: {summary} ({elapsed:.2f}초) ==='))
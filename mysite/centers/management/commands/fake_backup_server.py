@@ -0,0 +1,36 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from centers.fake_storage_server import FakeStorageServer
+
+
+class Command(BaseCommand):
+    help = '로컬 테스트용 HTTP 백업 대상을 실행합니다 (backup_data --storage http / --mirror http)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='바인딩 주소 (기본값: 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=8765, help='포트 (기본값: 8765)')
+        parser.add_argument(
+            '--root',
+            default=os.path.join(settings.BASE_DIR, 'backups', 'fake_http'),
+            help='업로드된 파일을 저장할 폴더 (기본값: backups/fake_http)'
+        )
+        parser.add_argument(
+            '--flaky',
+            type=int,
+            default=0,
+            help='N번째 PUT 요청마다 503으로 실패 (재시도/이어 올리기 확인용, 기본값: 0=끔)'
+        )
+
+    def handle(self, *args, **options):
+        server = FakeStorageServer(
+            options['root'], host=options['host'], port=options['port'], flaky=options['flaky'], verbose=True
+        )
+        self.stdout.write(self.style.SUCCESS(f'테스트 백업 서버 실행: {server.url} (저장 위치: {options["root"]})'))
+        self.stdout.write(f'BACKUP_HTTP_URL={server.url} 로 설정하면 backup_data --storage http 로 업로드합니다.')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write('\n테스트 백업 서버 종료')
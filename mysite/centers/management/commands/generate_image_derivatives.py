@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from centers.image_derivatives import generate_derivatives, image_source, is_derivable, media_is_local
+from centers.models import CenterImage, Therapist
+
+
+class Command(BaseCommand):
+    help = 'Cloudinary URL이 없는 상담소 이미지/상담사 사진의 축소 WebP 파생본을 미리 생성합니다 (없으면 첫 요청 때 생성)'
+
+    def handle(self, *args, **options):
+        if not media_is_local():
+            self.stdout.write(self.style.WARNING('미디어 저장소가 원격(Cloudinary)이므로 파생본 대신 Cloudinary 변환 URL을 사용합니다.'))
+            return
+
+        self.stdout.write(self.style.SUCCESS('=== 이미지 파생본 생성 시작 ==='))
+
+        started = time.monotonic()
+        generated, failed = 0, 0
+        objects = list(CenterImage.objects.filter(image_url__isnull=True).exclude(image=''))
+        objects += list(Therapist.objects.filter(photo_url__isnull=True).exclude(photo=''))
+        for obj in objects:
+            url, name = image_source(obj)
+            if url or not is_derivable(name):
+                continue
+            try:
+                generate_derivatives(name)
+                generated += 1
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.WARNING(f'⚠️ {name}: {e}'))
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f'=== 이미지 파생본 생성 완료: {generated}개 이미지, 실패 {failed}개 ({elapsed:.2f}초) ==='
+        ))
@@ -0,0 +1,85 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from centers.geocoding import geocode_many
+from centers.models import Center
+from centers.restore import invalidate_caches
+from centers.search import CenterSearch
+
+
+class Command(BaseCommand):
+    help = '좌표(위도/경도)가 없는 상담소의 주소를 변환해 채웁니다 (캐시 우선, 동시 요청 수와 초당 요청 수 제한)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='동시 요청 수 (기본값: settings.GEOCODE_WORKERS)'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=None,
+            help='초당 최대 요청 수 (기본값: settings.GEOCODE_RATE_LIMIT)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='한 번에 변환하고 저장할 상담소 수 (기본값: 200)'
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='캐시를 무시하고 공급자에서 다시 가져옴'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='변환만 하고 상담소는 저장하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        pending = Center.objects.filter(Q(latitude__isnull=True) | Q(longitude__isnull=True)).exclude(address='')
+        centers = list(pending.only('id', 'address', 'latitude', 'longitude').order_by('id'))
+        self.stdout.write(self.style.SUCCESS(f'=== 좌표 변환 시작: 좌표 없는 상담소 {len(centers)}개 ==='))
+
+        started = time.monotonic()
+        updated, not_found, failed = [], 0, 0
+        batch_size = max(options['batch_size'], 1)
+        for start in range(0, len(centers), batch_size):
+            batch = centers[start:start + batch_size]
+            results = geocode_many(
+                [center.address for center in batch],
+                workers=options['workers'], rate_limit=options['rate'], refresh=options['refresh'],
+                log=self.stdout.write,
+            )
+            changed = []
+            for center in batch:
+                if center.address not in results:
+                    failed += 1
+                elif results[center.address] is None:
+                    not_found += 1
+                    self.stdout.write(self.style.WARNING(f'⚠️ 검색 결과 없음: {center.address}'))
+                else:
+                    center.latitude, center.longitude = results[center.address]
+                    center.geohash = center.compute_geohash()
+                    changed.append(center)
+            if changed and not options['dry_run']:
+                Center.objects.bulk_update(changed, ['latitude', 'longitude', 'geohash'])
+            updated.extend(changed)
+            self.stdout.write(f'  {start + len(batch)}/{len(centers)} 처리')
+
+        # bulk_update는 시그널을 거치지 않으므로 검색 문서와 캐시를 한 번에 갱신
+        if updated and not options['dry_run']:
+            CenterSearch().index([center.pk for center in updated])
+            invalidate_caches(['Center'])
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'=== 좌표 변환 완료: {len(updated)}개 저장{" (dry-run, 저장 안 함)" if options["dry_run"] else ""}, '
+            f'검색 결과 없음 {not_found}개, 실패 {failed}개 ({elapsed:.2f}초) ==='
+        ))
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from centers.models import Center
+
+
+class Command(BaseCommand):
+    help = '상담소별 리뷰 집계(리뷰 수, 평균 평점, 평점 분포, 최근 리뷰 시각)를 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--center',
+            type=int,
+            nargs='+',
+            help='재계산할 상담소 ID (미지정시 전체)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 갱신할 상담소 수 (기본값: 500)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('=== 리뷰 집계 재계산 시작 ==='))
+
+        centers = Center.objects.all()
+        if options.get('center'):
+            centers = centers.filter(pk__in=options['center'])
+
+        started = time.monotonic()
+        updated = centers.refresh_review_stats(batch_size=options['batch_size'])
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(f'=== 리뷰 집계 재계산 완료: {updated}개 상담소 ({elapsed:.2f}초) ===')
+        )
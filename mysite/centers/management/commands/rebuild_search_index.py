@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from centers.search import CenterSearch
+
+
+class Command(BaseCommand):
+    help = '상담소 검색 색인(이름, 전화번호, 주소, 상담사, 설명/리뷰)을 다시 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--center',
+            type=int,
+            nargs='+',
+            help='재색인할 상담소 ID (미지정시 전체)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='한 번에 색인할 상담소 수 (기본값: 200)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('=== 검색 색인 재생성 시작 ==='))
+
+        search = CenterSearch()
+        started = time.monotonic()
+        if options.get('center'):
+            indexed = search.index(options['center'], batch_size=options['batch_size'])
+        else:
+            indexed = search.rebuild(batch_size=options['batch_size'])
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(f'=== 검색 색인 재생성 완료: {indexed}개 상담소 ({elapsed:.2f}초) ===')
+        )
@@ -1,13 +1,13 @@
 import os
-import json
-import gzip
 from django.core.management.base import BaseCommand
-from django.core import serializers
-from django.db import transaction
-from django.apps import apps
 from django.conf import settings
 import requests
 
+from centers.backup_io import BackupFormatError, create_temp_path, iter_backup_file
+from centers.backup_storage import download_http_file
+from centers.media_store import get_blob_store, restore_media_blobs
+from centers.restore import DEFAULT_BATCH_SIZE, RestoreEngine
+
 # boto3는 선택적 import (S3 사용시에만 필요)
 try:
     import boto3
@@ -22,12 +22,14 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument(
-            'backup_file',
-            help='복원할 백업 파일의 경로 또는 이름'
+            'backup_files',
+            nargs='+',
+            metavar='backup_file',
+            help='복원할 백업 파일의 경로 또는 이름. 전체 백업 뒤에 증분 백업들을 순서대로 나열하면 차례로 적용합니다'
         )
         parser.add_argument(
             '--storage',
-            choices=['github', 's3', 'local'],
+            choices=['github', 's3', 'local', 'http'],
             default='github',
             help='백업 파일이 저장된 위치 (기본값: github)'
         )
@@ -46,6 +48,17 @@ class Command(BaseCommand):
             action='store_true',
             help='실제 복원하지 않고 복원 과정만 시뮬레이션합니다'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'한 번에 저장할 레코드 수 (기본값: {DEFAULT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--skip-media',
+            action='store_true',
+            help='미디어 블롭 manifest가 있어도 미디어 파일은 복원하지 않습니다'
+        )
         parser.add_argument(
             '--force',
             action='store_true',
@@ -76,74 +89,126 @@ class Command(BaseCommand):
         if options['dry_run']:
             self.stdout.write(self.style.WARNING('DRY RUN 모드: 실제 데이터는 변경되지 않습니다.'))
         
-        # 백업 파일 읽기
-        backup_data = self._load_backup_file(options['backup_file'], options['storage'])
-        
-        if not backup_data:
-            self.stdout.write(self.style.ERROR('백업 파일을 읽을 수 없습니다.'))
-            return
-        
-        # 메타데이터 확인
-        metadata = backup_data.get('_metadata', {})
-        self.stdout.write(f"백업 생성 시간: {metadata.get('backup_time', '알 수 없음')}")
-        self.stdout.write(f"백업 형식: {metadata.get('backup_format', '알 수 없음')}")
-        self.stdout.write(f"총 모델 수: {metadata.get('total_models', '알 수 없음')}")
-        self.stdout.write(f"저장 방식: {metadata.get('storage_type', '알 수 없음')}")
-        
-        # 복원할 모델들 결정
-        models_to_restore = options.get('models') or [
-            key for key in backup_data.keys() if key != '_metadata'
-        ]
-        
-        self.stdout.write(f"복원할 모델들: {', '.join(models_to_restore)}")
-        
-        if not options['dry_run'] and not options['force']:
-            # 사용자 확인 (dry-run이나 force 옵션이 아닌 경우)
-            confirm = input('\n정말로 데이터를 복원하시겠습니까? (yes/no): ')
-            if confirm.lower() != 'yes':
-                self.stdout.write(self.style.WARNING('복원이 취소되었습니다.'))
+        # 백업 파일 내려받기 (내용은 복원하면서 스트리밍으로 읽음)
+        fetched = []
+        try:
+            for backup_file in options['backup_files']:
+                backup_path, is_temp = self._fetch_backup_file(backup_file, options['storage'])
+                if not backup_path:
+                    self.stdout.write(self.style.ERROR(f'백업 파일을 읽을 수 없습니다: {backup_file}'))
+                    return
+                fetched.append((backup_path, is_temp))
+            backup_paths = [path for path, is_temp in fetched]
+            
+            if not options['dry_run'] and not options['force']:
+                # 사용자 확인 (dry-run이나 force 옵션이 아닌 경우)
+                for backup_path in backup_paths:
+                    self._print_metadata(self._read_metadata(backup_path))
+                confirm = input('\n정말로 데이터를 복원하시겠습니까? (yes/no): ')
+                if confirm.lower() != 'yes':
+                    self.stdout.write(self.style.WARNING('복원이 취소되었습니다.'))
+                    return
+            elif options['force']:
+                self.stdout.write(self.style.WARNING('--force 옵션이 설정되어 사용자 확인을 건너뜁니다.'))
+            
+            if options.get('models'):
+                self.stdout.write(f"복원할 모델들: {', '.join(options['models'])}")
+            if len(backup_paths) > 1:
+                self.stdout.write(f'전체 백업 1개 + 증분 백업 {len(backup_paths) - 1}개를 순서대로 적용합니다.')
+            
+            # 데이터 복원 실행 (여러 파일이면 한 트랜잭션에서 차례로 적용)
+            engine = RestoreEngine(
+                batch_size=options['batch_size'],
+                models=options.get('models'),
+                clear_existing=options['clear_existing'],
+                dry_run=options['dry_run'],
+                log=self.stdout.write,
+            )
+            try:
+                report = engine.restore_chain(backup_paths)
+            except BackupFormatError as e:
+                self.stdout.write(self.style.ERROR(f'백업 파일 로드 실패: {str(e)}'))
                 return
-        elif options['force']:
-            self.stdout.write(self.style.WARNING('--force 옵션이 설정되어 사용자 확인을 건너뜁니다.'))
+        finally:
+            for backup_path, is_temp in fetched:
+                if is_temp and os.path.exists(backup_path):
+                    os.remove(backup_path)
         
-        # 데이터 복원 실행
-        with transaction.atomic():
-            for model_name in models_to_restore:
-                if model_name not in backup_data:
-                    self.stdout.write(
-                        self.style.WARNING(f'{model_name} 모델 데이터가 백업에 없습니다.')
-                    )
-                    continue
-                
-                self._restore_model_data(
-                    model_name, 
-                    backup_data[model_name], 
-                    options['clear_existing'],
-                    options['dry_run']
+        if options['force'] or options['dry_run']:
+            for metadata in report.chain:
+                self._print_metadata(metadata)
+        
+        for model_name in options.get('models') or []:
+            if model_name not in report.models:
+                self.stdout.write(
+                    self.style.WARNING(f'{model_name} 모델 데이터가 백업에 없습니다.')
                 )
         
+        stats = report.as_dict()
         if options['dry_run']:
+            for model_name, entry in stats['models'].items():
+                self.stdout.write(
+                    self.style.SUCCESS(f"✓ [DRY RUN] {model_name}: {entry['restored']}개 레코드 복원 예정")
+                )
             self.stdout.write(self.style.SUCCESS('=== DRY RUN 완료 ==='))
         else:
+            for model_name, deleted in stats['deleted'].items():
+                self.stdout.write(f'✓ {model_name}: {deleted}개 삭제 반영')
+            self.stdout.write(f"총 {stats['total_restored']}개 레코드, {stats['seconds']}초")
+            if report.media and not options['skip_media']:
+                self._restore_media(report.media)
             self.stdout.write(self.style.SUCCESS('=== 데이터 복원 완료 ==='))
 
-    def _load_backup_file(self, backup_file, storage):
-        """백업 파일을 로드합니다"""
+    def _restore_media(self, media):
+        """마지막 백업의 manifest 기준으로 로컬에 없거나 바뀐 미디어 파일만 블롭 저장소에서 받아옴"""
+        store = get_blob_store(media.get('store'))
+        if store is None:
+            self.stdout.write(
+                self.style.WARNING(f"미디어 블롭 저장소({media.get('store')}) 설정이 없어 미디어 파일은 복원하지 않았습니다.")
+            )
+            return
+        result = restore_media_blobs(store, media, settings.MEDIA_ROOT, log=self.stdout.write)
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ 미디어 파일 {result['fetched']}개 복원, {result['skipped']}개는 이미 최신")
+        )
+
+    def _read_metadata(self, backup_path):
+        """백업 메타데이터 (파일 끝에 있으므로 레코드는 건너뛰며 읽음)"""
+        try:
+            for event, key, payload in iter_backup_file(backup_path):
+                if event == 'metadata' and key == '_metadata':
+                    return payload
+        except BackupFormatError:
+            pass
+        return {}
+
+    def _print_metadata(self, metadata):
+        self.stdout.write(f"백업 생성 시간: {metadata.get('backup_time', '알 수 없음')}")
+        if metadata.get('backup_mode') == 'incremental':
+            self.stdout.write(f"증분 백업 (기준: {metadata.get('base_backup')})")
+        self.stdout.write(f"백업 형식: {metadata.get('backup_format', '알 수 없음')}")
+        self.stdout.write(f"총 모델 수: {metadata.get('total_models', '알 수 없음')}")
+        self.stdout.write(f"저장 방식: {metadata.get('storage_type', '알 수 없음')}")
+
+    def _fetch_backup_file(self, backup_file, storage):
+        """백업 파일의 로컬 경로와 임시 파일 여부를 반환합니다"""
         try:
             if storage == 'local':
-                return self._load_local_file(backup_file)
+                return self._local_file_path(backup_file), False
             elif storage == 'github':
-                return self._load_github_file(backup_file)
+                return self._download_github_file(backup_file), True
             elif storage == 's3':
-                return self._load_s3_file(backup_file)
+                return self._download_s3_file(backup_file), True
+            elif storage == 'http':
+                return download_http_file(backup_file, log=self.stdout.write), True
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'백업 파일 로드 실패: {str(e)}')
             )
-            return None
+        return None, False
 
-    def _load_local_file(self, backup_file):
-        """로컬 백업 파일을 로드합니다"""
+    def _local_file_path(self, backup_file):
+        """로컬 백업 파일 경로"""
         # 절대 경로가 아닌 경우 backups 디렉토리에서 찾기
         if not os.path.isabs(backup_file):
             backup_dir = os.path.join(settings.BASE_DIR, 'backups')
@@ -152,19 +217,10 @@ class Command(BaseCommand):
         if not os.path.exists(backup_file):
             raise FileNotFoundError(f'백업 파일을 찾을 수 없습니다: {backup_file}')
         
-        # 파일 확장자에 따라 압축 여부 판단
-        is_compressed = backup_file.endswith('.gz')
-        
-        if is_compressed:
-            with gzip.open(backup_file, 'rb') as f:
-                content = f.read().decode('utf-8')
-                return json.loads(content)
-        else:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        return backup_file
 
-    def _load_github_file(self, backup_file):
-        """GitHub Releases에서 백업 파일을 로드합니다"""
+    def _download_github_file(self, backup_file):
+        """GitHub Releases에서 백업 파일을 임시 파일로 내려받습니다"""
         try:
             token = getattr(settings, 'GITHUB_TOKEN', None) or os.getenv('GITHUB_TOKEN')
             repo = getattr(settings, 'GITHUB_BACKUP_REPO', None) or os.getenv('GITHUB_BACKUP_REPO')
@@ -202,26 +258,20 @@ class Command(BaseCommand):
             
             # 파일 다운로드
             self.stdout.write(f'GitHub에서 파일 다운로드 중: {download_url}')
-            download_response = requests.get(download_url, headers={'Authorization': f'token {token}'})
-            download_response.raise_for_status()
-            
-            file_content = download_response.content
-            
-            # 압축 여부 판단
-            is_compressed = backup_file.endswith('.gz')
+            download_path = create_temp_path(suffix=f'_{os.path.basename(backup_file)}')
+            with requests.get(download_url, headers={'Authorization': f'token {token}'}, stream=True) as download_response:
+                download_response.raise_for_status()
+                with open(download_path, 'wb') as f:
+                    for chunk in download_response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
             
-            if is_compressed:
-                import io
-                with gzip.GzipFile(fileobj=io.BytesIO(file_content)) as f:
-                    return json.load(f)
-            else:
-                return json.loads(file_content.decode('utf-8'))
+            return download_path
                 
         except Exception as e:
             raise Exception(f'GitHub에서 파일을 다운로드할 수 없습니다: {str(e)}')
 
-    def _load_s3_file(self, backup_file):
-        """S3 백업 파일을 로드합니다"""
+    def _download_s3_file(self, backup_file):
+        """S3 백업 파일을 임시 파일로 내려받습니다"""
         if not HAS_BOTO3:
             raise Exception('boto3 패키지가 필요합니다.')
             
@@ -245,74 +295,9 @@ class Command(BaseCommand):
             s3_key = f'backups/{backup_file}' if not backup_file.startswith('backups/') else backup_file
             
             # S3에서 파일 다운로드
-            response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-            file_content = response['Body'].read()
-            
-            # 압축 여부 판단
-            is_compressed = backup_file.endswith('.gz')
-            
-            if is_compressed:
-                import io
-                with gzip.GzipFile(fileobj=io.BytesIO(file_content)) as f:
-                    return json.load(f)
-            else:
-                return json.loads(file_content.decode('utf-8'))
+            download_path = create_temp_path(suffix=f'_{os.path.basename(backup_file)}')
+            s3_client.download_file(bucket_name, s3_key, download_path)
+            return download_path
                 
         except ClientError as e:
             raise Exception(f'S3에서 파일을 다운로드할 수 없습니다: {str(e)}')
-
-    def _restore_model_data(self, model_name, model_data, clear_existing, dry_run):
-        """특정 모델의 데이터를 복원합니다"""
-        try:
-            app_label = 'centers'
-            model = apps.get_model(app_label, model_name)
-            
-            record_count = model_data.get('count', 0)
-            backup_records = model_data.get('data', [])
-            
-            self.stdout.write(f'{model_name} 모델 복원 중... ({record_count}개 레코드)')
-            
-            if dry_run:
-                self.stdout.write(
-                    self.style.SUCCESS(f'✓ [DRY RUN] {model_name}: {record_count}개 레코드 복원 예정')
-                )
-                return
-            
-            # 기존 데이터 삭제 (옵션)
-            if clear_existing:
-                deleted_count = model.objects.count()
-                model.objects.all().delete()
-                self.stdout.write(f'기존 {model_name} 데이터 {deleted_count}개 삭제')
-            
-            # 데이터 복원
-            if backup_records:
-                # JSON 데이터를 다시 serialize 형태로 변환
-                serialized_data = json.dumps(backup_records)
-                
-                # deserialize하여 객체 생성
-                objects = []
-                for deserialized_obj in serializers.deserialize('json', serialized_data):
-                    objects.append(deserialized_obj.object)
-                
-                # bulk_create로 효율적으로 생성
-                if objects:
-                    model.objects.bulk_create(objects, ignore_conflicts=True)
-                    
-                    # 실제 생성된 객체 수 확인
-                    created_count = len(objects)
-                    self.stdout.write(
-                        self.style.SUCCESS(f'✓ {model_name}: {created_count}개 레코드 복원 완료')
-                    )
-                else:
-                    self.stdout.write(
-                        self.style.WARNING(f'- {model_name}: 복원할 데이터가 없습니다')
-                    )
-            else:
-                self.stdout.write(
-                    self.style.WARNING(f'- {model_name}: 백업 데이터가 비어있습니다')
-                )
-                
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'✗ {model_name} 복원 실패: {str(e)}')
-            ) 
\ No newline at end of file
@@ -88,7 +88,9 @@ class Command(BaseCommand):
         schedule.clear()
         
         if interval == 'hourly':
-            schedule.every().hour.do(lambda: self._run_backup(storage))
+            # 매시간은 직전 백업 이후 변경분만 (증분), 하루 한 번 --time에 전체 백업으로 체인을 새로 시작
+            schedule.every().hour.do(lambda: self._run_backup(storage, mode='incremental'))
+            schedule.every().day.at(backup_time).do(lambda: self._run_backup(storage))
             # 정리 작업은 매일 한 번만
             schedule.every().day.at("03:00").do(lambda: self._cleanup_old_releases(retention_days))
         elif interval == 'daily':
@@ -127,20 +129,20 @@ class Command(BaseCommand):
         except KeyboardInterrupt:
             self.stdout.write("\n백업 스케줄러가 중지되었습니다.")
 
-    def _run_backup(self, storage):
-        """백업을 실행합니다"""
+    def _run_backup(self, storage, mode='full'):
+        """백업을 실행합니다 (mode: full 또는 incremental)"""
         try:
-            self.stdout.write(f"\n[{datetime.now()}] 백업 시작 - 저장소: {storage}")
+            self.stdout.write(f"\n[{datetime.now()}] 백업 시작 - 저장소: {storage}, 방식: {mode}")
             
             if storage == 'github':
                 # GitHub 설정 가져오기
                 repo = getattr(settings, 'GITHUB_BACKUP_REPO', None) or os.getenv('GITHUB_BACKUP_REPO')
                 if repo:
-                    call_command('backup_data', storage='github', verbosity=1)
+                    call_command('backup_data', storage='github', mode=mode, verbosity=1)
                 else:
                     call_command('backup_to_github', repo=repo, verbosity=1)
             else:
-                call_command('backup_data', storage=storage, verbosity=1)
+                call_command('backup_data', storage=storage, mode=mode, verbosity=1)
             
             self.stdout.write(f"[{datetime.now()}] 백업 완료")
             
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from centers.backup_catalog import SYNCABLE_STORAGES, sync_storage
+from centers.backup_storage import StorageError, get_backup_storage
+
+
+class Command(BaseCommand):
+    help = '백업 목록 표(BackupCatalogEntry)를 원격 저장소의 실제 파일 목록과 맞춥니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--storage',
+            dest='storages',
+            nargs='+',
+            choices=SYNCABLE_STORAGES,
+            help='맞출 저장소 (기본값: 설정된 모든 저장소)'
+        )
+
+    def handle(self, *args, **options):
+        explicit = bool(options.get('storages'))
+        for name in options.get('storages') or SYNCABLE_STORAGES:
+            try:
+                storage = get_backup_storage(name, log=self.stdout.write)
+            except StorageError as e:
+                # 기본값(전체)일 때는 설정되지 않은 저장소를 조용히 건너뜀
+                if explicit:
+                    self.stdout.write(self.style.WARNING(f'{name}: {e}'))
+                continue
+            try:
+                result = sync_storage(storage)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'✗ {storage.label} 목록 조회 실패: {e}'))
+                continue
+            self.stdout.write(self.style.SUCCESS(
+                f"✓ {storage.label}: 파일 {result['total']}개 "
+                f"(추가 {result['added']}, 갱신 {result['updated']}, 삭제 {result['removed']})"
+            ))
@@ -0,0 +1,279 @@
+"""
+미디어 백업용 내용 주소 저장소 (content-addressed blob store)
+
+- 미디어 파일을 sha256 해시 이름의 블롭으로 한 번만 저장하고, 각 백업 파일에는 {상대 경로: 해시} manifest('_media' 구역)만 기록
+- 백업: 저장소에 없는 해시의 블롭만 업로드 (같은 이미지는 몇 번을 백업해도 한 번만 전송)
+- 복원: 로컬 파일의 해시가 manifest와 다른(또는 없는) 파일만 블롭을 받아 교체
+- 저장소: local(BACKUP_MEDIA_STORE_DIR 폴더), s3(버킷의 media-blobs/ 접두사), github(media-blobs 릴리스의 asset)
+"""
+
+import os
+import shutil
+
+from django.conf import settings
+import requests
+
+from .backup_io import COPY_BUFFER_SIZE, create_temp_path
+from .backup_storage import StorageError, call_with_retries, run_concurrently
+from .incremental import file_sha256
+
+# boto3는 선택적 import (S3 사용시에만 필요)
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+BLOB_PREFIX = 'media-blobs'
+
+
+class BlobStore:
+    """블롭 저장소 인터페이스 (digest = sha256 hex)"""
+
+    name = ''
+
+    def missing(self, digests):
+        """digests 중 저장소에 없는 것의 집합"""
+        return {digest for digest in digests if not self.has(digest)}
+
+    def has(self, digest):
+        raise NotImplementedError
+
+    def put(self, digest, path):
+        raise NotImplementedError
+
+    def get(self, digest, dest_path):
+        raise NotImplementedError
+
+
+class LocalBlobStore(BlobStore):
+    """로컬 폴더 저장소: {root}/ab/abcdef... (테스트와 단일 서버용)"""
+
+    name = 'local'
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def has(self, digest):
+        return os.path.exists(self._path(digest))
+
+    def put(self, digest, path):
+        dest = self._path(digest)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        # 임시 이름으로 복사한 뒤 교체해 중간에 실패해도 깨진 블롭이 남지 않도록
+        temp_dest = f'{dest}.{os.getpid()}.tmp'
+        shutil.copyfile(path, temp_dest)
+        os.replace(temp_dest, dest)
+
+    def get(self, digest, dest_path):
+        shutil.copyfile(self._path(digest), dest_path)
+
+
+class S3BlobStore(BlobStore):
+    """S3 저장소: s3://{bucket}/media-blobs/{digest}"""
+
+    name = 's3'
+
+    def __init__(self, client, bucket):
+        self.client = client
+        self.bucket = bucket
+
+    def _key(self, digest):
+        return f'{BLOB_PREFIX}/{digest}'
+
+    def missing(self, digests):
+        # 블롭 목록을 한 번에 조회 (파일마다 HEAD 요청을 보내지 않음)
+        existing = set()
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=f'{BLOB_PREFIX}/'):
+            for item in page.get('Contents', []):
+                existing.add(item['Key'].rsplit('/', 1)[-1])
+        return set(digests) - existing
+
+    def has(self, digest):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(digest))
+            return True
+        except ClientError:
+            return False
+
+    def put(self, digest, path):
+        self.client.upload_file(path, self.bucket, self._key(digest))
+
+    def get(self, digest, dest_path):
+        self.client.download_file(self.bucket, self._key(digest), dest_path)
+
+
+class GitHubBlobStore(BlobStore):
+    """GitHub 저장소: 백업 레포의 media-blobs 릴리스에 해시 이름의 asset으로 저장"""
+
+    name = 'github'
+    api_url = 'https://api.github.com'
+
+    def __init__(self, repo, token):
+        self.repo = repo
+        self.headers = {
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        self._release = None
+        self._assets = None
+
+    def _get_release(self):
+        """블롭용 릴리스 (없으면 생성)"""
+        if self._release is None:
+            url = f'{self.api_url}/repos/{self.repo}/releases/tags/{BLOB_PREFIX}'
+            response = requests.get(url, headers=self.headers, timeout=30)
+            if response.status_code == 404:
+                response = requests.post(
+                    f'{self.api_url}/repos/{self.repo}/releases',
+                    headers=self.headers,
+                    json={
+                        'tag_name': BLOB_PREFIX,
+                        'name': 'Media blobs',
+                        'body': '미디어 백업 블롭 저장소 (파일명 = sha256). 삭제하면 이 블롭을 참조하는 백업의 이미지를 복원할 수 없습니다.',
+                        'prerelease': True,
+                    },
+                    timeout=30,
+                )
+            response.raise_for_status()
+            self._release = response.json()
+        return self._release
+
+    def _asset_ids(self):
+        """{digest: asset id}"""
+        if self._assets is None:
+            release = self._get_release()
+            self._assets = {}
+            page = 1
+            while True:
+                response = requests.get(
+                    f"{self.api_url}/repos/{self.repo}/releases/{release['id']}/assets",
+                    headers=self.headers, params={'per_page': 100, 'page': page}, timeout=30,
+                )
+                response.raise_for_status()
+                assets = response.json()
+                self._assets.update({asset['name']: asset['id'] for asset in assets})
+                if len(assets) < 100:
+                    break
+                page += 1
+        return self._assets
+
+    def missing(self, digests):
+        return set(digests) - set(self._asset_ids())
+
+    def has(self, digest):
+        return digest in self._asset_ids()
+
+    def put(self, digest, path):
+        upload_url = self._get_release()['upload_url'].replace('{?name,label}', '')
+        with open(path, 'rb') as f:
+            response = requests.post(
+                f'{upload_url}?name={digest}',
+                headers={**self.headers, 'Content-Type': 'application/octet-stream'},
+                data=f,
+                timeout=300,
+            )
+        response.raise_for_status()
+        self._asset_ids()[digest] = response.json()['id']
+
+    def get(self, digest, dest_path):
+        asset_id = self._asset_ids().get(digest)
+        if asset_id is None:
+            raise FileNotFoundError(f'GitHub에서 미디어 블롭을 찾을 수 없습니다: {digest}')
+        with requests.get(
+            f'{self.api_url}/repos/{self.repo}/releases/assets/{asset_id}',
+            headers={**self.headers, 'Accept': 'application/octet-stream'},
+            stream=True, timeout=300,
+        ) as response:
+            response.raise_for_status()
+            with open(dest_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=COPY_BUFFER_SIZE):
+                    f.write(chunk)
+
+
+def get_blob_store(storage):
+    """저장 위치에 맞는 블롭 저장소 (지원하지 않거나 설정이 없으면 None)"""
+    if storage == 'local':
+        root = getattr(settings, 'BACKUP_MEDIA_STORE_DIR', None) or os.path.join(settings.BASE_DIR, 'backups', 'media_store')
+        return LocalBlobStore(root)
+    if storage == 's3':
+        bucket = getattr(settings, 'AWS_BACKUP_BUCKET_NAME', None)
+        if not HAS_BOTO3 or not bucket:
+            return None
+        client = boto3.client(
+            's3',
+            aws_access_key_id=getattr(settings, 'AWS_ACCESS_KEY_ID', None),
+            aws_secret_access_key=getattr(settings, 'AWS_SECRET_ACCESS_KEY', None),
+            region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2')
+        )
+        return S3BlobStore(client, bucket)
+    if storage == 'github':
+        repo = getattr(settings, 'GITHUB_BACKUP_REPO', None) or os.getenv('GITHUB_BACKUP_REPO')
+        token = getattr(settings, 'GITHUB_TOKEN', None) or os.getenv('GITHUB_TOKEN')
+        if not repo or not token:
+            return None
+        return GitHubBlobStore(repo, token)
+    return None
+
+
+def upload_media_blobs(store, media_root, manifest, log=print):
+    """manifest의 파일 중 저장소에 없는 블롭만 스레드 풀로 동시에 업로드하고 업로드 개수를 반환합니다"""
+    paths = {}
+    for relpath, entry in manifest.items():
+        paths.setdefault(entry['sha256'], relpath)
+    missing = sorted(store.missing(paths))
+
+    def put(digest):
+        relpath = paths[digest]
+        call_with_retries(
+            lambda: store.put(digest, os.path.join(media_root, relpath)), f'미디어 블롭 업로드 ({relpath})', log=log
+        )
+        log(f'미디어 블롭 업로드: {relpath} ({digest[:12]})')
+
+    errors = [f'{paths[digest]}: {error}' for digest, _, error in run_concurrently(put, missing) if error]
+    if errors:
+        raise StorageError(f"미디어 블롭 업로드 실패 - {'; '.join(errors[:5])}")
+    return len(missing)
+
+
+def media_section(store, manifest):
+    """백업 파일에 기록할 '_media' 구역"""
+    return {
+        'store': store.name,
+        'files': {relpath: {'sha256': entry['sha256'], 'size': entry['size']} for relpath, entry in manifest.items()},
+    }
+
+
+def restore_media_blobs(store, media, media_root, log=print):
+    """
+    '_media' manifest대로 미디어 파일을 복원합니다.
+    로컬 파일의 크기와 해시가 같으면 건너뛰고, 나머지만 블롭을 받아 해시를 확인한 뒤 교체합니다.
+    """
+    fetched, skipped = [], 0
+    media_root = os.path.abspath(media_root)
+    for relpath, entry in (media or {}).get('files', {}).items():
+        dest = os.path.abspath(os.path.join(media_root, relpath))
+        if not dest.startswith(media_root + os.sep):
+            log(f'⚠️ 잘못된 미디어 경로 건너뜀: {relpath}')
+            continue
+        if os.path.exists(dest) and os.path.getsize(dest) == entry['size'] and file_sha256(dest) == entry['sha256']:
+            skipped += 1
+            continue
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        temp_path = create_temp_path(suffix='.blob')
+        try:
+            store.get(entry['sha256'], temp_path)
+            if file_sha256(temp_path) != entry['sha256']:
+                raise ValueError(f'미디어 블롭 해시가 일치하지 않습니다: {relpath}')
+            shutil.move(temp_path, dest)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        fetched.append(relpath)
+        log(f'미디어 파일 복원: {relpath}')
+    return {'fetched': len(fetched), 'skipped': skipped, 'restored_files': fetched[:10]}
@@ -0,0 +1,77 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:06
+
+from django.db import migrations, models
+
+# 이 마이그레이션 시점의 centers.geo 값을 그대로 옮겨 둠
+GEOHASH_PRECISION = 9
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def _encode_geohash(lat, lng, precision=GEOHASH_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    ch = 0
+    even = True  # 짝수 번째 비트는 경도
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                ch = (ch << 1) | 1
+                lng_range[0] = mid
+            else:
+                ch = ch << 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_range[0] = mid
+            else:
+                ch = ch << 1
+                lat_range[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[ch])
+            bit = 0
+            ch = 0
+
+    return ''.join(chars)
+
+
+def populate_geohash(apps, schema_editor):
+    """기존 센터의 geohash 채우기"""
+    Center = apps.get_model('centers', 'Center')
+    centers = Center.objects.filter(latitude__isnull=False, longitude__isnull=False).only('id', 'latitude', 'longitude')
+    batch = []
+    for center in centers.iterator(chunk_size=500):
+        center.geohash = _encode_geohash(float(center.latitude), float(center.longitude))
+        batch.append(center)
+        if len(batch) >= 500:
+            Center.objects.bulk_update(batch, ['geohash'])
+            batch = []
+    if batch:
+        Center.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0009_delete_csvuploadproxy_center_image_url_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='center',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='위도/경도로부터 자동 계산되는 geohash', max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='center',
+            index=models.Index(fields=['latitude', 'longitude'], name='center_lat_lng_idx'),
+        ),
+        migrations.RunPython(populate_geohash, migrations.RunPython.noop),
+    ]
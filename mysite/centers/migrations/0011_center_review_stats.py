@@ -0,0 +1,92 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:08
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+
+
+def populate_review_stats(apps, schema_editor):
+    """기존 리뷰로부터 센터별 집계 컬럼 채우기"""
+    Center = apps.get_model('centers', 'Center')
+    Review = apps.get_model('centers', 'Review')
+
+    stats = Review.objects.order_by().values('center_id').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        last_review_at=Max('created_at'),
+        **{f'rating_{rating}_count': Count('id', filter=Q(rating=rating)) for rating in range(1, 6)}
+    )
+    fields = ['review_count', 'rating_sum', 'average_rating', 'last_review_at'] + [
+        f'rating_{rating}_count' for rating in range(1, 6)
+    ]
+
+    batch = []
+    for row in stats:
+        center = Center(pk=row['center_id'])
+        center.review_count = row['review_count']
+        center.rating_sum = row['rating_sum'] or 0
+        center.average_rating = center.rating_sum / center.review_count
+        center.last_review_at = row['last_review_at']
+        for rating in range(1, 6):
+            setattr(center, f'rating_{rating}_count', row[f'rating_{rating}_count'])
+        batch.append(center)
+        if len(batch) >= 500:
+            Center.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        Center.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0010_center_geohash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='center',
+            name='average_rating',
+            field=models.FloatField(blank=True, db_index=True, editable=False, help_text='평균 평점', null=True),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='last_review_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='최근 리뷰 작성 시각', null=True),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='1점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='2점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='3점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='4점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='5점 리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='평점 합계'),
+        ),
+        migrations.AddField(
+            model_name='center',
+            name='review_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='리뷰 수'),
+        ),
+        migrations.RunPython(populate_review_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,165 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:15
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 이 마이그레이션 시점의 centers.search 값을 그대로 옮겨 둠 (이후 search.py가 바뀌어도 결과가 같도록)
+MAX_INDEXED_REVIEWS = 50
+
+POSTGRES_SETUP_SQL = [
+    "CREATE INDEX IF NOT EXISTS centers_search_vector_gin ON centers_centersearchdocument USING GIN (("
+    "setweight(to_tsvector('simple'::regconfig, name_tokens), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, phone_tokens), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, address_tokens), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, therapist_tokens), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, body_tokens), 'D')))",
+]
+POSTGRES_TEARDOWN_SQL = [
+    'DROP INDEX IF EXISTS centers_search_vector_gin',
+]
+SQLITE_SETUP_SQL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS centers_search_fts USING fts5("
+    "name_tokens, phone_tokens, address_tokens, therapist_tokens, body_tokens, "
+    "content='centers_centersearchdocument', content_rowid='center_id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS centers_search_fts_ai AFTER INSERT ON centers_centersearchdocument BEGIN "
+    "INSERT INTO centers_search_fts(rowid, name_tokens, phone_tokens, address_tokens, therapist_tokens, body_tokens) "
+    "VALUES (new.center_id, new.name_tokens, new.phone_tokens, new.address_tokens, new.therapist_tokens, "
+    "new.body_tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS centers_search_fts_ad AFTER DELETE ON centers_centersearchdocument BEGIN "
+    "INSERT INTO centers_search_fts(centers_search_fts, rowid, name_tokens, phone_tokens, address_tokens, "
+    "therapist_tokens, body_tokens) VALUES ('delete', old.center_id, old.name_tokens, old.phone_tokens, "
+    "old.address_tokens, old.therapist_tokens, old.body_tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS centers_search_fts_au AFTER UPDATE ON centers_centersearchdocument BEGIN "
+    "INSERT INTO centers_search_fts(centers_search_fts, rowid, name_tokens, phone_tokens, address_tokens, "
+    "therapist_tokens, body_tokens) VALUES ('delete', old.center_id, old.name_tokens, old.phone_tokens, "
+    "old.address_tokens, old.therapist_tokens, old.body_tokens); "
+    "INSERT INTO centers_search_fts(rowid, name_tokens, phone_tokens, address_tokens, therapist_tokens, body_tokens) "
+    "VALUES (new.center_id, new.name_tokens, new.phone_tokens, new.address_tokens, new.therapist_tokens, "
+    "new.body_tokens); END",
+    "INSERT INTO centers_search_fts(centers_search_fts) VALUES ('rebuild')",
+]
+SQLITE_TEARDOWN_SQL = [
+    'DROP TRIGGER IF EXISTS centers_search_fts_ai',
+    'DROP TRIGGER IF EXISTS centers_search_fts_ad',
+    'DROP TRIGGER IF EXISTS centers_search_fts_au',
+    'DROP TABLE IF EXISTS centers_search_fts',
+]
+
+_WORD_RE = re.compile(r'[^\W_]+')
+_SCRIPT_RUN_RE = re.compile(r'[가-힣ㄱ-ㆎ]+|[^가-힣ㄱ-ㆎ]+')
+_HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+
+def _tokenize(text):
+    """한글 구간은 음절 bigram + 마지막 음절, 그 외는 단어 그대로 (공백 구분)"""
+    tokens = []
+    for word in _WORD_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        for run in _SCRIPT_RUN_RE.findall(word):
+            if _HANGUL_RE.match(run) and len(run) > 1:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+                tokens.append(run[-1])
+            else:
+                tokens.append(run)
+    return ' '.join(tokens)
+
+
+def _phone_tokens(phone):
+    parts = [part for part in re.split(r'\D+', phone or '') if part]
+    digits = ''.join(parts)
+    if not digits:
+        return ''
+    tokens = [''.join(parts[i:]) for i in range(len(parts))]
+    if len(parts) == 1:
+        tokens += [digits[-8:], digits[-7:], digits[-4:]]
+    return ' '.join(dict.fromkeys(token for token in tokens if len(token) >= 4))
+
+
+def _document_fields(center, therapists, reviews):
+    return {
+        'name_tokens': _tokenize(center.name),
+        'phone_tokens': _phone_tokens(center.phone),
+        'address_tokens': _tokenize(center.address),
+        'therapist_tokens': _tokenize(' '.join(f'{t.name} {t.specialty}' for t in therapists)),
+        'body_tokens': _tokenize(' '.join(
+            [center.description or ''] + [f'{r.title} {r.content}' for r in reviews]
+        )),
+    }
+
+
+def _sqlite_has_fts5(connection):
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            return bool(cursor.fetchone()[0])
+    except Exception:
+        return False
+
+
+def _backend_sql(connection, setup):
+    if connection.vendor == 'postgresql':
+        return POSTGRES_SETUP_SQL if setup else POSTGRES_TEARDOWN_SQL
+    if connection.vendor == 'sqlite' and _sqlite_has_fts5(connection):
+        return SQLITE_SETUP_SQL if setup else SQLITE_TEARDOWN_SQL
+    # FTS5가 없으면 검색 문서 테이블에 대한 LIKE 검색으로 동작
+    return []
+
+
+def create_search_backend(apps, schema_editor):
+    """DB별 전문 검색 인덱스(PostgreSQL GIN / SQLite FTS5 테이블과 트리거) 생성"""
+    for sql in _backend_sql(schema_editor.connection, setup=True):
+        schema_editor.execute(sql)
+
+
+def drop_search_backend(apps, schema_editor):
+    for sql in _backend_sql(schema_editor.connection, setup=False):
+        schema_editor.execute(sql)
+
+
+def populate_search_documents(apps, schema_editor):
+    """기존 센터의 검색 문서 생성"""
+    Center = apps.get_model('centers', 'Center')
+    Therapist = apps.get_model('centers', 'Therapist')
+    Review = apps.get_model('centers', 'Review')
+    CenterSearchDocument = apps.get_model('centers', 'CenterSearchDocument')
+
+    batch = []
+    for center in Center.objects.order_by('pk').iterator(chunk_size=200):
+        therapists = Therapist.objects.filter(center_id=center.pk)
+        reviews = Review.objects.filter(center_id=center.pk).order_by('-created_at')[:MAX_INDEXED_REVIEWS]
+        batch.append(CenterSearchDocument(center_id=center.pk, **_document_fields(center, therapists, reviews)))
+        if len(batch) >= 200:
+            CenterSearchDocument.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        CenterSearchDocument.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0012_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CenterSearchDocument',
+            fields=[
+                ('center', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='centers.center')),
+                ('name_tokens', models.TextField(blank=True, default='')),
+                ('phone_tokens', models.TextField(blank=True, default='')),
+                ('address_tokens', models.TextField(blank=True, default='')),
+                ('therapist_tokens', models.TextField(blank=True, default='')),
+                ('body_tokens', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '센터 검색 문서',
+                'verbose_name_plural': '센터 검색 문서 목록',
+            },
+        ),
+        migrations.RunPython(create_search_backend, drop_search_backend),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:44
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0013_center_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuphistory',
+            name='backup_mode',
+            field=models.CharField(choices=[('full', '전체'), ('incremental', '증분')], default='full', help_text='백업 방식', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='backuphistory',
+            name='base_backup',
+            field=models.ForeignKey(blank=True, help_text='증분 백업이 이어지는 직전 백업', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='incrementals', to='centers.backuphistory'),
+        ),
+        migrations.AddField(
+            model_name='backuphistory',
+            name='media_manifest',
+            field=models.JSONField(blank=True, default=dict, help_text='백업 체인에 포함된 미디어 파일 {경로: {mtime, size, sha256}}'),
+        ),
+        migrations.AddField(
+            model_name='backuphistory',
+            name='watermark',
+            field=models.DateTimeField(blank=True, help_text='이 시각까지의 변경분이 백업됨 (백업 시작 시각)', null=True),
+        ),
+        migrations.CreateModel(
+            name='DeletedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=50)),
+                ('object_pk', models.CharField(max_length=64)),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': '삭제 기록',
+                'verbose_name_plural': '삭제 기록 목록',
+                'indexes': [models.Index(fields=['deleted_at'], name='deletedrecord_deleted_at_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:53
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0014_incremental_backups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackupCatalogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filename', models.CharField(help_text='백업 파일명', max_length=255)),
+                ('storage', models.CharField(help_text='저장 위치 (local, github, s3, http, google_drive)', max_length=50)),
+                ('kind', models.CharField(choices=[('data', '데이터'), ('media', '미디어 아카이브')], default='data', max_length=20)),
+                ('location', models.CharField(blank=True, help_text='파일 경로 또는 다운로드 URL', max_length=500)),
+                ('size', models.BigIntegerField(default=0, help_text='파일 크기 (bytes)')),
+                ('sha256', models.CharField(blank=True, help_text='파일 체크섬 (동기화로 찾은 파일은 비어 있을 수 있음)', max_length=64)),
+                ('backup_format', models.CharField(blank=True, help_text='json 또는 xml', max_length=20)),
+                ('backup_mode', models.CharField(blank=True, help_text='full 또는 incremental', max_length=20)),
+                ('models_count', models.JSONField(blank=True, default=dict, help_text='모델별 레코드 수')),
+                ('extra', models.JSONField(blank=True, default=dict, help_text='저장소별 추가 정보 (릴리스 태그 등)')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, help_text='백업 생성(업로드) 시각')),
+                ('synced_at', models.DateTimeField(blank=True, help_text='원격 저장소에서 마지막으로 확인한 시각', null=True)),
+                ('history', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='catalog_entries', to='centers.backuphistory')),
+            ],
+            options={
+                'verbose_name': '백업 목록',
+                'verbose_name_plural': '백업 목록',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['kind', 'created_at'], name='backupcatalog_kind_created_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='backupcatalogentry',
+            constraint=models.UniqueConstraint(fields=('storage', 'filename'), name='backupcatalog_storage_filename_uniq'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:09
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0015_backup_catalog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CloudinaryOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('upload', '업로드'), ('delete', '삭제')], max_length=10)),
+                ('status', models.CharField(choices=[('pending', '대기 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10)),
+                ('key', models.UUIDField(default=uuid.uuid4, help_text='업로드 public_id (재시도해도 같은 이미지를 덮어씀)', unique=True)),
+                ('target_model', models.CharField(blank=True, help_text="예: 'centers.therapist'", max_length=50)),
+                ('target_id', models.BigIntegerField(blank=True, null=True)),
+                ('file_name', models.CharField(blank=True, help_text='저장소 파일 이름', max_length=255)),
+                ('folder', models.CharField(blank=True, max_length=50)),
+                ('public_id', models.CharField(blank=True, max_length=255)),
+                ('url', models.URLField(blank=True, max_length=500)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='이 시각 이후에 처리 (재시도 대기)')),
+                ('locked_by', models.CharField(blank=True, help_text='항목을 가져간 워커의 임대 토큰', max_length=64)),
+                ('locked_until', models.DateTimeField(blank=True, help_text='워커가 가져간 항목의 임대 만료 시각', null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Cloudinary 작업 대기열',
+                'verbose_name_plural': 'Cloudinary 작업 대기열',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0016_cloudinary_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodeCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(help_text='정규화한 주소', max_length=255, unique=True)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+                ('provider', models.CharField(blank=True, help_text='좌표를 가져온 공급자', max_length=50)),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now, help_text='공급자에서 가져온 시각 (GEOCODE_CACHE_TTL 기준)')),
+            ],
+            options={
+                'verbose_name': '주소 좌표 캐시',
+                'verbose_name_plural': '주소 좌표 캐시 목록',
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.2 on 2026-10-18 11:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('centers', '0017_geocode_cache'),
+    ]
+
+    operations = [
+        # 기존 행은 마이그레이션 시각으로 채워 다음 증분 백업에 한 번 모두 포함 (그동안 놓친 수정도 반영)
+        migrations.AddField(
+            model_name='externalreview',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='centerimage',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
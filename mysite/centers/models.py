@@ -1,8 +1,159 @@
+import math
+import uuid
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
+from django.db.models import Q
+
+from .geo import EARTH_RADIUS_KM, bounding_box, encode_geohash, geohash_cover, haversine_km
+
+
+class CenterQuerySet(models.QuerySet):
+    """위치 기반 조회를 지원하는 Center QuerySet"""
+
+    def within_bbox(self, sw_lat, sw_lng, ne_lat, ne_lng):
+        """
+        bbox 안의 센터만 필터링합니다.
+
+        geohash 접두사로 인덱스 범위를 좁힌 뒤 위도/경도 범위로 정확히 거릅니다.
+        save()를 거치지 않고 저장되어 geohash가 비어 있는 행(loaddata, QuerySet.update 등)도
+        위도/경도 범위로만 걸러 포함합니다.
+        sw_lng > ne_lng이면 날짜 변경선을 넘는 영역으로 처리합니다.
+        """
+        if sw_lng <= ne_lng:
+            boxes = [(sw_lat, sw_lng, ne_lat, ne_lng)]
+        else:
+            boxes = [(sw_lat, sw_lng, ne_lat, 180.0), (sw_lat, -180.0, ne_lat, ne_lng)]
+
+        condition = Q()
+        for box in boxes:
+            box_condition = Q(
+                latitude__gte=box[0], latitude__lte=box[2],
+                longitude__gte=box[1], longitude__lte=box[3],
+            )
+            cells = geohash_cover(*box)
+            if cells:
+                cell_condition = Q(geohash='')
+                for cell in cells:
+                    cell_condition |= Q(geohash__startswith=cell)
+                box_condition &= cell_condition
+            condition |= box_condition
+
+        return self.filter(condition)
+
+    def nearest(self, lat, lng, k=10, initial_radius_km=2.0):
+        """
+        (lat, lng)에서 haversine 거리 기준으로 가장 가까운 센터 k개를 반환합니다.
+
+        반경을 두 배씩 넓히며 bbox 후보만 조회하고, 반경 안에 k개 이상이 들어오면
+        멈추므로 결과는 전체 스캔과 동일합니다. 각 객체에 distance(km) 속성이 추가된
+        리스트를 가까운 순으로 반환합니다.
+        """
+        if k <= 0:
+            return []
+
+        located = self.filter(latitude__isnull=False, longitude__isnull=False)
+        max_radius = math.pi * EARTH_RADIUS_KM
+        radius = initial_radius_km
+
+        while True:
+            if radius >= max_radius:
+                candidates = list(located)
+            else:
+                condition = Q()
+                for box in bounding_box(lat, lng, radius):
+                    condition |= Q(
+                        latitude__gte=box[0], latitude__lte=box[2],
+                        longitude__gte=box[1], longitude__lte=box[3],
+                    )
+                candidates = list(located.filter(condition))
+
+            for center in candidates:
+                center.distance = haversine_km(lat, lng, center.latitude, center.longitude)
+
+            if radius < max_radius:
+                # bbox 모서리의 후보는 반경 밖일 수 있으므로 원 안의 것만 확정
+                candidates = [center for center in candidates if center.distance <= radius]
+
+            if len(candidates) >= k or radius >= max_radius:
+                candidates.sort(key=lambda center: (center.distance, center.pk))
+                return candidates[:k]
+
+            radius *= 2
+
+    def refresh_geohash(self, batch_size=500):
+        """
+        QuerySet에 포함된 센터들의 geohash를 좌표로부터 다시 계산합니다.
+        save()를 거치지 않고 저장된 행(복원, bulk_create 등)용이며, 값이 바뀐 센터 수를 반환합니다.
+        """
+        changed = []
+        updated = 0
+        for center in self.order_by('pk').only('pk', 'latitude', 'longitude', 'geohash').iterator(chunk_size=batch_size):
+            geohash = center.compute_geohash()
+            if center.geohash != geohash:
+                center.geohash = geohash
+                changed.append(center)
+            if len(changed) >= batch_size:
+                Center.objects.using(self.db).bulk_update(changed, ['geohash'])
+                updated += len(changed)
+                changed = []
+        if changed:
+            Center.objects.using(self.db).bulk_update(changed, ['geohash'])
+            updated += len(changed)
+        return updated
+
+    def refresh_review_stats(self, batch_size=500):
+        """
+        QuerySet에 포함된 센터들의 리뷰 집계 컬럼을 Review 테이블로부터 다시 계산합니다.
+
+        센터 행을 잠근 뒤 센터별 GROUP BY 한 번과 bulk_update로 갱신하므로
+        호출한 쪽의 트랜잭션과 함께 커밋됩니다. 갱신된 센터 수를 반환합니다.
+        """
+        from django.db import transaction
+
+        updated = 0
+        with transaction.atomic():
+            center_ids = list(self.order_by('pk').select_for_update().values_list('pk', flat=True))
+            for start in range(0, len(center_ids), batch_size):
+                batch_ids = center_ids[start:start + batch_size]
+                stats = {
+                    row['center_id']: row
+                    for row in Review.objects.filter(center_id__in=batch_ids)
+                    .order_by()
+                    .values('center_id')
+                    .annotate(
+                        review_count=models.Count('id'),
+                        rating_sum=models.Sum('rating'),
+                        last_review_at=models.Max('created_at'),
+                        **{
+                            f'rating_{rating}_count': models.Count('id', filter=Q(rating=rating))
+                            for rating in range(1, 6)
+                        }
+                    )
+                }
+
+                centers = []
+                for center_id in batch_ids:
+                    row = stats.get(center_id, {})
+                    center = Center(pk=center_id)
+                    center.review_count = row.get('review_count', 0)
+                    center.rating_sum = row.get('rating_sum') or 0
+                    center.average_rating = (
+                        center.rating_sum / center.review_count if center.review_count else None
+                    )
+                    center.last_review_at = row.get('last_review_at')
+                    for rating in range(1, 6):
+                        setattr(center, f'rating_{rating}_count', row.get(f'rating_{rating}_count', 0))
+                    centers.append(center)
+
+                Center.objects.bulk_update(centers, Center.REVIEW_STATS_FIELDS)
+                updated += len(centers)
+
+        return updated
+
 
 class Center(models.Model):
     # Type choices
@@ -25,17 +176,60 @@ class Center(models.Model):
     )
     latitude = models.FloatField(null=True, blank=True)
     longitude = models.FloatField(null=True, blank=True)
+    geohash = models.CharField(max_length=12, blank=True, default='', db_index=True, editable=False,
+                               help_text='위도/경도로부터 자동 계산되는 geohash')
     image_url = models.URLField(blank=True, null=True, help_text='Cloudinary에 저장된 이미지 URL')
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # 리뷰 집계 (Review 저장/삭제 시 자동 갱신, rebuild_review_stats 명령으로 재계산)
+    review_count = models.PositiveIntegerField(default=0, db_index=True, editable=False, help_text='리뷰 수')
+    rating_sum = models.PositiveIntegerField(default=0, editable=False, help_text='평점 합계')
+    average_rating = models.FloatField(null=True, blank=True, db_index=True, editable=False, help_text='평균 평점')
+    rating_1_count = models.PositiveIntegerField(default=0, editable=False, help_text='1점 리뷰 수')
+    rating_2_count = models.PositiveIntegerField(default=0, editable=False, help_text='2점 리뷰 수')
+    rating_3_count = models.PositiveIntegerField(default=0, editable=False, help_text='3점 리뷰 수')
+    rating_4_count = models.PositiveIntegerField(default=0, editable=False, help_text='4점 리뷰 수')
+    rating_5_count = models.PositiveIntegerField(default=0, editable=False, help_text='5점 리뷰 수')
+    last_review_at = models.DateTimeField(null=True, blank=True, editable=False, help_text='최근 리뷰 작성 시각')
+
+    REVIEW_STATS_FIELDS = [
+        'review_count', 'rating_sum', 'average_rating',
+        'rating_1_count', 'rating_2_count', 'rating_3_count', 'rating_4_count', 'rating_5_count',
+        'last_review_at',
+    ]
+
+    objects = CenterQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # 좌표가 바뀌면 geohash도 함께 갱신
+        self.geohash = self.compute_geohash()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and ({'latitude', 'longitude'} & set(update_fields)):
+            kwargs['update_fields'] = set(update_fields) | {'geohash'}
+        super().save(*args, **kwargs)
+
+    def compute_geohash(self):
+        """현재 좌표의 geohash (좌표가 없으면 빈 문자열)"""
+        if self.latitude is None or self.longitude is None:
+            return ''
+        return encode_geohash(float(self.latitude), float(self.longitude))
+
+    @property
+    def rating_histogram(self):
+        """평점별 리뷰 수 {1: n, ..., 5: n}"""
+        return {rating: getattr(self, f'rating_{rating}_count') for rating in range(1, 6)}
+
     class Meta:
         verbose_name = '상담소'
         verbose_name_plural = '상담소 목록'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['latitude', 'longitude'], name='center_lat_lng_idx'),
+        ]
 
 class Therapist(models.Model):
     center = models.ForeignKey(Center, on_delete=models.CASCADE, related_name='therapists')
@@ -72,10 +266,22 @@ class Review(models.Model):
     def __str__(self):
         return f"{self.title} - {self.center.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 센터가 바뀌는 경우 이전 센터의 집계도 갱신하기 위해 로드 시점 값을 보관
+        instance._loaded_center_id = instance.__dict__.get('center_id')
+        return instance
+
     class Meta:
         verbose_name = '리뷰'
         verbose_name_plural = '리뷰 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 커서 페이지네이션 (-created_at, -id) 용 복합 인덱스
+            models.Index(fields=['created_at', 'id'], name='review_created_id_idx'),
+            models.Index(fields=['center', 'created_at', 'id'], name='review_center_created_id_idx'),
+        ]
 
 class ReviewComment(models.Model):
     """센터관리자가 리뷰에 달 수 있는 댓글"""
@@ -100,6 +306,7 @@ class ExternalReview(models.Model):
     summary = models.CharField(blank=True, max_length=100)
     source = models.CharField(blank=True, max_length=50)
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
     likes = models.PositiveIntegerField(default=0)
     dislikes = models.PositiveIntegerField(default=0)
     center = models.ForeignKey(Center, on_delete=models.CASCADE, related_name='external_reviews')
@@ -111,12 +318,16 @@ class ExternalReview(models.Model):
         verbose_name = '외부 리뷰'
         verbose_name_plural = '외부 리뷰'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['center', 'created_at', 'id'], name='extreview_center_created_idx'),
+        ]
 
 class CenterImage(models.Model):
     center = models.ForeignKey(Center, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='centers/')
     image_url = models.URLField(blank=True, null=True, help_text='Cloudinary에 저장된 이미지 URL')
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.center.name} - {self.created_at}"
@@ -126,6 +337,23 @@ class CenterImage(models.Model):
         verbose_name_plural = '상담소 이미지 목록'
         ordering = ['-created_at']
 
+class CenterSearchDocument(models.Model):
+    """센터 검색용 토큰 문서 (centers.search.CenterSearch가 관리, 직접 수정하지 않음)"""
+    center = models.OneToOneField(Center, on_delete=models.CASCADE, primary_key=True, related_name='search_document')
+    name_tokens = models.TextField(blank=True, default='')
+    phone_tokens = models.TextField(blank=True, default='')
+    address_tokens = models.TextField(blank=True, default='')
+    therapist_tokens = models.TextField(blank=True, default='')
+    body_tokens = models.TextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"검색 문서 - {self.center_id}"
+
+    class Meta:
+        verbose_name = '센터 검색 문서'
+        verbose_name_plural = '센터 검색 문서 목록'
+
 class BackupHistory(models.Model):
     """백업 히스토리"""
     filename = models.CharField(max_length=255, help_text='백업 파일명')
@@ -137,6 +365,21 @@ class BackupHistory(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     error_message = models.TextField(blank=True, help_text='오류 메시지 (실패시)')
 
+    # 증분 백업: watermark 이후 변경분만 백업하고 base_backup에 이어 붙이는 체인을 구성
+    BACKUP_MODE_CHOICES = [
+        ('full', '전체'),
+        ('incremental', '증분'),
+    ]
+    backup_mode = models.CharField(max_length=20, choices=BACKUP_MODE_CHOICES, default='full', help_text='백업 방식')
+    watermark = models.DateTimeField(null=True, blank=True, help_text='이 시각까지의 변경분이 백업됨 (백업 시작 시각)')
+    base_backup = models.ForeignKey(
+        'self', on_delete=models.SET_NULL, null=True, blank=True, related_name='incrementals',
+        help_text='증분 백업이 이어지는 직전 백업'
+    )
+    media_manifest = models.JSONField(
+        default=dict, blank=True, help_text='백업 체인에 포함된 미디어 파일 {경로: {mtime, size, sha256}}'
+    )
+
     def __str__(self):
         return f"백업 {self.filename} - {self.created_at}"
 
@@ -145,6 +388,61 @@ class BackupHistory(models.Model):
         verbose_name_plural = '백업 히스토리 목록'
         ordering = ['-created_at']
 
+class BackupCatalogEntry(models.Model):
+    """
+    저장소별 백업 파일 목록 (백업할 때 기록하고 sync_backup_catalog 명령으로 원격 저장소와 맞춤).
+    list_backups 명령과 백업 대시보드는 원격 API 대신 이 표를 읽습니다.
+    """
+    KIND_CHOICES = [
+        ('data', '데이터'),
+        ('media', '미디어 아카이브'),
+    ]
+    filename = models.CharField(max_length=255, help_text='백업 파일명')
+    storage = models.CharField(max_length=50, help_text='저장 위치 (local, github, s3, http, google_drive)')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='data')
+    location = models.CharField(max_length=500, blank=True, help_text='파일 경로 또는 다운로드 URL')
+    size = models.BigIntegerField(default=0, help_text='파일 크기 (bytes)')
+    sha256 = models.CharField(max_length=64, blank=True, help_text='파일 체크섬 (동기화로 찾은 파일은 비어 있을 수 있음)')
+    backup_format = models.CharField(max_length=20, blank=True, help_text='json 또는 xml')
+    backup_mode = models.CharField(max_length=20, blank=True, help_text='full 또는 incremental')
+    models_count = models.JSONField(default=dict, blank=True, help_text='모델별 레코드 수')
+    extra = models.JSONField(default=dict, blank=True, help_text='저장소별 추가 정보 (릴리스 태그 등)')
+    history = models.ForeignKey(
+        BackupHistory, on_delete=models.SET_NULL, null=True, blank=True, related_name='catalog_entries'
+    )
+    created_at = models.DateTimeField(default=timezone.now, help_text='백업 생성(업로드) 시각')
+    synced_at = models.DateTimeField(null=True, blank=True, help_text='원격 저장소에서 마지막으로 확인한 시각')
+
+    def __str__(self):
+        return f"{self.storage}:{self.filename}"
+
+    class Meta:
+        verbose_name = '백업 목록'
+        verbose_name_plural = '백업 목록'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['storage', 'filename'], name='backupcatalog_storage_filename_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['kind', 'created_at'], name='backupcatalog_kind_created_idx'),
+        ]
+
+class DeletedRecord(models.Model):
+    """삭제된 행 기록 (증분 백업이 삭제를 복원 쪽에 전달하기 위한 tombstone)"""
+    model_name = models.CharField(max_length=50)
+    object_pk = models.CharField(max_length=64)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"삭제 {self.model_name}#{self.object_pk} - {self.deleted_at}"
+
+    class Meta:
+        verbose_name = '삭제 기록'
+        verbose_name_plural = '삭제 기록 목록'
+        indexes = [
+            models.Index(fields=['deleted_at'], name='deletedrecord_deleted_at_idx'),
+        ]
+
 class RestoreHistory(models.Model):
     """복원 히스토리"""
     filename = models.CharField(max_length=255, help_text='복원된 백업 파일명')
@@ -164,3 +462,70 @@ class RestoreHistory(models.Model):
         verbose_name = '복원 히스토리'
         verbose_name_plural = '복원 히스토리 목록'
         ordering = ['-created_at']
+
+class CloudinaryOutbox(models.Model):
+    """Cloudinary 업로드/삭제 대기열 (요청 트랜잭션에서 기록하고 워커가 처리, centers/cloudinary_outbox.py)"""
+    ACTION_UPLOAD = 'upload'
+    ACTION_DELETE = 'delete'
+    ACTION_CHOICES = [
+        (ACTION_UPLOAD, '업로드'),
+        (ACTION_DELETE, '삭제'),
+    ]
+    STATUS_PENDING = 'pending'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    key = models.UUIDField(default=uuid.uuid4, unique=True, help_text='업로드 public_id (재시도해도 같은 이미지를 덮어씀)')
+
+    # 업로드: 로컬 저장소 파일을 올리고 대상 객체의 URL 필드를 채움
+    target_model = models.CharField(max_length=50, blank=True, help_text="예: 'centers.therapist'")
+    target_id = models.BigIntegerField(null=True, blank=True)
+    file_name = models.CharField(max_length=255, blank=True, help_text='저장소 파일 이름')
+    folder = models.CharField(max_length=50, blank=True)
+
+    # 삭제 대상 또는 업로드 결과
+    public_id = models.CharField(max_length=255, blank=True)
+    url = models.URLField(max_length=500, blank=True)
+
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text='이 시각 이후에 처리 (재시도 대기)')
+    locked_by = models.CharField(max_length=64, blank=True, help_text='항목을 가져간 워커의 임대 토큰')
+    locked_until = models.DateTimeField(null=True, blank=True, help_text='워커가 가져간 항목의 임대 만료 시각')
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        target = self.public_id or f'{self.target_model}#{self.target_id}'
+        return f"{self.get_action_display()} {target} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = 'Cloudinary 작업 대기열'
+        verbose_name_plural = 'Cloudinary 작업 대기열'
+        ordering = ['-created_at']
+        indexes = [
+            # 워커의 다음 항목 조회 (status='pending' AND next_attempt_at <= now)
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx'),
+        ]
+
+class GeocodeCache(models.Model):
+    """주소 좌표 변환 결과 캐시 (centers/geocoding.py). 좌표가 없으면 검색 결과 없음"""
+    address = models.CharField(max_length=255, unique=True, help_text='정규화한 주소')
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    provider = models.CharField(max_length=50, blank=True, help_text='좌표를 가져온 공급자')
+    fetched_at = models.DateTimeField(default=timezone.now, help_text='공급자에서 가져온 시각 (GEOCODE_CACHE_TTL 기준)')
+
+    def __str__(self):
+        return f"{self.address} ({self.latitude}, {self.longitude})"
+
+    class Meta:
+        verbose_name = '주소 좌표 캐시'
+        verbose_name_plural = '주소 좌표 캐시 목록'
@@ -0,0 +1,154 @@
+"""
+익명 사용자용 페이지 캐시 (cache-aside)
+비로그인 GET 요청의 렌더링 결과를 공유 캐시에 저장하고, 페이지가 의존하는 모델의 버전을
+캐시 키에 넣어 모델이 바뀌면(post_save/post_delete) 자동으로 새 키를 쓰도록 합니다.
+"""
+
+import hashlib
+import uuid
+from functools import wraps
+
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .tiered_cache import tiered_cache
+
+PAGE_CACHE_TIMEOUT = 60 * 5  # 5분 (48시간 내 리뷰 수, 이벤트 진행 여부 등 시간에 따른 값 반영 주기)
+VERSION_KEY_PREFIX = 'model_version'
+# 버전을 워커 메모리(L1)에 두는 시간 (초). 다른 프로세스의 변경은 최대 이 시간만큼 늦게 반영됨
+VERSION_L1_TTL = 2
+
+# 버전을 관리하는 모델 (변경 시 이 모델에 의존하는 페이지 캐시가 무효화됨)
+VERSIONED_MODELS = [
+    'centers.Center',
+    'centers.Review',
+    'centers.ReviewComment',
+    'centers.ExternalReview',
+    'centers.Therapist',
+    'centers.CenterImage',
+    'boards.Post',
+    'boards.EventPost',
+    'boards.Comment',
+]
+
+
+def _version_key(label):
+    return f'{VERSION_KEY_PREFIX}:{label.lower()}'
+
+
+def _new_version():
+    """
+    새 버전 토큰
+    incr은 파일/DB 캐시에서 읽고-쓰기라 동시에 올리면 한쪽이 사라질 수 있으므로, 매번 겹치지 않는 값을 set합니다.
+    키가 축출된 뒤 다시 만들어져도 예전 버전 값과 겹치지 않습니다.
+    """
+    return uuid.uuid4().hex[:12]
+
+
+def model_versions(labels):
+    """
+    모델별 현재 버전
+    L1에 있는 버전은 그대로 쓰고, 나머지만 한 번의 get_many로 공유 캐시에서 읽습니다 (없으면 새 토큰으로 초기화).
+    """
+    versions = {}
+    missing = {}
+    for label in labels:
+        key = _version_key(label)
+        version = tiered_cache.l1.get(key)
+        if version is None:
+            missing[label] = key
+        else:
+            versions[label] = version
+    if not missing:
+        return versions
+
+    found = cache.get_many(list(missing.values()))
+    for label, key in missing.items():
+        version = found.get(key)
+        if version is None:
+            version = _new_version()
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)  # 다른 프로세스가 먼저 초기화함
+        tiered_cache.l1.set(key, version, VERSION_L1_TTL)
+        versions[label] = version
+    return versions
+
+
+def bump_model_version(label):
+    """모델 버전을 새 토큰으로 바꿔 이 모델에 의존하는 캐시 키를 모두 무효화 (현재 프로세스에는 바로 반영)"""
+    key = _version_key(label)
+    version = _new_version()
+    cache.set(key, version, None)
+    tiered_cache.l1.set(key, version, VERSION_L1_TTL)
+
+
+def versioned_cache_key(name, dependencies, *parts):
+    """의존 모델 버전을 포함한 데이터 캐시 키 (모델이 바뀌면 자동으로 새 키)"""
+    versions = model_versions(dependencies)
+    raw = '|'.join([str(part) for part in parts] + [f'{label}={versions[label]}' for label in sorted(versions)])
+    return f'data:{name}:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def page_cache_key(request, name, dependencies):
+    versions = model_versions(dependencies)
+    raw = '|'.join([request.get_full_path()] + [f'{label}={versions[label]}' for label in sorted(versions)])
+    return f'page:{name}:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def _is_cacheable_request(request):
+    if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+        return False
+    # 대기 중인 메시지(쿠키/세션)가 있으면 다른 사용자에게 보이면 안 되므로 캐시하지 않음
+    if 'messages' in request.COOKIES:
+        return False
+    session = getattr(request, 'session', None)
+    return not (session is not None and session.session_key and '_messages' in session)
+
+
+def _is_cacheable_response(request, response):
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    # 템플릿에서 CSRF 토큰을 사용했거나 메시지를 출력했다면 요청별 내용이 포함됨
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return False
+    storage = getattr(request, '_messages', None)
+    if storage is not None and len(storage):
+        return False
+    cache_control = response.get('Cache-Control', '')
+    return 'private' not in cache_control and 'no-store' not in cache_control
+
+
+def cache_anonymous_page(*dependencies, timeout=PAGE_CACHE_TIMEOUT):
+    """
+    비로그인 사용자의 GET 응답을 캐시하는 뷰 데코레이터.
+    dependencies에는 페이지 내용이 의존하는 모델 라벨('centers.Review' 등)을 지정합니다.
+    """
+    unknown = set(dependencies) - set(VERSIONED_MODELS)
+    if unknown:
+        raise ValueError(f'버전 관리되지 않는 모델입니다: {", ".join(sorted(unknown))}')
+
+    def decorator(view_func):
+        name = view_func.__name__
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+
+            key = page_cache_key(request, name, dependencies)
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+                response['X-Page-Cache'] = 'HIT'
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            if _is_cacheable_response(request, response):
+                cache.set(key, (response.content, response['Content-Type']), timeout)
+                response['X-Page-Cache'] = 'MISS'
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,225 @@
+"""
+커서(keyset) 페이지네이션
+OFFSET 대신 마지막으로 본 행의 (created_at, id) 값을 기준으로 다음 페이지를 조회해
+깊은 페이지에서도 조회 비용이 일정합니다. COUNT(*)도 실행하지 않습니다.
+
+번호 페이지가 꼭 필요한 화면은 CachedCountPaginator로 전체 개수를 캐시된 근사값으로 대체합니다.
+"""
+
+import base64
+import hashlib
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+DEFAULT_ORDERING = ('-created_at', '-id')
+
+APPROXIMATE_COUNT_TIMEOUT = 60 * 5  # 5분
+# PostgreSQL 통계 추정치가 이 값보다 작으면 정확한 COUNT(*)를 사용
+EXACT_COUNT_THRESHOLD = 10000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode_value(value):
+    # 마이크로초까지 보존해야 같은 시각의 행을 건너뛰지 않음
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def encode_cursor(values, direction='next'):
+    payload = json.dumps({'v': [_encode_value(v) for v in values], 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """커서 문자열을 (값 목록, 방향)으로 변환 (잘못된 커서는 InvalidCursor)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        values = payload['v']
+        direction = payload.get('d', 'next')
+    except (ValueError, KeyError, TypeError, UnicodeDecodeError):
+        raise InvalidCursor('잘못된 페이지 커서입니다.')
+    if not isinstance(values, list) or direction not in ('next', 'previous'):
+        raise InvalidCursor('잘못된 페이지 커서입니다.')
+    return values, direction
+
+
+class CursorPage:
+    """Paginator의 Page와 비슷하게 템플릿에서 순회/has_next 등을 사용할 수 있는 커서 페이지"""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def to_dict(self):
+        return {
+            'has_next': self.has_next(),
+            'has_previous': self.has_previous(),
+            'next_cursor': self.next_cursor,
+            'previous_cursor': self.previous_cursor,
+        }
+
+
+class CursorPaginator:
+    """
+    정렬 키(기본값: -created_at, -id) 기준 커서 페이지네이션.
+
+    모든 정렬 필드는 같은 방향이어야 하며, 마지막 필드는 고유해야 합니다(보통 id).
+    조회는 (필드..) 복합 인덱스를 따라 per_page + 1개만 읽습니다.
+    """
+
+    def __init__(self, queryset, per_page, ordering=DEFAULT_ORDERING):
+        descending = {field.startswith('-') for field in ordering}
+        if len(descending) != 1:
+            raise ValueError('커서 페이지네이션의 정렬 필드는 모두 같은 방향이어야 합니다.')
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.descending = descending.pop()
+        self.fields = [field.lstrip('-') for field in ordering]
+
+    def _reversed_ordering(self):
+        if self.descending:
+            return self.fields
+        return ['-' + field for field in self.fields]
+
+    def _position(self, obj):
+        return [getattr(obj, field) for field in self.fields]
+
+    def _to_python(self, values):
+        if len(values) != len(self.fields):
+            raise InvalidCursor('잘못된 페이지 커서입니다.')
+        opts = self.queryset.model._meta
+        try:
+            return [
+                (opts.pk if name == 'pk' else opts.get_field(name)).to_python(value)
+                for name, value in zip(self.fields, values)
+            ]
+        except Exception:
+            raise InvalidCursor('잘못된 페이지 커서입니다.')
+
+    def _keyset_filter(self, values, forward):
+        """정렬 순서상 values 뒤(forward) 또는 앞에 오는 행 조건"""
+        lookup = 'lt' if self.descending == forward else 'gt'
+        condition = Q()
+        for i, field in enumerate(self.fields):
+            step = Q(**{f'{field}__{lookup}': values[i]})
+            for prev_field, prev_value in zip(self.fields[:i], values[:i]):
+                step &= Q(**{prev_field: prev_value})
+            condition |= step
+        return condition
+
+    def page(self, cursor=None):
+        """cursor 다음(또는 이전) 페이지를 반환 (cursor가 없으면 첫 페이지)"""
+        if not cursor:
+            rows = list(self.queryset.order_by(*self.ordering)[:self.per_page + 1])
+            items = rows[:self.per_page]
+            return self._build_page(items, has_next=len(rows) > self.per_page, has_previous=False)
+
+        raw_values, direction = decode_cursor(cursor)
+        values = self._to_python(raw_values)
+
+        if direction == 'next':
+            rows = list(
+                self.queryset.filter(self._keyset_filter(values, forward=True))
+                .order_by(*self.ordering)[:self.per_page + 1]
+            )
+            items = rows[:self.per_page]
+            return self._build_page(items, has_next=len(rows) > self.per_page, has_previous=True)
+
+        # 이전 페이지: 반대 방향으로 읽은 뒤 뒤집기
+        rows = list(
+            self.queryset.filter(self._keyset_filter(values, forward=False))
+            .order_by(*self._reversed_ordering())[:self.per_page + 1]
+        )
+        items = list(reversed(rows[:self.per_page]))
+        return self._build_page(items, has_next=True, has_previous=len(rows) > self.per_page)
+
+    def _build_page(self, items, has_next, has_previous):
+        next_cursor = encode_cursor(self._position(items[-1]), 'next') if has_next and items else None
+        previous_cursor = encode_cursor(self._position(items[0]), 'previous') if has_previous and items else None
+        return CursorPage(items, next_cursor, previous_cursor)
+
+
+def count_cache_key(prefix, *parts, dependencies=()):
+    """
+    검색어 등 임의 문자열이 들어가도 안전한 카운트 캐시 키.
+    dependencies(모델 라벨)의 페이지 캐시 버전을 키에 넣어 행이 추가/삭제되면 바로 새 키를 씀
+    """
+    from .page_cache import model_versions
+
+    versions = model_versions(dependencies) if dependencies else {}
+    parts = [str(part) for part in parts] + [f'{label}={versions[label]}' for label in sorted(versions)]
+    digest = hashlib.md5('|'.join(parts).encode()).hexdigest()
+    return f'approx_count:{prefix}:{digest}'
+
+
+def _estimated_table_rows(queryset):
+    """PostgreSQL 통계의 테이블 행 수 추정치 (조건 없는 QuerySet에서만, 그 외 None)"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql' or queryset.query.where:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [queryset.model._meta.db_table]
+        )
+        row = cursor.fetchone()
+    return row[0] if row and row[0] >= EXACT_COUNT_THRESHOLD else None
+
+
+def approximate_count(queryset, cache_key, timeout=APPROXIMATE_COUNT_TIMEOUT):
+    """캐시된 근사 개수 (캐시 만료 전까지는 최근 변경이 반영되지 않을 수 있음)"""
+    from .tiered_cache import tiered_cache
+
+    def compute():
+        count = _estimated_table_rows(queryset)
+        return queryset.count() if count is None else count
+
+    return tiered_cache.get_or_set('counts', cache_key, compute, timeout)
+
+
+class CachedCountPaginator(Paginator):
+    """
+    번호 페이지가 필요한 화면용 Paginator.
+    전체 개수를 직접 넘기거나(count) 캐시된 근사값(count_cache_key)을 사용해 매 요청 COUNT(*)를 피합니다.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True,
+                 count=None, count_cache_key=None):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self._known_count = count
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self):
+        if self._known_count is not None:
+            return self._known_count
+        if self.count_cache_key:
+            return approximate_count(self.object_list, self.count_cache_key)
+        return super().count
@@ -0,0 +1,434 @@
+"""
+백업 복원 엔진 (웹 복원 화면과 restore_data 명령이 함께 사용)
+
+- 백업 파일을 레코드 단위로 스트리밍 파싱 (backup_io.iter_backup_file)
+- 모델 의존 순서(Center → Therapist/CenterImage/Review/ExternalReview → ReviewComment)대로 복원.
+  파일 안의 순서가 다르면 먼저 나온 모델의 레코드를 임시 파일로 내려 두었다가 의존 모델 복원 후 처리
+- batch_size개씩 bulk_create(update_conflicts=True)로 INSERT ... ON CONFLICT (id) DO UPDATE (bulk upsert)
+- 다른 테이블(사용자 등)에 없는 행을 가리키는 레코드는 건너뛰고 개수를 보고
+- 복원 후 PostgreSQL 시퀀스 재설정, geohash(예전 백업에는 없음)/리뷰 집계/검색 색인 재계산, 캐시 무효화
+- 증분 백업: '_deletions' 구역의 삭제를 먼저 반영하고, restore_chain()으로 전체 백업 + 증분 백업들을 순서대로 적용.
+  복원 중 삭제는 tombstone을 남기지 않고, 복원 후에는 다음 백업이 전체 백업이 되도록 백업 체인을 초기화
+- 미디어 블롭 manifest('_media' 구역)는 report.media에 담아 두고, 파일 복원은 호출하는 쪽에서 media_store로 처리
+- 모델별 처리 건수와 초당 처리량 보고
+"""
+
+import json
+import os
+import time
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.color import no_style
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .backup_io import BackupFormatError, create_temp_path, iter_backup_file
+
+DEFAULT_BATCH_SIZE = 500
+APP_LABEL = 'centers'
+
+
+def dependency_order(model_names, app_label=APP_LABEL):
+    """FK 관계 기준으로 부모 모델이 먼저 오도록 정렬한 모델명 목록"""
+    models = {name: apps.get_model(app_label, name) for name in model_names}
+    ordered = []
+    visiting = set()
+
+    def visit(name):
+        if name in ordered or name in visiting:
+            return
+        visiting.add(name)
+        for dependency in _dependencies(models[name]):
+            if dependency in models:
+                visit(dependency)
+        visiting.discard(name)
+        ordered.append(name)
+
+    for name in model_names:
+        visit(name)
+    return ordered
+
+
+def _dependencies(model):
+    """같은 앱 안에서 model이 FK로 참조하는 모델명"""
+    return {
+        field.related_model.__name__
+        for field in model._meta.concrete_fields
+        if field.is_relation and field.related_model is not model
+        and field.related_model._meta.app_label == model._meta.app_label
+    }
+
+
+class RestoreReport:
+    """모델별 복원 결과"""
+
+    def __init__(self):
+        self.models = {}
+        self.deleted = {}
+        self.metadata = {}
+        self.media = None  # 마지막으로 적용한 백업의 미디어 블롭 manifest
+        self.chain = []  # restore_chain()으로 적용한 파일별 메타데이터
+        self.started = time.monotonic()
+
+    def _entry(self, model_name):
+        return self.models.setdefault(model_name, {'restored': 0, 'skipped': 0, 'seconds': 0.0})
+
+    def add(self, model_name, restored, skipped, seconds):
+        entry = self._entry(model_name)
+        entry['restored'] += restored
+        entry['skipped'] += skipped
+        entry['seconds'] += seconds
+
+    @property
+    def restored_counts(self):
+        return {name: entry['restored'] for name, entry in self.models.items()}
+
+    @property
+    def total_restored(self):
+        return sum(entry['restored'] for entry in self.models.values())
+
+    def as_dict(self):
+        models = {}
+        for name, entry in self.models.items():
+            seconds = entry['seconds']
+            models[name] = {
+                **entry,
+                'seconds': round(seconds, 3),
+                'rows_per_second': round(entry['restored'] / seconds) if seconds else None,
+            }
+        return {
+            'models': models,
+            'deleted': dict(self.deleted),
+            'total_restored': self.total_restored,
+            'seconds': round(time.monotonic() - self.started, 3),
+        }
+
+
+class RestoreEngine:
+    """
+    백업 파일 하나를 복원합니다.
+
+        report = RestoreEngine(batch_size=1000).restore('backup.json.gz')
+        report.as_dict()  # {'models': {'Review': {'restored', 'skipped', 'seconds', 'rows_per_second'}, ...}}
+
+    models를 지정하면 그 모델만 복원하고, clear_existing이면 각 모델 복원 직전에 기존 데이터를 삭제합니다.
+    dry_run이면 레코드 수만 세고 DB는 바꾸지 않습니다. log는 진행 메시지를 받을 함수입니다 (기본값 print).
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, models=None, clear_existing=False, dry_run=False,
+                 using=DEFAULT_DB_ALIAS, log=print):
+        self.batch_size = batch_size
+        self.models = set(models) if models else None
+        self.clear_existing = clear_existing
+        self.dry_run = dry_run
+        self.using = using
+        self.log = log
+
+    def restore(self, path_or_file):
+        return self.restore_chain([path_or_file])
+
+    def restore_chain(self, paths):
+        """
+        전체 백업과 그 뒤의 증분 백업들을 순서대로 한 트랜잭션에서 적용합니다.
+        증분 백업의 base_backup이 바로 앞 파일과 다르면 BackupFormatError로 전체를 되돌립니다.
+        clear_existing은 첫 파일에만 적용됩니다.
+        """
+        from .incremental import reset_backup_chain, suppress_tombstones
+
+        report = RestoreReport()
+        clear_existing = self.clear_existing
+        try:
+            with transaction.atomic(using=self.using), suppress_tombstones():
+                for index, path in enumerate(paths):
+                    report.metadata = {}
+                    self._restore_stream(path, report)
+                    if index:
+                        check_chain(report.chain[-1], report.metadata)
+                    report.chain.append(report.metadata)
+                    self.clear_existing = False
+                if not self.dry_run and (report.models or report.deleted):
+                    self._finalize(report)
+                    purged = reset_backup_chain(using=self.using)
+                    self.log(f'백업 체인 초기화: 다음 백업은 전체 백업으로 실행 (삭제 기록 {purged}개 정리)')
+        finally:
+            self.clear_existing = clear_existing
+        touched = set(report.models) | set(report.deleted)
+        if not self.dry_run and touched:
+            transaction.on_commit(lambda: invalidate_caches(touched), using=self.using)
+        return report
+
+    # -- 스트리밍 처리 --
+
+    def _wanted(self, model_name):
+        if model_name.startswith('_'):
+            return False
+        if self.models is not None and model_name not in self.models:
+            return False
+        try:
+            apps.get_model(APP_LABEL, model_name)
+        except LookupError:
+            self.log(f'⚠️ 알 수 없는 모델 건너뜀: {model_name}')
+            return False
+        return True
+
+    def _restore_stream(self, path_or_file, report):
+        done = set()
+        deferred = {}  # 모델명 -> 레코드를 내려 둔 임시 파일 경로
+        spill = None
+        current = None
+        batch = []
+
+        def flush_current():
+            nonlocal current, spill
+            if current is None:
+                return
+            if spill is not None:
+                spill.close()
+                spill = None
+            else:
+                self._write_batch(current, batch, report)
+                batch.clear()
+                done.add(current)
+            current = None
+            self._run_ready(deferred, done, report)
+
+        try:
+            for event, model_name, payload in iter_backup_file(path_or_file):
+                if event == 'metadata':
+                    if model_name == '_deletions':
+                        self._apply_deletions(payload or {}, report)
+                    elif model_name == '_media':
+                        report.media = payload
+                    elif model_name == '_metadata':
+                        report.metadata = payload if isinstance(payload, dict) else {}
+                    continue
+                if event == 'model':
+                    flush_current()
+                    if not self._wanted(model_name):
+                        continue
+                    current = model_name
+                    if self._waiting_for(model_name, done):
+                        # 의존하는 모델이 아직 복원되지 않음: 레코드를 임시 파일에 내려 두기
+                        if model_name not in deferred:
+                            deferred[model_name] = create_temp_path('.ndjson')
+                        spill = open(deferred[model_name], 'a', encoding='utf-8')
+                        self.log(f'{model_name}: 의존 모델 복원 후 처리하도록 보류')
+                    else:
+                        self._start_model(model_name)
+                    continue
+                if current != model_name:
+                    continue
+                if event == 'xml':
+                    records = _xml_records(payload)
+                else:
+                    records = [payload]
+                for record in records:
+                    if spill is not None:
+                        spill.write(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n')
+                        continue
+                    batch.append(record)
+                    if len(batch) >= self.batch_size:
+                        self._write_batch(current, batch, report)
+                        batch.clear()
+            flush_current()
+
+            # 의존 모델이 백업에 없는 경우 등 남은 보류 모델을 의존 순서대로 처리
+            for model_name in dependency_order(list(deferred)):
+                self._restore_deferred(model_name, deferred.pop(model_name), report)
+        finally:
+            if spill is not None:
+                spill.close()
+            for path in deferred.values():
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _waiting_for(self, model_name, done):
+        model = apps.get_model(APP_LABEL, model_name)
+        pending = _dependencies(model) - done
+        if self.models is not None:
+            pending &= self.models
+        return bool(pending)
+
+    def _run_ready(self, deferred, done, report):
+        progressed = True
+        while progressed:
+            progressed = False
+            for model_name in list(deferred):
+                if not self._waiting_for(model_name, done):
+                    self._restore_deferred(model_name, deferred.pop(model_name), report)
+                    done.add(model_name)
+                    progressed = True
+
+    def _restore_deferred(self, model_name, path, report):
+        try:
+            self._start_model(model_name)
+            batch = []
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    batch.append(json.loads(line))
+                    if len(batch) >= self.batch_size:
+                        self._write_batch(model_name, batch, report)
+                        batch.clear()
+            self._write_batch(model_name, batch, report)
+        finally:
+            os.remove(path)
+
+    def _start_model(self, model_name):
+        self.log(f'{model_name} 모델 복원 중...')
+        if self.clear_existing and not self.dry_run:
+            model = apps.get_model(APP_LABEL, model_name)
+            deleted_count, _ = model.objects.using(self.using).all().delete()
+            self.log(f'기존 {model_name} 데이터 {deleted_count}개 삭제')
+
+    def _apply_deletions(self, deletions, report):
+        """
+        증분 백업의 삭제 목록 반영. 모델 구역보다 앞에 있으므로 삭제 후 같은 pk로 다시 만들어진 행도
+        뒤따르는 upsert로 되살아납니다. 딸린 행은 ORM CASCADE로 함께 삭제됩니다.
+        """
+        for model_name in dependency_order(list(deletions)):
+            if not self._wanted(model_name):
+                continue
+            model = apps.get_model(APP_LABEL, model_name)
+            pks = deletions[model_name]
+            deleted = 0
+            for start in range(0, len(pks), self.batch_size):
+                queryset = model._base_manager.using(self.using).filter(pk__in=pks[start:start + self.batch_size])
+                if self.dry_run:
+                    deleted += queryset.count()
+                else:
+                    deleted += queryset.delete()[1].get(model._meta.label, 0)
+            report.deleted[model_name] = report.deleted.get(model_name, 0) + deleted
+            self.log(f'{model_name}: 삭제 {deleted}개 반영')
+
+    # -- 배치 쓰기 --
+
+    def _write_batch(self, model_name, records, report):
+        started = time.monotonic()
+        if self.dry_run or not records:
+            report.add(model_name, len(records), 0, time.monotonic() - started)
+            return
+        model = apps.get_model(APP_LABEL, model_name)
+        objects = [
+            deserialized.object
+            for deserialized in serializers.deserialize('python', records, using=self.using, ignorenonexistent=True)
+        ]
+        objects, skipped = self._drop_dangling(model, objects)
+        if objects:
+            self._upsert(model, objects)
+        report.add(model_name, len(objects), skipped, time.monotonic() - started)
+
+    def _drop_dangling(self, model, objects):
+        """참조 대상 행이 없는 레코드 제외 (FK 제약 위반으로 배치 전체가 실패하지 않도록)"""
+        kept = objects
+        for field in model._meta.concrete_fields:
+            if not field.is_relation or not (field.many_to_one or field.one_to_one):
+                continue
+            referenced = {getattr(obj, field.attname) for obj in kept} - {None}
+            if not referenced:
+                continue
+            target = field.target_field
+            existing = set(
+                field.related_model._base_manager.using(self.using)
+                .filter(**{f'{target.attname}__in': referenced})
+                .values_list(target.attname, flat=True)
+            )
+            if len(existing) != len(referenced):
+                kept = [obj for obj in kept if getattr(obj, field.attname) in existing | {None}]
+        return kept, len(objects) - len(kept)
+
+    def _upsert(self, model, objects):
+        """
+        INSERT ... ON CONFLICT (pk) DO UPDATE (bulk_create(update_conflicts=True)).
+        bulk_create()는 auto_now 필드(updated_at)를 현재 시각으로 바꾸므로, 백업된 값을 기억해 두었다가
+        bulk_update()로 되돌립니다 (bulk_update는 auto_now를 적용하지 않음).
+        """
+        opts = model._meta
+        fields = [field for field in opts.concrete_fields if not field.generated]
+        auto_now = [field.name for field in fields if getattr(field, 'auto_now', False)]
+        backed_up = [[getattr(obj, name) for name in auto_now] for obj in objects]
+
+        queryset = model._base_manager.using(self.using)
+        queryset.bulk_create(
+            objects,
+            update_conflicts=True,
+            unique_fields=[opts.pk.name],
+            update_fields=[field.name for field in fields if not field.primary_key],
+        )
+        if auto_now:
+            for obj, values in zip(objects, backed_up):
+                for name, value in zip(auto_now, values):
+                    setattr(obj, name, value)
+            queryset.bulk_update(objects, auto_now)
+
+    # -- 후처리 --
+
+    def _finalize(self, report):
+        restored = set(report.models)
+        reset_sequences([apps.get_model(APP_LABEL, name) for name in restored], using=self.using)
+
+        # 시그널 없이 저장되었으므로 geohash, 리뷰 집계, 검색 색인을 일괄 재계산
+        if 'Center' in restored:
+            from .models import Center
+            updated = Center.objects.using(self.using).all().refresh_geohash()
+            self.log(f'geohash 재계산 완료: {updated}개 상담소')
+        if {'Review', 'Center'} & restored:
+            from .models import Center
+            updated = Center.objects.using(self.using).all().refresh_review_stats()
+            self.log(f'리뷰 집계 재계산 완료: {updated}개 상담소')
+        if {'Center', 'Therapist', 'Review'} & restored:
+            from .search import CenterSearch
+            indexed = CenterSearch(using=self.using).rebuild()
+            self.log(f'검색 색인 재생성 완료: {indexed}개 상담소')
+
+        for name, entry in report.as_dict()['models'].items():
+            self.log(
+                f"✓ {name}: {entry['restored']}개 복원, {entry['skipped']}개 건너뜀 "
+                f"({entry['seconds']}초, {entry['rows_per_second'] or '-'}건/초)"
+            )
+
+
+def check_chain(previous, current):
+    """증분 백업 파일이 바로 앞 백업에 이어지는지 확인 (메타데이터의 filename/base_backup 비교)"""
+    name = current.get('filename') or current.get('backup_time') or '알 수 없는 파일'
+    if current.get('backup_mode') != 'incremental':
+        raise BackupFormatError(f'{name}: 두 번째 파일부터는 증분 백업이어야 합니다.')
+    if previous.get('filename') and current.get('base_backup') != previous['filename']:
+        raise BackupFormatError(
+            f"증분 백업 체인이 맞지 않습니다: {name}의 기준은 {current.get('base_backup')}이지만 "
+            f"앞 파일은 {previous['filename']}입니다."
+        )
+
+
+def reset_sequences(models, using=DEFAULT_DB_ALIAS):
+    """pk를 지정해 넣은 뒤 다음 INSERT가 충돌하지 않도록 시퀀스 재설정 (PostgreSQL 등, SQLite는 불필요)"""
+    connection = connections[using]
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def _xml_records(xml_data):
+    """XML 형식 백업 데이터를 python 직렬화 dict 목록으로 변환"""
+    serializer = serializers.get_serializer('python')()
+    return serializer.serialize(
+        deserialized.object for deserialized in serializers.deserialize('xml', xml_data)
+    )
+
+
+def invalidate_caches(model_names):
+    """시그널로 갱신되지 않은 캐시(페이지 캐시 버전, 지도 클러스터, 자동완성) 무효화"""
+    from .clustering import invalidate_clusters
+    from .page_cache import VERSIONED_MODELS, bump_model_version
+    from .typeahead import typeahead_index
+
+    for name in model_names:
+        label = f'{APP_LABEL}.{name}'
+        if label in VERSIONED_MODELS:
+            bump_model_version(label)
+    if 'Center' in model_names:
+        invalidate_clusters()
+    if {'Center', 'Therapist'} & set(model_names):
+        typeahead_index.invalidate()
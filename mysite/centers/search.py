@@ -0,0 +1,370 @@
+"""
+상담소 전문 검색
+센터 이름/전화번호/주소/상담사/설명·리뷰를 토큰화한 검색 문서(CenterSearchDocument)를 유지하고,
+DB에 맞는 백엔드로 검색합니다.
+
+- PostgreSQL: 가중치 tsvector 표현식 + GIN 인덱스, ts_rank 정렬
+- SQLite: FTS5 외부 콘텐츠 테이블(트리거로 동기화), bm25 정렬
+- 그 외(FTS5가 없는 SQLite 등): 검색 문서 테이블에 대한 LIKE 검색
+
+한국어는 형태소 분석 없이 음절 bigram으로 토큰화하고, 검색어도 같은 방식으로 나눠 구문(phrase) 검색합니다.
+"""
+
+import re
+import unicodedata
+
+from django.db import connections, router
+from django.db.models import Q, Prefetch
+
+# 검색 문서에 포함할 센터당 최신 리뷰 수
+MAX_INDEXED_REVIEWS = 50
+
+FTS_TABLE = 'centers_search_fts'
+DOCUMENT_TABLE = 'centers_centersearchdocument'
+DOCUMENT_COLUMNS = ['name_tokens', 'phone_tokens', 'address_tokens', 'therapist_tokens', 'body_tokens']
+
+# 컬럼별 가중치 (PostgreSQL은 A~D, SQLite bm25는 컬럼 순서대로)
+POSTGRES_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, name_tokens), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, phone_tokens), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, address_tokens), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, therapist_tokens), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, body_tokens), 'D')"
+)
+SQLITE_BM25_WEIGHTS = (10.0, 8.0, 5.0, 3.0, 1.0)
+
+POSTGRES_SETUP_SQL = [
+    f'CREATE INDEX IF NOT EXISTS centers_search_vector_gin ON {DOCUMENT_TABLE} USING GIN (({POSTGRES_VECTOR_SQL}))',
+]
+POSTGRES_TEARDOWN_SQL = [
+    'DROP INDEX IF EXISTS centers_search_vector_gin',
+]
+
+_columns = ', '.join(DOCUMENT_COLUMNS)
+_new_values = ', '.join(f'new.{column}' for column in DOCUMENT_COLUMNS)
+_old_values = ', '.join(f'old.{column}' for column in DOCUMENT_COLUMNS)
+SQLITE_SETUP_SQL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({_columns}, "
+    f"content='{DOCUMENT_TABLE}', content_rowid='center_id', tokenize='unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.center_id, {_new_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) VALUES ('delete', old.center_id, {_old_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) VALUES ('delete', old.center_id, {_old_values}); "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.center_id, {_new_values}); END",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+SQLITE_TEARDOWN_SQL = [
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ai',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ad',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_au',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+_WORD_RE = re.compile(r'[^\W_]+')
+_SCRIPT_RUN_RE = re.compile(r'[가-힣ㄱ-ㆎ]+|[^가-힣ㄱ-ㆎ]+')
+_HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+_PHONE_QUERY_RE = re.compile(r'^[\d\-.()]+$')
+
+
+# ---------------------------------------------------------------------------
+# 토큰화
+# ---------------------------------------------------------------------------
+
+def _normalize(text):
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def _runs(text):
+    """정규화한 문자열을 한글 연속 구간과 그 외(영문/숫자) 연속 구간으로 나눔"""
+    for word in _WORD_RE.findall(_normalize(text)):
+        yield from _SCRIPT_RUN_RE.findall(word)
+
+
+def _run_tokens(run):
+    """한글 구간은 음절 bigram, 그 외는 단어 그대로"""
+    if _HANGUL_RE.match(run) and len(run) > 1:
+        return [run[i:i + 2] for i in range(len(run) - 1)]
+    return [run]
+
+
+def tokenize(text):
+    """
+    색인용 토큰 문자열 (공백 구분)
+    한글 구간 끝에는 마지막 음절을 한 번 더 넣어 한 글자 접두어 검색이 모든 음절에 걸리도록 합니다.
+    """
+    tokens = []
+    for run in _runs(text):
+        tokens.extend(_run_tokens(run))
+        if _HANGUL_RE.match(run) and len(run) > 1:
+            tokens.append(run[-1])
+    return ' '.join(tokens)
+
+
+def normalize_phone(phone):
+    """전화번호에서 숫자만 남김"""
+    return re.sub(r'\D', '', phone or '')
+
+
+def phone_tokens(phone):
+    """
+    전화번호 색인 토큰: 전체 숫자와 지역번호/국번을 뺀 뒷부분들.
+    '02-1234-5678' -> 0212345678, 12345678, 5678
+    """
+    parts = [part for part in re.split(r'\D+', phone or '') if part]
+    digits = ''.join(parts)
+    if not digits:
+        return ''
+    tokens = [''.join(parts[i:]) for i in range(len(parts))]
+    if len(parts) == 1:
+        tokens += [digits[-8:], digits[-7:], digits[-4:]]
+    return ' '.join(dict.fromkeys(token for token in tokens if len(token) >= 4))
+
+
+def parse_query(query):
+    """
+    검색어를 검색 조건 목록으로 변환합니다. 모든 조건을 만족하는 문서만 검색됩니다.
+
+    반환값: [(토큰 목록, 접두어 검색 여부), ...]
+    한글 구간은 bigram 구문, 한 글자 한글과 영문/숫자는 접두어, 전화번호 형태는 숫자 접두어로 검색합니다.
+    """
+    terms = []
+    for raw in _normalize(query).split():
+        if _PHONE_QUERY_RE.match(raw):
+            digits = normalize_phone(raw)
+            if len(digits) >= 2:
+                terms.append(([digits], True))
+                continue
+        for run in _runs(raw):
+            if _HANGUL_RE.match(run) and len(run) > 1:
+                terms.append((_run_tokens(run), False))
+            else:
+                terms.append(([run], True))
+    return terms
+
+
+def build_document_fields(center, therapists, reviews):
+    """센터/상담사/리뷰 객체로 검색 문서 필드 값을 만듦"""
+    return {
+        'name_tokens': tokenize(center.name),
+        'phone_tokens': phone_tokens(center.phone),
+        'address_tokens': tokenize(center.address),
+        'therapist_tokens': tokenize(' '.join(f'{t.name} {t.specialty}' for t in therapists)),
+        'body_tokens': tokenize(' '.join(
+            [center.description or ''] + [f'{r.title} {r.content}' for r in reviews]
+        )),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 검색 백엔드
+# ---------------------------------------------------------------------------
+
+class _PostgresBackend:
+    def __init__(self, connection):
+        self.connection = connection
+
+    @staticmethod
+    def _tsquery(terms):
+        groups = []
+        for tokens, prefix in terms:
+            group = ' <-> '.join(tokens)
+            groups.append(f'{group}:*' if prefix else group)
+        return ' & '.join(f'({group})' for group in groups)
+
+    def count(self, terms):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {DOCUMENT_TABLE} "
+                f"WHERE ({POSTGRES_VECTOR_SQL}) @@ to_tsquery('simple'::regconfig, %s)",
+                [self._tsquery(terms)]
+            )
+            return cursor.fetchone()[0]
+
+    def fetch(self, terms, offset, limit):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT center_id, ts_rank({POSTGRES_VECTOR_SQL}, query) AS score "
+                f"FROM {DOCUMENT_TABLE}, to_tsquery('simple'::regconfig, %s) query "
+                f"WHERE ({POSTGRES_VECTOR_SQL}) @@ query "
+                f"ORDER BY score DESC, center_id LIMIT %s OFFSET %s",
+                [self._tsquery(terms), limit, offset]
+            )
+            return cursor.fetchall()
+
+
+class _SQLiteFTSBackend:
+    def __init__(self, connection):
+        self.connection = connection
+
+    @staticmethod
+    def _match(terms):
+        # 토큰은 문자/숫자만 포함하므로 큰따옴표로 감싸 구문으로 사용
+        return ' AND '.join(
+            f'"{" ".join(tokens)}"' + ('*' if prefix else '')
+            for tokens, prefix in terms
+        )
+
+    def count(self, terms):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [self._match(terms)])
+            return cursor.fetchone()[0]
+
+    def fetch(self, terms, offset, limit):
+        weights = ', '.join(str(weight) for weight in SQLITE_BM25_WEIGHTS)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid, -bm25({FTS_TABLE}, {weights}) AS score FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s ORDER BY score DESC, rowid LIMIT %s OFFSET %s',
+                [self._match(terms), limit, offset]
+            )
+            return cursor.fetchall()
+
+
+class _LikeBackend:
+    """전문 검색 기능이 없는 DB용: 검색 문서 토큰 문자열에 대한 부분 일치"""
+
+    def _queryset(self, terms):
+        from .models import CenterSearchDocument
+
+        queryset = CenterSearchDocument.objects.all()
+        for tokens, prefix in terms:
+            phrase = ' '.join(tokens)
+            condition = Q()
+            for column in DOCUMENT_COLUMNS:
+                condition |= Q(**{f'{column}__contains': phrase})
+            queryset = queryset.filter(condition)
+        return queryset
+
+    def count(self, terms):
+        return self._queryset(terms).count()
+
+    def fetch(self, terms, offset, limit):
+        ids = self._queryset(terms).order_by('center_id').values_list('center_id', flat=True)[offset:offset + limit]
+        return [(center_id, 0.0) for center_id in ids]
+
+
+def sqlite_has_fts5(connection):
+    """SQLite 빌드가 FTS5를 지원하는지 확인"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            return bool(cursor.fetchone()[0])
+    except Exception:
+        return False
+
+
+def _get_backend(connection):
+    if connection.vendor == 'postgresql':
+        return _PostgresBackend(connection)
+    if connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names():
+        return _SQLiteFTSBackend(connection)
+    return _LikeBackend()
+
+
+# ---------------------------------------------------------------------------
+# 공개 API
+# ---------------------------------------------------------------------------
+
+class SearchResults:
+    """
+    검색 결과의 지연 시퀀스. count()와 슬라이싱만 지원하므로 Django Paginator에 그대로 넘길 수 있습니다.
+    슬라이스로 가져온 Center에는 search_rank 속성이 붙습니다.
+    """
+
+    def __init__(self, backend, terms):
+        self.backend = backend
+        self.terms = terms
+        self._count = None
+
+    def count(self):
+        if self._count is None:
+            self._count = self.backend.count(self.terms) if self.terms else 0
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        from .models import Center
+
+        offset = index.start or 0
+        limit = (index.stop if index.stop is not None else self.count()) - offset
+        if not self.terms or limit <= 0:
+            return []
+        rows = self.backend.fetch(self.terms, offset, limit)
+        centers = Center.objects.prefetch_related('images').in_bulk([center_id for center_id, _ in rows])
+        results = []
+        for center_id, rank in rows:
+            center = centers.get(center_id)
+            if center is not None:
+                center.search_rank = rank
+                results.append(center)
+        return results
+
+
+class CenterSearch:
+    """상담소 검색 진입점: 색인 갱신(index/rebuild)과 검색(search)"""
+
+    def __init__(self, using=None):
+        from .models import CenterSearchDocument
+
+        self.using = using or router.db_for_write(CenterSearchDocument)
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def search(self, query):
+        """검색어에 맞는 센터를 관련도순으로 반환 (SearchResults)"""
+        return SearchResults(_get_backend(self.connection), parse_query(query))
+
+    def index(self, center_ids, batch_size=200):
+        """지정한 센터들의 검색 문서를 다시 만듦 (없어진 센터의 문서는 삭제)"""
+        from .models import Center, CenterSearchDocument, Review
+
+        center_ids = list(center_ids)
+        indexed = 0
+        for start in range(0, len(center_ids), batch_size):
+            batch_ids = center_ids[start:start + batch_size]
+            centers = Center.objects.using(self.using).filter(pk__in=batch_ids).prefetch_related(
+                'therapists',
+                Prefetch(
+                    'reviews',
+                    queryset=Review.objects.only('id', 'center_id', 'title', 'content')
+                    .order_by('-created_at')[:MAX_INDEXED_REVIEWS],
+                    to_attr='indexed_reviews'  # 슬라이스한 Prefetch는 to_attr로만 사용 가능
+                ),
+            )
+            documents = [
+                CenterSearchDocument(
+                    center_id=center.pk,
+                    **build_document_fields(center, center.therapists.all(), center.indexed_reviews)
+                )
+                for center in centers
+            ]
+            CenterSearchDocument.objects.using(self.using).bulk_create(
+                documents,
+                update_conflicts=True,
+                unique_fields=['center'],
+                update_fields=DOCUMENT_COLUMNS + ['updated_at'],
+            )
+            found = {document.center_id for document in documents}
+            missing = [pk for pk in batch_ids if pk not in found]
+            if missing:
+                CenterSearchDocument.objects.using(self.using).filter(center_id__in=missing).delete()
+            indexed += len(documents)
+        return indexed
+
+    def rebuild(self, batch_size=200):
+        """전체 검색 색인 재생성"""
+        from .models import Center, CenterSearchDocument
+
+        CenterSearchDocument.objects.using(self.using).exclude(
+            center_id__in=Center.objects.using(self.using).values('pk')
+        ).delete()
+        center_ids = list(Center.objects.using(self.using).order_by('pk').values_list('pk', flat=True))
+        return self.index(center_ids, batch_size=batch_size)
@@ -0,0 +1,139 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Center, CenterImage, DeletedRecord, Review, Therapist
+from .clustering import invalidate_clusters
+from .search import CenterSearch
+from .typeahead import typeahead_index
+from .page_cache import VERSIONED_MODELS, bump_model_version
+from .image_derivatives import generate_derivatives, image_source, is_derivable
+from .incremental import tombstones_suppressed
+
+
+def _deleted_with_center(origin):
+    """센터 삭제에 딸려 지워지는 경우인지 (센터 쪽에서 한 번에 처리되므로 개별 갱신 생략)"""
+    return isinstance(origin, Center) or getattr(origin, 'model', None) is Center
+
+
+@receiver(post_save, sender=Center)
+@receiver(post_delete, sender=Center)
+def invalidate_center_clusters(sender, instance, **kwargs):
+    """센터 추가/수정/삭제 시 지도 클러스터 캐시 무효화"""
+    invalidate_clusters()
+
+
+@receiver(post_save, sender=Review)
+def update_center_review_stats_on_save(sender, instance, raw=False, **kwargs):
+    """리뷰 작성/수정 시 센터 리뷰 집계 갱신 (복원 중 raw 저장은 복원 후 일괄 재계산)"""
+    if raw:
+        return
+
+    center_ids = {instance.center_id}
+    loaded_center_id = getattr(instance, '_loaded_center_id', None)
+    if loaded_center_id:
+        center_ids.add(loaded_center_id)
+
+    Center.objects.filter(pk__in=center_ids).refresh_review_stats()
+    CenterSearch().index(center_ids)
+    instance._loaded_center_id = instance.center_id
+
+
+@receiver(post_delete, sender=Review)
+def update_center_review_stats_on_delete(sender, instance, origin=None, **kwargs):
+    """리뷰 삭제 시 센터 리뷰 집계 갱신 (센터와 함께 삭제되는 경우 제외)"""
+    if _deleted_with_center(origin):
+        return
+
+    Center.objects.filter(pk=instance.center_id).refresh_review_stats()
+    CenterSearch().index([instance.center_id])
+
+
+@receiver(post_save, sender=Center)
+def update_center_search_document(sender, instance, raw=False, **kwargs):
+    """센터 추가/수정 시 검색 문서 갱신 (센터 삭제 시에는 문서가 함께 삭제됨)"""
+    if raw:
+        return
+    CenterSearch().index([instance.pk])
+
+
+@receiver(post_save, sender=Therapist)
+@receiver(post_delete, sender=Therapist)
+def update_therapist_search_document(sender, instance, raw=False, origin=None, **kwargs):
+    """상담사 추가/수정/삭제 시 소속 센터 검색 문서 갱신"""
+    if raw or _deleted_with_center(origin):
+        return
+    CenterSearch().index([instance.center_id])
+
+
+@receiver(post_save, sender=Center)
+def update_center_typeahead(sender, instance, **kwargs):
+    """센터 이름/주소 변경을 자동완성 인덱스에 반영 (커밋 후)"""
+    transaction.on_commit(lambda: typeahead_index.update_center(instance))
+
+
+@receiver(post_delete, sender=Center)
+def remove_center_typeahead(sender, instance, **kwargs):
+    center_id = instance.pk
+    transaction.on_commit(lambda: typeahead_index.remove_center(center_id))
+
+
+@receiver(post_save, sender=Therapist)
+def update_therapist_typeahead(sender, instance, **kwargs):
+    """상담사 전문분야 변경을 자동완성 인덱스에 반영 (커밋 후)"""
+    transaction.on_commit(lambda: typeahead_index.update_therapist(instance))
+
+
+@receiver(post_delete, sender=Therapist)
+def remove_therapist_typeahead(sender, instance, **kwargs):
+    therapist_id = instance.pk
+    transaction.on_commit(lambda: typeahead_index.remove_therapist(therapist_id))
+
+
+@receiver(post_save, sender=CenterImage)
+@receiver(post_save, sender=Therapist)
+def create_image_derivatives(sender, instance, raw=False, **kwargs):
+    """Cloudinary URL 없이 로컬에만 저장된 이미지의 축소 WebP를 미리 생성 (커밋 후, 실패하면 첫 요청 때 생성)"""
+    url, name = image_source(instance)
+    if raw or url or not is_derivable(name):
+        return
+
+    def generate():
+        try:
+            generate_derivatives(name)
+        except Exception as e:
+            print(f"⚠️ 이미지 파생본 생성 실패: {name} ({e})")
+
+    transaction.on_commit(generate)
+
+
+def bump_page_cache_version(sender, **kwargs):
+    """모델 변경 시 해당 모델에 의존하는 익명 페이지 캐시 무효화"""
+    bump_model_version(sender._meta.label)
+
+
+for _label in VERSIONED_MODELS:
+    post_save.connect(bump_page_cache_version, sender=_label, dispatch_uid=f'page_cache_save:{_label}')
+    post_delete.connect(bump_page_cache_version, sender=_label, dispatch_uid=f'page_cache_delete:{_label}')
+
+
+def record_deletion(sender, instance, origin=None, **kwargs):
+    """
+    증분 백업용 삭제 기록. 다른 백업 대상 모델 삭제에 딸려 지워진 행(센터 삭제 시 리뷰 등)은
+    복원 쪽에서도 부모 삭제로 함께 지워지므로 기록하지 않습니다.
+    """
+    if tombstones_suppressed():
+        return  # 복원 엔진의 삭제 (복원 후 reset_backup_chain이 다음 백업을 전체 백업으로 만듦)
+    if origin is not None:
+        origin_model = getattr(origin, 'model', None) or type(origin)
+        origin_label = getattr(getattr(origin_model, '_meta', None), 'label', None)
+        if origin_model is not sender and origin_label in BACKUP_MODEL_LABELS:
+            return
+    DeletedRecord.objects.create(model_name=sender.__name__, object_pk=str(instance.pk))
+
+
+BACKUP_MODEL_LABELS = {f'centers.{name}' for name in settings.BACKUP_DEFAULT_MODELS}
+
+for _label in BACKUP_MODEL_LABELS:
+    post_delete.connect(record_deletion, sender=_label, dispatch_uid=f'backup_tombstone:{_label}')
@@ -0,0 +1,119 @@
+// CSV 가져오기 폼 (상담소/상담사/외부 리뷰 공통)
+// 업로드하면 서버가 백그라운드 작업을 등록하고 task_id를 반환합니다.
+// 이후 progress/?task_id= 를 작업이 끝날 때(finished)까지 폴링합니다.
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('csv-import-form');
+    const progressContainer = document.querySelector('.progress-container');
+    const progressBar = document.querySelector('.progress-bar-fill');
+    const processedText = document.querySelector('.processed');
+    const totalText = document.querySelector('.total');
+    const errorList = document.querySelector('.error-list');
+    const messageContainer = document.getElementById('message-container');
+    const POLL_INTERVAL = 1000;
+    let isUploading = false;
+
+    if (!form) {
+        return;
+    }
+
+    function getCSRFToken() {
+        const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]');
+        if (csrfToken) {
+            return csrfToken.value;
+        }
+        for (let cookie of document.cookie.split(';')) {
+            const [name, value] = cookie.trim().split('=');
+            if (name === 'csrftoken') {
+                return value;
+            }
+        }
+        return null;
+    }
+
+    function showMessage(message, type) {
+        const messageDiv = document.createElement('div');
+        messageDiv.className = `message ${type}`;
+        messageDiv.textContent = message;
+        messageContainer.innerHTML = '';
+        messageContainer.appendChild(messageDiv);
+    }
+
+    function renderProgress(data) {
+        if (data.total > 0) {
+            progressBar.style.width = `${(data.processed / data.total) * 100}%`;
+        }
+        processedText.textContent = data.processed;
+        totalText.textContent = data.total;
+        if (data.errors && data.errors.length > 0) {
+            errorList.innerHTML = data.errors.map(error =>
+                `<div>행 ${error.row}: ${error.error}</div>`
+            ).join('');
+        }
+    }
+
+    function pollProgress(taskId, redirect) {
+        const progressUrl = `${window.location.pathname}progress/?task_id=${taskId}`;
+        const timer = setInterval(async () => {
+            try {
+                const response = await fetch(progressUrl, {
+                    headers: {'X-Requested-With': 'XMLHttpRequest'},
+                    cache: 'no-cache'
+                });
+                const data = await response.json();
+                if (!response.ok || data.success === false) {
+                    throw new Error(data.error || '진행 상황을 불러오지 못했습니다.');
+                }
+                renderProgress(data);
+                if (!data.finished) {
+                    return;
+                }
+                clearInterval(timer);
+                isUploading = false;
+                if (data.status === 'succeeded') {
+                    showMessage(data.message, 'success');
+                    setTimeout(() => { window.location.href = redirect || '../'; }, 3000);
+                } else {
+                    showMessage(`업로드 실패: ${data.error || data.status_display}`, 'error');
+                }
+            } catch (error) {
+                console.error('진행률 체크 오류:', error);
+            }
+        }, POLL_INTERVAL);
+    }
+
+    form.addEventListener('submit', async function(e) {
+        e.preventDefault();
+        if (isUploading) {
+            return;
+        }
+        isUploading = true;
+
+        progressContainer.style.display = 'block';
+        progressBar.style.width = '0%';
+        processedText.textContent = '0';
+        totalText.textContent = '0';
+        errorList.innerHTML = '';
+        messageContainer.innerHTML = '';
+
+        try {
+            const response = await fetch(window.location.href, {
+                method: 'POST',
+                body: new FormData(form),
+                headers: {
+                    'X-CSRFToken': getCSRFToken(),
+                    'X-Requested-With': 'XMLHttpRequest'
+                }
+            });
+            const data = await response.json();
+            if (!response.ok || !data.success) {
+                throw new Error(data.error || '업로드 중 오류가 발생했습니다.');
+            }
+            showMessage(data.message, 'success');
+            pollProgress(data.task_id, data.redirect);
+        } catch (error) {
+            showMessage(`업로드 실패: ${error.message}`, 'error');
+            progressContainer.style.display = 'none';
+            isUploading = false;
+        }
+    });
+});
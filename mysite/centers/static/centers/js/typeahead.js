@@ -0,0 +1,130 @@
+// 검색창 자동완성 (센터 이름, 시/군/구, 상담사 전문분야)
+
+(function () {
+    const DEBOUNCE_MS = 120;
+    const KIND_ICONS = {
+        center: 'fa-building',
+        district: 'fa-map-marker-alt',
+        specialty: 'fa-user-md'
+    };
+
+    function initTypeahead(input) {
+        const form = input.form;
+        const suggestUrl = input.dataset.typeaheadUrl;
+        const indexUrl = input.dataset.indexUrl;
+        if (!form || !suggestUrl) return;
+
+        const list = document.createElement('ul');
+        list.className = 'typeahead-list';
+        list.setAttribute('role', 'listbox');
+        form.appendChild(list);
+        input.setAttribute('autocomplete', 'off');
+
+        let timer = null;
+        let requestId = 0;
+        let items = [];
+        let activeIndex = -1;
+        const cache = new Map();
+
+        function close() {
+            list.innerHTML = '';
+            list.classList.remove('open');
+            items = [];
+            activeIndex = -1;
+        }
+
+        function select(item) {
+            if (item.kind === 'center' && item.center_id && indexUrl) {
+                // 검색 결과 페이지와 같은 방식으로 지도에서 센터 열기
+                sessionStorage.setItem('selectedCenterId', item.center_id);
+                window.location.href = indexUrl;
+                return;
+            }
+            input.value = item.label;
+            close();
+            form.submit();
+        }
+
+        function render(suggestions) {
+            items = suggestions;
+            activeIndex = -1;
+            if (!suggestions.length) {
+                close();
+                return;
+            }
+            list.innerHTML = '';
+            suggestions.forEach((item, i) => {
+                const li = document.createElement('li');
+                li.className = 'typeahead-item';
+                li.setAttribute('role', 'option');
+                const icon = document.createElement('i');
+                icon.className = `fas ${KIND_ICONS[item.kind] || 'fa-search'}`;
+                li.appendChild(icon);
+                li.appendChild(document.createTextNode(' ' + item.label));
+                // blur보다 먼저 처리되도록 mousedown 사용
+                li.addEventListener('mousedown', (e) => {
+                    e.preventDefault();
+                    select(items[i]);
+                });
+                list.appendChild(li);
+            });
+            list.classList.add('open');
+        }
+
+        function highlight(index) {
+            const nodes = list.querySelectorAll('.typeahead-item');
+            nodes.forEach((node, i) => node.classList.toggle('active', i === index));
+            activeIndex = index;
+        }
+
+        function fetchSuggestions(query) {
+            if (cache.has(query)) {
+                render(cache.get(query));
+                return;
+            }
+            const currentId = ++requestId;
+            fetch(`${suggestUrl}?q=${encodeURIComponent(query)}`)
+                .then(response => response.json())
+                .then(data => {
+                    const suggestions = data.success ? data.suggestions : [];
+                    cache.set(query, suggestions);
+                    // 늦게 도착한 이전 입력의 응답은 무시
+                    if (currentId === requestId) render(suggestions);
+                })
+                .catch(error => console.error('자동완성 조회 실패:', error));
+        }
+
+        input.addEventListener('input', () => {
+            clearTimeout(timer);
+            const query = input.value.trim();
+            if (!query) {
+                requestId++;
+                close();
+                return;
+            }
+            timer = setTimeout(() => fetchSuggestions(query), DEBOUNCE_MS);
+        });
+
+        input.addEventListener('keydown', (e) => {
+            if (!items.length) return;
+            if (e.key === 'ArrowDown') {
+                e.preventDefault();
+                highlight((activeIndex + 1) % items.length);
+            } else if (e.key === 'ArrowUp') {
+                e.preventDefault();
+                highlight((activeIndex - 1 + items.length) % items.length);
+            } else if (e.key === 'Enter' && activeIndex >= 0) {
+                e.preventDefault();
+                select(items[activeIndex]);
+            } else if (e.key === 'Escape') {
+                close();
+            }
+        });
+
+        input.addEventListener('blur', close);
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        document.querySelectorAll('input[data-typeahead-url]').forEach(initTypeahead);
+    });
+})();
@@ -217,6 +217,160 @@ function loadCenters(centers) {
     // 이는 중복 처리를 방지합니다.
 }
 
+// 이 줌 레벨 미만에서는 서버에서 계산한 클러스터를 표시
+const CLUSTER_ZOOM_THRESHOLD = 14;
+
+// 현재 지도 영역의 센터 요약 목록을 서버에서 가져오기
+let viewportRequestId = 0;
+
+function getViewportParams() {
+    const bounds = map.getBounds();
+    const sw = bounds.getSW();
+    const ne = bounds.getNE();
+    return new URLSearchParams({
+        sw_lat: sw.lat(),
+        sw_lng: sw.lng(),
+        ne_lat: ne.lat(),
+        ne_lng: ne.lng(),
+        zoom: map.getZoom()
+    });
+}
+
+function fetchViewportCenters() {
+    if (!map) {
+        console.error('Map is not initialized yet');
+        return;
+    }
+
+    if (map.getZoom() < CLUSTER_ZOOM_THRESHOLD) {
+        fetchViewportClusters();
+        return;
+    }
+
+    const params = getViewportParams();
+
+    // 늦게 도착한 이전 요청의 응답은 무시
+    const requestId = ++viewportRequestId;
+
+    fetch(`${centersApiUrl}?${params.toString()}`)
+        .then(response => response.json())
+        .then(data => {
+            if (requestId !== viewportRequestId) {
+                return;
+            }
+            if (!data.success) {
+                console.error('센터 목록을 가져오는데 실패했습니다:', data.error);
+                return;
+            }
+            centersData = data.centers;
+            loadCenters(centersData);
+        })
+        .catch(error => {
+            console.error('센터 목록 요청 중 오류 발생:', error);
+        });
+}
+
+// 줌 아웃 상태에서 서버 클러스터 목록 가져오기
+function fetchViewportClusters() {
+    const params = getViewportParams();
+    const requestId = ++viewportRequestId;
+
+    fetch(`${clustersApiUrl}?${params.toString()}`)
+        .then(response => response.json())
+        .then(data => {
+            if (requestId !== viewportRequestId) {
+                return;
+            }
+            if (!data.success) {
+                console.error('클러스터 목록을 가져오는데 실패했습니다:', data.error);
+                return;
+            }
+            loadClusters(data.clusters);
+        })
+        .catch(error => {
+            console.error('클러스터 목록 요청 중 오류 발생:', error);
+        });
+}
+
+function getClusterIcon(count) {
+    const size = count < 10 ? 36 : (count < 100 ? 44 : 52);
+    return {
+        content: `
+            <div style="
+                background-color: rgba(59, 130, 246, 0.85);
+                color: white;
+                width: ${size}px;
+                height: ${size}px;
+                line-height: ${size}px;
+                border-radius: 50%;
+                border: 3px solid white;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.3);
+                text-align: center;
+                font-weight: 600;
+                font-size: 14px;
+            ">${count}</div>
+        `,
+        size: new naver.maps.Size(size, size),
+        anchor: new naver.maps.Point(size / 2, size / 2)
+    };
+}
+
+function loadClusters(clusters) {
+    // 기존 마커 제거
+    markers.forEach(marker => marker.setMap(null));
+    markers = [];
+
+    clusters.forEach(cluster => {
+        const position = new naver.maps.LatLng(cluster.lat, cluster.lng);
+
+        // 센터가 하나뿐인 클러스터는 일반 마커로 표시
+        if (cluster.count === 1 && cluster.center_id) {
+            const marker = new naver.maps.Marker({
+                position: position,
+                map: map,
+                icon: getMarkerIcon(cluster.type)
+            });
+            naver.maps.Event.addListener(marker, 'click', function() {
+                showCenterDetails({ id: cluster.center_id });
+            });
+            markers.push(marker);
+            return;
+        }
+
+        const marker = new naver.maps.Marker({
+            position: position,
+            map: map,
+            icon: getClusterIcon(cluster.count)
+        });
+
+        // 클러스터 클릭 시 해당 위치로 확대
+        naver.maps.Event.addListener(marker, 'click', function() {
+            map.setCenter(position);
+            map.setZoom(Math.min(map.getZoom() + 2, CLUSTER_ZOOM_THRESHOLD));
+        });
+
+        markers.push(marker);
+    });
+}
+
+// 센터 상세 정보 캐시 (마커를 열 때만 로드)
+const centerDetailCache = {};
+
+function fetchCenterDetail(centerId) {
+    if (centerDetailCache[centerId]) {
+        return Promise.resolve(centerDetailCache[centerId]);
+    }
+    return fetch(`${centersApiUrl}${centerId}/`)
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) {
+                throw new Error(data.error || '센터 정보를 불러올 수 없습니다.');
+            }
+            centerDetailCache[centerId] = data.center;
+            return data.center;
+        });
+}
+
 function createTherapistCard(therapist) {
     const card = document.createElement('div');
     card.className = 'swiper-slide';
@@ -268,6 +422,14 @@ function updateTherapistCards(therapists) {
 }
 
 function showCenterDetails(center) {
+    // 요약 데이터만 있는 경우 상세 정보를 먼저 로드
+    if (!center.therapists) {
+        fetchCenterDetail(center.id)
+            .then(detail => showCenterDetails(detail))
+            .catch(error => console.error('센터 상세 정보 요청 중 오류 발생:', error));
+        return;
+    }
+
     console.log("Showing center details for:", center);
     
     // 현재 선택된 센터 ID 저장
@@ -1256,18 +1418,19 @@ async function initializeMap(initialLat, initialLng, initialZoom) {
         const bottomSheet = document.getElementById('bottomSheet');
         const isBottomSheetClosed = !bottomSheet || bottomSheet.classList.contains('translate-y-full');
         
-        if (isBottomSheetClosed && typeof centersData !== 'undefined') {
+        if (isBottomSheetClosed) {
             console.log('🔄 마커 재로딩 실행');
-            loadCenters(centersData);
+            fetchViewportCenters();
         } else {
             console.log('⚠️ 마커 재로딩 스킵 - Bottom sheet 열려있음');
         }
     });
 
-    // 센터 데이터 로드
+    // 센터 데이터 로드 (URL로 선택된 센터 먼저 표시 후 지도 영역 로드)
     if (typeof centersData !== 'undefined') {
         loadCenters(centersData);
     }
+    fetchViewportCenters();
 
     // URL 파라미터 처리 (한 번만 실행)
     if (!urlParameterProcessed) {
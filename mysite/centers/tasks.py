@@ -0,0 +1,100 @@
+"""
+centers 앱 백그라운드 작업 (jobs.runner.register로 등록, run_worker 명령이 실행)
+- centers.backup: backup_data 명령 실행 (payload: storage, mode=full|incremental)
+- centers.restore: 업로드된 백업 파일 복원 후 RestoreHistory 기록
+- centers.csv_import: 상담소/상담사/외부 리뷰 CSV 가져오기 (각 ModelAdmin의 run_import_job)
+- centers.cloudinary_outbox: 아웃박스에 기록된 Cloudinary 업로드/삭제 처리 (cloudinary_outbox.py)
+"""
+
+from io import StringIO
+
+from django.apps import apps
+from django.contrib import admin
+from django.core.management import call_command
+
+from jobs.runner import PermanentJobError, register
+
+from .cloudinary_outbox import DRAIN_JOB_KIND, OutboxDrainer
+from .models import RestoreHistory
+
+
+@register('centers.backup')
+def run_backup(ctx):
+    """backup_data 실행 (명령이 BackupHistory를 기록하고, 여기서는 작업을 요청한 사용자만 채움)"""
+    from .management.commands.backup_data import Command as BackupCommand
+    
+    storage = ctx.payload.get('storage', 'github')
+    mode = ctx.payload.get('mode', 'full')
+    ctx.set_message(f'{storage} 백업 실행 중')
+    output = StringIO()
+    command = BackupCommand()
+    try:
+        call_command(command, storage=storage, mode=mode, stdout=output)
+    finally:
+        history = getattr(command, 'history', None)
+        if history is not None:
+            history.created_by = ctx.user
+            history.save(update_fields=['created_by'])
+    
+    output_text = output.getvalue()
+    if history is None:
+        # 설정 누락 등으로 백업이 실행되지 않음 (재시도해도 같은 결과)
+        raise PermanentJobError(output_text.strip().splitlines()[-1] if output_text.strip() else '백업이 실행되지 않았습니다.')
+    
+    ctx.set_message(f'백업 완료: {history.filename}')
+    return {
+        'filename': history.filename,
+        'backup_mode': history.backup_mode,
+        'models_count': history.models_count,
+        'output': output_text[-5000:],
+    }
+
+
+# 복원 도중 실패하면 데이터 복원은 트랜잭션으로 롤백되므로, 자동 재시도 대신 관리자가 다시 실행
+@register('centers.restore', max_attempts=1)
+def run_restore(ctx):
+    from .views import restore_data_file, restore_media_file
+    
+    payload = ctx.payload
+    data_path, media_path = payload.get('data_path'), payload.get('media_path')
+    history = {
+        'filename': f"data:{payload.get('data_name') or 'None'}, media:{payload.get('media_name') or 'None'}",
+        'file_size': payload.get('file_size', 0),
+        'restore_type': 'complete' if (data_path and media_path) else ('data' if data_path else 'media'),
+        'restored_by': ctx.user,
+    }
+    
+    try:
+        restored_data = {}
+        if data_path:
+            # 복원 엔진의 단계별 로그를 작업 진행 메시지로 기록 (취소 요청 시 JobCancelled로 롤백)
+            restored_data.update(restore_data_file(data_path, log=ctx.note))
+        if media_path:
+            ctx.set_message('미디어 파일 복원 중')
+            restored_data.update(restore_media_file(media_path))
+    except Exception as e:
+        RestoreHistory.objects.create(status='failed', error_message=str(e), **history)
+        raise
+    
+    RestoreHistory.objects.create(
+        status='success',
+        models_restored=restored_data.get('models_restored', {}),
+        media_files_count=restored_data.get('media_files_count', 0),
+        **history
+    )
+    ctx.set_message('복원이 완료되었습니다.')
+    return restored_data
+
+
+# 배치마다 바로 커밋되므로 재시도하지 않고 한 번만 실행 (다시 올리면 이미 등록된 행은 중복으로 건너뜀)
+@register('centers.csv_import', max_attempts=1)
+def run_csv_import(ctx):
+    model = apps.get_model(ctx.payload['model'])
+    return admin.site.get_model_admin(model).run_import_job(ctx)
+
+
+# 실패한 항목은 아웃박스에서 항목별로 재시도하므로 작업 자체는 한 번만 실행
+@register(DRAIN_JOB_KIND, max_attempts=1)
+def run_cloudinary_outbox(ctx):
+    ctx.set_message('Cloudinary 업로드/삭제 처리 중')
+    return OutboxDrainer().drain(ctx)
@@ -1,6 +1,11 @@
 from django import template
 from django.conf import settings
 import os
+import re
+
+from centers.image_derivatives import (
+    DERIVATIVE_WIDTHS, derivative_url, image_source, is_derivable, media_name_from_url, nearest_width, srcset, variant_url,
+)
 
 register = template.Library()
 
@@ -40,7 +45,14 @@ def optimize_cloudinary(url, params="w_300,h_200,c_fill,q_auto"):
     사용법:
     {{ image_url|optimize_cloudinary:"w_400,h_300,c_fill" }}
     """
-    if not url or 'cloudinary.com' not in str(url):
+    if not url:
+        return url
+    if 'cloudinary.com' not in str(url):
+        # 로컬 이미지면 w_ 값에 맞는 축소 WebP 파생본
+        name = media_name_from_url(url)
+        width = re.search(r'(?:^|,)w_(\d+)', params)
+        if width and is_derivable(name):
+            return derivative_url(name, int(width.group(1)))
         return url
     
     try:
@@ -51,6 +63,31 @@ def optimize_cloudinary(url, params="w_300,h_200,c_fill,q_auto"):
     except:
         return url
 
+@register.filter
+def image_variant(image_obj, width=480):
+    """
+    너비에 맞춘 이미지 URL (Cloudinary면 변환 파라미터, 로컬 이미지면 축소 WebP 파생본)
+    
+    사용법:
+    {{ center_image|image_variant:480 }}
+    {{ therapist|image_variant:320 }}
+    """
+    url, name = image_source(image_obj)
+    return variant_url(url, name, int(width))
+
+@register.filter
+def image_srcset(image_obj, widths=None):
+    """
+    <img srcset> 값 (Cloudinary/로컬 모두)
+    
+    사용법:
+    <img src="{{ center_image|image_variant:480 }}" srcset="{{ center_image|image_srcset }}" sizes="...">
+    {{ therapist|image_srcset:"160,320" }}
+    """
+    url, name = image_source(image_obj)
+    widths = [int(w) for w in str(widths).split(',')] if widths else DERIVATIVE_WIDTHS
+    return srcset(url, name, widths)
+
 @register.simple_tag
 def cloudinary_config():
     """
@@ -76,21 +113,30 @@ def responsive_image(image_obj, alt_text="", css_class="", sizes=None):
     """
     if not sizes:
         sizes = ["300", "600", "900"]  # 기본 크기들
+    elif isinstance(sizes, str):
+        sizes = [size.strip() for size in sizes.split(',') if size.strip()]
     
     base_url = cloudinary_url(image_obj)
     if not base_url:
         return {'image_url': None}
     
     # 여러 크기의 이미지 URL 생성
-    srcset = []
+    srcset_items = []
     if 'cloudinary.com' in base_url:
         for size in sizes:
             optimized_url = optimize_cloudinary(base_url, f"w_{size},h_{size},c_fill,q_auto")
-            srcset.append(f"{optimized_url} {size}w")
+            srcset_items.append(f"{optimized_url} {size}w")
+    else:
+        # 로컬 이미지는 축소 WebP 파생본 (원본 대신 중간 크기를 기본 src로)
+        url, name = image_source(image_obj)
+        if is_derivable(name):
+            widths = sorted({nearest_width(size) for size in sizes})
+            srcset_items = [f"{derivative_url(name, width)} {width}w" for width in widths]
+            base_url = derivative_url(name, widths[len(widths) // 2])
     
     return {
         'image_url': base_url,
-        'srcset': ', '.join(srcset) if srcset else None,
+        'srcset': ', '.join(srcset_items) if srcset_items else None,
         'alt_text': alt_text,
         'css_class': css_class,
         'sizes': "(max-width: 768px) 300px, (max-width: 1024px) 600px, 900px"
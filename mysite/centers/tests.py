@@ -0,0 +1,525 @@
+import base64
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage, default_storage
+from django.core.management import call_command
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import csv_import
+from .backup_io import (
+    READ_BUFFER_SIZE, BackupFormatError, StreamingBackupWriter, create_temp_path, iter_backup_file,
+    iter_serialized, write_base64_json_body,
+)
+from .image_import import FakeImageUploader, ZipImageSource
+from .image_derivatives import derivative_name, derivative_storage, variant_url
+from .incremental import changed_queryset, last_backup
+from .models import BackupHistory, Center, CenterImage, DeletedRecord, ExternalReview, Review, ReviewComment, Therapist
+from .page_cache import bump_model_version, model_versions
+from .pagination import CachedCountPaginator, CursorPaginator, InvalidCursor, count_cache_key
+from .restore import RestoreEngine
+from .tiered_cache import tiered_cache
+
+
+class ReviewQueryCountTests(TestCase):
+    """리뷰/댓글 수가 늘어도 뷰의 쿼리 수가 그대로인지 (N+1 회귀 방지)"""
+
+    def setUp(self):
+        self.manager = User.objects.create_user('manager', password='pw')
+        self.manager.profile.role = 'admin'
+        self.manager.profile.save()
+        self.client.force_login(self.manager)
+
+    def make_center(self, review_count, name):
+        center = Center.objects.create(name=name, address=name, latitude=37.5, longitude=127.0)
+        for i in range(review_count):
+            author = User.objects.create_user(f'{name}-author-{i}')
+            review = Review.objects.create(center=center, user=author, title=f'리뷰 {i}', content='내용', rating=4)
+            for j in range(2):
+                ReviewComment.objects.create(review=review, author=self.manager, content=f'댓글 {j}')
+        return center
+
+    def count_queries(self, url):
+        # 캐시(페이지 캐시, 워커 메모리의 개수 캐시, 권한 컨텍스트)에 따라 쿼리 수가 달라지지 않도록 매번 비움
+        cache.clear()
+        tiered_cache.l1.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assert_constant_queries(self, url_for):
+        """리뷰 2개인 센터와 20개인 센터에서 url_for(center) 요청의 쿼리 수가 같은지 확인"""
+        small = self.make_center(2, 'small')
+        url = url_for(small)
+        self.client.get(url)  # 세션 저장 등 첫 요청에만 있는 쿼리 제외
+        expected = self.count_queries(url)
+
+        large = self.make_center(20, 'large')
+        url = url_for(large)
+        cache.clear()
+        tiered_cache.l1.clear()
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_index_with_selected_center(self):
+        self.assert_constant_queries(lambda center: reverse('centers:index') + f'?center_id={center.pk}')
+
+    def test_get_reviews(self):
+        self.assert_constant_queries(lambda center: reverse('centers:get_reviews', args=[center.pk]))
+
+    def test_get_reviews_with_cursor(self):
+        self.assert_constant_queries(lambda center: reverse('centers:get_reviews', args=[center.pk]) + '?cursor=')
+
+    def test_get_review_comments(self):
+        def url_for(center):
+            review = center.reviews.order_by('pk').first()
+            for j in range(2, 20 if center.name == 'large' else 2):
+                ReviewComment.objects.create(review=review, author=self.manager, content=f'댓글 {j}')
+            return reverse('centers:get_review_comments', args=[review.pk])
+        self.assert_constant_queries(url_for)
+
+    def test_review_management(self):
+        # 센터마다 리뷰를 만들어 전체 리뷰 수(2개 / 22개)를 다르게 함
+        self.assert_constant_queries(lambda center: reverse('centers:review_management'))
+
+
+class BackupStreamTests(TestCase):
+    def setUp(self):
+        self.path = create_temp_path('.json.gz')
+        self.addCleanup(os.remove, self.path)
+        # 읽기 버퍼(READ_BUFFER_SIZE)보다 긴 레코드도 조각 경계를 넘어 읽혀야 함
+        Center.objects.create(name='긴 설명 센터', address='서울', latitude=37.5, longitude=127.0,
+                              description='가' * (READ_BUFFER_SIZE * 2))
+        for i in range(4):
+            Center.objects.create(name=f'센터 {i}', address='서울', latitude=37.5, longitude=127.0)
+
+    def read_events(self, path_or_file):
+        return list(iter_backup_file(path_or_file))
+
+    def test_gzip_round_trip(self):
+        with StreamingBackupWriter(self.path, chunk_size=2) as writer:
+            writer.write_section('_deletions', {'Review': [3, 5]})
+            writer.write_model('Center', Center.objects.all())
+            writer.write_model('Review', Review.objects.all())
+            writer.write_metadata({'backup_type': 'full'})
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(2), b'\x1f\x8b')
+        expected = json.loads(json.dumps(list(iter_serialized(Center.objects.all())), cls=DjangoJSONEncoder))
+        events = self.read_events(self.path)
+
+        self.assertEqual(writer.counts, {'Center': 5, 'Review': 0})
+        self.assertEqual(events[0], ('metadata', '_deletions', {'Review': [3, 5]}))
+        self.assertEqual(events[1], ('model', 'Center', None))
+        self.assertEqual([record for kind, name, record in events if kind == 'record'], expected)
+        self.assertEqual(events[-2:], [('model', 'Review', None), ('metadata', '_metadata', {'backup_type': 'full'})])
+
+    def test_reads_legacy_indented_backup(self):
+        """예전 백업 (indent=2, 압축 없음, count가 data보다 앞)"""
+        records = json.loads(serializers.serialize('json', Center.objects.order_by('pk')))
+        legacy = json.dumps({'Center': {'count': len(records), 'data': records}, '_metadata': {'version': 1}}, indent=2)
+
+        events = self.read_events(io.BytesIO(legacy.encode('utf-8')))
+
+        self.assertEqual([record for kind, _, record in events if kind == 'record'], records)
+        self.assertEqual(events[-1], ('metadata', '_metadata', {'version': 1}))
+
+    def test_truncated_file_raises_format_error(self):
+        with StreamingBackupWriter(self.path, compress=False) as writer:
+            writer.write_model('Center', Center.objects.all())
+        with open(self.path, 'rb') as f:
+            truncated = f.read()[:-200]
+
+        with self.assertRaises(BackupFormatError):
+            self.read_events(io.BytesIO(truncated))
+
+    def test_base64_body_decodes_to_source(self):
+        with open(self.path, 'wb') as f:
+            f.write(os.urandom(1024 * 1024 + 7))  # 3바이트 단위 조각 경계를 넘는 크기
+        body_path = write_base64_json_body(self.path, {'message': '백업'})
+        self.addCleanup(os.remove, body_path)
+
+        with open(body_path, encoding='utf-8') as f:
+            body = json.load(f)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(base64.b64decode(body['data']), f.read())
+        self.assertEqual(body['message'], '백업')
+
+
+class CenterBboxTests(TestCase):
+    def test_within_bbox_includes_rows_without_geohash(self):
+        """save()를 거치지 않아 geohash가 빈 행도 좌표가 영역 안이면 포함"""
+        indexed = Center.objects.create(name='indexed', address='a', latitude=37.5, longitude=127.0)
+        Center.objects.bulk_create([Center(name='raw', address='b', latitude=37.51, longitude=127.01)])
+        outside = Center.objects.create(name='outside', address='c', latitude=35.1, longitude=129.0)
+        Center.objects.filter(pk=outside.pk).update(geohash='')
+
+        names = set(Center.objects.within_bbox(37.4, 126.9, 37.6, 127.1).values_list('name', flat=True))
+
+        self.assertEqual(Center.objects.get(name='raw').geohash, '')
+        self.assertIn(indexed.name, names)
+        self.assertEqual(names, {'indexed', 'raw'})
+
+
+class CursorPaginatorTests(TestCase):
+    def setUp(self):
+        self.center = Center.objects.create(name='center', address='a', latitude=37.5, longitude=127.0)
+        author = User.objects.create_user('author')
+        self.reviews = [
+            Review.objects.create(center=self.center, user=author, title=f'리뷰 {i}', content='내용', rating=4)
+            for i in range(7)
+        ]
+        # 작성 시각이 모두 같아도 id로 순서가 정해져야 함
+        Review.objects.update(created_at=self.reviews[0].created_at)
+        self.paginator = CursorPaginator(Review.objects.all(), 3)
+
+    def walk_forward(self):
+        pages, cursor = [], None
+        while True:
+            page = self.paginator.page(cursor)
+            pages.append(page)
+            if not page.has_next():
+                return pages
+            cursor = page.next_cursor
+
+    def test_pages_cover_every_row_once_when_timestamps_tie(self):
+        pages = self.walk_forward()
+        ids = [review.pk for page in pages for review in page]
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(ids, sorted((review.pk for review in self.reviews), reverse=True))
+
+    def test_cursor_is_stable_when_rows_are_added(self):
+        first = self.paginator.page()
+        second = self.paginator.page(first.next_cursor)
+        Review.objects.create(center=self.center, user=User.objects.create_user('late'), title='새 리뷰', content='내용', rating=5)
+
+        again = self.paginator.page(first.next_cursor)
+
+        self.assertEqual([r.pk for r in again], [r.pk for r in second])
+
+    def test_previous_cursor_returns_previous_page(self):
+        first = self.paginator.page()
+        second = self.paginator.page(first.next_cursor)
+
+        back = self.paginator.page(second.previous_cursor)
+
+        self.assertEqual([r.pk for r in back], [r.pk for r in first])
+        self.assertFalse(back.has_previous())
+        self.assertTrue(back.has_next())
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            self.paginator.page('not-a-cursor')
+
+
+class CachedCountPaginatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        tiered_cache.l1.clear()
+        self.center = Center.objects.create(name='center', address='a', latitude=37.5, longitude=127.0)
+        for i in range(3):
+            Review.objects.create(center=self.center, user=User.objects.create_user(f'author-{i}'),
+                                  title=f'리뷰 {i}', content='내용', rating=4)
+
+    def test_known_count_skips_count_query(self):
+        paginator = CachedCountPaginator(Review.objects.order_by('pk'), 2, count=3)
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.num_pages, 2)
+
+    def test_cached_count_is_reused(self):
+        key = count_cache_key('reviews', 'test')
+        self.assertEqual(CachedCountPaginator(Review.objects.order_by('pk'), 2, count_cache_key=key).count, 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(Review.objects.order_by('pk'), 2, count_cache_key=key).count, 3)
+
+    def test_dependency_version_refreshes_count(self):
+        def count():
+            key = count_cache_key('reviews', 'test', dependencies=['centers.Review'])
+            return CachedCountPaginator(Review.objects.order_by('pk'), 2, count_cache_key=key).count
+
+        self.assertEqual(count(), 3)
+        Review.objects.create(center=self.center, user=User.objects.create_user('late'), title='새 리뷰', content='내용', rating=5)
+        self.assertEqual(count(), 4)
+
+
+class ModelVersionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        tiered_cache.l1.clear()
+
+    def test_bump_changes_version(self):
+        before = model_versions(['centers.Review'])
+        bump_model_version('centers.Review')
+        after = model_versions(['centers.Review'])
+
+        self.assertNotEqual(after, before)
+        self.assertEqual(model_versions(['centers.Review']), after)
+
+    def test_evicted_version_does_not_reuse_old_value(self):
+        old = model_versions(['centers.Review'])['centers.Review']
+        cache.clear()  # 캐시 축출/재시작
+        tiered_cache.l1.clear()
+
+        self.assertNotEqual(model_versions(['centers.Review'])['centers.Review'], old)
+
+    def test_versions_are_read_from_l1(self):
+        versions = model_versions(['centers.Review', 'centers.Center'])
+        cache.clear()  # 공유 캐시를 읽지 않으면 L1의 값이 그대로 나와야 함
+
+        self.assertEqual(model_versions(['centers.Review', 'centers.Center']), versions)
+
+
+class RestoreRoundTripTests(TestCase):
+    def setUp(self):
+        self.path = create_temp_path('.json.gz')
+        self.addCleanup(os.remove, self.path)
+        self.author = User.objects.create_user('author')
+        self.center = Center.objects.create(name='센터', address='서울', latitude=37.5, longitude=127.0)
+        self.reviews = [
+            Review.objects.create(center=self.center, user=self.author, title=f'리뷰 {i}', content='내용', rating=i + 3)
+            for i in range(2)
+        ]
+        ReviewComment.objects.create(review=self.reviews[0], author=self.author, content='댓글')
+        # 백업된 updated_at이 복원 후에도 그대로인지 보기 위해 과거 시각으로 맞춤
+        self.updated_at = (timezone.now() - timedelta(days=30)).replace(microsecond=0)
+        Review.objects.update(updated_at=self.updated_at)
+
+    def snapshot(self):
+        def rows(model):
+            # JSON 백업은 시각을 밀리초까지만 저장 (DjangoJSONEncoder)
+            return [
+                {key: value.replace(microsecond=value.microsecond // 1000 * 1000) if isinstance(value, datetime) else value
+                 for key, value in row.items()}
+                for row in model.objects.order_by('pk').values()
+            ]
+
+        return {'centers': rows(Center), 'reviews': rows(Review), 'comments': rows(ReviewComment)}
+
+    def write_backup(self, models):
+        with StreamingBackupWriter(self.path) as writer:
+            for model in models:
+                writer.write_model(model.__name__, model.objects.all())
+            writer.write_metadata({'backup_type': 'full'})
+
+    def test_restore_round_trip(self):
+        self.write_backup([Center, Review, ReviewComment])
+        expected = self.snapshot()
+
+        Center.objects.filter(pk=self.center.pk).update(name='바뀐 이름')
+        self.reviews[1].delete()
+        ReviewComment.objects.all().delete()
+
+        report = RestoreEngine(batch_size=1, log=lambda message: None).restore(self.path)
+
+        self.assertEqual(report.restored_counts, {'Center': 1, 'Review': 2, 'ReviewComment': 1})
+        self.assertEqual(self.snapshot(), expected)
+        self.assertEqual(set(Review.objects.values_list('updated_at', flat=True)), {self.updated_at})
+
+    def test_restore_fills_geohash_and_review_stats_for_old_backups(self):
+        """geohash 컬럼이 생기기 전 백업도 복원 후 지도 조회에 나타나야 함"""
+        self.write_backup([Center, Review])
+        expected_geohash = self.center.geohash
+        Review.objects.all().delete()
+        Center.objects.all().delete()
+
+        events = list(iter_backup_file(self.path))
+        with StreamingBackupWriter(self.path) as writer:
+            for kind, name, payload in events:
+                if kind == 'record' and name == 'Center':
+                    del payload['fields']['geohash']
+            writer.write_section('Center', {'data': [p for k, n, p in events if k == 'record' and n == 'Center']})
+            writer.write_section('Review', {'data': [p for k, n, p in events if k == 'record' and n == 'Review']})
+
+        RestoreEngine(log=lambda message: None).restore(self.path)
+
+        center = Center.objects.get(pk=self.center.pk)
+        self.assertEqual(center.geohash, expected_geohash)
+        self.assertEqual(center.review_count, 2)
+        self.assertIn(center, Center.objects.within_bbox(37.4, 126.9, 37.6, 127.1))
+
+
+class IncrementalChangesTests(TestCase):
+    def test_edits_to_old_rows_are_included(self):
+        """created_at이 기준 시각보다 오래된 행도 수정되면 증분 백업 대상"""
+        center = Center.objects.create(name='센터', address='서울', latitude=37.5, longitude=127.0)
+        long_ago = timezone.now() - timedelta(days=30)
+        external = ExternalReview.objects.create(center=center, title='블로그', url='https://example.com', created_at=long_ago)
+        image = CenterImage.objects.create(center=center, image='centers/a.jpg', created_at=long_ago)
+        ExternalReview.objects.update(updated_at=long_ago)
+        CenterImage.objects.update(updated_at=long_ago)
+        since = timezone.now() - timedelta(days=1)
+
+        self.assertFalse(changed_queryset(ExternalReview, since).exists())
+        external.likes += 1
+        external.save()
+        image.image_url = 'https://res.cloudinary.com/demo/image/upload/a.jpg'
+        image.save()
+
+        self.assertEqual(list(changed_queryset(ExternalReview, since)), [external])
+        self.assertEqual(list(changed_queryset(CenterImage, since)), [image])
+
+
+class RestoreThenIncrementalTests(TestCase):
+    """복원 후의 증분 백업 체인만으로 현재 상태를 다시 만들 수 있는지"""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir)
+        self.enterContext(override_settings(BASE_DIR=self.base_dir))  # LocalStorage: BASE_DIR/backups
+        self.author = User.objects.create_user('author')
+        self.center = Center.objects.create(name='센터', address='서울', latitude=37.5, longitude=127.0)
+        self.other = Center.objects.create(name='다른 센터', address='부산', latitude=35.1, longitude=129.0)
+        Review.objects.create(center=self.center, user=self.author, title='리뷰', content='내용', rating=5)
+
+    def backup(self, mode):
+        call_command('backup_data', storage='local', mode=mode, include_media=False, stdout=io.StringIO())
+        history = BackupHistory.objects.filter(status='success').latest('id')
+        return history, os.path.join(self.base_dir, 'backups', history.filename)
+
+    def snapshot(self):
+        return {
+            'centers': list(Center.objects.order_by('pk').values_list('pk', 'name')),
+            'reviews': list(Review.objects.order_by('pk').values_list('pk', 'center_id', 'title')),
+        }
+
+    def test_chain_after_restore_replays_current_state(self):
+        _, full_path = self.backup('full')
+        Center.objects.filter(pk=self.center.pk).update(name='복원 전 수정')
+
+        RestoreEngine(clear_existing=True, log=lambda message: None).restore(full_path)
+
+        # 복원 엔진의 삭제는 tombstone이 아니고, 이전 백업은 더 이상 증분의 기준이 아님
+        self.assertFalse(DeletedRecord.objects.exists())
+        self.assertIsNone(last_backup('local'))
+
+        self.other.delete()
+        added = Center.objects.create(name='새 센터', address='대구', latitude=35.8, longitude=128.6)
+        base, base_path = self.backup('incremental')
+        self.assertEqual(base.backup_mode, 'full')
+
+        added.delete()
+        Review.objects.create(center=self.center, user=self.author, title='새 리뷰', content='내용', rating=4)
+        incremental, incremental_path = self.backup('incremental')
+        self.assertEqual((incremental.backup_mode, incremental.base_backup), ('incremental', base))
+        expected = self.snapshot()
+
+        Center.objects.all().delete()
+        RestoreEngine(clear_existing=True, log=lambda message: None).restore_chain([base_path, incremental_path])
+
+        self.assertEqual(self.snapshot(), expected)
+
+
+class RemoteMediaStorage(InMemoryStorage):
+    """운영 환경의 MediaCloudinaryStorage처럼 로컬 파일 시스템이 아닌 미디어 저장소"""
+
+    def __init__(self, **kwargs):
+        super().__init__(base_url='https://res.cloudinary.com/demo/image/upload/', **kwargs)
+
+
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.derivatives_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.addCleanup(shutil.rmtree, self.derivatives_root)
+        output = io.BytesIO()
+        Image.new('RGB', (1200, 800), 'white').save(output, 'PNG')
+        self.png = output.getvalue()
+
+    def test_local_media_derivative_goes_to_dedicated_storage(self):
+        with self.settings(MEDIA_ROOT=self.media_root, IMAGE_DERIVATIVES_ROOT=self.derivatives_root):
+            name = default_storage.save('centers/a.png', ContentFile(self.png))
+            response = self.client.get(variant_url(None, name, 480))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(Image.open(io.BytesIO(b''.join(response.streaming_content))).width, 480)
+            self.assertTrue(derivative_storage().exists(derivative_name(name, 480)))
+            self.assertFalse(default_storage.exists(derivative_name(name, 480)))
+
+    @override_settings(DEFAULT_FILE_STORAGE='centers.tests.RemoteMediaStorage')
+    def test_remote_media_uses_cloudinary_transformation(self):
+        with self.settings(IMAGE_DERIVATIVES_ROOT=self.derivatives_root):
+            url = variant_url(None, 'centers/a.png', 480)
+            response = self.client.get(reverse('centers:image_derivative', kwargs={'width': 480, 'name': 'centers/a.png'}))
+
+        self.assertEqual(url, 'https://res.cloudinary.com/demo/image/upload/w_480,q_auto:good,f_auto/centers/a.png')
+        self.assertRedirects(response, url, fetch_redirect_response=False, status_code=301)
+        self.assertEqual(os.listdir(self.derivatives_root), [])
+
+
+class CsvImportTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        output = io.BytesIO()
+        Image.new('RGB', (10, 10), 'white').save(output, 'PNG')
+        zip_path = os.path.join(self.media_root, 'images.zip')
+        with zipfile.ZipFile(zip_path, 'w') as zip_file:
+            zip_file.writestr('a.png', output.getvalue())
+            zip_file.writestr('b.png', output.getvalue())
+        self.images = ZipImageSource(zip_path)
+        self.addCleanup(self.images.close)
+        self.center = Center.objects.create(name='기존 상담소', address='서울시 종로구 1')
+
+    def run_import(self, importer_class, rows, **options):
+        depths = []
+        real_upload_images = csv_import.upload_images
+
+        def upload_images(*args, **kwargs):
+            depths.append(len(connection.savepoint_ids))
+            return real_upload_images(*args, **kwargs)
+
+        importer = importer_class(options=options, images=self.images, uploader=FakeImageUploader(), log=lambda message: None)
+        with self.settings(MEDIA_ROOT=self.media_root), mock.patch.object(csv_import, 'upload_images', upload_images):
+            baseline = len(connection.savepoint_ids)
+            result = importer.run(rows)
+        return result, depths, baseline
+
+    def test_center_images_are_uploaded_outside_the_savepoint(self):
+        version = model_versions(['centers.CenterImage'])['centers.CenterImage']
+        rows = [
+            {'name': '가 상담소', 'address': '서울시 중구 1', 'latitude': '37.5', 'longitude': '127.0',
+             'image_filename': 'a.png, b.png'},
+            {'name': '나 상담소', 'address': '서울시 중구 2', 'latitude': '37.6', 'longitude': '127.1'},
+        ]
+
+        result, depths, baseline = self.run_import(csv_import.CenterImporter, rows)
+
+        self.assertEqual(result, {'total': 2, 'success': 2, 'errors': 0})
+        self.assertEqual(depths, [baseline])
+        center = Center.objects.get(name='가 상담소')
+        self.assertEqual(center.images.count(), 2)
+        self.assertTrue(center.image_url.startswith('https://images.example.com/centers/'))
+        self.assertNotEqual(model_versions(['centers.CenterImage'])['centers.CenterImage'], version)
+
+    def test_therapists_with_the_same_name_are_both_imported(self):
+        Therapist.objects.create(center=self.center, name='김상담')
+        rows = [
+            {'name': '김상담', 'image_filename': 'a.png'},
+            {'name': '김상담'},
+        ]
+
+        result, depths, baseline = self.run_import(csv_import.TherapistImporter, rows, center=self.center)
+
+        self.assertEqual(result, {'total': 2, 'success': 2, 'errors': 0})
+        self.assertEqual(depths, [baseline])
+        self.assertEqual(Therapist.objects.filter(center=self.center, name='김상담').count(), 3)
+        self.assertEqual(Therapist.objects.exclude(photo_url=None).exclude(photo_url='').count(), 1)
@@ -0,0 +1,194 @@
+"""
+2단계 캐시 (워커별 L1 LRU + 공유 L2 Django 캐시)
+자주 읽는 키(홈 화면 리뷰 목록, 지도 클러스터, 목록 개수 등)의 만료 순간에 여러 요청이 동시에
+다시 계산하는 현상(cache stampede)을 막습니다.
+
+- L1: 워커 프로세스 메모리의 LRU (항목 수 제한, 짧은 TTL로 다른 워커의 갱신을 늦게 반영하는 시간을 제한)
+- L2: settings.CACHES['default'] (Redis/DB 캐시 등)
+- 확률적 조기 만료(XFetch): 만료가 가까울수록, 계산이 오래 걸리는 값일수록 일찍 한 요청만 다시 계산
+- single-flight: 락 키(cache.add)를 얻은 요청만 계산하고, 나머지는 이전 값(stale)을 쓰거나 잠시 대기.
+  cache.add가 원자적인 백엔드(Redis, DB 캐시, LocMem)가 필요합니다. 파일 캐시(CACHE_BACKEND=file)의 add는
+  읽고-쓰기라 여러 요청이 함께 락을 얻을 수 있고, 그만큼 중복 계산이 생깁니다 (값은 정확함)
+- stale-while-revalidate: 만료 후 stale_ttl 동안은 이전 값을 돌려주면서 한 요청이 갱신
+- 키 계열(family)별 L1/L2 적중, 미스, 계산 횟수, 지연 시간 집계 (stats())
+"""
+
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+L1_MAX_ENTRIES = 256
+L1_TTL = 5  # 초
+DEFAULT_STALE_TTL = 60  # 만료 후 stale 값을 허용하는 시간 (초)
+LOCK_TIMEOUT = 30  # 계산 중 락 유지 시간 (계산한 워커가 죽어도 이 시간 뒤 해제)
+LOCK_WAIT = 3.0  # 값이 없을 때 다른 요청의 계산을 기다리는 최대 시간
+LOCK_POLL_INTERVAL = 0.05
+
+
+class LRUCache:
+    """스레드 안전한 크기 제한 LRU"""
+
+    def __init__(self, max_entries=L1_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class _FamilyStats:
+    __slots__ = ('l1_hits', 'l2_hits', 'misses', 'stale_served', 'early_recomputes',
+                 'recomputes', 'lock_waits', 'get_seconds', 'compute_seconds', 'calls')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['avg_get_ms'] = round(self.get_seconds / self.calls * 1000, 3) if self.calls else None
+        data['avg_compute_ms'] = round(self.compute_seconds / self.recomputes * 1000, 3) if self.recomputes else None
+        data['hit_ratio'] = round((self.l1_hits + self.l2_hits) / self.calls, 3) if self.calls else None
+        del data['get_seconds'], data['compute_seconds']
+        return data
+
+
+class TieredCache:
+    """L1 LRU + L2 Django 캐시. L2에는 (값, 논리적 만료 시각, 계산 소요 시간)을 저장합니다."""
+
+    def __init__(self, l1_max_entries=L1_MAX_ENTRIES, l1_ttl=L1_TTL):
+        self.l1 = LRUCache(l1_max_entries)
+        self.l1_ttl = l1_ttl
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def _family(self, family):
+        with self._stats_lock:
+            stats = self._stats.get(family)
+            if stats is None:
+                stats = self._stats[family] = _FamilyStats()
+            return stats
+
+    @staticmethod
+    def _should_recompute_early(expires_at, delta, beta, now):
+        # XFetch: now - delta * beta * ln(rand) >= expires_at 이면 미리 다시 계산
+        return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+    def _compute_and_store(self, key, compute, ttl, stale_ttl, stats):
+        started = time.monotonic()
+        value = compute()
+        delta = time.monotonic() - started
+        envelope = (value, time.time() + ttl, delta)
+        cache.set(key, envelope, ttl + stale_ttl)
+        self.l1.set(key, envelope, min(self.l1_ttl, ttl))
+        stats.recomputes += 1
+        stats.compute_seconds += delta
+        return value
+
+    def get_or_set(self, family, key, compute, ttl, stale_ttl=DEFAULT_STALE_TTL, beta=1.0):
+        """
+        key의 값을 반환하고, 없거나 만료되었으면 compute()로 계산해 저장합니다.
+        family는 통계 집계 단위입니다 (예: 'home', 'clusters').
+        """
+        stats = self._family(family)
+        started = time.monotonic()
+        try:
+            return self._get_or_set(key, compute, ttl, stale_ttl, beta, stats)
+        finally:
+            stats.calls += 1
+            stats.get_seconds += time.monotonic() - started
+
+    def _get_or_set(self, key, compute, ttl, stale_ttl, beta, stats):
+        now = time.time()
+
+        envelope = self.l1.get(key)
+        if envelope is not None and envelope[1] > now:
+            stats.l1_hits += 1
+            return envelope[0]
+
+        envelope = cache.get(key)
+        if envelope is not None:
+            value, expires_at, delta = envelope
+            if expires_at > now and not self._should_recompute_early(expires_at, delta, beta, now):
+                stats.l2_hits += 1
+                self.l1.set(key, envelope, min(self.l1_ttl, expires_at - now))
+                return value
+
+            # 조기 만료 또는 stale: 락을 얻은 한 요청만 갱신하고 나머지는 이전 값 사용
+            lock_key = f'{key}:lock'
+            if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+                stats.stale_served += 1
+                return value
+            try:
+                if expires_at > now:
+                    stats.early_recomputes += 1
+                else:
+                    stats.misses += 1
+                return self._compute_and_store(key, compute, ttl, stale_ttl, stats)
+            finally:
+                cache.delete(lock_key)
+
+        # 값이 전혀 없음: 한 요청만 계산하고 나머지는 잠시 기다렸다가 그 결과를 사용
+        stats.misses += 1
+        lock_key = f'{key}:lock'
+        if cache.add(lock_key, 1, LOCK_TIMEOUT):
+            try:
+                return self._compute_and_store(key, compute, ttl, stale_ttl, stats)
+            finally:
+                cache.delete(lock_key)
+
+        stats.lock_waits += 1
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            envelope = cache.get(key)
+            if envelope is not None:
+                self.l1.set(key, envelope, self.l1_ttl)
+                return envelope[0]
+        # 계산한 요청이 실패했거나 너무 오래 걸리면 직접 계산
+        return self._compute_and_store(key, compute, ttl, stale_ttl, stats)
+
+    def delete(self, key):
+        self.l1.delete(key)
+        cache.delete(key)
+
+    def stats(self):
+        """키 계열별 통계 (현재 워커 기준)"""
+        with self._stats_lock:
+            families = {family: stats.as_dict() for family, stats in self._stats.items()}
+        return {'l1_entries': len(self.l1), 'l1_max_entries': self.l1.max_entries, 'families': families}
+
+
+tiered_cache = TieredCache()
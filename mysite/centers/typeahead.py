@@ -0,0 +1,303 @@
+"""
+검색창 자동완성(typeahead) 인덱스
+센터 이름, 주소에서 추출한 시/군/구, 상담사 전문분야를 워커 프로세스 메모리의
+정렬된 키 배열에 두고 bisect로 접두어 검색합니다. 키 입력마다 DB를 조회하지 않습니다.
+
+- 첫 조회 시 DB에서 한 번 만들고, Center/Therapist 시그널로 항목 단위로 갱신합니다.
+- 다른 워커에서 생긴 변경은 캐시의 버전 키로 감지해(최대 VERSION_CHECK_INTERVAL초마다 확인) 다시 만듭니다.
+- 키 개수는 MAX_KEYS로 제한하며 stats()로 항목 수와 대략적인 메모리 사용량을 확인할 수 있습니다.
+"""
+
+import re
+import sys
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+
+from django.core.cache import cache
+
+MAX_KEYS = 50000
+MAX_SCAN = 300  # 한 번의 조회에서 살펴볼 최대 키 수
+DEFAULT_LIMIT = 8
+
+VERSION_CACHE_KEY = 'typeahead:version'
+VERSION_CHECK_INTERVAL = 30  # 초
+
+# 같은 점수일 때 보여줄 순서
+KIND_ORDER = {'center': 0, 'district': 1, 'specialty': 2}
+
+_PROVINCE_SUFFIXES = ('특별시', '광역시', '특별자치시', '특별자치도', '도')
+_SHORT_PROVINCES = {
+    '서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원',
+    '충북', '충남', '전북', '전남', '경북', '경남', '제주',
+}
+_DISTRICT_RE = re.compile(r'^[가-힣]+(?:시|군|구)$')
+_SPECIALTY_SPLIT_RE = re.compile(r'[,/·|]+')
+
+
+def normalize_key(text):
+    """조회 키 정규화: NFKC, 소문자, 공백 제거"""
+    return re.sub(r'\s+', '', unicodedata.normalize('NFKC', text or '').lower())
+
+
+def parse_districts(address):
+    """
+    주소에서 시/군/구 이름을 추출합니다.
+    '서울특별시 강남구 테헤란로 1' -> ['서울특별시 강남구'], '경기도 성남시 분당구 ...' -> ['경기도 성남시', '경기도 성남시 분당구']
+    """
+    words = (address or '').split()
+    districts = []
+    prefix = []
+    for word in words[:4]:
+        if not prefix and (word in _SHORT_PROVINCES or word.endswith(_PROVINCE_SUFFIXES)):
+            prefix.append(word)
+            continue
+        if not _DISTRICT_RE.match(word):
+            break
+        prefix.append(word)
+        districts.append(' '.join(prefix))
+    return districts
+
+
+def parse_specialties(specialty):
+    """'인지행동치료, 놀이치료' -> ['인지행동치료', '놀이치료']"""
+    return [part.strip() for part in _SPECIALTY_SPLIT_RE.split(specialty or '') if part.strip()]
+
+
+def _label_keys(label):
+    """라벨의 각 단어 시작 위치부터의 정규화 키 ('마음숲 심리상담센터' -> 마음숲심리상담센터, 심리상담센터)"""
+    words = label.split()
+    return {normalize_key(''.join(words[i:])) for i in range(len(words))} - {''}
+
+
+class PrefixIndex:
+    """(키, 항목 ID) 정렬 배열 + 항목 참조 카운트"""
+
+    def __init__(self, max_keys=MAX_KEYS):
+        self.max_keys = max_keys
+        self._keys = []
+        self._entries = {}
+        self.dropped = 0  # 용량 초과로 색인하지 못한 항목 수
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entry_id, label, kind, center_id=None, _sorted=True):
+        entry = self._entries.get(entry_id)
+        if entry is not None:
+            entry['count'] += 1
+            return
+        keys = _label_keys(label)
+        if len(self._keys) + len(keys) > self.max_keys:
+            self.dropped += 1
+            return
+        self._entries[entry_id] = {
+            'label': label, 'kind': kind, 'center_id': center_id, 'count': 1,
+            'full_key': normalize_key(label),
+        }
+        for key in keys:
+            if _sorted:
+                insort(self._keys, (key, entry_id))
+            else:
+                self._keys.append((key, entry_id))
+
+    def load(self, entries):
+        """여러 항목을 한 번에 추가 (마지막에 한 번만 정렬)"""
+        for entry in entries:
+            self.add(*entry, _sorted=False)
+        self._keys.sort()
+
+    def discard(self, entry_id):
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return
+        entry['count'] -= 1
+        if entry['count'] > 0:
+            return
+        del self._entries[entry_id]
+        for key in _label_keys(entry['label']):
+            position = bisect_left(self._keys, (key, entry_id))
+            if position < len(self._keys) and self._keys[position] == (key, entry_id):
+                del self._keys[position]
+
+    def lookup(self, prefix, limit=DEFAULT_LIMIT):
+        prefix = normalize_key(prefix)
+        if not prefix:
+            return []
+        found = {}
+        position = bisect_left(self._keys, (prefix,))
+        for key, entry_id in self._keys[position:position + MAX_SCAN]:
+            if not key.startswith(prefix):
+                break
+            # 라벨 맨 앞에서 일치하면 단어 중간 일치보다 우선
+            found[entry_id] = found.get(entry_id, False) or key == self._entries[entry_id]['full_key']
+        ranked = sorted(
+            found.items(),
+            key=lambda item: (
+                not item[1],
+                KIND_ORDER.get(self._entries[item[0]]['kind'], 9),
+                -self._entries[item[0]]['count'],
+                self._entries[item[0]]['label'],
+            )
+        )
+        return [self._entries[entry_id] for entry_id, _ in ranked[:limit]]
+
+    def memory_bytes(self):
+        """정렬 배열과 항목 사전의 대략적인 메모리 사용량"""
+        size = sys.getsizeof(self._keys) + sys.getsizeof(self._entries)
+        for key, entry_id in self._keys:
+            size += sys.getsizeof(key)
+        for entry in self._entries.values():
+            size += sys.getsizeof(entry) + sys.getsizeof(entry['label']) + sys.getsizeof(entry['full_key'])
+        return size
+
+
+def _center_entries(center):
+    entries = [(('center', center.pk), center.name, 'center', center.pk)]
+    for district in parse_districts(center.address):
+        entries.append((('district', district), district, 'district', None))
+    return entries
+
+
+def _therapist_entries(therapist):
+    return [
+        (('specialty', specialty), specialty, 'specialty', None)
+        for specialty in parse_specialties(therapist.specialty)
+    ]
+
+
+class TypeaheadIndex:
+    """워커 프로세스당 하나인 자동완성 인덱스 (typeahead_index)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._index = None
+        self._sources = {}  # ('center'|'therapist', pk) -> 그 객체가 추가한 항목 목록
+        self._version = None
+        self._checked_at = 0.0
+        self.built_at = None
+        self.build_seconds = None
+
+    # -- 버전 (워커 간 변경 감지) --
+
+    def _shared_version(self):
+        version = cache.get(VERSION_CACHE_KEY)
+        if version is None:
+            version = 1
+            cache.add(VERSION_CACHE_KEY, version, None)
+        return version
+
+    def _bump_version(self):
+        try:
+            new_version = cache.incr(VERSION_CACHE_KEY)
+        except ValueError:
+            new_version = 2
+            cache.set(VERSION_CACHE_KEY, new_version, None)
+        # 내 변경만 반영된 경우에만 최신 상태로 간주 (그 사이 다른 워커가 바꿨으면 다음 조회 때 재구성)
+        if self._version is not None and new_version == self._version + 1:
+            self._version = new_version
+
+    # -- 구성/갱신 --
+
+    def rebuild(self):
+        from .models import Center, Therapist
+
+        started = time.monotonic()
+        version = self._shared_version()
+        sources = {}
+        for center in Center.objects.only('id', 'name', 'address').iterator(chunk_size=1000):
+            sources[('center', center.pk)] = _center_entries(center)
+        for therapist in Therapist.objects.only('id', 'specialty').iterator(chunk_size=1000):
+            sources[('therapist', therapist.pk)] = _therapist_entries(therapist)
+        index = PrefixIndex()
+        index.load(entry for entries in sources.values() for entry in entries)
+
+        with self._lock:
+            self._index = index
+            self._sources = sources
+            self._version = version
+            self._checked_at = time.monotonic()
+            self.built_at = time.time()
+            self.build_seconds = time.monotonic() - started
+
+        stats = self.stats()
+        print(f"🔤 자동완성 인덱스 구성: 항목 {stats['entries']}개, 키 {stats['keys']}개, "
+              f"약 {stats['memory_bytes'] / 1024:.1f}KB, {self.build_seconds * 1000:.1f}ms")
+        if index.dropped:
+            print(f"⚠️ 자동완성 인덱스 용량 초과로 {index.dropped}개 항목 제외 (MAX_KEYS={MAX_KEYS})")
+
+    def _ensure_fresh(self):
+        if self._index is None:
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        if self._shared_version() != self._version:
+            self.rebuild()
+
+    def _replace_source(self, source_key, entries):
+        with self._lock:
+            if self._index is None:
+                return
+            for entry in self._sources.pop(source_key, []):
+                self._index.discard(entry[0])
+            if entries:
+                self._sources[source_key] = entries
+                for entry in entries:
+                    self._index.add(*entry)
+
+    def invalidate(self):
+        """시그널 없이 대량 변경된 경우(백업 복원 등) 모든 워커가 다시 구성하도록 무효화"""
+        with self._lock:
+            self._index = None
+            self._sources = {}
+        self._bump_version()
+
+    def update_center(self, center):
+        self._replace_source(('center', center.pk), _center_entries(center))
+        self._bump_version()
+
+    def remove_center(self, center_id):
+        self._replace_source(('center', center_id), [])
+        self._bump_version()
+
+    def update_therapist(self, therapist):
+        self._replace_source(('therapist', therapist.pk), _therapist_entries(therapist))
+        self._bump_version()
+
+    def remove_therapist(self, therapist_id):
+        self._replace_source(('therapist', therapist_id), [])
+        self._bump_version()
+
+    # -- 조회 --
+
+    def suggest(self, query, limit=DEFAULT_LIMIT):
+        """접두어에 맞는 자동완성 후보 [{'label', 'kind', 'center_id'}, ...]"""
+        with self._lock:
+            self._ensure_fresh()
+            entries = self._index.lookup(query, limit)
+        return [
+            {'label': entry['label'], 'kind': entry['kind'], 'center_id': entry['center_id']}
+            for entry in entries
+        ]
+
+    def stats(self):
+        with self._lock:
+            if self._index is None:
+                return {'built': False}
+            return {
+                'built': True,
+                'entries': len(self._index),
+                'keys': len(self._index._keys),
+                'max_keys': self._index.max_keys,
+                'dropped': self._index.dropped,
+                'memory_bytes': self._index.memory_bytes(),
+                'build_seconds': self.build_seconds,
+                'version': self._version,
+            }
+
+
+typeahead_index = TypeaheadIndex()
@@ -7,7 +7,14 @@ urlpatterns = [
     path('', views.home, name='home'),  # 새로운 메인 페이지
     path('centers/', views.index, name='index'),  # 기존 index를 센터찾기 페이지로 변경
     path('search/', views.search_results, name='search_results'),
+    path('api/typeahead/', views.typeahead, name='typeahead'),
+    path('api/typeahead/stats/', views.typeahead_stats, name='typeahead_stats'),
+    path('api/cache/stats/', views.cache_stats, name='cache_stats'),
     path('api/geocode/', views.geocode_address, name='geocode_address'),
+    path('images/w<int:width>/<path:name>', views.image_derivative, name='image_derivative'),
+    path('api/centers/', views.centers_in_viewport, name='centers_in_viewport'),
+    path('api/centers/clusters/', views.center_clusters, name='center_clusters'),
+    path('api/centers/<int:center_id>/', views.get_center_detail, name='get_center_detail'),
     path('reviews/<int:center_id>/', views.get_reviews, name='get_reviews'),
     path('reviews/<int:review_id>/update/', views.update_review, name='update_review'),
     path('reviews/<int:review_id>/delete/', views.delete_review, name='delete_review'),
@@ -8,13 +8,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-def upload_image_to_cloudinary(image_file, folder='centers'):
+def upload_image_to_cloudinary(image_file, folder='centers', public_id=None):
     """
     이미지를 Cloudinary에 업로드하고 URL을 반환합니다.
     
     Args:
         image_file: 업로드할 이미지 파일
         folder: Cloudinary 내 저장 폴더명
+        public_id: 지정하면 같은 이름으로 덮어씀 (재시도해도 이미지가 중복되지 않음)
     
     Returns:
         dict: 업로드 결과 정보 (url, public_id 등)
@@ -30,6 +31,7 @@ def upload_image_to_cloudinary(image_file, folder='centers'):
             print(f"🌐 Cloudinary 업로드 시작: {folder}")
             print(f"🔑 Cloud Name: {cloud_name[:10]}...")
             
+            options = {'public_id': public_id} if public_id else {}
             result = cloudinary.uploader.upload(
                 image_file,
                 folder=folder,
@@ -38,7 +40,8 @@ def upload_image_to_cloudinary(image_file, folder='centers'):
                 transformation=[
                     {'quality': 'auto:good'},
                     {'fetch_format': 'auto'}
-                ]
+                ],
+                **options
             )
             
             upload_url = result.get('secure_url')
@@ -98,6 +101,46 @@ def delete_image_from_cloudinary(public_id):
             'error': str(e)
         }
 
+def delete_images_from_cloudinary(public_ids):
+    """
+    Cloudinary에서 여러 이미지를 한 번의 API 호출로 삭제합니다 (최대 100개).
+    
+    Args:
+        public_ids: 삭제할 이미지의 public_id 목록
+    
+    Returns:
+        dict: 삭제 결과 (deleted: {public_id: 'deleted' | 'not_found' | 'skipped'(설정 없음) ...})
+    """
+    try:
+        cloud_name = os.getenv('CLOUDINARY_CLOUD_NAME')
+        api_key = os.getenv('CLOUDINARY_API_KEY')
+        api_secret = os.getenv('CLOUDINARY_API_SECRET')
+        
+        if cloud_name and api_key and api_secret and public_ids:
+            result = cloudinary.api.delete_resources(list(public_ids))
+            return {'success': True, 'deleted': result.get('deleted', {})}
+        return {
+            'success': True,
+            'deleted': {public_id: 'skipped' for public_id in public_ids},
+            'message': 'No Cloudinary config - no deletion needed'
+        }
+    except Exception as e:
+        logger.error(f"Cloudinary bulk delete failed: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def public_id_from_url(url):
+    """
+    Cloudinary URL에서 public_id(폴더/파일명, 확장자 제외)를 추출합니다.
+    예: https://res.cloudinary.com/x/image/upload/v1/therapists/abc.jpg -> therapists/abc
+    """
+    if not url or 'cloudinary.com' not in url:
+        return None
+    public_id_with_extension = '/'.join(url.split('/')[-2:])
+    return public_id_with_extension.rsplit('.', 1)[0]
+
 def get_optimized_image_url(url, width=None, height=None, quality='auto:good'):
     """
     Cloudinary URL에 최적화 파라미터를 추가합니다.
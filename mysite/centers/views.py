@@ -2,17 +2,25 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.http import JsonResponse, HttpResponse
 from .models import Center, Review, ExternalReview, Therapist, CenterImage, ReviewComment, BackupHistory, RestoreHistory
 from .forms import ReviewForm, CenterManagementForm, TherapistManagementForm, ReviewCommentForm
-from .utils import upload_image_to_cloudinary, delete_image_from_cloudinary  # Cloudinary 유틸리티 추가
+from .cloudinary_outbox import record_delete, record_upload, schedule_drain
+from .geocoding import GeocodingError, geocode
+from .clustering import clusters_in_bbox
+from .search import CenterSearch
+from .typeahead import typeahead_index
+from .page_cache import cache_anonymous_page, versioned_cache_key
+from .tiered_cache import tiered_cache
+from .image_derivatives import CARD_WIDTH, LARGE_WIDTH, variant_url
+from .pagination import CursorPaginator, CachedCountPaginator, InvalidCursor, approximate_count, count_cache_key
+from accounts.access import access_for
 from django.utils import timezone
+from django.core.paginator import Paginator
 from django.contrib.auth.decorators import login_required
 from datetime import datetime
-from django.db.models import Q
-from django.core.paginator import Paginator
+from django.db.models import Q, Prefetch
 import json
 from decimal import Decimal
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
-import requests
 import csv
 from django.utils.safestring import mark_safe
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -27,8 +35,6 @@ import gzip
 import subprocess
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import user_passes_test
-from django.core.management import call_command
-from io import StringIO
 import tempfile
 from django.apps import apps
 
@@ -59,12 +65,8 @@ def create_pagination_data(page_obj):
 
 def serialize_therapist(therapist):
     """상담사 객체 직렬화"""
-    # Cloudinary URL이 있으면 우선 사용, 없으면 로컬 이미지 URL 사용
-    photo_url = None
-    if therapist.photo_url:  # Cloudinary URL이 있는 경우
-        photo_url = therapist.photo_url
-    elif therapist.photo:  # 로컬 이미지가 있는 경우
-        photo_url = therapist.photo.url
+    # Cloudinary URL이 있으면 너비 변환 URL, 없으면 로컬 이미지의 축소 WebP
+    photo_url = variant_url(therapist.photo_url, therapist.photo.name if therapist.photo else '', CARD_WIDTH)
     
     return {
         'name': escape_quotes(therapist.name),
@@ -74,18 +76,43 @@ def serialize_therapist(therapist):
         'description': escape_quotes(therapist.description)
     }
 
+def active_comments_prefetch(lookup='comments'):
+    """활성 댓글을 작성일순으로, 작성자와 함께 미리 로드하는 Prefetch (review.active_comments)"""
+    return Prefetch(
+        lookup,
+        queryset=ReviewComment.objects.filter(is_active=True).select_related('author').order_by('created_at'),
+        to_attr='active_comments'
+    )
+
+def review_queryset():
+    """serialize_review에 필요한 작성자와 활성 댓글을 함께 로드하는 리뷰 QuerySet"""
+    return Review.objects.select_related('user').prefetch_related(active_comments_prefetch())
+
+def center_detail_prefetches():
+    """serialize_center에 필요한 연관 객체들을 한 번에 로드하는 Prefetch 목록"""
+    return [
+        'images',
+        'therapists',
+        Prefetch('reviews', queryset=review_queryset().order_by('-created_at')),
+        Prefetch('external_reviews', queryset=ExternalReview.objects.order_by('-created_at')),
+    ]
+
 def serialize_review(review, user=None):
     """리뷰 객체 직렬화"""
-    # 댓글 직렬화
+    # 댓글 직렬화 (active_comments_prefetch로 미리 로드된 경우 추가 쿼리 없음)
+    comments = getattr(review, 'active_comments', None)
+    if comments is None:
+        comments = review.comments.filter(is_active=True).select_related('author').order_by('created_at')
+    
     comments_data = []
-    for comment in review.comments.filter(is_active=True).order_by('created_at'):
+    for comment in comments:
         comments_data.append({
             'id': comment.id,
             'content': escape_quotes(comment.content),
             'author': escape_quotes(comment.author.username),
             'created_at': format_date_for_json(comment.created_at),
             'updated_at': format_date_for_json(comment.updated_at) if comment.updated_at != comment.created_at else None,
-            'can_edit': user and comment.author == user
+            'can_edit': bool(user and user.is_authenticated and comment.author_id == user.pk)
         })
     
     return {
@@ -95,7 +122,7 @@ def serialize_review(review, user=None):
         'author': escape_quotes(review.user.username if hasattr(review, 'user') and review.user else '익명'),
         'rating': getattr(review, 'rating', 5),
         'created_at': format_date_for_json(review.created_at),
-        'is_owner': user and hasattr(review, 'user') and review.user == user,
+        'is_owner': bool(user and user.is_authenticated and review.user_id == user.pk),
         'comments': comments_data
     }
 
@@ -115,13 +142,12 @@ def serialize_center(center, user=None):
         lat = float(center.latitude) if isinstance(center.latitude, Decimal) else center.latitude
         lng = float(center.longitude) if isinstance(center.longitude, Decimal) else center.longitude
         
-        # 센터 이미지 URL 처리 - Cloudinary URL 우선 사용
+        # 센터 이미지 URL 처리 - Cloudinary URL 우선 사용, 로컬 이미지는 축소 WebP
         image_urls = []
         for image in center.images.all():
-            if image.image_url:  # Cloudinary URL이 있는 경우
-                image_urls.append(escape_quotes(image.image_url))
-            elif image.image:  # 로컬 이미지가 있는 경우
-                image_urls.append(escape_quotes(image.image.url))
+            url = variant_url(image.image_url, image.image.name if image.image else '', LARGE_WIDTH)
+            if url:
+                image_urls.append(escape_quotes(url))
         
         return {
             'id': center.id,
@@ -136,14 +162,62 @@ def serialize_center(center, user=None):
             'description': escape_quotes(center.description),
             'images': image_urls,
             'therapists': [serialize_therapist(t) for t in center.therapists.all()],
-            'reviews': [serialize_review(r, user) for r in center.reviews.all().prefetch_related('comments').order_by('-created_at')],
-            'external_reviews': [serialize_external_review(r) for r in center.external_reviews.all().order_by('-created_at')],
+            # center_detail_prefetches()로 정렬된 채 미리 로드된 목록 사용
+            'reviews': [serialize_review(r, user) for r in center.reviews.all()],
+            'external_reviews': [serialize_external_review(r) for r in center.external_reviews.all()],
             'is_authenticated': user.is_authenticated if user else False
         }
     except Exception as e:
         print(f"Error serializing center {center.id}: {str(e)}")
         return None
 
+def serialize_center_summary(center):
+    """지도 마커용 경량 센터 직렬화 (상세 정보는 마커를 열 때 별도 로드)"""
+    first_image = None
+    for image in center.images.all():
+        first_image = variant_url(image.image_url, image.image.name if image.image else '', CARD_WIDTH)
+        if first_image:
+            break
+    
+    average_rating = center.average_rating
+    
+    return {
+        'id': center.id,
+        'name': escape_quotes(center.name),
+        'type': escape_quotes(center.type),
+        'lat': center.latitude,
+        'lng': center.longitude,
+        'image': escape_quotes(first_image) if first_image else None,
+        'review_count': center.review_count,
+        'average_rating': round(average_rating, 1) if average_rating is not None else None,
+    }
+
+def parse_viewport_params(params):
+    """bbox(sw_lat, sw_lng, ne_lat, ne_lng)와 zoom 파라미터를 검증"""
+    try:
+        sw_lat = float(params['sw_lat'])
+        sw_lng = float(params['sw_lng'])
+        ne_lat = float(params['ne_lat'])
+        ne_lng = float(params['ne_lng'])
+    except KeyError:
+        raise ValueError('sw_lat, sw_lng, ne_lat, ne_lng 파라미터가 필요합니다.')
+    except (TypeError, ValueError):
+        raise ValueError('좌표는 숫자여야 합니다.')
+    
+    if not (-90 <= sw_lat <= 90 and -90 <= ne_lat <= 90):
+        raise ValueError('위도는 -90에서 90 사이여야 합니다.')
+    if not (-180 <= sw_lng <= 180 and -180 <= ne_lng <= 180):
+        raise ValueError('경도는 -180에서 180 사이여야 합니다.')
+    if sw_lat > ne_lat:
+        raise ValueError('남서쪽 위도가 북동쪽 위도보다 클 수 없습니다.')
+    
+    try:
+        zoom = int(params.get('zoom', 13))
+    except (TypeError, ValueError):
+        raise ValueError('zoom은 정수여야 합니다.')
+    
+    return (sw_lat, sw_lng, ne_lat, ne_lng), max(0, min(zoom, 21))
+
 def validate_review_data(data):
     """리뷰 데이터 검증"""
     title = data.get('title')
@@ -162,18 +236,29 @@ def validate_review_data(data):
     
     return title, content, rating
 
-# 뷰 함수들
-def home(request):
-    """새로운 메인 홈페이지 뷰"""
+HOME_DEPENDENCIES = ('centers.Review', 'centers.Center', 'boards.Post', 'boards.EventPost')
+HOME_DATA_TIMEOUT = 60  # 48시간 내 리뷰 수가 시간에 따라 바뀌므로 짧게 유지
+NEW_REVIEWS_COUNT_TIMEOUT = 60
+
+
+def count_new_reviews():
+    """48시간 내 새로운 리뷰 건수 (2단계 캐시, 1분 단위로 갱신)"""
     from datetime import timedelta
-    
+
+    def compute():
+        two_days_ago = timezone.now() - timedelta(hours=48)
+        return Review.objects.filter(created_at__gte=two_days_ago).count()
+
+    return tiered_cache.get_or_set(
+        'new_reviews_count', versioned_cache_key('new_reviews_count', ('centers.Review',)),
+        compute, NEW_REVIEWS_COUNT_TIMEOUT
+    )
+
+
+def _build_home_data():
+    """홈 화면 데이터 (로그인 사용자도 공유하는 부분만)"""
     # 최신 리뷰 5개 가져오기
-    latest_reviews = Review.objects.select_related('center', 'user').order_by('-created_at')[:5]
-    
-    # 48시간 내 새로운 리뷰 건수 계산
-    now = timezone.now()
-    two_days_ago = now - timedelta(hours=48)
-    new_reviews_count = Review.objects.filter(created_at__gte=two_days_ago).count()
+    latest_reviews = list(Review.objects.select_related('center', 'user').order_by('-created_at')[:5])
     
     # 리뷰 데이터를 JSON으로 직렬화
     reviews_data = {}
@@ -192,38 +277,61 @@ def home(request):
     # 자유게시판, 이벤트게시판 최신 글 가져오기 (익명게시판 제거)
     try:
         from boards.models import Post
-        free_posts = Post.objects.filter(board_type='free').order_by('-created_at')[:5]
-        event_posts = Post.objects.filter(board_type='event').select_related('event_detail').order_by('-created_at')[:5]
+        free_posts = list(Post.objects.filter(board_type='free').select_related('author').order_by('-created_at')[:5])
+        event_posts = list(Post.objects.filter(board_type='event').select_related('event_detail', 'author').order_by('-created_at')[:5])
     except ImportError:
         free_posts = []
         event_posts = []
     
-    context = {
+    return {
         'latest_reviews': latest_reviews,
-        'new_reviews_count': new_reviews_count,
+        'new_reviews_count': count_new_reviews(),
         'reviews_data_json': json.dumps(reviews_data, ensure_ascii=False),
         'free_posts': free_posts,
         'event_posts': event_posts,
     }
+
+# 뷰 함수들
+@cache_anonymous_page(*HOME_DEPENDENCIES)
+def home(request):
+    """새로운 메인 홈페이지 뷰"""
+    home_data = tiered_cache.get_or_set(
+        'home',
+        versioned_cache_key('home', HOME_DEPENDENCIES),
+        _build_home_data,
+        HOME_DATA_TIMEOUT,
+    )
+    latest_reviews = home_data['latest_reviews']
+    
+    context = {
+        'latest_reviews': latest_reviews,
+        'new_reviews_count': home_data['new_reviews_count'],
+        'reviews_data_json': home_data['reviews_data_json'],
+        'free_posts': home_data['free_posts'],
+        'event_posts': home_data['event_posts'],
+    }
     
     return render(request, 'centers/home.html', context)
 
+@cache_anonymous_page('centers.Review', 'centers.Center')
 def latest_reviews(request):
     """최신 리뷰 게시판"""
-    from datetime import timedelta
+    # 예전 번호 페이지(?page=N) 주소는 커서 기반 첫 페이지로 영구 이동 (크롤러의 깊은 OFFSET 조회 방지)
+    if 'page' in request.GET:
+        return redirect('centers:latest_reviews', permanent=True)
     
     # 모든 리뷰를 최신 순으로 가져오기
-    all_reviews = Review.objects.select_related('center', 'user').order_by('-created_at')
+    all_reviews = Review.objects.select_related('center', 'user')
     
-    # 페이지네이션 (한 페이지에 10개)
-    paginator = Paginator(all_reviews, 10)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
+    # 커서 페이지네이션 (한 페이지에 10개)
+    paginator = CursorPaginator(all_reviews, 10)
+    try:
+        page_obj = paginator.page(request.GET.get('cursor'))
+    except InvalidCursor:
+        return redirect('centers:latest_reviews')
     
-    # 48시간 내 새로운 리뷰 건수 계산
-    now = timezone.now()
-    two_days_ago = now - timedelta(hours=48)
-    new_reviews_count = Review.objects.filter(created_at__gte=two_days_ago).count()
+    # 48시간 내 새로운 리뷰 건수
+    new_reviews_count = count_new_reviews()
     
     # 리뷰 데이터를 JSON으로 직렬화 (현재 페이지의 리뷰들만)
     reviews_data = {}
@@ -244,28 +352,31 @@ def latest_reviews(request):
         'new_reviews_count': new_reviews_count,
         'reviews_data_json': json.dumps(reviews_data, ensure_ascii=False),
         'page_obj': page_obj,
-        'total_reviews': all_reviews.count(),
+        'total_reviews': approximate_count(Review.objects.all(), count_cache_key('reviews', 'all', dependencies=['centers.Review'])),
     }
     
     return render(request, 'centers/latest_reviews.html', context)
 
+@cache_anonymous_page(
+    'centers.Center', 'centers.Review', 'centers.ReviewComment', 'centers.ExternalReview',
+    'centers.Therapist', 'centers.CenterImage',
+)
 def index(request):
-    centers = Center.objects.all().prefetch_related(
-        'images', 
-        'therapists', 
-        'reviews__comments', 
-        'external_reviews'
-    )
-    
-    center_list = []
-    for center in centers:
-        serialized = serialize_center(center, request.user)
-        if serialized:
-            center_list.append(serialized)
-
     # URL 파라미터 처리 (center_id 또는 centerId 모두 지원)
     selected_center_id = request.GET.get('center_id') or request.GET.get('centerId')
     
+    # 전체 센터 목록은 지도 영역 API(centers_in_viewport)로 로드하고,
+    # URL로 지정된 센터만 상세 정보를 미리 포함
+    center_list = []
+    if selected_center_id and str(selected_center_id).isdigit():
+        selected_center = Center.objects.filter(id=selected_center_id).prefetch_related(
+            *center_detail_prefetches()
+        ).first()
+        if selected_center:
+            serialized = serialize_center(selected_center, request.user)
+            if serialized:
+                center_list.append(serialized)
+    
     # 캐시 버스팅을 위한 타임스탬프
     import time
     timestamp = int(time.time())
@@ -278,20 +389,82 @@ def index(request):
         'timestamp': timestamp
     })
 
+# 지도 영역 내 센터 최대 반환 개수
+VIEWPORT_MAX_CENTERS = 500
+
+def centers_in_viewport(request):
+    """지도 영역(bbox)과 줌 레벨에 해당하는 센터 요약 목록 API"""
+    try:
+        bbox, zoom = parse_viewport_params(request.GET)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    
+    centers = Center.objects.within_bbox(*bbox).prefetch_related('images').order_by('id')
+    
+    center_list = [serialize_center_summary(center) for center in centers[:VIEWPORT_MAX_CENTERS + 1]]
+    truncated = len(center_list) > VIEWPORT_MAX_CENTERS
+    
+    return JsonResponse({
+        'success': True,
+        'zoom': zoom,
+        'centers': center_list[:VIEWPORT_MAX_CENTERS],
+        'truncated': truncated,
+    })
+
+def center_clusters(request):
+    """지도 영역(bbox)과 줌 레벨에 해당하는 서버 사이드 마커 클러스터 API"""
+    try:
+        bbox, zoom = parse_viewport_params(request.GET)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    
+    clusters = clusters_in_bbox(zoom, *bbox)
+    
+    return JsonResponse({
+        'success': True,
+        'zoom': zoom,
+        'clusters': clusters,
+    })
+
+def get_center_detail(request, center_id):
+    """마커 선택 시 센터 상세 정보를 제공하는 API endpoint"""
+    center = get_object_or_404(
+        Center.objects.prefetch_related(*center_detail_prefetches()),
+        id=center_id
+    )
+    
+    serialized = serialize_center(center, request.user)
+    if not serialized:
+        return JsonResponse({'success': False, 'error': '센터 정보를 불러올 수 없습니다.'}, status=500)
+    
+    return JsonResponse({
+        'success': True,
+        'center': serialized
+    })
+
 def get_reviews(request, center_id):
     center = get_object_or_404(Center, id=center_id)
-    page = int(request.GET.get('page', 1))
     per_page = 5  # 페이지당 5개 리뷰
     
-    reviews = center.reviews.all().prefetch_related('comments').order_by('-created_at')
-    paginator = Paginator(reviews, per_page)
-    page_obj = paginator.get_page(page)
+    reviews = review_queryset().filter(center=center)
+    
+    # ?cursor= 가 있으면 커서 페이지네이션, 없으면 번호 페이지 (전체 개수는 센터의 리뷰 집계 사용)
+    if 'cursor' in request.GET:
+        try:
+            page_obj = CursorPaginator(reviews, per_page).page(request.GET.get('cursor'))
+        except InvalidCursor as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        pagination = page_obj.to_dict()
+    else:
+        paginator = CachedCountPaginator(reviews.order_by('-created_at', '-id'), per_page, count=center.review_count)
+        page_obj = paginator.get_page(request.GET.get('page', 1))
+        pagination = create_pagination_data(page_obj)
     
     reviews_data = [serialize_review(review, request.user) for review in page_obj]
     
     return JsonResponse({
         'reviews': reviews_data,
-        'pagination': create_pagination_data(page_obj)
+        'pagination': pagination
     })
 
 def get_review_detail(request, review_id):
@@ -335,14 +508,16 @@ def add_review(request, center_id):
         data = json.loads(request.body)
         title, content, rating = validate_review_data(data)
         
-        review = Review.objects.create(
-            user=request.user,
-            center=center,
-            title=title,
-            content=content,
-            rating=rating,
-            created_at=timezone.now()
-        )
+        # 리뷰와 센터 리뷰 집계를 하나의 트랜잭션으로 저장
+        with transaction.atomic():
+            review = Review.objects.create(
+                user=request.user,
+                center=center,
+                title=title,
+                content=content,
+                rating=rating,
+                created_at=timezone.now()
+            )
         
         return JsonResponse({
             'success': True,
@@ -372,7 +547,8 @@ def update_review(request, review_id):
         review.title = title
         review.content = content
         review.rating = rating
-        review.save()
+        with transaction.atomic():
+            review.save()
         
         return JsonResponse({
             'success': True,
@@ -396,28 +572,81 @@ def delete_review(request, review_id):
         return JsonResponse({'error': '리뷰 삭제 권한이 없습니다.'}, status=403)
     
     try:
-        review.delete()
+        with transaction.atomic():
+            review.delete()
         return JsonResponse({'success': True})
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+SEARCH_RESULTS_PER_PAGE = 12
+
+@cache_anonymous_page('centers.Center', 'centers.Therapist', 'centers.Review')
 def search_results(request):
-    query = request.GET.get('q', '')
+    query = request.GET.get('q', '').strip()
     centers = []
+    page_obj = None
     
     if query:
-        centers = Center.objects.filter(
-            Q(name__icontains=query) |
-            Q(address__icontains=query) |
-            Q(phone__icontains=query) |
-            Q(description__icontains=query)
-        ).distinct()
+        # 관련도순 전문 검색 (centers.search 참고)
+        paginator = Paginator(CenterSearch().search(query), SEARCH_RESULTS_PER_PAGE)
+        page_obj = paginator.get_page(request.GET.get('page', 1))
+        centers = page_obj.object_list
     
     return render(request, 'centers/search_results.html', {
         'query': query,
         'centers': centers,
+        'page_obj': page_obj,
+    })
+
+TYPEAHEAD_MAX_LIMIT = 20
+
+def typeahead(request):
+    """검색창 자동완성 (센터 이름, 시/군/구, 상담사 전문분야) - 메모리 인덱스에서 조회"""
+    query = request.GET.get('q', '').strip()
+    try:
+        limit = max(1, min(int(request.GET.get('limit', 8)), TYPEAHEAD_MAX_LIMIT))
+    except ValueError:
+        limit = 8
+    
+    return JsonResponse({
+        'success': True,
+        'query': query,
+        'suggestions': typeahead_index.suggest(query, limit) if query else [],
     })
 
+@user_passes_test(lambda u: u.is_superuser)
+def typeahead_stats(request):
+    """자동완성 인덱스 항목 수/메모리 사용량 (현재 워커 기준)"""
+    return JsonResponse({'success': True, 'stats': typeahead_index.stats()})
+
+@user_passes_test(lambda u: u.is_superuser)
+def cache_stats(request):
+    """2단계 캐시 키 계열별 적중/미스/지연 시간 (현재 워커 기준)"""
+    return JsonResponse({'success': True, 'stats': tiered_cache.stats()})
+
+def image_derivative(request, width, name):
+    """로컬 이미지의 축소 WebP (없으면 만들어서 응답). URL이 원본 이름과 너비로 정해지므로 브라우저가 오래 캐시"""
+    from django.http import FileResponse
+    from .image_derivatives import (
+        DERIVATIVE_WIDTHS, derivative_storage, generate_derivative, is_derivable, media_is_local, variant_url,
+    )
+    
+    if width not in DERIVATIVE_WIDTHS:
+        raise Http404
+    if not media_is_local() and name:
+        # 미디어가 원격 저장소로 바뀐 뒤 남아 있는 예전 파생본 URL은 Cloudinary 변환 URL로 보냄
+        return redirect(variant_url(None, name, width), permanent=True)
+    if not is_derivable(name):
+        raise Http404
+    try:
+        key = generate_derivative(name, width)
+    except (FileNotFoundError, OSError):
+        raise Http404
+    
+    response = FileResponse(derivative_storage().open(key, 'rb'), content_type='image/webp')
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 def check_auth(request):
     return JsonResponse({'is_authenticated': request.user.is_authenticated})
 
@@ -433,28 +662,15 @@ def geocode_address(request):
         if not address:
             return JsonResponse({'error': '주소가 필요합니다.'}, status=400)
         
-        headers = {
-            'X-NCP-APIGW-API-KEY-ID': settings.NAVER_CLIENT_ID,
-            'X-NCP-APIGW-API-KEY': settings.NAVER_CLIENT_SECRET
-        }
-        
-        response = requests.get(
-            f'https://naveropenapi.apigw.ntruss.com/map-geocode/v2/geocode',
-            params={'query': address},
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('addresses'):
-                first_result = result['addresses'][0]
-                return JsonResponse({
-                    'latitude': float(first_result['y']),
-                    'longitude': float(first_result['x'])
-                })
+        # 캐시(GeocodeCache)에 있으면 API를 호출하지 않음 (centers/geocoding.py)
+        coords = geocode(address)
+        if coords:
+            return JsonResponse({'latitude': coords[0], 'longitude': coords[1]})
         
         return JsonResponse({'error': '주소를 찾을 수 없습니다.'}, status=404)
         
+    except GeocodingError as e:
+        return JsonResponse({'error': str(e)}, status=502)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -504,11 +720,22 @@ def review_form(request, center_id):
 
 def get_external_reviews(request, center_id):
     center = get_object_or_404(Center, pk=center_id)
-    external_reviews = ExternalReview.objects.filter(center=center).order_by('-created_at')
+    external_reviews = ExternalReview.objects.filter(center=center)
     
-    page_number = request.GET.get('page', 1)
-    paginator = Paginator(external_reviews, 10)
-    page_obj = paginator.get_page(page_number)
+    # ?cursor= 가 있으면 커서 페이지네이션, 없으면 캐시된 개수로 번호 페이지
+    if 'cursor' in request.GET:
+        try:
+            page_obj = CursorPaginator(external_reviews, 10).page(request.GET.get('cursor'))
+        except InvalidCursor as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        pagination = page_obj.to_dict()
+    else:
+        paginator = CachedCountPaginator(
+            external_reviews.order_by('-created_at', '-id'), 10,
+            count_cache_key=count_cache_key('external_reviews', center.pk, dependencies=['centers.ExternalReview'])
+        )
+        page_obj = paginator.get_page(request.GET.get('page', 1))
+        pagination = create_pagination_data(page_obj)
     
     reviews_data = [
         {
@@ -523,7 +750,7 @@ def get_external_reviews(request, center_id):
     
     return JsonResponse({
         'reviews': reviews_data,
-        'pagination': create_pagination_data(page_obj)
+        'pagination': pagination
     })
 
 def upload_centers(request):
@@ -540,8 +767,8 @@ def upload_centers(request):
         
         for row in csv_reader:
             try:
-                geocode_result = geocode_address(row['address'])
-                if not geocode_result:
+                coords = geocode(row['address'])
+                if not coords:
                     continue
                 
                 description = row['description'].replace("'", "''") if row['description'] else ""
@@ -552,8 +779,8 @@ def upload_centers(request):
                     phone=row['phone'],
                     url=row['url'],
                     description=description,
-                    latitude=geocode_result['latitude'],
-                    longitude=geocode_result['longitude']
+                    latitude=coords[0],
+                    longitude=coords[1]
                 )
                 
                 if row.get('image_url'):
@@ -578,12 +805,12 @@ class CenterManagerRequiredMixin:
         if not request.user.is_authenticated:
             return redirect('accounts:account_login')
         
-        if not hasattr(request.user, 'profile'):
+        access = access_for(request)
+        if not access.has_profile:
             messages.error(request, '프로필이 설정되지 않았습니다.')
             return redirect('centers:index')
         
-        profile = request.user.profile
-        if not (profile.is_admin() or profile.is_center_manager()):
+        if not access.is_manager():
             messages.error(request, '센터 관리 권한이 없습니다. 일반 사용자는 이 페이지에 접근할 수 없습니다.')
             return redirect('centers:index')
         
@@ -601,8 +828,7 @@ class CenterManagementView(CenterManagerRequiredMixin, UpdateView):
         center = get_object_or_404(Center, pk=center_id)
         
         # 권한 확인
-        profile = self.request.user.profile
-        if not profile.can_manage_center(center):
+        if not access_for(self.request).can_manage_center(center):
             raise Http404("해당 센터를 관리할 권한이 없습니다.")
         
         return center
@@ -642,94 +868,63 @@ class CenterManagementView(CenterManagerRequiredMixin, UpdateView):
         therapist_formset = context['therapist_formset']
         image_formset = context['image_formset']
         
+        # Cloudinary 업로드/삭제는 트랜잭션 안에서 호출하지 않고 아웃박스에 기록만 함 (워커가 처리, centers/cloudinary_outbox.py)
         with transaction.atomic():
             if form.is_valid() and therapist_formset.is_valid() and image_formset.is_valid():
                 self.object = form.save()
+                outbox = []
                 
-                # 삭제될 상담사들의 Cloudinary 이미지 정리 (미리 파악)
-                therapists_to_delete = []
+                # 삭제될 상담사들의 Cloudinary 사진 삭제 예약
                 for form_instance in therapist_formset:
                     if form_instance.cleaned_data.get('DELETE') and form_instance.instance.pk:
-                        therapists_to_delete.append(form_instance.instance)
-                
-                for therapist in therapists_to_delete:
-                    if hasattr(therapist, 'photo_url') and therapist.photo_url:
-                        print(f"🗑️ 상담사 사진 Cloudinary 삭제: {therapist.name}")
-                        try:
-                            # public_id 추출 방법 개선
-                            if 'cloudinary.com' in therapist.photo_url:
-                                url_parts = therapist.photo_url.split('/')
-                                # therapists/filename.jpg에서 therapists/filename 추출
-                                public_id_with_extension = '/'.join(url_parts[-2:])  # therapists/filename.jpg
-                                public_id = public_id_with_extension.split('.')[0]  # therapists/filename
-                                delete_result = delete_image_from_cloudinary(public_id)
-                                print(f"✅ Cloudinary 삭제 결과: {delete_result}")
-                        except Exception as e:
-                            print(f"⚠️ Cloudinary 삭제 실패: {e}")
+                        outbox.append(record_delete(url=form_instance.instance.photo_url))
                 
-                # 삭제될 센터 이미지들의 Cloudinary 이미지 정리 (미리 파악)
-                images_to_delete = []
+                # 삭제될 센터 이미지들의 Cloudinary 이미지 삭제 예약
                 for form_instance in image_formset:
                     if form_instance.cleaned_data.get('DELETE') and form_instance.instance.pk:
-                        images_to_delete.append(form_instance.instance)
+                        outbox.append(record_delete(url=form_instance.instance.image_url))
                 
-                for center_image in images_to_delete:
-                    if hasattr(center_image, 'image_url') and center_image.image_url:
-                        print(f"🗑️ 센터 이미지 Cloudinary 삭제: {self.object.name}")
-                        try:
-                            # public_id 추출 방법 개선
-                            if 'cloudinary.com' in center_image.image_url:
-                                url_parts = center_image.image_url.split('/')
-                                # centers/filename.jpg에서 centers/filename 추출
-                                public_id_with_extension = '/'.join(url_parts[-2:])  # centers/filename.jpg
-                                public_id = public_id_with_extension.split('.')[0]  # centers/filename
-                                delete_result = delete_image_from_cloudinary(public_id)
-                                print(f"✅ Cloudinary 삭제 결과: {delete_result}")
-                        except Exception as e:
-                            print(f"⚠️ Cloudinary 삭제 실패: {e}")
-                
-                # 상담사 폼셋 처리 (사진 Cloudinary 업로드)
+                # 상담사 폼셋 처리: 사진이 바뀐 상담사만 Cloudinary 업로드 예약
                 therapist_formset.instance = self.object
                 therapist_instances = therapist_formset.save(commit=False)
+                changed_photos = {id(f.instance) for f in therapist_formset.forms if 'photo' in f.changed_data}
+                uploads = []
                 
                 for therapist in therapist_instances:
-                    # 새로운 사진이 업로드된 경우 Cloudinary에 저장
-                    if therapist.photo:
-                        print(f"🏥 상담사 사진 Cloudinary 업로드: {therapist.name}")
-                        upload_result = upload_image_to_cloudinary(therapist.photo, folder='therapists')
-                        
-                        if upload_result.get('success') and upload_result.get('url'):
-                            therapist.photo_url = upload_result['url']
-                            print(f"✅ 상담사 사진 Cloudinary 업로드 성공: {upload_result['url']}")
-                        else:
-                            print(f"⚠️ 상담사 사진 Cloudinary 업로드 실패, 로컬 저장소 사용: {upload_result.get('error', '알 수 없는 오류')}")
-                    
+                    if id(therapist) in changed_photos:
+                        # 이전 Cloudinary 사진은 삭제하고, 업로드가 끝날 때까지는 로컬 파일로 표시
+                        outbox.append(record_delete(url=therapist.photo_url))
+                        therapist.photo_url = None
+                        if therapist.photo:
+                            print(f"🏥 상담사 사진 Cloudinary 업로드 예약: {therapist.name}")
+                            uploads.append((therapist, 'therapists'))
                     therapist.save()
                 
                 # 상담사 폼셋 최종 저장 (삭제 처리 포함)
                 therapist_formset.save()
                 
-                # 센터 이미지 폼셋 처리 (Cloudinary 업로드)
+                # 센터 이미지 폼셋 처리: 새로 올리거나 바뀐 이미지만 Cloudinary 업로드 예약
                 image_formset.instance = self.object
                 image_instances = image_formset.save(commit=False)
+                changed_images = {id(f.instance) for f in image_formset.forms if 'image' in f.changed_data}
                 
                 for center_image in image_instances:
-                    # 새로운 이미지가 업로드된 경우 Cloudinary에 저장
-                    if center_image.image:
-                        print(f"🏢 센터 이미지 Cloudinary 업로드: {self.object.name}")
-                        upload_result = upload_image_to_cloudinary(center_image.image, folder='centers')
-                        
-                        if upload_result.get('success') and upload_result.get('url'):
-                            center_image.image_url = upload_result['url']
-                            print(f"✅ 센터 이미지 Cloudinary 업로드 성공: {upload_result['url']}")
-                        else:
-                            print(f"⚠️ 센터 이미지 Cloudinary 업로드 실패, 로컬 저장소 사용: {upload_result.get('error', '알 수 없는 오류')}")
-                    
+                    if id(center_image) in changed_images:
+                        outbox.append(record_delete(url=center_image.image_url))
+                        center_image.image_url = None
+                        if center_image.image:
+                            print(f"🏢 센터 이미지 Cloudinary 업로드 예약: {self.object.name}")
+                            uploads.append((center_image, 'centers'))
                     center_image.save()
                 
                 # 이미지 폼셋 최종 저장 (삭제 처리 포함)
                 image_formset.save()
                 
+                # 저장된 객체 기준으로 업로드 기록 (새 객체는 여기서 ID가 생김)
+                outbox += [record_upload(instance, folder) for instance, folder in uploads]
+                if any(outbox):
+                    schedule_drain()
+                
                 messages.success(self.request, '센터 정보가 성공적으로 업데이트되었습니다.')
                 return redirect('centers:center_management', pk=self.object.pk)
             else:
@@ -745,34 +940,34 @@ class CenterListView(CenterManagerRequiredMixin, ListView):
     context_object_name = 'centers'
     
     def get_queryset(self):
-        profile = self.request.user.profile
-        if profile.is_admin():
+        access = access_for(self.request)
+        if access.is_admin():
             return Center.objects.all()
-        elif profile.is_center_manager():
-            return Center.objects.filter(id=profile.managed_center.id)
+        elif access.is_center_manager():
+            return Center.objects.filter(id=access.managed_center_id)
         return Center.objects.none()
 
 @login_required
 def center_management_dashboard(request):
     """센터 관리 대시보드"""
-    if not hasattr(request.user, 'profile'):
+    access = access_for(request)
+    if not access.has_profile:
         messages.error(request, '프로필이 설정되지 않았습니다.')
         return redirect('centers:index')
     
-    profile = request.user.profile
-    if not (profile.is_admin() or profile.is_center_manager()):
+    if not access.is_manager():
         messages.error(request, '센터 관리 권한이 없습니다. 일반 사용자는 이 페이지에 접근할 수 없습니다.')
         return redirect('centers:index')
     
     # 관리 가능한 센터 목록
-    if profile.is_admin():
+    if access.is_admin():
         centers = Center.objects.all()
     else:
-        centers = Center.objects.filter(id=profile.managed_center.id) if profile.managed_center else Center.objects.none()
+        centers = Center.objects.filter(id=access.managed_center_id) if access.managed_center_id else Center.objects.none()
     
     context = {
         'centers': centers,
-        'profile': profile,
+        'profile': access,  # 템플릿은 profile.is_admin만 사용
     }
     
     return render(request, 'centers/management_dashboard.html', context)
@@ -784,15 +979,17 @@ class ReviewManagementView(CenterManagerRequiredMixin, ListView):
     template_name = 'centers/review_management.html'
     context_object_name = 'reviews'
     paginate_by = 10
+    paginator_class = CachedCountPaginator
     
-    def get_queryset(self):
-        profile = self.request.user.profile
+    def get_managed_reviews(self):
+        """관리 가능한 센터의 리뷰 중 검색어에 맞는 리뷰 (작성자, 센터, 댓글 작성자를 함께 로드)"""
+        access = access_for(self.request)
         
         # 관리 가능한 센터의 리뷰만 조회
-        if profile.is_admin():
+        if access.is_admin():
             queryset = Review.objects.all()
-        elif profile.is_center_manager() and profile.managed_center:
-            queryset = Review.objects.filter(center=profile.managed_center)
+        elif access.is_center_manager() and access.managed_center_id:
+            queryset = Review.objects.filter(center_id=access.managed_center_id)
         else:
             queryset = Review.objects.none()
         
@@ -805,38 +1002,34 @@ class ReviewManagementView(CenterManagerRequiredMixin, ListView):
                 Q(user__username__icontains=search_query)
             )
         
-        return queryset.select_related('user', 'center').prefetch_related('comments').order_by('-created_at')
+        return queryset.select_related('user', 'center').prefetch_related(
+            Prefetch('comments', queryset=ReviewComment.objects.select_related('author').order_by('created_at'))
+        ).order_by('-created_at', '-id')
+    
+    def get_queryset(self):
+        return self.get_managed_reviews()
+    
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        # 관리 범위와 검색어별로 전체 개수를 캐시해 페이지마다 COUNT(*)를 반복하지 않음
+        access = access_for(self.request)
+        scope = 'all' if access.is_admin() else access.managed_center_id
+        return super().get_paginator(
+            queryset, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page,
+            count_cache_key=count_cache_key(
+                'review_management', scope, self.request.GET.get('search', ''), dependencies=['centers.Review']
+            ),
+            **kwargs
+        )
     
     def get_unanswered_reviews(self):
         """답변이 없는 리뷰들을 반환"""
-        profile = self.request.user.profile
-        
-        # 관리 가능한 센터의 리뷰만 조회
-        if profile.is_admin():
-            queryset = Review.objects.all()
-        elif profile.is_center_manager() and profile.managed_center:
-            queryset = Review.objects.filter(center=profile.managed_center)
-        else:
-            queryset = Review.objects.none()
-        
-        # 검색 기능
-        search_query = self.request.GET.get('search', '')
-        if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(content__icontains=search_query) |
-                Q(user__username__icontains=search_query)
-            )
-        
         # 댓글이 없는 리뷰만 필터링
-        unanswered_reviews = queryset.filter(comments__isnull=True).select_related('user', 'center').prefetch_related('comments').order_by('-created_at')
-        
-        return unanswered_reviews
+        return self.get_managed_reviews().filter(comments__isnull=True)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['profile'] = self.request.user.profile
+        context['profile'] = access_for(self.request)  # 템플릿은 profile.is_admin만 사용
         
         # 미응답 리뷰 추가
         context['unanswered_reviews'] = self.get_unanswered_reviews()
@@ -853,11 +1046,11 @@ def add_review_comment(request, review_id):
     review = get_object_or_404(Review, pk=review_id)
     
     # 권한 확인
-    if not hasattr(request.user, 'profile'):
+    access = access_for(request)
+    if not access.has_profile:
         return JsonResponse({'error': '프로필이 설정되지 않았습니다.'}, status=403)
     
-    profile = request.user.profile
-    if not (profile.is_admin() or (profile.is_center_manager() and profile.managed_center == review.center)):
+    if not access.can_manage_center(review.center_id):
         return JsonResponse({'error': '댓글을 작성할 권한이 없습니다.'}, status=403)
     
     try:
@@ -951,7 +1144,7 @@ def delete_review_comment(request, comment_id):
 def get_review_comments(request, review_id):
     """리뷰의 댓글 목록 조회"""
     review = get_object_or_404(Review, pk=review_id)
-    comments = ReviewComment.objects.filter(review=review, is_active=True).order_by('created_at')
+    comments = ReviewComment.objects.filter(review=review, is_active=True).select_related('author').order_by('created_at')
     
     comments_data = []
     for comment in comments:
@@ -961,7 +1154,7 @@ def get_review_comments(request, review_id):
             'author': comment.author.username,
             'created_at': comment.created_at.strftime('%Y-%m-%d %H:%M'),
             'updated_at': comment.updated_at.strftime('%Y-%m-%d %H:%M') if comment.updated_at != comment.created_at else None,
-            'can_edit': comment.author == request.user
+            'can_edit': comment.author_id == request.user.pk
         })
     
     return JsonResponse({
@@ -974,127 +1167,53 @@ def is_superuser(user):
 
 @user_passes_test(is_superuser)
 def backup_dashboard(request):
-    """백업/복원 대시보드"""
-    # GitHub API에서 실제 백업 히스토리 가져오기
-    backup_history = []
-    try:
-        token = getattr(settings, 'GITHUB_TOKEN', None) or os.getenv('GITHUB_TOKEN')
-        repo = getattr(settings, 'GITHUB_BACKUP_REPO', None) or os.getenv('GITHUB_BACKUP_REPO')
-        
-        if token and repo:
-            headers = {
-                'Authorization': f'token {token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
-            # GitHub Releases API 호출
-            url = f'https://api.github.com/repos/{repo}/releases'
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                releases = response.json()
-                for release in releases[:10]:  # 최근 10개만
-                    if release['tag_name'].startswith('backup-'):
-                        for asset in release.get('assets', []):
-                            if asset['name'].endswith('.json.gz'):
-                                backup_history.append({
-                                    'filename': asset['name'],
-                                    'size': f"{asset['size'] / 1024:.1f} KB",
-                                    'date': release['created_at'][:19].replace('T', ' '),
-                                    'download_count': asset['download_count']
-                                })
-                        break  # 각 릴리스당 하나의 asset만
-    except Exception as e:
-        print(f"GitHub 백업 히스토리 로드 실패: {e}")
+    """백업/복원 대시보드 (백업 목록은 원격 API 대신 BackupCatalogEntry에서 조회)"""
+    from .models import BackupCatalogEntry
+    
+    backups = BackupCatalogEntry.objects.filter(kind='data')
+    backup_history = list(backups.order_by('-created_at')[:10])
     
     # DB에서 복원 히스토리 가져오기
     restore_history = RestoreHistory.objects.all()[:10]  # 최근 10개
     
     context = {
         'backup_history': backup_history,
+        'backup_count': backups.count(),
         'restore_history': restore_history,
     }
     return render(request, 'centers/backup_dashboard.html', context)
 
+# 백업/복원은 요청 안에서 실행하지 않고 백그라운드 작업(centers/tasks.py)으로 등록
+BACKUP_JOB_KINDS = ('centers.backup', 'centers.restore')
+
 @user_passes_test(is_superuser)
 @csrf_exempt
 def perform_backup(request):
-    """백업 실행"""
+    """백업 실행 (작업 등록 후 job_id 반환, 진행 상황은 get_backup_status로 조회)"""
+    from jobs.runner import enqueue
+    
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': '잘못된 요청입니다.'})
     
     try:
-        # 백업 명령어 실행
-        output = StringIO()
-        call_command('backup_data', storage='github', stdout=output)
-        
-        output_text = output.getvalue()
-        
-        # 백업 성공시 히스토리 저장
-        try:
-            # 파일명 추출 (출력에서)
-            lines = output_text.split('\n')
-            filename = None
-            for line in lines:
-                if 'backup_' in line and '.json.gz' in line:
-                    # "=== 백업 완료: backup_20231201_143000.json.gz ===" 형태에서 파일명 추출
-                    if '===' in line:
-                        filename = line.split('===')[1].strip().replace('백업 완료: ', '').strip()
-                        break
-            
-            if not filename:
-                # 기본 파일명 생성
-                from datetime import datetime
-                filename = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz"
-            
-            # 백업 히스토리 저장
-            BackupHistory.objects.create(
-                filename=filename,
-                file_size=0,  # GitHub에서 실제 크기를 가져올 수 없으므로 0으로 설정
-                backup_type='github',
-                status='success',
-                models_count={
-                    'Center': Center.objects.count(),
-                    'Review': Review.objects.count(),
-                    'ExternalReview': ExternalReview.objects.count(),
-                    'Therapist': Therapist.objects.count(),
-                    'CenterImage': CenterImage.objects.count(),
-                    'ReviewComment': ReviewComment.objects.count(),
-                },
-                created_by=request.user
-            )
-        except Exception as e:
-            print(f"백업 히스토리 저장 실패: {e}")
-        
+        job = enqueue('centers.backup', {'storage': 'github'}, user=request.user)
         return JsonResponse({
-            'success': True, 
-            'message': '백업이 성공적으로 완료되었습니다.',
-            'output': output_text
+            'success': True,
+            'message': '백업 작업이 등록되었습니다.',
+            'job_id': job.pk
         })
     except Exception as e:
-        # 백업 실패시 히스토리 저장
-        try:
-            BackupHistory.objects.create(
-                filename=f"failed_backup_{timezone.now().strftime('%Y%m%d_%H%M%S')}",
-                file_size=0,
-                backup_type='github',
-                status='failed',
-                models_count={},
-                created_by=request.user,
-                error_message=str(e)
-            )
-        except Exception as save_error:
-            print(f"실패 히스토리 저장 실패: {save_error}")
-        
         return JsonResponse({
             'success': False, 
-            'error': f'백업 실행 중 오류가 발생했습니다: {str(e)}'
+            'error': f'백업 작업 등록 중 오류가 발생했습니다: {str(e)}'
         })
 
 @user_passes_test(is_superuser)
 @csrf_exempt
 def perform_restore(request):
-    """복원 실행"""
+    """복원 실행 (업로드 파일을 저장하고 작업 등록 후 job_id 반환)"""
+    from jobs.runner import enqueue, save_job_file
+    
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': '잘못된 요청입니다.'})
     
@@ -1104,136 +1223,69 @@ def perform_restore(request):
     if not data_file and not media_file:
         return JsonResponse({'success': False, 'error': '복원할 파일이 필요합니다.'})
     
+    if data_file and not data_file.name.endswith('.json.gz'):
+        return JsonResponse({'success': False, 'error': '올바른 데이터 파일 형식이 아닙니다. (.json.gz 파일만 허용)'})
+    
+    if media_file and not media_file.name.endswith('.tar.gz'):
+        return JsonResponse({'success': False, 'error': '올바른 미디어 파일 형식이 아닙니다. (.tar.gz 파일만 허용)'})
+    
     try:
-        restored_data = {}
-        
-        # 데이터 파일 복원
-        if data_file:
-            if not data_file.name.endswith('.json.gz'):
-                return JsonResponse({'success': False, 'error': '올바른 데이터 파일 형식이 아닙니다. (.json.gz 파일만 허용)'})
-            
-            restored_data.update(restore_data_file(data_file, request.user))
-        
-        # 미디어 파일 복원
-        if media_file:
-            if not media_file.name.endswith('.tar.gz'):
-                return JsonResponse({'success': False, 'error': '올바른 미디어 파일 형식이 아닙니다. (.tar.gz 파일만 허용)'})
-            
-            restored_data.update(restore_media_file(media_file))
-        
-        # 복원 히스토리 저장
-        try:
-            RestoreHistory.objects.create(
-                filename=f"data:{data_file.name if data_file else 'None'}, media:{media_file.name if media_file else 'None'}",
-                file_size=(data_file.size if data_file else 0) + (media_file.size if media_file else 0),
-                restore_type='complete' if (data_file and media_file) else ('data' if data_file else 'media'),
-                status='success',
-                restored_by=request.user,
-                models_restored=restored_data.get('models_restored', {}),
-                media_files_count=restored_data.get('media_files_count', 0)
-            )
-        except Exception as e:
-            print(f"복원 히스토리 저장 실패: {e}")
-        
+        data_path = save_job_file(data_file) if data_file else None
+        media_path = save_job_file(media_file) if media_file else None
+        job = enqueue(
+            'centers.restore',
+            {
+                'data_path': data_path,
+                'media_path': media_path,
+                'data_name': data_file.name if data_file else None,
+                'media_name': media_file.name if media_file else None,
+                'file_size': (data_file.size if data_file else 0) + (media_file.size if media_file else 0),
+            },
+            user=request.user,
+            files=[p for p in (data_path, media_path) if p],
+        )
         return JsonResponse({
             'success': True, 
-            'message': '복원이 성공적으로 완료되었습니다.',
-            'restored_data': restored_data
+            'message': '복원 작업이 등록되었습니다.',
+            'job_id': job.pk
         })
         
     except Exception as e:
-        # 복원 실패시 히스토리 저장
-        try:
-            RestoreHistory.objects.create(
-                filename=f"data:{data_file.name if data_file else 'None'}, media:{media_file.name if media_file else 'None'}",
-                file_size=(data_file.size if data_file else 0) + (media_file.size if media_file else 0),
-                restore_type='complete' if (data_file and media_file) else ('data' if data_file else 'media'),
-                status='failed',
-                restored_by=request.user,
-                error_message=str(e)
-            )
-        except Exception as save_error:
-            print(f"실패 히스토리 저장 실패: {save_error}")
-        
         return JsonResponse({
             'success': False, 
-            'error': f'복원 실행 중 오류가 발생했습니다: {str(e)}'
+            'error': f'복원 작업 등록 중 오류가 발생했습니다: {str(e)}'
         })
 
-def restore_data_file(data_file, user):
-    """데이터 파일을 복원합니다"""
-    import gzip
-    import json
-    from django.core import serializers
-    from django.db import transaction
-    
-    # 임시 파일로 저장
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json.gz') as temp_file:
-        for chunk in data_file.chunks():
-            temp_file.write(chunk)
-        temp_file_path = temp_file.name
-    
-    try:
-        # 압축 해제 및 JSON 로드
-        with gzip.open(temp_file_path, 'rt', encoding='utf-8') as f:
-            backup_data = json.load(f)
-        
-        models_restored = {}
-        
-        with transaction.atomic():
-            # 메타데이터 확인
-            if '_metadata' in backup_data:
-                metadata = backup_data['_metadata']
-                print(f"백업 정보: {metadata}")
-            
-            # 모델별 데이터 복원
-            for model_name, model_data in backup_data.items():
-                if model_name.startswith('_'):  # 메타데이터 스킵
-                    continue
-                
-                try:
-                    # 기존 데이터 삭제 (선택적)
-                    model_class = apps.get_model('centers', model_name)
-                    
-                    # 데이터 복원
-                    restored_objects = []
-                    for obj_data in model_data['data']:
-                        try:
-                            # Django serializer를 사용해 객체 복원
-                            for obj in serializers.deserialize('json', json.dumps([obj_data])):
-                                obj.save()
-                                restored_objects.append(obj.object)
-                        except Exception as e:
-                            print(f"객체 복원 실패: {e}")
-                            continue
-                    
-                    models_restored[model_name] = len(restored_objects)
-                    print(f"{model_name}: {len(restored_objects)}개 객체 복원 완료")
-                
-                except Exception as e:
-                    print(f"{model_name} 모델 복원 실패: {e}")
-                    continue
-        
-        return {
-            'models_restored': models_restored,
-            'total_restored': sum(models_restored.values())
-        }
-        
-    finally:
-        # 임시 파일 정리
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+def restore_data_file(data_path, log=print):
+    """
+    데이터 파일을 복원합니다 (스트리밍 파싱 + 배치 upsert, centers.restore.RestoreEngine)
+    미디어 블롭 manifest가 들어 있는 백업이면 로컬에 없거나 바뀐 미디어 파일만 블롭 저장소에서 받아옵니다.
+    """
+    from .media_store import get_blob_store, restore_media_blobs
+    from .restore import DEFAULT_BATCH_SIZE, RestoreEngine
+    
+    engine = RestoreEngine(batch_size=getattr(settings, 'RESTORE_BATCH_SIZE', DEFAULT_BATCH_SIZE), log=log)
+    report = engine.restore(data_path)
+    if report.metadata:
+        print(f"백업 정보: {report.metadata}")
+    
+    result = {
+        'models_restored': report.restored_counts,
+        'total_restored': report.total_restored,
+        'restore_stats': report.as_dict(),
+    }
+    if report.media:
+        store = get_blob_store(report.media.get('store'))
+        if store is None:
+            log(f"⚠️ 미디어 블롭 저장소({report.media.get('store')}) 설정이 없어 미디어 파일은 복원하지 않았습니다.")
+        else:
+            media = restore_media_blobs(store, report.media, settings.MEDIA_ROOT, log=log)
+            result.update(media_files_count=media['fetched'], restored_files=media['restored_files'])
+    return result
 
-def restore_media_file(media_file):
+def restore_media_file(media_path):
     """미디어 파일을 복원합니다"""
     import tarfile
-    import shutil
-    
-    # 임시 파일로 저장
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.tar.gz') as temp_file:
-        for chunk in media_file.chunks():
-            temp_file.write(chunk)
-        temp_file_path = temp_file.name
     
     try:
         media_root = settings.MEDIA_ROOT
@@ -1242,7 +1294,7 @@ def restore_media_file(media_file):
         restored_files = []
         
         # tar.gz 파일 추출
-        with tarfile.open(temp_file_path, 'r:gz') as tar:
+        with tarfile.open(media_path, 'r:gz') as tar:
             for member in tar.getmembers():
                 if member.isfile():
                     # 파일 추출
@@ -1258,25 +1310,31 @@ def restore_media_file(media_file):
     except Exception as e:
         print(f"미디어 파일 복원 실패: {e}")
         raise e
-        
-    finally:
-        # 임시 파일 정리
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
 
 @user_passes_test(is_superuser)
 def get_backup_status(request):
-    """백업 상태 조회"""
-    try:
-        output = StringIO()
-        call_command('list_backups', storage='github', limit=5, stdout=output)
-        
-        return JsonResponse({
-            'success': True,
-            'backups': output.getvalue()
-        })
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'error': str(e)
-        })
\ No newline at end of file
+    """백업/복원 작업 상태 조회 (?job_id= 이면 해당 작업, 없으면 최근 작업, 마지막 백업, 백업 목록)"""
+    from jobs.models import Job
+    from .backup_catalog import entry_to_dict
+    from .models import BackupCatalogEntry
+    
+    job_id = request.GET.get('job_id', '')
+    if job_id:
+        job = Job.objects.filter(pk=job_id, kind__in=BACKUP_JOB_KINDS).first() if job_id.isdigit() else None
+        if job is None:
+            return JsonResponse({'success': False, 'error': '작업을 찾을 수 없습니다.'}, status=404)
+        return JsonResponse({'success': True, 'job': job.to_dict()})
+    
+    last_backup = BackupHistory.objects.filter(status='success').first()
+    backups = BackupCatalogEntry.objects.filter(kind='data')
+    return JsonResponse({
+        'success': True,
+        'jobs': [job.to_dict() for job in Job.objects.filter(kind__in=BACKUP_JOB_KINDS)[:5]],
+        'backup_count': backups.count(),
+        'backups': [entry_to_dict(entry) for entry in backups.order_by('-created_at')[:10]],
+        'last_backup': {
+            'filename': last_backup.filename,
+            'created_at': timezone.localtime(last_backup.created_at).strftime('%Y-%m-%d %H:%M'),
+        } if last_backup else None,
+    })
+
@@ -0,0 +1,31 @@
+from django.contrib import admin, messages
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'progress_display', 'attempts', 'created_by', 'created_at', 'finished_at']
+    list_filter = ['status', 'kind', 'created_at']
+    search_fields = ['kind', 'error_message']
+    readonly_fields = [
+        'kind', 'payload', 'status', 'attempts', 'max_attempts', 'run_after', 'progress', 'result',
+        'error_message', 'cancel_requested', 'worker_id', 'heartbeat_at', 'created_by', 'created_at',
+        'started_at', 'finished_at',
+    ]
+    actions = ['cancel_jobs']
+
+    def has_add_permission(self, request):
+        return False
+
+    def progress_display(self, obj):
+        progress = obj.progress or {}
+        if not progress.get('total'):
+            return progress.get('message', '-')
+        return f"{progress.get('processed', 0)}/{progress['total']}"
+    progress_display.short_description = '진행'
+
+    def cancel_jobs(self, request, queryset):
+        cancelled = sum(1 for job in queryset if job.request_cancel())
+        self.message_user(request, f'{cancelled}개 작업에 취소를 요청했습니다.', messages.SUCCESS)
+    cancel_jobs.short_description = '선택한 작업 취소'
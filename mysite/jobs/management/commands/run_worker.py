@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from jobs.runner import Worker
+
+
+class Command(BaseCommand):
+    help = '대기 중인 백그라운드 작업(백업, 복원, CSV 가져오기)을 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 처리한 뒤 종료'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='대기 작업이 없을 때 다시 확인하기까지의 간격(초)'
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='이 개수만큼 처리한 뒤 종료 (메모리 누수 대비 재시작용)'
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(poll_interval=options['poll_interval'], log=self.stdout.write)
+        processed = worker.run(once=options['once'], max_jobs=options['max_jobs'])
+        self.stdout.write(self.style.SUCCESS(f'작업 워커 종료: {processed}개 처리'))
@@ -0,0 +1,46 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(help_text='작업 종류 (등록된 핸들러 이름)', max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict, help_text='작업 인자')),
+                ('status', models.CharField(choices=[('queued', '대기 중'), ('running', '실행 중'), ('succeeded', '완료'), ('failed', '실패'), ('cancelled', '취소됨')], default='queued', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='실행 시도 횟수')),
+                ('max_attempts', models.PositiveIntegerField(default=3, help_text='최대 실행 횟수')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='이 시각 이후에 실행 (재시도 대기)')),
+                ('progress', models.JSONField(blank=True, default=dict)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('error_message', models.TextField(blank=True)),
+                ('cancel_requested', models.BooleanField(default=False)),
+                ('worker_id', models.CharField(blank=True, help_text='작업을 가져간 워커', max_length=100)),
+                ('heartbeat_at', models.DateTimeField(blank=True, help_text='워커가 마지막으로 진행 상황을 기록한 시각', null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업 목록',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='job_status_run_after_idx')],
+            },
+        ),
+    ]
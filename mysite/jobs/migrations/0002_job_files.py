@@ -0,0 +1,42 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:42
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFile',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('size', models.BigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': '작업 파일',
+                'verbose_name_plural': '작업 파일 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='JobFileChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField()),
+                ('data', models.BinaryField()),
+                ('file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='jobs.jobfile')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='jobfilechunk',
+            constraint=models.UniqueConstraint(fields=('file', 'index'), name='job_file_chunk_unique_index'),
+        ),
+    ]
@@ -0,0 +1,128 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """DB 기반 백그라운드 작업 (run_worker 명령이 처리)"""
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, '대기 중'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_SUCCEEDED, '완료'),
+        (STATUS_FAILED, '실패'),
+        (STATUS_CANCELLED, '취소됨'),
+    ]
+    FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+    kind = models.CharField(max_length=100, help_text='작업 종류 (등록된 핸들러 이름)')
+    payload = models.JSONField(default=dict, blank=True, help_text='작업 인자')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+
+    # 재시도
+    attempts = models.PositiveIntegerField(default=0, help_text='실행 시도 횟수')
+    max_attempts = models.PositiveIntegerField(default=3, help_text='최대 실행 횟수')
+    run_after = models.DateTimeField(default=timezone.now, help_text='이 시각 이후에 실행 (재시도 대기)')
+
+    # 진행 상황: {'total', 'processed', 'success', 'errors': [{'row', 'error'}], 'message'}
+    progress = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error_message = models.TextField(blank=True)
+
+    cancel_requested = models.BooleanField(default=False)
+    worker_id = models.CharField(max_length=100, blank=True, help_text='작업을 가져간 워커')
+    heartbeat_at = models.DateTimeField(null=True, blank=True, help_text='워커가 마지막으로 진행 상황을 기록한 시각')
+
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = '백그라운드 작업'
+        verbose_name_plural = '백그라운드 작업 목록'
+        ordering = ['-created_at']
+        indexes = [
+            # 워커의 다음 작업 조회 (status='queued' AND run_after <= now ORDER BY run_after)
+            models.Index(fields=['status', 'run_after'], name='job_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
+
+    def request_cancel(self):
+        """대기 중이면 바로 취소하고, 실행 중이면 워커가 다음 진행 기록 때 중단하도록 표시"""
+        now = timezone.now()
+        if Job.objects.filter(pk=self.pk, status=self.STATUS_QUEUED).update(
+            status=self.STATUS_CANCELLED, cancel_requested=True, finished_at=now
+        ):
+            self.status, self.cancel_requested, self.finished_at = self.STATUS_CANCELLED, True, now
+            return True
+        if Job.objects.filter(pk=self.pk, status=self.STATUS_RUNNING).update(cancel_requested=True):
+            self.cancel_requested = True
+            return True
+        return False
+
+    def to_dict(self):
+        progress = self.progress or {}
+        return {
+            'id': self.pk,
+            'kind': self.kind,
+            'status': self.status,
+            'status_display': self.get_status_display(),
+            'finished': self.is_finished,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'total': progress.get('total', 0),
+            'processed': progress.get('processed', 0),
+            'success': progress.get('success', 0),
+            'errors': progress.get('errors', []),
+            'message': progress.get('message', ''),
+            'result': self.result,
+            'error': self.error_message,
+            'cancel_requested': self.cancel_requested,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobFile(models.Model):
+    """
+    작업에 넘기는 업로드 파일 (복원할 백업, CSV/ZIP 등)
+    웹과 워커가 다른 인스턴스에서 실행되므로 디스크 대신 DB에 조각으로 저장하고, 워커가 실행 전에 로컬 임시 파일로 받습니다.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255)
+    size = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = '작업 파일'
+        verbose_name_plural = '작업 파일 목록'
+
+    def __str__(self):
+        return f"{self.name} ({self.size} bytes)"
+
+
+class JobFileChunk(models.Model):
+    file = models.ForeignKey(JobFile, on_delete=models.CASCADE, related_name='chunks')
+    index = models.PositiveIntegerField()
+    data = models.BinaryField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['file', 'index'], name='job_file_chunk_unique_index'),
+        ]
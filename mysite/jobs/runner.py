@@ -0,0 +1,383 @@
+"""
+DB 기반 작업 큐
+외부 브로커 없이 Job 테이블을 큐로 사용합니다. 웹 요청은 enqueue()로 작업을 등록하고 바로 작업 ID를 반환하며,
+run_worker 명령(Worker)이 대기 중인 작업을 하나씩 가져와 실행합니다.
+
+- register('kind'): 작업 핸들러 등록. 핸들러는 JobContext를 받아 결과(dict, JSON 가능)를 반환
+- 진행 상황: ctx.set_total()/ctx.advance()가 Job.progress에 일정 간격으로 기록
+- 재시도: 예외 발생 시 max_attempts까지 지수 백오프로 다시 대기열에 넣음 (PermanentJobError는 재시도하지 않음)
+- 취소: Job.request_cancel() 후 핸들러가 다음에 진행 상황을 기록할 때(ctx.advance/ctx.note 등) JobCancelled로 중단
+- 워커가 죽어 heartbeat가 끊긴 실행 중 작업은 STALE_AFTER 후 다시 대기열로 복구
+- 워커 프로세스의 생존 신호(record_worker_heartbeat)를 캐시에 남겨 readiness 검사(mysite/health.py)가 확인
+- 업로드 파일은 DB(JobFile)에 저장하므로 워커를 웹과 다른 인스턴스(Render worker 서비스)에서 실행할 수 있음
+"""
+
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job, JobFile, JobFileChunk
+
+PROGRESS_SAVE_INTERVAL = 1.0  # 초 (진행 상황 DB 기록 최소 간격)
+MAX_PROGRESS_ERRORS = 200  # progress에 보관할 최대 오류 행 수
+HEARTBEAT_INTERVAL = 30  # 초
+STALE_AFTER = timedelta(minutes=5)  # heartbeat가 이보다 오래 없으면 워커가 죽은 것으로 판단
+RETRY_BASE_DELAY = 30  # 초 (재시도 대기: 30초, 60초, 120초 ...)
+WORKER_HEARTBEAT_KEY = 'jobs:worker_heartbeat'
+WORKER_HEARTBEAT_INTERVAL = 10  # 초 (대기 중 생존 신호 기록 간격)
+JOB_FILE_CHUNK_SIZE = 1024 * 1024  # 작업 파일을 DB에 나눠 저장하는 크기 (바이트)
+JOB_FILE_REF_PREFIX = 'jobfile:'
+
+_handlers = {}
+
+
+class JobCancelled(Exception):
+    """취소 요청으로 작업 중단"""
+
+
+class PermanentJobError(Exception):
+    """재시도해도 성공할 수 없는 오류 (잘못된 입력 등)"""
+
+
+def register(kind, max_attempts=3):
+    """작업 핸들러 등록 데코레이터"""
+    def decorator(func):
+        _handlers[kind] = (func, max_attempts)
+        return func
+    return decorator
+
+
+def enqueue(kind, payload=None, user=None, max_attempts=None, files=None, run_after=None):
+    """
+    작업을 대기열에 등록하고 Job을 반환합니다.
+    files에는 작업이 끝나면 삭제할 작업 파일 참조(save_job_file의 반환값)를 넘깁니다.
+    run_after를 넘기면 그 시각 이후에 실행합니다.
+    """
+    if kind not in _handlers:
+        raise ValueError(f'등록되지 않은 작업 종류입니다: {kind}')
+    payload = dict(payload or {})
+    if files:
+        payload['_files'] = list(files)
+    return Job.objects.create(
+        kind=kind,
+        payload=payload,
+        max_attempts=max_attempts or _handlers[kind][1],
+        created_by=user if user is not None and user.is_authenticated else None,
+        run_after=run_after or timezone.now(),
+    )
+
+
+def job_files_dir():
+    """워커가 작업 파일을 받아 두는 로컬 임시 디렉토리"""
+    path = getattr(settings, 'JOB_FILES_DIR', os.path.join(settings.BASE_DIR, 'job_files'))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def save_job_file(uploaded_file):
+    """
+    업로드 파일을 DB(JobFile)에 조각으로 저장하고 참조 문자열을 반환합니다.
+    payload에 이 참조를 넣고 enqueue(files=[...])로 넘기면, 워커가 실행 전에 로컬 경로로 바꿔 핸들러에 전달합니다.
+    """
+    name = os.path.basename(uploaded_file.name or 'upload')
+    chunk_size = getattr(settings, 'JOB_FILE_CHUNK_SIZE', JOB_FILE_CHUNK_SIZE)
+    with transaction.atomic():
+        job_file = JobFile.objects.create(name=name)
+        size = 0
+        for index, chunk in enumerate(uploaded_file.chunks(chunk_size)):
+            JobFileChunk.objects.create(file=job_file, index=index, data=chunk)
+            size += len(chunk)
+        job_file.size = size
+        job_file.save(update_fields=['size'])
+    return f'{JOB_FILE_REF_PREFIX}{job_file.pk}'
+
+
+def _job_file_id(ref):
+    if isinstance(ref, str) and ref.startswith(JOB_FILE_REF_PREFIX):
+        return ref[len(JOB_FILE_REF_PREFIX):]
+    return None
+
+
+def _local_job_file_path(ref):
+    return os.path.join(job_files_dir(), f'{_job_file_id(ref)}.part')
+
+
+def _fetch_job_files(payload):
+    """payload의 작업 파일 참조를 로컬 임시 파일로 받고, 참조 대신 경로를 넣은 payload를 반환"""
+    paths = {}
+    for ref in payload.get('_files', []):
+        file_id = _job_file_id(ref)
+        if file_id is None:
+            continue  # 예전 작업: 이미 로컬 경로
+        job_file = JobFile.objects.filter(pk=file_id).first()
+        if job_file is None:
+            raise PermanentJobError(f'작업 파일을 찾을 수 없습니다: {ref}')
+        path = _local_job_file_path(ref)
+        with open(path, 'wb') as f:
+            chunks = JobFileChunk.objects.filter(file_id=file_id).order_by('index').values_list('data', flat=True)
+            for data in chunks.iterator(chunk_size=1):
+                f.write(data)
+        paths[ref] = path
+    return {key: paths.get(value, value) if isinstance(value, str) else value for key, value in payload.items()}
+
+
+def _remove_local_job_files(job):
+    for ref in (job.payload or {}).get('_files', []):
+        if _job_file_id(ref) is None:
+            continue
+        try:
+            os.remove(_local_job_file_path(ref))
+        except FileNotFoundError:
+            pass
+
+
+def _remove_job_files(job):
+    """작업이 끝났을 때 DB의 작업 파일과 로컬 사본 삭제"""
+    refs = (job.payload or {}).get('_files', [])
+    _remove_local_job_files(job)
+    JobFile.objects.filter(pk__in=[file_id for file_id in map(_job_file_id, refs) if file_id]).delete()
+    for path in refs:
+        if _job_file_id(path) is None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class JobContext:
+    """핸들러에 전달되는 작업 정보와 진행 상황 기록 도구"""
+
+    def __init__(self, job):
+        self.job = job
+        self.payload = job.payload or {}
+        self.progress = {'total': 0, 'processed': 0, 'success': 0, 'errors': [], 'error_count': 0}
+        self.progress.update(job.progress or {})
+        self.cancelled = False
+        self._saved_at = 0.0
+
+    @property
+    def user(self):
+        return self.job.created_by
+
+    def set_total(self, total, message=None):
+        self.progress['total'] = total
+        if message is not None:
+            self.progress['message'] = message
+        self.save_progress(force=True)
+
+    def set_message(self, message):
+        self.progress['message'] = message
+        self.save_progress(force=True)
+
+    def advance(self, success=True, error=None, row=None, count=1):
+        """처리 건수 증가 (실패면 오류 행 기록)"""
+        self.progress['processed'] += count
+        if success:
+            self.progress['success'] += count
+        else:
+            self.progress['error_count'] += count
+            if len(self.progress['errors']) < MAX_PROGRESS_ERRORS:
+                self.progress['errors'].append({'row': row or 'unknown', 'error': str(error) if error else 'Unknown error'})
+        self.save_progress()
+
+    def save_progress(self, force=False):
+        """진행 상황을 기록하고 취소 요청을 확인합니다 (force가 아니면 PROGRESS_SAVE_INTERVAL마다)"""
+        now = time.monotonic()
+        if not force and now - self._saved_at < PROGRESS_SAVE_INTERVAL:
+            return
+        self._saved_at = now
+        Job.objects.filter(pk=self.job.pk).update(progress=self.progress, heartbeat_at=timezone.now())
+        self.check_cancelled()
+
+    def note(self, message):
+        """
+        트랜잭션 안에서 쓰는 진행 메시지. 작업 행을 그 트랜잭션에서 UPDATE하면 커밋 전까지 보이지 않고
+        행 잠금도 잡히므로 DB에는 heartbeat 스레드가 기록하고, 취소 요청은 플래그로만 확인합니다.
+        """
+        self.progress['message'] = message
+        if self.cancelled:
+            raise JobCancelled()
+
+    def check_cancelled(self):
+        if self.cancelled or Job.objects.filter(pk=self.job.pk, cancel_requested=True).exists():
+            self.cancelled = True
+            raise JobCancelled()
+
+
+def record_worker_heartbeat(worker_id):
+    """워커 프로세스가 살아 있음을 캐시에 기록 (작업이 없어도 주기적으로 호출)"""
+    try:
+        cache.set(WORKER_HEARTBEAT_KEY, {'worker_id': worker_id, 'at': time.time()}, None)
+    except Exception as e:
+        print(f"⚠️ 워커 생존 신호 기록 실패: {e}")
+
+
+def last_worker_heartbeat():
+    """가장 최근 워커 생존 신호 {'worker_id', 'at'(epoch 초)} 또는 None"""
+    return cache.get(WORKER_HEARTBEAT_KEY)
+
+
+class _Heartbeat(threading.Thread):
+    """진행 상황 기록이 없는 긴 단계(외부 업로드 등) 동안에도 heartbeat를 갱신하는 스레드"""
+
+    def __init__(self, job_id, ctx, worker_id):
+        super().__init__(daemon=True)
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.ctx = ctx
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(HEARTBEAT_INTERVAL):
+                record_worker_heartbeat(self.worker_id)
+                try:
+                    Job.objects.filter(pk=self.job_id).update(
+                        heartbeat_at=timezone.now(), progress=dict(self.ctx.progress)
+                    )
+                    if Job.objects.filter(pk=self.job_id, cancel_requested=True).exists():
+                        self.ctx.cancelled = True
+                except Exception as e:
+                    print(f"⚠️ heartbeat 기록 실패 (job #{self.job_id}): {e}")
+        finally:
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join(timeout=5)
+
+
+class Worker:
+    """대기 중인 작업을 하나씩 가져와 실행하는 워커 (run_worker 명령)"""
+
+    def __init__(self, worker_id=None, poll_interval=2.0, log=print):
+        self.worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}'
+        self.poll_interval = poll_interval
+        self.log = log
+        self._stopping = False
+
+    def stop(self, *args):
+        self.log('⏹️ 종료 요청: 현재 작업을 마친 뒤 종료합니다')
+        self._stopping = True
+
+    def run(self, once=False, max_jobs=None):
+        """once면 대기열이 빌 때까지만 처리하고 종료"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        self.log(f'👷 작업 워커 시작: {self.worker_id}')
+        processed = 0
+        last_recovery = 0.0
+        last_heartbeat = 0.0
+        while not self._stopping:
+            close_old_connections()
+            if time.monotonic() - last_heartbeat > WORKER_HEARTBEAT_INTERVAL:
+                record_worker_heartbeat(self.worker_id)
+                last_heartbeat = time.monotonic()
+            if time.monotonic() - last_recovery > HEARTBEAT_INTERVAL:
+                self.recover_stale()
+                last_recovery = time.monotonic()
+            job = self.claim_next()
+            if job is None:
+                if once:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            self.run_job(job)
+            processed += 1
+            if max_jobs and processed >= max_jobs:
+                break
+        close_old_connections()
+        return processed
+
+    def claim_next(self):
+        """대기 작업 하나를 실행 중으로 바꾸고 반환 (조건부 UPDATE라 여러 워커가 같은 작업을 가져가지 않음)"""
+        now = timezone.now()
+        candidates = list(
+            Job.objects.filter(status=Job.STATUS_QUEUED, run_after__lte=now)
+            .order_by('run_after', 'id').values_list('pk', flat=True)[:5]
+        )
+        for pk in candidates:
+            claimed = Job.objects.filter(pk=pk, status=Job.STATUS_QUEUED).update(
+                status=Job.STATUS_RUNNING, worker_id=self.worker_id, attempts=F('attempts') + 1,
+                started_at=now, heartbeat_at=now, error_message='',
+            )
+            if claimed:
+                return Job.objects.select_related('created_by').get(pk=pk)
+        return None
+
+    def run_job(self, job):
+        entry = _handlers.get(job.kind)
+        ctx = JobContext(job)
+        heartbeat = _Heartbeat(job.pk, ctx, self.worker_id)
+        heartbeat.start()
+        started = time.monotonic()
+        self.log(f'▶️ 작업 시작: {job} (시도 {job.attempts}/{job.max_attempts})')
+        try:
+            if entry is None:
+                raise PermanentJobError(f'등록되지 않은 작업 종류입니다: {job.kind}')
+            ctx.payload = _fetch_job_files(ctx.payload)
+            result = entry[0](ctx)
+        except JobCancelled:
+            self._finish(job, ctx, Job.STATUS_CANCELLED, error='사용자 요청으로 취소되었습니다.')
+            self.log(f'⏹️ 작업 취소: {job}')
+        except Exception as e:
+            retry = not isinstance(e, PermanentJobError) and job.attempts < job.max_attempts
+            self.log(f'❌ 작업 실패: {job} - {e}')
+            if retry:
+                self._retry(job, ctx, e)
+            else:
+                self._finish(job, ctx, Job.STATUS_FAILED, error=str(e) or type(e).__name__)
+                traceback.print_exc()
+        else:
+            self._finish(job, ctx, Job.STATUS_SUCCEEDED, result=result)
+            self.log(f'✅ 작업 완료: {job} ({time.monotonic() - started:.1f}초)')
+        finally:
+            heartbeat.stop()
+            # 재시도는 다른 워커 인스턴스에서 실행될 수 있으므로 로컬 사본은 매번 지우고 다시 받음
+            _remove_local_job_files(job)
+
+    def _finish(self, job, ctx, status, result=None, error=''):
+        Job.objects.filter(pk=job.pk).update(
+            status=status, result=result, error_message=error, progress=ctx.progress,
+            finished_at=timezone.now(), heartbeat_at=timezone.now(),
+        )
+        _remove_job_files(job)
+
+    def _retry(self, job, ctx, error):
+        delay = RETRY_BASE_DELAY * (2 ** (job.attempts - 1))
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.STATUS_QUEUED, error_message=str(error), progress=ctx.progress,
+            run_after=timezone.now() + timedelta(seconds=delay), worker_id='',
+        )
+        self.log(f'🔁 {delay}초 후 재시도: {job}')
+
+    def recover_stale(self):
+        """heartbeat가 끊긴 실행 중 작업을 다시 대기열에 넣거나(시도 횟수 남음) 실패 처리"""
+        threshold = timezone.now() - STALE_AFTER
+        stale = Job.objects.filter(status=Job.STATUS_RUNNING, heartbeat_at__lt=threshold)
+        for job in stale:
+            if job.cancel_requested:
+                status, error = Job.STATUS_CANCELLED, '사용자 요청으로 취소되었습니다.'
+            elif job.attempts < job.max_attempts:
+                status, error = Job.STATUS_QUEUED, '워커 응답 없음: 다시 대기열에 등록'
+            else:
+                status, error = Job.STATUS_FAILED, '워커 응답 없음: 최대 시도 횟수 초과'
+            updated = Job.objects.filter(pk=job.pk, status=Job.STATUS_RUNNING, heartbeat_at__lt=threshold).update(
+                status=status, error_message=error, worker_id='',
+                finished_at=None if status == Job.STATUS_QUEUED else timezone.now(),
+            )
+            if updated:
+                self.log(f'⚠️ 멈춘 작업 복구: {job} -> {status}')
+                if status != Job.STATUS_QUEUED:
+                    _remove_job_files(job)
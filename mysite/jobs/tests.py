@@ -0,0 +1,73 @@
+import io
+import json
+import os
+import tempfile
+import time
+
+from django.core.cache import cache
+from django.core.files import File
+from django.test import TestCase, override_settings
+
+from .models import Job, JobFile
+from .runner import WORKER_HEARTBEAT_KEY, Worker, enqueue, register, save_job_file
+
+
+@register('tests.read_file', max_attempts=1)
+def read_file(ctx):
+    with open(ctx.payload['path'], 'rb') as f:
+        return {'path': ctx.payload['path'], 'content': f.read().decode()}
+
+
+@override_settings(HEALTH_CHECK_WORKER=True, HEALTH_READY_CACHE_SECONDS=0, HEALTH_WORKER_STALE_SECONDS=60)
+class WorkerReadinessTests(TestCase):
+    def setUp(self):
+        cache.delete(WORKER_HEARTBEAT_KEY)
+
+    def readiness(self):
+        response = self.client.get('/health/ready/')
+        return response.status_code, json.loads(response.content)['checks']['job_worker']
+
+    def test_not_ready_without_worker_heartbeat(self):
+        status, check = self.readiness()
+
+        self.assertEqual(status, 503)
+        self.assertFalse(check['ok'])
+
+    def test_ready_after_worker_loop(self):
+        Worker(worker_id='test-worker', log=lambda message: None).run(once=True)
+
+        status, check = self.readiness()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(check['worker_id'], 'test-worker')
+
+    def test_stale_heartbeat_is_not_ready(self):
+        cache.set(WORKER_HEARTBEAT_KEY, {'worker_id': 'test-worker', 'at': time.time() - 61}, None)
+
+        status, check = self.readiness()
+
+        self.assertEqual(status, 503)
+        self.assertIn('test-worker', check['error'])
+
+
+@override_settings(JOB_FILE_CHUNK_SIZE=4)
+class JobFileTests(TestCase):
+    def setUp(self):
+        self.files_dir = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, self.files_dir)
+        self.enterContext(override_settings(JOB_FILES_DIR=self.files_dir))
+
+    def test_worker_reads_file_saved_by_web(self):
+        ref = save_job_file(File(io.BytesIO(b'name,address\n'), name='data.csv'))  # 디스크 임시 파일 업로드처럼 조각으로 읽힘
+        job = enqueue('tests.read_file', {'path': ref}, files=[ref])
+
+        self.assertEqual(JobFile.objects.get().size, 13)
+        self.assertEqual(JobFile.objects.get().chunks.count(), 4)
+
+        Worker(worker_id='test-worker', log=lambda message: None).run(once=True)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_SUCCEEDED)
+        self.assertEqual(job.result['content'], 'name,address\n')
+        self.assertFalse(os.path.exists(job.result['path']))
+        self.assertFalse(JobFile.objects.exists())
@@ -0,0 +1,34 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_POST
+
+from .models import Job
+
+
+def _get_visible_job(request, job_id):
+    """작업을 등록한 사용자 또는 슈퍼유저만 조회 가능"""
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None or not (request.user.is_superuser or job.created_by_id == request.user.pk):
+        return None
+    return job
+
+
+@staff_member_required
+def job_status(request, job_id):
+    """작업 진행 상황 조회 (화면에서 finished가 될 때까지 폴링)"""
+    job = _get_visible_job(request, job_id)
+    if job is None:
+        return JsonResponse({'success': False, 'error': '작업을 찾을 수 없습니다.'}, status=404)
+    return JsonResponse({'success': True, 'job': job.to_dict()})
+
+
+@staff_member_required
+@require_POST
+def cancel_job(request, job_id):
+    """작업 취소 요청"""
+    job = _get_visible_job(request, job_id)
+    if job is None:
+        return JsonResponse({'success': False, 'error': '작업을 찾을 수 없습니다.'}, status=404)
+    if not job.request_cancel():
+        return JsonResponse({'success': False, 'error': '이미 끝난 작업입니다.'})
+    return JsonResponse({'success': True, 'job': job.to_dict()})
@@ -0,0 +1,128 @@
+"""
+헬스 체크 (MIDDLEWARE 맨 앞의 HealthCheckMiddleware가 처리)
+
+- /health/ (liveness, render.yaml의 healthCheckPath): 프로세스가 응답하는지만 확인. DB, 세션, 인증, 템플릿을 거치지 않고
+  호스트 검사/HTTPS 리다이렉트보다 먼저 응답하므로 Render 내부 헬스 체크도 그대로 200을 받음
+- /health/ready/ (readiness): DB 왕복, 캐시 읽기/쓰기 지연 시간, 미적용 마이그레이션 수, 웹 프로세스 가동 시간을 JSON으로 반환.
+  HEALTH_CHECK_WORKER면 작업 워커(run_worker, 별도 서비스) 생존 신호도 확인 (외부 모니터링용)
+  결과는 프로세스마다 HEALTH_READY_CACHE_SECONDS초 동안 재사용하고, 하나라도 실패하면 503
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.http import HttpResponse
+
+LIVENESS_PATH = '/health/'
+READINESS_PATH = '/health/ready/'
+READY_CACHE_SECONDS = 5
+WORKER_STALE_SECONDS = 120  # 작업 워커 생존 신호가 이보다 오래되면 실패
+
+STARTED_AT = time.time()
+
+_ready_lock = threading.Lock()
+_ready_result = None  # (계산 시각, 상태 코드, 본문)
+
+
+def _timed(check):
+    """check()를 실행하고 {'ok', 'latency_ms', ...}를 반환"""
+    started = time.perf_counter()
+    try:
+        details = check() or {}
+        ok = True
+    except Exception as e:
+        details = {'error': f'{type(e).__name__}: {e}'}
+        ok = False
+    return {'ok': ok, 'latency_ms': round((time.perf_counter() - started) * 1000, 2), **details}
+
+
+def check_database():
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+
+
+def check_cache():
+    from django.core.cache import cache
+
+    key = f'health:{uuid.uuid4().hex}'
+    cache.set(key, 1, 10)
+    if cache.get(key) != 1:
+        raise RuntimeError('캐시에 쓴 값을 읽지 못했습니다')
+    cache.delete(key)
+
+
+def check_migrations():
+    from django.db import connection
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    pending = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    if pending:
+        raise RuntimeError(f'적용되지 않은 마이그레이션 {len(pending)}개')
+    return {'pending': 0}
+
+
+def check_worker():
+    from jobs.runner import last_worker_heartbeat
+
+    heartbeat = last_worker_heartbeat()
+    if heartbeat is None:
+        raise RuntimeError('작업 워커 생존 신호가 없습니다')
+    age = time.time() - heartbeat['at']
+    if age > getattr(settings, 'HEALTH_WORKER_STALE_SECONDS', WORKER_STALE_SECONDS):
+        raise RuntimeError(f"작업 워커 응답 없음 ({heartbeat['worker_id']}, {age:.0f}초 전)")
+    return {'worker_id': heartbeat['worker_id'], 'heartbeat_age_seconds': round(age, 1)}
+
+
+def readiness():
+    """(상태 코드, JSON 본문). 최근 결과가 있으면 다시 검사하지 않음"""
+    global _ready_result
+    cache_seconds = getattr(settings, 'HEALTH_READY_CACHE_SECONDS', READY_CACHE_SECONDS)
+    with _ready_lock:
+        now = time.monotonic()
+        if _ready_result is not None and now - _ready_result[0] < cache_seconds:
+            return _ready_result[1], _ready_result[2]
+
+        checks = {
+            'database': _timed(check_database),
+            'cache': _timed(check_cache),
+            'migrations': _timed(check_migrations),
+        }
+        if getattr(settings, 'HEALTH_CHECK_WORKER', False):
+            checks['job_worker'] = _timed(check_worker)
+        ready = all(check['ok'] for check in checks.values())
+        body = json.dumps({
+            'status': 'ok' if ready else 'error',
+            'checks': checks,
+            'worker': {'pid': os.getpid(), 'uptime_seconds': round(time.time() - STARTED_AT, 1)},
+            'checked_at': round(time.time(), 3),
+        })
+        _ready_result = (now, 200 if ready else 503, body)
+        return _ready_result[1], _ready_result[2]
+
+
+class HealthCheckMiddleware:
+    """헬스 체크 경로는 다른 미들웨어와 뷰를 거치지 않고 바로 응답 (MIDDLEWARE 맨 앞에 둠)"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == LIVENESS_PATH:
+            return self._response(200, 'ok', 'text/plain')
+        if request.path == READINESS_PATH:
+            status, body = readiness()
+            return self._response(status, body, 'application/json')
+        return self.get_response(request)
+
+    def _response(self, status, body, content_type):
+        response = HttpResponse(body, status=status, content_type=content_type)
+        response['Cache-Control'] = 'no-store'
+        return response
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 import dj_database_url
 from dotenv import load_dotenv
@@ -49,17 +50,22 @@ INSTALLED_APPS = [
     # Local apps
     'centers',
     'boards',
+    'jobs',
     'crispy_forms',
     'crispy_bootstrap5',
 ]
 
 MIDDLEWARE = [
+    # /health/, /health/ready/는 호스트 검사, HTTPS 리다이렉트, 세션/인증보다 먼저 응답 (mysite/health.py)
+    'mysite.health.HealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # request.access: 역할/관리 센터 ID를 요청당 한 번만 로드 (accounts/access.py)
+    'accounts.access.AccessContextMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     # 'allauth.account.middleware.AccountMiddleware',  # 0.54.0에서는 존재하지 않음
@@ -167,6 +173,8 @@ else:
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# 로컬 이미지 축소 WebP 파생본 저장 위치 (미디어 저장소와 별도, 미디어가 로컬 파일일 때만 사용)
+IMAGE_DERIVATIVES_ROOT = os.getenv('IMAGE_DERIVATIVES_ROOT', os.path.join(BASE_DIR, 'image_derivatives'))
 
 # Cloudinary 설정
 CLOUDINARY_STORAGE = {
@@ -256,15 +264,49 @@ LOGIN_URL = 'accounts:account_login'
 LOGOUT_REDIRECT_URL = 'centers:index'
 
 # Session settings
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# 캐시를 먼저 읽고, 데이터가 바뀌었거나 만료일을 늘려야 할 때만 DB에 쓰는 세션 저장소 (accounts/session_store.py)
+SESSION_ENGINE = 'accounts.session_store'
 SESSION_COOKIE_AGE = 1209600  # 2 weeks
 SESSION_COOKIE_NAME = 'sessionid'
-SESSION_SAVE_EVERY_REQUEST = True  # 매 요청마다 세션 저장
+SESSION_SAVE_EVERY_REQUEST = True  # 매 요청마다 만료일을 늘림 (쿠키는 매번, DB는 SESSION_REFRESH_INTERVAL마다)
+SESSION_REFRESH_INTERVAL = int(os.getenv('SESSION_REFRESH_INTERVAL', '3600'))  # 초
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 
+# 요청 단위 권한 컨텍스트(request.access)의 역할/관리 센터 ID 캐시 시간 (초, 0이면 요청마다 DB에서 읽음)
+ACCESS_CONTEXT_CACHE_SECONDS = int(os.getenv('ACCESS_CONTEXT_CACHE_SECONDS', '60'))
+
 # Cache settings - 환경별 분리
-if os.getenv('RENDER'):
-    # Render 프로덕션 환경: Database cache 사용 (PostgreSQL)
+# CACHE_BACKEND 환경변수로 선택: redis | file | database | locmem
+# 기본값: Render 프로덕션은 REDIS_URL이 있으면 Redis, 없으면 DB 캐시(인스턴스 간 공유, build.sh의 createcachetable) / 로컬은 LocMemCache
+# 파일 캐시는 인스턴스마다 따로이고 add가 원자적이지 않아 직접 지정할 때만 사용
+CACHE_BACKEND = os.getenv('CACHE_BACKEND') or (
+    ('redis' if os.getenv('REDIS_URL') else 'database') if os.getenv('RENDER') else 'locmem'
+)
+
+if CACHE_BACKEND == 'redis':
+    # Django 내장 Redis 백엔드 (redis 패키지, requirements.txt에 포함)
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+            'TIMEOUT': 600,  # 10 minutes
+            'KEY_PREFIX': 'mysite',
+        }
+    }
+elif CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_DIR', os.path.join(tempfile.gettempdir(), 'mysite_cache')),
+            'TIMEOUT': 600,  # 10 minutes
+            'OPTIONS': {
+                'MAX_ENTRIES': 5000,
+                'CULL_FREQUENCY': 3,
+            }
+        }
+    }
+elif CACHE_BACKEND == 'database':
+    # Database cache (PostgreSQL) - createcachetable 필요
     CACHES = {
         'default': {
             'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
@@ -277,7 +319,7 @@ if os.getenv('RENDER'):
         }
     }
 else:
-    # 로컬 개발 환경: LocMemCache 사용
+    # 로컬 개발 환경 / 테스트: LocMemCache 사용 (프로세스별)
     CACHES = {
         'default': {
             'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
@@ -334,6 +376,17 @@ AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 AWS_BACKUP_BUCKET_NAME = os.getenv('AWS_BACKUP_BUCKET_NAME')
 AWS_S3_REGION_NAME = os.getenv('AWS_S3_REGION_NAME', 'ap-northeast-2')
 
+# 미디어 백업 블롭 저장소 (backup_data --storage local). s3/github는 각 저장소 안의 media-blobs에 저장
+BACKUP_MEDIA_STORE_DIR = os.getenv('BACKUP_MEDIA_STORE_DIR', os.path.join(BASE_DIR, 'backups', 'media_store'))
+
+# HTTP 백업 대상 (선택사항, --storage http / --mirror http). 로컬 테스트는 fake_backup_server 명령
+BACKUP_HTTP_URL = os.getenv('BACKUP_HTTP_URL')
+BACKUP_HTTP_TOKEN = os.getenv('BACKUP_HTTP_TOKEN')
+
+# 백업 업로드: 동시 업로드 수와 파일별 최대 시도 횟수 (지수 백오프)
+BACKUP_UPLOAD_WORKERS = int(os.getenv('BACKUP_UPLOAD_WORKERS', '4'))
+BACKUP_UPLOAD_RETRIES = int(os.getenv('BACKUP_UPLOAD_RETRIES', '4'))
+
 # Google Drive 백업 설정 (선택사항)
 GOOGLE_DRIVE_WEBHOOK_URL = os.getenv('GOOGLE_DRIVE_WEBHOOK_URL')
 
@@ -347,6 +400,32 @@ BACKUP_DEFAULT_MODELS = [
     'ReviewComment'
 ]
 
+# 백그라운드 작업 (jobs 앱, run_worker 명령)
+# 업로드 파일(복원, CSV 가져오기)은 DB(jobs.JobFile)에 저장하므로 웹과 워커가 다른 인스턴스여도 됩니다.
+# JOB_FILES_DIR은 워커가 실행 전에 파일을 받아 두는 로컬 임시 디렉토리
+JOB_FILES_DIR = os.getenv('JOB_FILES_DIR', os.path.join(BASE_DIR, 'job_files'))
+
+# readiness(/health/ready/) 검사 결과를 재사용하는 시간 (초)
+HEALTH_READY_CACHE_SECONDS = int(os.getenv('HEALTH_READY_CACHE_SECONDS', '5'))
+# readiness에 작업 워커 생존 신호 검사 포함 여부 (외부 모니터링용, 기본 사용 안 함)
+# 워커는 별도 서비스이므로 웹 인스턴스의 헬스 체크(render.yaml)에는 넣지 않음
+HEALTH_CHECK_WORKER = os.getenv('HEALTH_CHECK_WORKER', 'false').lower() == 'true'
+HEALTH_WORKER_STALE_SECONDS = int(os.getenv('HEALTH_WORKER_STALE_SECONDS', '120'))
+
+# CSV 가져오기: 한 번에 bulk_create하는 행 수 (배치마다 savepoint, 실패한 배치만 행 단위로 다시 저장)
+CSV_IMPORT_BATCH_SIZE = int(os.getenv('CSV_IMPORT_BATCH_SIZE', '500'))
+# CSV 가져오기 이미지: 동시 업로드 수와 이미지별 최대 시도 횟수 (지수 백오프)
+IMAGE_UPLOAD_WORKERS = int(os.getenv('IMAGE_UPLOAD_WORKERS', '8'))
+IMAGE_UPLOAD_RETRIES = int(os.getenv('IMAGE_UPLOAD_RETRIES', '3'))
+
+# 지오코딩 (centers/geocoding.py): 공급자, 캐시 유지 시간(초, 검색 결과 없음은 짧게), 요청 제한 시간, 동시 요청 수와 초당 요청 수
+GEOCODER = os.getenv('GEOCODER', 'centers.geocoding.NaverGeocoder')
+GEOCODE_CACHE_TTL = int(os.getenv('GEOCODE_CACHE_TTL', str(90 * 24 * 3600)))
+GEOCODE_MISS_TTL = int(os.getenv('GEOCODE_MISS_TTL', str(24 * 3600)))
+GEOCODE_TIMEOUT = float(os.getenv('GEOCODE_TIMEOUT', '5'))
+GEOCODE_WORKERS = int(os.getenv('GEOCODE_WORKERS', '4'))
+GEOCODE_RATE_LIMIT = float(os.getenv('GEOCODE_RATE_LIMIT', '10'))
+
 # 로깅 설정 (백업 관련)
 LOG_DIR = os.path.join(BASE_DIR, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)  # logs 디렉토리 자동 생성
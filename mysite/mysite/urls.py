@@ -9,6 +9,7 @@ urlpatterns = [
     path('accounts/', include('accounts.urls', namespace='accounts')),
     path('', include('centers.urls', namespace='centers')),
     path('board/', include('boards.urls', namespace='boards')),
+    path('jobs/', include('jobs.urls', namespace='jobs')),
 ]
 
 # Add static files (media)